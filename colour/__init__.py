@@ -46,8 +46,9 @@ from .adaptation import (CHROMATIC_ADAPTATION_METHODS,
 from .algebra import (
     CubicSplineInterpolator, Extrapolator, KernelInterpolator,
     LinearInterpolator, NullInterpolator, PchipInterpolator,
-    SpragueInterpolator, kernel_cardinal_spline, kernel_lanczos, kernel_linear,
-    kernel_nearest_neighbour, kernel_sinc, lagrange_coefficients)
+    SpragueInterpolator, TABLE_INTERPOLATION_METHODS, kernel_cardinal_spline,
+    kernel_lanczos, kernel_linear, kernel_nearest_neighbour, kernel_sinc,
+    lagrange_coefficients, table_interpolation)
 from .colorimetry import (
     ASTME30815_PRACTISE_SHAPE, BANDPASS_CORRECTION_METHODS,
     CIE_standard_illuminant_A_function, CMFS, DEFAULT_SPECTRAL_SHAPE,
@@ -64,9 +65,10 @@ from .colorimetry import (
     mesopic_luminous_efficiency_function, ones_spd, spectral_to_XYZ,
     wavelength_to_XYZ, whiteness, yellowness, zeros_spd)
 from .appearance import (
-    ATD95_Specification, CAM16_Specification, CAM16_VIEWING_CONDITIONS,
-    CAM16_to_XYZ, CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS,
-    CIECAM02_to_XYZ, HUNT_VIEWING_CONDITIONS, Hunt_Specification,
+    ATD95_Specification, CAM16_Model, CAM16_Specification,
+    CAM16_VIEWING_CONDITIONS, CAM16_to_XYZ, CIECAM02_Model,
+    CIECAM02_Specification, CIECAM02_VIEWING_CONDITIONS, CIECAM02_to_XYZ,
+    HUNT_VIEWING_CONDITIONS, Hunt_Specification,
     LLAB_Specification, LLAB_VIEWING_CONDITIONS, Nayatani95_Specification,
     RLAB_D_FACTOR, RLAB_Specification, RLAB_VIEWING_CONDITIONS, XYZ_to_ATD95,
     XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt, XYZ_to_LLAB, XYZ_to_Nayatani95,
@@ -75,35 +77,38 @@ from .difference import DELTA_E_METHODS, delta_E
 from .characterisation import (CAMERAS_RGB_SPECTRAL_SENSITIVITIES,
                                COLOURCHECKERS, COLOURCHECKERS_SPDS,
                                DISPLAYS_RGB_PRIMARIES, first_order_colour_fit)
-from .io import (IES_TM2714_Spd, read_image, read_spds_from_csv_file,
-                 read_spds_from_xrite_file, read_spectral_data_from_csv_file,
-                 write_image, write_spds_to_csv_file)
+from .io import (IES_TM2714_Spd, LUT1D, LUT3D, read_LUT, read_image,
+                 read_spds_from_csv_file, read_spds_from_xrite_file,
+                 read_spectral_data_from_csv_file, write_LUT, write_image,
+                 write_spds_to_csv_file)
 from .models import (
     CAM02LCD_to_JMh_CIECAM02, CAM02SCD_to_JMh_CIECAM02,
     CAM02UCS_to_JMh_CIECAM02, CAM16LCD_to_JMh_CAM16, CAM16SCD_to_JMh_CAM16,
     CAM16UCS_to_JMh_CAM16, CMYK_to_CMY, CMY_to_CMYK, CMY_to_RGB, CV_range,
-    EOTFS, EOTFS_REVERSE, HDR_CIELAB_METHODS, HDR_IPT_METHODS, HSL_to_RGB,
-    HSV_to_RGB, Hunter_Lab_to_XYZ, ICTCP_to_RGB, IPT_hue_angle, IPT_to_XYZ,
+    EOTFS, EOTFS_REVERSE, HDR_CIELAB_METHODS, HDR_Encoder, HDR_IPT_METHODS,
+    HSL_to_RGB, HSV_to_RGB, Hunter_Lab_to_XYZ, ICTCP_to_RGB, IPT_hue_angle,
+    IPT_to_XYZ,
     JMh_CAM16_to_CAM16LCD, JMh_CAM16_to_CAM16SCD, JMh_CAM16_to_CAM16UCS,
     JMh_CIECAM02_to_CAM02LCD, JMh_CIECAM02_to_CAM02SCD,
     JMh_CIECAM02_to_CAM02UCS, LCHab_to_Lab, LCHuv_to_Luv, LOG_DECODING_CURVES,
     LOG_ENCODING_CURVES, Lab_to_LCHab, Lab_to_XYZ, Luv_to_LCHuv, Luv_to_XYZ,
     Luv_to_uv, Luv_uv_to_xy, OETFS, OETFS_REVERSE, OOTFS, OOTFS_REVERSE,
     POINTER_GAMUT_BOUNDARIES, POINTER_GAMUT_DATA, POINTER_GAMUT_ILLUMINANT,
-    Prismatic_to_RGB, RGB_COLOURSPACES, RGB_Colourspace, RGB_luminance,
-    RGB_luminance_equation, RGB_to_CMY, RGB_to_HSL, RGB_to_HSV, RGB_to_ICTCP,
-    RGB_to_Prismatic, RGB_to_RGB, RGB_to_RGB_matrix, RGB_to_XYZ, RGB_to_YCbCr,
-    RGB_to_YcCbcCrc, UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, XYZ_to_Hunter_Lab,
-    XYZ_to_Hunter_Rdab, XYZ_to_IPT, XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab,
-    XYZ_to_Luv, XYZ_to_RGB, XYZ_to_UCS, XYZ_to_UVW, XYZ_to_hdr_CIELab,
-    XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy, XYZ_to_xyY, YCBCR_WEIGHTS,
-    YCbCr_to_RGB, YcCbcCrc_to_RGB, chromatically_adapted_primaries, eotf,
-    eotf_reverse, full_to_legal, function_gamma, function_linear,
-    hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ, legal_to_full, log_decoding_curve,
-    log_encoding_curve, normalised_primary_matrix, oetf, oetf_reverse, ootf,
-    ootf_reverse, primaries_whitepoint, sRGB_to_XYZ,
-    spectral_to_aces_relative_exposure_values, xyY_to_XYZ, xyY_to_xy,
-    xy_to_XYZ, xy_to_xyY)
+    Prismatic_to_RGB, RGB_COLOURSPACES, RGB_Colourspace, RGB_conversion_plan,
+    RGB_luminance, RGB_luminance_equation, RGB_to_CMY, RGB_to_HSL, RGB_to_HSV,
+    RGB_to_ICTCP, RGB_to_Prismatic, RGB_to_RGB, RGB_to_RGB_matrix, RGB_to_XYZ,
+    RGB_to_YCbCr, RGB_to_YcCbcCrc, UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy,
+    XYZ_to_Hunter_Lab, XYZ_to_Hunter_Rdab, XYZ_to_IPT,
+    XYZ_to_K_ab_HunterLab1966, XYZ_to_Lab, XYZ_to_Luv, XYZ_to_RGB, XYZ_to_UCS,
+    XYZ_to_UVW, XYZ_to_hdr_CIELab, XYZ_to_hdr_IPT, XYZ_to_sRGB, XYZ_to_xy,
+    XYZ_to_xyY, YCBCR_WEIGHTS, YCbCr_to_RGB, YcCbcCrc_to_RGB,
+    chromatically_adapted_primaries, convert, eotf, eotf_LUT, eotf_reverse,
+    full_to_legal, function_gamma, function_linear, hdr_CIELab_to_XYZ,
+    hdr_IPT_to_XYZ, legal_to_full, log_decoding_curve, log_decoding_curve_LUT,
+    log_encoding_curve, log_encoding_curve_LUT, normalised_primary_matrix,
+    oetf, oetf_LUT, oetf_reverse, ootf, ootf_reverse, primaries_whitepoint,
+    sRGB_to_XYZ, spectral_to_aces_relative_exposure_values, xyY_to_XYZ,
+    xyY_to_xy, xy_to_XYZ, xy_to_xyY)
 from .corresponding import (BRENEMAN_EXPERIMENTS,
                             BRENEMAN_EXPERIMENTS_PRIMARIES_CHROMATICITIES,
                             CORRESPONDING_CHROMATICITIES_PREDICTION_MODELS,
@@ -123,8 +128,10 @@ from .volume import (
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
     RGB_colourspace_volume_MonteCarlo,
-    RGB_colourspace_volume_coverage_MonteCarlo, is_within_macadam_limits,
-    is_within_mesh_volume, is_within_pointer_gamut, is_within_visible_spectrum)
+    RGB_colourspace_volume_coverage_MonteCarlo, RGB_colourspace_volume_mesh,
+    RGB_colourspaces_intersection_volume_mesh, RGB_colourspace_coverage_mesh,
+    is_within_macadam_limits, is_within_mesh_volume, is_within_pointer_gamut,
+    is_within_visible_spectrum)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -141,9 +148,10 @@ __all__ += [
 __all__ += [
     'CubicSplineInterpolator', 'Extrapolator', 'KernelInterpolator',
     'LinearInterpolator', 'NullInterpolator', 'PchipInterpolator',
-    'SpragueInterpolator', 'kernel_cardinal_spline', 'kernel_lanczos',
-    'kernel_linear', 'kernel_nearest_neighbour', 'kernel_sinc',
-    'lagrange_coefficients'
+    'SpragueInterpolator', 'TABLE_INTERPOLATION_METHODS',
+    'kernel_cardinal_spline', 'kernel_lanczos', 'kernel_linear',
+    'kernel_nearest_neighbour', 'kernel_sinc', 'lagrange_coefficients',
+    'table_interpolation'
 ]
 __all__ += [
     'ASTME30815_PRACTISE_SHAPE', 'BANDPASS_CORRECTION_METHODS',
@@ -162,9 +170,10 @@ __all__ += [
     'wavelength_to_XYZ', 'whiteness', 'yellowness', 'zeros_spd'
 ]
 __all__ += [
-    'ATD95_Specification', 'CAM16_Specification', 'CAM16_VIEWING_CONDITIONS',
-    'CAM16_to_XYZ', 'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS',
-    'CIECAM02_to_XYZ', 'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
+    'ATD95_Specification', 'CAM16_Model', 'CAM16_Specification',
+    'CAM16_VIEWING_CONDITIONS', 'CAM16_to_XYZ', 'CIECAM02_Model',
+    'CIECAM02_Specification', 'CIECAM02_VIEWING_CONDITIONS', 'CIECAM02_to_XYZ',
+    'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
     'LLAB_Specification', 'LLAB_VIEWING_CONDITIONS',
     'Nayatani95_Specification', 'RLAB_D_FACTOR', 'RLAB_Specification',
     'RLAB_VIEWING_CONDITIONS', 'XYZ_to_ATD95', 'XYZ_to_CAM16',
@@ -177,16 +186,18 @@ __all__ += [
     'COLOURCHECKERS_SPDS', 'DISPLAYS_RGB_PRIMARIES', 'first_order_colour_fit'
 ]
 __all__ += [
-    'IES_TM2714_Spd', 'read_image', 'read_spds_from_csv_file',
-    'read_spds_from_xrite_file', 'read_spectral_data_from_csv_file',
-    'write_image', 'write_spds_to_csv_file'
+    'IES_TM2714_Spd', 'LUT1D', 'LUT3D', 'read_LUT', 'read_image',
+    'read_spds_from_csv_file', 'read_spds_from_xrite_file',
+    'read_spectral_data_from_csv_file', 'write_LUT', 'write_image',
+    'write_spds_to_csv_file'
 ]
 __all__ += [
     'CAM02LCD_to_JMh_CIECAM02', 'CAM02SCD_to_JMh_CIECAM02',
     'CAM02UCS_to_JMh_CIECAM02', 'CAM16LCD_to_JMh_CAM16',
     'CAM16SCD_to_JMh_CAM16', 'CAM16UCS_to_JMh_CAM16', 'CMYK_to_CMY',
     'CMY_to_CMYK', 'CMY_to_RGB', 'CV_range', 'EOTFS', 'EOTFS_REVERSE',
-    'HDR_CIELAB_METHODS', 'HDR_IPT_METHODS', 'HSL_to_RGB', 'HSV_to_RGB',
+    'HDR_CIELAB_METHODS', 'HDR_Encoder', 'HDR_IPT_METHODS', 'HSL_to_RGB',
+    'HSV_to_RGB',
     'Hunter_Lab_to_XYZ', 'ICTCP_to_RGB', 'IPT_hue_angle', 'IPT_to_XYZ',
     'JMh_CAM16_to_CAM16LCD', 'JMh_CAM16_to_CAM16SCD', 'JMh_CAM16_to_CAM16UCS',
     'JMh_CIECAM02_to_CAM02LCD', 'JMh_CIECAM02_to_CAM02SCD',
@@ -195,19 +206,21 @@ __all__ += [
     'Luv_to_LCHuv', 'Luv_to_XYZ', 'Luv_to_uv', 'Luv_uv_to_xy', 'OETFS',
     'OETFS_REVERSE', 'OOTFS', 'OOTFS_REVERSE', 'POINTER_GAMUT_BOUNDARIES',
     'POINTER_GAMUT_DATA', 'POINTER_GAMUT_ILLUMINANT', 'Prismatic_to_RGB',
-    'RGB_COLOURSPACES', 'RGB_Colourspace', 'RGB_luminance',
-    'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL', 'RGB_to_HSV',
-    'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB', 'RGB_to_RGB_matrix',
-    'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YcCbcCrc', 'UCS_to_XYZ', 'UCS_to_uv',
-    'UCS_uv_to_xy', 'XYZ_to_Hunter_Lab', 'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT',
-    'XYZ_to_K_ab_HunterLab1966', 'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_RGB',
-    'XYZ_to_UCS', 'XYZ_to_UVW', 'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT',
-    'XYZ_to_sRGB', 'XYZ_to_xy', 'XYZ_to_xyY', 'YCBCR_WEIGHTS', 'YCbCr_to_RGB',
-    'YcCbcCrc_to_RGB', 'chromatically_adapted_primaries', 'eotf',
+    'RGB_COLOURSPACES', 'RGB_Colourspace', 'RGB_conversion_plan',
+    'RGB_luminance', 'RGB_luminance_equation', 'RGB_to_CMY', 'RGB_to_HSL',
+    'RGB_to_HSV', 'RGB_to_ICTCP', 'RGB_to_Prismatic', 'RGB_to_RGB',
+    'RGB_to_RGB_matrix', 'RGB_to_XYZ', 'RGB_to_YCbCr', 'RGB_to_YcCbcCrc',
+    'UCS_to_XYZ', 'UCS_to_uv', 'UCS_uv_to_xy', 'XYZ_to_Hunter_Lab',
+    'XYZ_to_Hunter_Rdab', 'XYZ_to_IPT', 'XYZ_to_K_ab_HunterLab1966',
+    'XYZ_to_Lab', 'XYZ_to_Luv', 'XYZ_to_RGB', 'XYZ_to_UCS', 'XYZ_to_UVW',
+    'XYZ_to_hdr_CIELab', 'XYZ_to_hdr_IPT', 'XYZ_to_sRGB', 'XYZ_to_xy',
+    'XYZ_to_xyY', 'YCBCR_WEIGHTS', 'YCbCr_to_RGB', 'YcCbcCrc_to_RGB',
+    'chromatically_adapted_primaries', 'convert', 'eotf', 'eotf_LUT',
     'eotf_reverse', 'full_to_legal', 'function_gamma', 'function_linear',
     'hdr_CIELab_to_XYZ', 'hdr_IPT_to_XYZ', 'legal_to_full',
-    'log_decoding_curve', 'log_encoding_curve', 'normalised_primary_matrix',
-    'oetf', 'oetf_reverse', 'ootf', 'ootf_reverse', 'primaries_whitepoint',
+    'log_decoding_curve', 'log_decoding_curve_LUT', 'log_encoding_curve',
+    'log_encoding_curve_LUT', 'normalised_primary_matrix', 'oetf', 'oetf_LUT',
+    'oetf_reverse', 'ootf', 'ootf_reverse', 'primaries_whitepoint',
     'sRGB_to_XYZ', 'spectral_to_aces_relative_exposure_values', 'xyY_to_XYZ',
     'xyY_to_xy', 'xy_to_XYZ', 'xy_to_xyY'
 ]
@@ -235,7 +248,9 @@ __all__ += [
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
     'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
     'RGB_colourspace_volume_MonteCarlo',
-    'RGB_colourspace_volume_coverage_MonteCarlo', 'is_within_macadam_limits',
+    'RGB_colourspace_volume_coverage_MonteCarlo',
+    'RGB_colourspace_volume_mesh', 'RGB_colourspaces_intersection_volume_mesh',
+    'RGB_colourspace_coverage_mesh', 'is_within_macadam_limits',
     'is_within_mesh_volume', 'is_within_pointer_gamut',
     'is_within_visible_spectrum'
 ]
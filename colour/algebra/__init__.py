@@ -12,9 +12,12 @@ from .interpolation import (
     kernel_nearest_neighbour, kernel_linear, kernel_sinc, kernel_lanczos,
     kernel_cardinal_spline, KernelInterpolator, LinearInterpolator,
     SpragueInterpolator, CubicSplineInterpolator, PchipInterpolator,
-    NullInterpolator, lagrange_coefficients)
+    NullInterpolator, lagrange_coefficients, table_interpolation_trilinear,
+    table_interpolation_tetrahedral, TABLE_INTERPOLATION_METHODS,
+    table_interpolation)
 from .matrix import is_identity
-from .random import random_triplet_generator
+from .random import (random_triplet_generator, radical_inverse,
+                     halton_triplet_generator)
 
 __all__ = []
 __all__ += coordinates.__all__
@@ -27,7 +30,11 @@ __all__ += [
     'kernel_nearest_neighbour', 'kernel_linear', 'kernel_sinc',
     'kernel_lanczos', 'kernel_cardinal_spline', 'KernelInterpolator',
     'LinearInterpolator', 'SpragueInterpolator', 'CubicSplineInterpolator',
-    'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients'
+    'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients',
+    'table_interpolation_trilinear', 'table_interpolation_tetrahedral',
+    'TABLE_INTERPOLATION_METHODS', 'table_interpolation'
 ]
 __all__ += ['is_identity']
-__all__ += ['random_triplet_generator']
+__all__ += [
+    'random_triplet_generator', 'radical_inverse', 'halton_triplet_generator'
+]
@@ -17,9 +17,19 @@ Defines classes for interpolating variables.
 -   :class:`colour.NullInterpolator`: 1-D function null interpolation.
 -   :func:`colour.lagrange_coefficients`: Computation of
     *Lagrange Coefficients*.
+-   :func:`colour.algebra.table_interpolation_trilinear`: Trilinear
+    interpolation with table.
+-   :func:`colour.algebra.table_interpolation_tetrahedral`: Tetrahedral
+    interpolation with table.
+-   :attr:`colour.TABLE_INTERPOLATION_METHODS`: Supported table interpolation
+    methods.
+-   :func:`colour.table_interpolation`: Interpolation with table using given
+    method.
 
 References
 ----------
+-   :cite:`Bourkeb` : Bourke, P. (n.d.). Trilinear Interpolation. Retrieved
+    January 13, 2018, from http://paulbourke.net/miscellaneous/interpolation/
 -   :cite:`Burger2009b` : Burger, W., & Burge, M. J. (2009). Principles of
     Digital Image Processing. London: Springer London.
     doi:10.1007/978-1-84800-195-4
@@ -34,6 +44,9 @@ References
 -   :cite:`Fairman1985b` : Fairman, H. S. (1985). The calculation of weight
     factors for tristimulus integration. Color Research & Application, 10(4),
     199-203. doi:10.1002/col.5080100407
+-   :cite:`Kirk2006` : Kirk, R. (2006). Truelight Software Library 2.0.
+    Retrieved from https://www.filmlight.ltd.uk/pdf/whitepapers/\
+FL-TL-TN-0057-SoftwareLib.pdf
 -   :cite:`Westland2012h` : Westland, S., Ripamonti, C., & Cheung, V. (2012).
     Interpolation Methods. In Computational Colour Science Using MATLAB
     (2nd ed., pp. 29-37). ISBN:978-0-470-66569-5
@@ -46,14 +59,15 @@ Lagrange_polynomial#Definition
 
 from __future__ import division, unicode_literals
 
+import itertools
 import numpy as np
 import scipy.interpolate
 from collections import OrderedDict, Mapping
 from six.moves import reduce
 
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import (as_numeric, interval, is_integer, is_numeric,
-                              closest_indexes, warning)
+from colour.utilities import (CaseInsensitiveMapping, as_numeric, interval,
+                              is_integer, is_numeric, closest_indexes, warning)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -66,7 +80,9 @@ __all__ = [
     'kernel_nearest_neighbour', 'kernel_linear', 'kernel_sinc',
     'kernel_lanczos', 'kernel_cardinal_spline', 'KernelInterpolator',
     'LinearInterpolator', 'SpragueInterpolator', 'CubicSplineInterpolator',
-    'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients'
+    'PchipInterpolator', 'NullInterpolator', 'lagrange_coefficients',
+    'table_interpolation_trilinear', 'table_interpolation_tetrahedral',
+    'TABLE_INTERPOLATION_METHODS', 'table_interpolation'
 ]
 
 
@@ -1504,3 +1520,211 @@ def lagrange_coefficients(r, n=4):
         L_n.append(reduce(lambda x, y: x * y, basis))  # noqa
 
     return np.array(L_n)
+
+
+def _table_interpolation_indexes(V_xyz, table):
+    """
+    Returns the flattened table, its strides, the flat index of the lower
+    lattice vertex and the fractional part of given :math:`V_{xyz}` values
+    within given table.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate, normalised to domain [0, 1].
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    tuple
+        Flattened table, table strides, lower lattice vertex flat index and
+        fractional part of :math:`V_{xyz}` values.
+    """
+
+    V_xyz = np.clip(np.asarray(V_xyz, dtype=DEFAULT_FLOAT_DTYPE), 0, 1)
+    table = np.asarray(table)
+
+    shape = np.array(table.shape[0:-1])
+    strides = np.array([shape[1] * shape[2], shape[2], 1])
+
+    V_xyz_s = V_xyz * (shape - 1)
+    # The values being positive, truncation is equivalent to flooring. The
+    # lower indexes are clipped so that the upper ones, i.e. "i_f + 1", remain
+    # in the table, the fractional part is then equal to 1 on the upper table
+    # boundary. The *NaN* values are indexing the table origin, their
+    # fractional part remaining *NaN* so that they propagate to the output.
+    i_f = np.minimum(np.nan_to_num(V_xyz_s).astype(np.int_), shape - 2)
+
+    # Gathering from the flattened table with flat indexes is significantly
+    # faster than advanced indexing with three indexes arrays.
+    return (np.reshape(table, (-1, table.shape[-1])), strides,
+            np.dot(i_f, strides), V_xyz_s - i_f)
+
+
+def table_interpolation_trilinear(V_xyz, table):
+    """
+    Performs trilinear interpolation of given :math:`V_{xyz}` values using
+    given interpolation table.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate, normalised to domain [0, 1],
+        values outside the domain are clipped.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+
+    References
+    ----------
+    -   :cite:`Bourkeb`
+
+    Examples
+    --------
+    >>> table = np.transpose(
+    ...     np.meshgrid(*[np.linspace(0, 1, 3)] * 3, indexing='ij'),
+    ...     (1, 2, 3, 0))
+    >>> table = table * table[..., ::-1]
+    >>> V_xyz = np.array([0.2, 0.4, 0.6])
+    >>> table_interpolation_trilinear(V_xyz, table)  # doctest: +ELLIPSIS
+    array([ 0.12,  0.2 ,  0.12])
+    """
+
+    table, strides, i_f, V_xyzr = _table_interpolation_indexes(V_xyz, table)
+
+    V_xyzo = 0
+    for vertex in itertools.product((0, 1), repeat=3):
+        weights = 1
+        for i, j in enumerate(vertex):
+            weights = weights * (V_xyzr[..., i] if j else 1 - V_xyzr[..., i])
+
+        V_xyzo += weights[..., np.newaxis] * np.take(
+            table, i_f + np.dot(vertex, strides), axis=0)
+
+    return V_xyzo
+
+
+def table_interpolation_tetrahedral(V_xyz, table):
+    """
+    Performs tetrahedral interpolation of given :math:`V_{xyz}` values using
+    given interpolation table.
+
+    Each lattice cube is split into six tetrahedra sharing the main diagonal,
+    the tetrahedron containing a given point is defined by the order of its
+    fractional coordinates, and the point is interpolated from the four
+    vertices of that tetrahedron only.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate, normalised to domain [0, 1],
+        values outside the domain are clipped.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+
+    References
+    ----------
+    -   :cite:`Kirk2006`
+
+    Examples
+    --------
+    >>> table = np.transpose(
+    ...     np.meshgrid(*[np.linspace(0, 1, 3)] * 3, indexing='ij'),
+    ...     (1, 2, 3, 0))
+    >>> table = table * table[..., ::-1]
+    >>> V_xyz = np.array([0.2, 0.4, 0.6])
+    >>> table_interpolation_tetrahedral(V_xyz, table)  # doctest: +ELLIPSIS
+    array([ 0.15,  0.2 ,  0.15])
+    """
+
+    table, strides, i_f, V_xyzr = _table_interpolation_indexes(V_xyz, table)
+
+    # Walking from the lower vertex to the upper vertex of the lattice cube
+    # along the axes sorted by decreasing fractional coordinates, the middle
+    # vertex is reached by stepping back along the smallest fractional
+    # coordinate axis from the upper vertex.
+    V_x, V_y, V_z = V_xyzr[..., 0], V_xyzr[..., 1], V_xyzr[..., 2]
+    V_max = np.maximum(np.maximum(V_x, V_y), V_z)[..., np.newaxis]
+    V_min = np.minimum(np.minimum(V_x, V_y), V_z)[..., np.newaxis]
+    V_mid = (V_x + V_y + V_z)[..., np.newaxis] - V_max - V_min
+
+    i_3 = i_f + np.sum(strides)
+    i_1 = i_f + strides[np.argmax(V_xyzr, axis=-1)]
+    i_2 = i_3 - strides[np.argmin(V_xyzr, axis=-1)]
+
+    V_xyzo = ((1 - V_max) * np.take(table, i_f, axis=0) +
+              (V_max - V_mid) * np.take(table, i_1, axis=0) +
+              (V_mid - V_min) * np.take(table, i_2, axis=0) +
+              V_min * np.take(table, i_3, axis=0))
+
+    return V_xyzo
+
+
+TABLE_INTERPOLATION_METHODS = CaseInsensitiveMapping({
+    'Trilinear': table_interpolation_trilinear,
+    'Tetrahedral': table_interpolation_tetrahedral,
+})
+TABLE_INTERPOLATION_METHODS.__doc__ = """
+Supported table interpolation methods.
+
+References
+----------
+-   :cite:`Bourkeb`
+-   :cite:`Kirk2006`
+
+TABLE_INTERPOLATION_METHODS : CaseInsensitiveMapping
+    **{'Trilinear', 'Tetrahedral'}**
+"""
+
+
+def table_interpolation(V_xyz, table, method='Trilinear'):
+    """
+    Performs interpolation of given :math:`V_{xyz}` values using given
+    interpolation table and method.
+
+    Parameters
+    ----------
+    V_xyz : array_like
+        :math:`V_{xyz}` values to interpolate, normalised to domain [0, 1],
+        values outside the domain are clipped.
+    table : array_like
+        4-Dimensional (NxNxNx3) interpolation table.
+    method : unicode, optional
+        **{'Trilinear', 'Tetrahedral'}**,
+        Interpolation method.
+
+    Returns
+    -------
+    ndarray
+        Interpolated :math:`V_{xyz}` values.
+
+    References
+    ----------
+    -   :cite:`Bourkeb`
+    -   :cite:`Kirk2006`
+
+    Examples
+    --------
+    >>> table = np.transpose(
+    ...     np.meshgrid(*[np.linspace(0, 1, 3)] * 3, indexing='ij'),
+    ...     (1, 2, 3, 0))
+    >>> table = table * table[..., ::-1]
+    >>> V_xyz = np.array([0.2, 0.4, 0.6])
+    >>> table_interpolation(V_xyz, table)  # doctest: +ELLIPSIS
+    array([ 0.12,  0.2 ,  0.12])
+    >>> table_interpolation(V_xyz, table, method='Tetrahedral')
+    ... # doctest: +ELLIPSIS
+    array([ 0.15,  0.2 ,  0.15])
+    """
+
+    return TABLE_INTERPOLATION_METHODS.get(method)(V_xyz, table)
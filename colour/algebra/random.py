@@ -6,6 +6,16 @@ Random Numbers Utilities
 Defines random numbers generator objects:
 
 -   :func:`colour.algebra.random_triplet_generator`
+-   :func:`colour.algebra.halton_triplet_generator`
+
+References
+----------
+-   :cite:`Halton1964a` : Halton, J. H. (1964). Algorithm 247: Radical-inverse
+    quasi-random point sequence. Communications of the ACM, 7(12), 701-702.
+    doi:10.1145/355588.365104
+-   :cite:`Cranley1976a` : Cranley, R., & Patterson, T. N. L. (1976).
+    Randomization of Number Theoretic Methods for Multiple Integration. SIAM
+    Journal on Numerical Analysis, 13(6), 904-914. doi:10.1137/0713071
 """
 
 from __future__ import division, unicode_literals
@@ -21,7 +31,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['RANDOM_STATE', 'random_triplet_generator']
+__all__ = [
+    'RANDOM_STATE', 'random_triplet_generator', 'radical_inverse',
+    'halton_triplet_generator'
+]
 
 RANDOM_STATE = np.random.RandomState()
 
@@ -85,3 +98,107 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
             random_state.uniform(*limits[1]),
             random_state.uniform(*limits[2])
         ])
+
+
+def radical_inverse(indexes, base=2):
+    """
+    Returns the radical inverse of given indexes in given base, i.e. the
+    *van der Corput* sequence values at given indexes.
+
+    Parameters
+    ----------
+    indexes : array_like
+        Non-negative integer indexes.
+    base : integer, optional
+        Radical inverse base.
+
+    Returns
+    -------
+    ndarray
+        Radical inverse of given indexes.
+
+    Examples
+    --------
+    >>> radical_inverse(np.arange(8))
+    array([ 0.   ,  0.5  ,  0.25 ,  0.75 ,  0.125,  0.625,  0.375,  0.875])
+    """
+
+    indexes = np.array(indexes, dtype=np.int64)
+
+    inverse = np.zeros(indexes.shape)
+    factor = 1 / base
+    while np.any(indexes > 0):
+        indexes, digits = np.divmod(indexes, base)
+        inverse += digits * factor
+        factor /= base
+
+    return inverse
+
+
+def halton_triplet_generator(size,
+                             limits=np.array([[0, 1], [0, 1], [0, 1]]),
+                             random_state=RANDOM_STATE,
+                             block_size=10e4):
+    """
+    Returns a generator yielding blocks of randomised *Halton* quasi-random
+    triplets.
+
+    The *Halton* sequence in bases 2, 3 and 5 is randomised with a
+    *Cranley-Patterson* rotation, i.e. a random toroidal shift drawn from
+    given ``random_state``, so that independent generators give unbiased and
+    independent estimates.
+
+    Parameters
+    ----------
+    size : integer
+        Generator triplets count.
+    limits : array_like, (3, 2)
+        Quasi-random values limits on each triplet axis.
+    random_state : RandomState
+         Mersenne Twister pseudo-random number generator used to draw the
+         random shift.
+    block_size : integer, optional
+        Triplets count of the yielded blocks.
+
+    Returns
+    -------
+    generator
+        Quasi-random triplets blocks generator, each block is an array of
+        shape (block_size, 3).
+
+    References
+    ----------
+    -   :cite:`Halton1964a`
+    -   :cite:`Cranley1976a`
+
+    Examples
+    --------
+    >>> prng = np.random.RandomState(4)
+    >>> blocks = tuple(halton_triplet_generator(10, random_state=prng,
+    ...                                         block_size=4))
+    >>> [block.shape for block in blocks]
+    [(4, 3), (4, 3), (2, 3)]
+    >>> blocks[0]  # doctest: +ELLIPSIS
+    array([[ 0.4670298...,  0.8805655...,  0.1726843...],
+           [ 0.2170298...,  0.2138989...,  0.3726843...],
+           [ 0.7170298...,  0.6583433...,  0.5726843...],
+           [ 0.0920298...,  0.9916766...,  0.7726843...]])
+    """
+
+    integer_size = int(size)
+    if integer_size != size:
+        warning(('"size" has been cast to integer: {0}'.format(integer_size)))
+
+    block_size = int(block_size)
+    limits = np.asarray(limits)
+    shift = random_state.uniform(size=3)
+
+    for i in range(0, integer_size, block_size):
+        # The first index is skipped as it is the origin for all the bases.
+        indexes = np.arange(i + 1, min(i + block_size, integer_size) + 1)
+        block = np.mod(
+            np.column_stack(
+                [radical_inverse(indexes, base) for base in (2, 3, 5)]) +
+            shift, 1)
+
+        yield limits[..., 0] + block * (limits[..., 1] - limits[..., 0])
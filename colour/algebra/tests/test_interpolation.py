@@ -19,7 +19,8 @@ from colour.algebra import (
     kernel_nearest_neighbour, kernel_linear, kernel_sinc, kernel_lanczos,
     kernel_cardinal_spline, KernelInterpolator, LinearInterpolator,
     SpragueInterpolator, CubicSplineInterpolator, PchipInterpolator,
-    NullInterpolator, lagrange_coefficients)
+    NullInterpolator, lagrange_coefficients, table_interpolation_trilinear,
+    table_interpolation_tetrahedral, table_interpolation)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -38,7 +39,9 @@ __all__ = [
     'TestKernelLanczos', 'TestKernelCardinalSpline', 'TestKernelInterpolator',
     'TestLinearInterpolator', 'TestSpragueInterpolator',
     'TestCubicSplineInterpolator', 'TestPchipInterpolator',
-    'TestNullInterpolator', 'TestLagrangeCoefficients'
+    'TestNullInterpolator', 'TestLagrangeCoefficients', 'TABLE_A', 'V_XYZ_A',
+    'TestTableInterpolationTrilinear', 'TestTableInterpolationTetrahedral',
+    'TestTableInterpolation'
 ]
 
 POINTS_DATA_A = (9.3700, 12.3200, 12.4600, 9.5100, 5.9200, 4.3300, 4.2900,
@@ -146,6 +149,18 @@ LAGRANGE_COEFFICIENTS_B = np.array([
     [-0.0083125, 0.0511875, 0.9725625, -0.0154375],
 ])
 
+TABLE_A = np.transpose(
+    np.meshgrid(*[np.linspace(0, 1, 3)] * 3, indexing='ij'), (1, 2, 3, 0))
+TABLE_A = TABLE_A * TABLE_A[..., ::-1]
+
+V_XYZ_A = np.array([
+    [0.2, 0.4, 0.6],
+    [0.0, 0.0, 0.0],
+    [1.0, 1.0, 1.0],
+    [0.5, 0.5, 0.5],
+    [-0.5, 0.5, 1.5],
+])
+
 
 class TestKernelNearestNeighbour(unittest.TestCase):
     """
@@ -699,5 +714,143 @@ class TestLagrangeCoefficients(unittest.TestCase):
         np.testing.assert_almost_equal(lc, LAGRANGE_COEFFICIENTS_B, decimal=7)
 
 
+class TestTableInterpolationTrilinear(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition unit tests methods.
+    """
+
+    def test_table_interpolation_trilinear(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(V_XYZ_A, TABLE_A),
+            np.array([
+                [0.12, 0.20, 0.12],
+                [0.00, 0.00, 0.00],
+                [1.00, 1.00, 1.00],
+                [0.25, 0.25, 0.25],
+                [0.00, 0.25, 0.00],
+            ]),
+            decimal=7)
+
+        random_state = np.random.RandomState(4)
+        table = random_state.uniform(size=(5, 6, 7, 3))
+        V_xyz = random_state.uniform(size=(2, 50, 3))
+        indexes = V_xyz * (np.array([5, 6, 7]) - 1)
+        i_f = np.minimum(np.floor(indexes).astype(np.int_), [3, 4, 5])
+        V_xyzr = indexes - i_f
+
+        V_xyzo = 0
+        for i in (0, 1):
+            for j in (0, 1):
+                for k in (0, 1):
+                    weights = ((V_xyzr[..., 0] if i else 1 - V_xyzr[..., 0]) *
+                               (V_xyzr[..., 1] if j else 1 - V_xyzr[..., 1]) *
+                               (V_xyzr[..., 2] if k else 1 - V_xyzr[..., 2]))
+                    V_xyzo += weights[..., np.newaxis] * table[
+                        i_f[..., 0] + i, i_f[..., 1] + j, i_f[..., 2] + k]
+
+        np.testing.assert_almost_equal(
+            table_interpolation_trilinear(V_xyz, table), V_xyzo, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_table_interpolation_trilinear(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_trilinear` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        V_xyzo = table_interpolation_trilinear(cases, TABLE_A)
+
+        nan = np.any(np.isnan(cases), axis=-1)
+        self.assertTrue(np.all(np.isnan(V_xyzo[nan])))
+        self.assertTrue(np.all(np.isfinite(V_xyzo[~nan])))
+
+
+class TestTableInterpolationTetrahedral(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition unit tests methods.
+    """
+
+    def test_table_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_XYZ_A, TABLE_A),
+            np.array([
+                [0.15, 0.20, 0.15],
+                [0.00, 0.00, 0.00],
+                [1.00, 1.00, 1.00],
+                [0.25, 0.25, 0.25],
+                [0.00, 0.25, 0.00],
+            ]),
+            decimal=7)
+
+        # Tetrahedral interpolation is exact for affine transformations.
+        M = np.array([
+            [0.5, 0.2, -0.1],
+            [0.1, 0.9, 0.3],
+            [-0.2, 0.1, 1.2],
+        ])
+        table = np.dot(
+            np.transpose(
+                np.meshgrid(
+                    *[np.linspace(0, 1, i) for i in (5, 6, 7)],
+                    indexing='ij'), (1, 2, 3, 0)), np.transpose(M))
+        V_xyz = np.random.RandomState(4).uniform(size=(2, 50, 3))
+        np.testing.assert_almost_equal(
+            table_interpolation_tetrahedral(V_xyz, table),
+            np.einsum('ij,...j->...i', M, V_xyz),
+            decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_table_interpolation_tetrahedral(self):
+        """
+        Tests :func:`colour.algebra.interpolation.\
+table_interpolation_tetrahedral` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        V_xyzo = table_interpolation_tetrahedral(cases, TABLE_A)
+
+        nan = np.any(np.isnan(cases), axis=-1)
+        self.assertTrue(np.all(np.isnan(V_xyzo[nan])))
+        self.assertTrue(np.all(np.isfinite(V_xyzo[~nan])))
+
+
+class TestTableInterpolation(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.interpolation.table_interpolation`
+    definition unit tests methods.
+    """
+
+    def test_table_interpolation(self):
+        """
+        Tests :func:`colour.algebra.interpolation.table_interpolation`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            table_interpolation(V_XYZ_A, TABLE_A),
+            table_interpolation_trilinear(V_XYZ_A, TABLE_A),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            table_interpolation(V_XYZ_A, TABLE_A, 'Tetrahedral'),
+            table_interpolation_tetrahedral(V_XYZ_A, TABLE_A),
+            decimal=7)
+
+
 if __name__ == '__main__':
     unittest.main()
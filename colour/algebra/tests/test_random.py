@@ -8,7 +8,8 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.algebra import random_triplet_generator
+from colour.algebra import (random_triplet_generator, radical_inverse,
+                            halton_triplet_generator)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +18,10 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['RANDOM_TRIPLETS', 'TestRandomTripletGenerator']
+__all__ = [
+    'RANDOM_TRIPLETS', 'HALTON_TRIPLETS', 'TestRandomTripletGenerator',
+    'TestRadicalInverse', 'TestHaltonTripletGenerator'
+]
 
 RANDOM_TRIPLETS = np.array([
     [0.96702984, 0.54723225, 0.97268436],
@@ -32,6 +36,19 @@ RANDOM_TRIPLETS = np.array([
     [0.16797218, 0.73338017, 0.40844386],
 ])
 
+HALTON_TRIPLETS = np.array([
+    [0.46702984, 0.88056558, 0.17268436],
+    [0.21702984, 0.21389892, 0.37268436],
+    [0.71702984, 0.65834336, 0.57268436],
+    [0.09202984, 0.99167669, 0.77268436],
+    [0.59202984, 0.32501003, 0.01268436],
+    [0.34202984, 0.76945447, 0.21268436],
+    [0.84202984, 0.10278780, 0.41268436],
+    [0.02952984, 0.43612114, 0.61268436],
+    [0.52952984, 0.58426929, 0.81268436],
+    [0.27952984, 0.91760262, 0.05268436],
+])
+
 
 class TestRandomTripletGenerator(unittest.TestCase):
     """
@@ -63,5 +80,71 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
             decimal=7)
 
 
+class TestRadicalInverse(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.radical_inverse` definition unit
+    tests methods.
+    """
+
+    def test_radical_inverse(self):
+        """
+        Tests :func:`colour.algebra.random.radical_inverse` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            radical_inverse(np.arange(8)),
+            np.array([0, 1 / 2, 1 / 4, 3 / 4, 1 / 8, 5 / 8, 3 / 8, 7 / 8]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            radical_inverse(np.arange(1, 10), 3),
+            np.array([
+                1 / 3, 2 / 3, 1 / 9, 4 / 9, 7 / 9, 2 / 9, 5 / 9, 8 / 9, 1 / 27
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            radical_inverse(np.reshape(np.arange(8), (2, 2, 2))),
+            np.reshape(radical_inverse(np.arange(8)), (2, 2, 2)),
+            decimal=7)
+
+
+class TestHaltonTripletGenerator(unittest.TestCase):
+    """
+    Defines :func:`colour.algebra.random.halton_triplet_generator` definition
+    unit tests methods.
+    """
+
+    def test_halton_triplet_generator(self):
+        """
+        Tests :func:`colour.algebra.random.halton_triplet_generator`
+        definition.
+        """
+
+        prng = np.random.RandomState(4)
+        blocks = list(halton_triplet_generator(10, random_state=prng))
+        self.assertEqual(len(blocks), 1)
+        np.testing.assert_almost_equal(
+            HALTON_TRIPLETS, blocks[0], decimal=7)
+
+        prng = np.random.RandomState(4)
+        blocks = list(
+            halton_triplet_generator(10, random_state=prng, block_size=3))
+        self.assertListEqual([len(block) for block in blocks], [3, 3, 3, 1])
+        np.testing.assert_almost_equal(
+            HALTON_TRIPLETS, np.vstack(blocks), decimal=7)
+
+    def test_limits_halton_triplet_generator(self):
+        """
+        Tests :func:`colour.algebra.random.halton_triplet_generator`
+        definition limits support.
+        """
+
+        limits = np.array([[0, 100], [-150, 150], [-150, 150]])
+        triplets = np.vstack(list(halton_triplet_generator(1000, limits)))
+        np.testing.assert_array_less(limits[..., 0], np.min(triplets, 0))
+        np.testing.assert_array_less(np.max(triplets, 0), limits[..., 1])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -2,32 +2,36 @@
 
 from __future__ import absolute_import
 
+from .adapting_field import ADAPTING_FIELD_METHODS, adapting_field
 from .hunt import (Hunt_InductionFactors, HUNT_VIEWING_CONDITIONS,
                    Hunt_Specification, XYZ_to_Hunt)
 from .atd95 import ATD95_Specification, XYZ_to_ATD95
 from .ciecam02 import (CIECAM02_InductionFactors, CIECAM02_VIEWING_CONDITIONS,
-                       CIECAM02_Specification, XYZ_to_CIECAM02,
-                       CIECAM02_to_XYZ)
+                       CIECAM02_Specification, CIECAM02_Model,
+                       XYZ_to_CIECAM02, CIECAM02_to_XYZ)
 from .cam16 import (CAM16_InductionFactors, CAM16_VIEWING_CONDITIONS,
-                    CAM16_Specification, XYZ_to_CAM16, CAM16_to_XYZ)
+                    CAM16_Specification, CAM16_Model, XYZ_to_CAM16,
+                    CAM16_to_XYZ)
 from .llab import (LLAB_InductionFactors, LLAB_VIEWING_CONDITIONS,
                    LLAB_Specification, XYZ_to_LLAB)
 from .nayatani95 import Nayatani95_Specification, XYZ_to_Nayatani95
 from .rlab import (RLAB_VIEWING_CONDITIONS, RLAB_D_FACTOR, RLAB_Specification,
                    XYZ_to_RLAB)
 
-__all__ = [
+__all__ = ['ADAPTING_FIELD_METHODS', 'adapting_field']
+__all__ += [
     'Hunt_InductionFactors', 'HUNT_VIEWING_CONDITIONS', 'Hunt_Specification',
     'XYZ_to_Hunt'
 ]
 __all__ += ['ATD95_Specification', 'XYZ_to_ATD95']
 __all__ += [
     'CIECAM02_InductionFactors', 'CIECAM02_VIEWING_CONDITIONS',
-    'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ'
+    'CIECAM02_Specification', 'CIECAM02_Model', 'XYZ_to_CIECAM02',
+    'CIECAM02_to_XYZ'
 ]
 __all__ += [
     'CAM16_InductionFactors', 'CAM16_VIEWING_CONDITIONS',
-    'CAM16_Specification', 'XYZ_to_CAM16', 'CAM16_to_XYZ'
+    'CAM16_Specification', 'CAM16_Model', 'XYZ_to_CAM16', 'CAM16_to_XYZ'
 ]
 __all__ += [
     'LLAB_InductionFactors', 'LLAB_VIEWING_CONDITIONS', 'LLAB_Specification',
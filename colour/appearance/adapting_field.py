@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Adapting Field
+==============
+
+Defines the spatially varying adapting field computation objects:
+
+-   :attr:`colour.appearance.ADAPTING_FIELD_METHODS`: Supported adapting field
+    computation methods.
+-   :func:`colour.appearance.adapting_field`
+
+The colour appearance models, e.g. :func:`colour.XYZ_to_CIECAM02`,
+:func:`colour.XYZ_to_CAM16` or :func:`colour.XYZ_to_Hunt` definitions, and
+the chromatic adaptation transforms, e.g.
+:func:`colour.adaptation.chromatic_adaptation` definition, broadcast the
+reference white *CIE XYZ* tristimulus values and the viewing conditions
+against the stimulus: per pixel arrays, e.g. a low-pass filtered version of
+the image as in the *iCAM* framework, model local adaptation in a single
+call.
+
+References
+----------
+-   :cite:`Fairchild2004d` : Fairchild, M. D., & Johnson, G. M. (2004). iCAM
+    framework for image appearance, differences, and quality. Journal of
+    Electronic Imaging, 13(1), 126-138. doi:10.1117/1.1635368
+-   :cite:`Kovesi2010a` : Kovesi, P. (2010). Fast Almost-Gaussian Filtering.
+    In 2010 International Conference on Digital Image Computing: Techniques
+    and Applications (pp. 121-125). doi:10.1109/DICTA.2010.30
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from scipy.ndimage.filters import gaussian_filter1d
+
+from colour.utilities import (CaseInsensitiveMapping, as_float_array,
+                              filter_kwargs)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'box_filter_widths', 'adapting_field_Gaussian', 'adapting_field_box',
+    'ADAPTING_FIELD_METHODS', 'adapting_field'
+]
+
+
+def box_filter_widths(sigma, passes=3):
+    """
+    Returns the odd widths of the successive box filters approximating a
+    *Gaussian* filter with given standard deviation.
+
+    Parameters
+    ----------
+    sigma : numeric
+        *Gaussian* filter standard deviation :math:`\\sigma` in pixels.
+    passes : int, optional
+        Count of successive box filters.
+
+    Returns
+    -------
+    ndarray
+        Box filters widths.
+
+    References
+    ----------
+    -   :cite:`Kovesi2010a`
+
+    Examples
+    --------
+    >>> box_filter_widths(8)
+    array([15, 15, 17])
+    """
+
+    w_l = int(np.floor(np.sqrt(12 * sigma ** 2 / passes + 1)))
+    if w_l % 2 == 0:
+        w_l -= 1
+
+    m = int(
+        np.round((12 * sigma ** 2 - passes * w_l ** 2 - 4 * passes * w_l -
+                  3 * passes) / (-4 * w_l - 4)))
+
+    return np.where(np.arange(passes) < m, w_l, w_l + 2)
+
+
+def _box_filter(a, width, axis):
+    """
+    Filters given array along given axis with a box filter of given odd width
+    using a cumulative sum, the array is symmetrically extended at its
+    boundaries.
+    """
+
+    if width <= 1:
+        return a
+
+    r = width // 2
+    a = np.moveaxis(a, axis, 0)
+
+    padding = [(r + 1, r)] + [(0, 0)] * (a.ndim - 1)
+    a = np.cumsum(np.pad(a, padding, 'symmetric'), axis=0)
+    a = (a[width:] - a[:-width]) / width
+
+    return np.moveaxis(a, 0, axis)
+
+
+def adapting_field_Gaussian(XYZ, sigma):
+    """
+    Computes the adapting field of given image by filtering it with a
+    separable *Gaussian* filter.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        Image *CIE XYZ* tristimulus values or luminance with the spatial
+        dimensions on the first two axes.
+    sigma : numeric
+        *Gaussian* filter standard deviation :math:`\\sigma` in pixels.
+
+    Returns
+    -------
+    ndarray
+        Adapting field.
+
+    References
+    ----------
+    -   :cite:`Fairchild2004d`
+
+    Examples
+    --------
+    >>> XYZ = np.zeros((3, 3, 3))
+    >>> XYZ[1, 1] = np.array([95.05, 100.00, 108.88])
+    >>> adapting_field_Gaussian(XYZ, 1)[1]  # doctest: +ELLIPSIS
+    array([[ 11.4773106...,  12.0750243...,  13.1472864...],
+           [ 15.8074524...,  16.6306706...,  18.1074741...],
+           [ 11.4773106...,  12.0750243...,  13.1472864...]])
+    """
+
+    XYZ = as_float_array(XYZ)
+
+    for axis in (0, 1):
+        XYZ = gaussian_filter1d(XYZ, sigma, axis=axis)
+
+    return XYZ
+
+
+def adapting_field_box(XYZ, sigma, passes=3):
+    """
+    Computes the adapting field of given image by filtering it with
+    successive separable box filters approximating a *Gaussian* filter.
+
+    The box filters are computed with cumulative sums, thus their cost does
+    not depend on the filter width.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        Image *CIE XYZ* tristimulus values or luminance with the spatial
+        dimensions on the first two axes.
+    sigma : numeric
+        Approximated *Gaussian* filter standard deviation :math:`\\sigma` in
+        pixels.
+    passes : int, optional
+        Count of successive box filters.
+
+    Returns
+    -------
+    ndarray
+        Adapting field.
+
+    References
+    ----------
+    -   :cite:`Fairchild2004d`
+    -   :cite:`Kovesi2010a`
+
+    Examples
+    --------
+    >>> XYZ = np.zeros((3, 3, 3))
+    >>> XYZ[1, 1] = np.array([95.05, 100.00, 108.88])
+    >>> adapting_field_box(XYZ, 1)[1]  # doctest: +ELLIPSIS
+    array([[ 10.5611111...,  11.1111111...,  12.0977777...],
+           [ 10.5611111...,  11.1111111...,  12.0977777...],
+           [ 10.5611111...,  11.1111111...,  12.0977777...]])
+    """
+
+    XYZ = as_float_array(XYZ)
+
+    for width in box_filter_widths(sigma, passes):
+        for axis in (0, 1):
+            XYZ = _box_filter(XYZ, width, axis)
+
+    return XYZ
+
+
+ADAPTING_FIELD_METHODS = CaseInsensitiveMapping({
+    'Gaussian': adapting_field_Gaussian,
+    'Box': adapting_field_box
+})
+ADAPTING_FIELD_METHODS.__doc__ = """
+Supported adapting field computation methods.
+
+References
+----------
+-   :cite:`Fairchild2004d`
+-   :cite:`Kovesi2010a`
+
+ADAPTING_FIELD_METHODS : CaseInsensitiveMapping
+    **{'Gaussian', 'Box'}**
+"""
+
+
+def adapting_field(XYZ, sigma, method='Box', **kwargs):
+    """
+    Computes the spatially varying adapting field of given image, i.e. a
+    low-pass filtered version of the image used as per pixel reference white
+    or adapting luminance by the colour appearance models and chromatic
+    adaptation transforms.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        Image *CIE XYZ* tristimulus values or luminance with the spatial
+        dimensions on the first two axes.
+    sigma : numeric
+        *Gaussian* filter standard deviation :math:`\\sigma` in pixels, the
+        *iCAM* framework uses a quarter of the image width.
+    method : unicode, optional
+        **{'Box', 'Gaussian'}**,
+        Computation method.
+
+    Other Parameters
+    ----------------
+    passes : int, optional
+        {:func:`colour.appearance.adapting_field_box`},
+        Count of successive box filters.
+
+    Returns
+    -------
+    ndarray
+        Adapting field.
+
+    Notes
+    -----
+    -   The image is symmetrically extended at its boundaries.
+    -   The *Box* method cost does not depend on ``sigma`` and is preferred
+        for the large filters used for local adaptation.
+
+    References
+    ----------
+    -   :cite:`Fairchild2004d`
+    -   :cite:`Kovesi2010a`
+
+    Examples
+    --------
+    >>> from colour import XYZ_to_CAM16
+    >>> XYZ = np.random.RandomState(4).uniform(5, 95, (16, 16, 3))
+    >>> XYZ_w = adapting_field(XYZ, 4)
+    >>> L_A = adapting_field(XYZ[..., 1], 4) * 0.2
+    >>> XYZ_to_CAM16(XYZ, XYZ_w, L_A, 20).J.shape
+    (16, 16)
+    """
+
+    function = ADAPTING_FIELD_METHODS[method]
+
+    return function(XYZ, sigma, **filter_kwargs(function, **kwargs))
@@ -8,6 +8,7 @@ Defines *CAM16* colour appearance model objects:
 -   :class:`colour.appearance.CAM16_InductionFactors`
 -   :attr:`colour.CAM16_VIEWING_CONDITIONS`
 -   :class:`colour.CAM16_Specification`
+-   :class:`colour.CAM16_Model`
 -   :func:`colour.XYZ_to_CAM16`
 -   :func:`colour.CAM16_to_XYZ`
 
@@ -53,8 +54,8 @@ __status__ = 'Production'
 
 __all__ = [
     'M_16', 'M_16_INVERSE', 'CAM16_InductionFactors',
-    'CAM16_VIEWING_CONDITIONS', 'CAM16_Specification', 'XYZ_to_CAM16',
-    'CAM16_to_XYZ'
+    'CAM16_VIEWING_CONDITIONS', 'CAM16_Specification', 'CAM16_Model',
+    'XYZ_to_CAM16', 'CAM16_to_XYZ'
 ]
 
 M_16 = np.array([
@@ -161,6 +162,358 @@ class CAM16_Specification(
                                                        H, HC)
 
 
+class CAM16_Model(object):
+    """
+    Implements the *CAM16* colour appearance model for given reference white
+    and viewing conditions.
+
+    The quantities depending only on the reference white and the viewing
+    conditions, i.e. the viewing condition dependent parameters, the degree of
+    adaptation :math:`D`, the achromatic response of the reference white
+    :math:`A_w` and the matrices fusing the adaptation matrix
+    :math:`M_{16}` with the chromatic adaptation, are computed once at
+    initialisation.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white in domain [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CAM16_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    XYZ_w
+    L_A
+    Y_b
+    surround
+    discount_illuminant
+    D
+    F_L
+    A_w
+
+    Methods
+    -------
+    forward
+    reverse
+
+    References
+    ----------
+    -   :cite:`Li2017`
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> model = CAM16_Model(XYZ_w, 318.31, 20.0)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> specification = model.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CAM16_Specification(J=41.7180250..., C=11.9413446..., h=210.3838955..., \
+s=25.3564036..., Q=193.0617673..., M=12.4128523..., H=267.0983345..., HC=None)
+    >>> model.reverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=CAM16_VIEWING_CONDITIONS['Average'],
+                 discount_illuminant=False):
+        XYZ_w = np.asarray(XYZ_w)
+        L_A = np.asarray(L_A)
+        Y_b = np.asarray(Y_b)
+
+        self._XYZ_w = XYZ_w
+        self._L_A = L_A
+        self._Y_b = Y_b
+        self._surround = surround
+        self._discount_illuminant = discount_illuminant
+
+        _X_w, Y_w, _Z_w = tsplit(XYZ_w)
+
+        # Step 0
+        # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
+        RGB_w = dot_vector(M_16, XYZ_w)
+
+        # Computing degree of adaptation :math:`D`.
+        self._D = np.asarray(
+            np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
+            if not discount_illuminant else 1)
+
+        self._n, self._F_L, self._N_bb, self._N_cb, self._z = tsplit(
+            viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
+
+        D = self._D[..., np.newaxis]
+        D_RGB = D * XYZ_w / RGB_w + 1 - D
+
+        # Fusing the adaptation matrix :math:`M_{16}` with the chromatic
+        # adaptation.
+        self._XYZ_to_RGB_c_matrix = D_RGB[..., np.newaxis] * M_16
+        self._RGB_c_to_XYZ_matrix = M_16_INVERSE / D_RGB[..., np.newaxis, :]
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            D_RGB * RGB_w, self._F_L)
+
+        # Computing achromatic responses for the whitepoint.
+        self._A_w = achromatic_response_forward(RGB_aw, self._N_bb)
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter property for the *CIE XYZ* tristimulus values of reference
+        white.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
+
+        return self._XYZ_w
+
+    @property
+    def L_A(self):
+        """
+        Getter property for the adapting field *luminance* :math:`L_A`.
+
+        Returns
+        -------
+        ndarray
+            Adapting field *luminance* :math:`L_A`.
+        """
+
+        return self._L_A
+
+    @property
+    def Y_b(self):
+        """
+        Getter property for the relative luminance of background :math:`Y_b`.
+
+        Returns
+        -------
+        ndarray
+            Relative luminance of background :math:`Y_b`.
+        """
+
+        return self._Y_b
+
+    @property
+    def surround(self):
+        """
+        Getter property for the surround viewing conditions induction factors.
+
+        Returns
+        -------
+        CAM16_InductionFactors
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter property for whether the illuminant is discounted.
+
+        Returns
+        -------
+        bool
+            Whether the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    @property
+    def D(self):
+        """
+        Getter property for the degree of adaptation :math:`D`.
+
+        Returns
+        -------
+        ndarray
+            Degree of adaptation :math:`D`.
+        """
+
+        return self._D
+
+    @property
+    def F_L(self):
+        """
+        Getter property for the *luminance* level adaptation factor
+        :math:`F_L`.
+
+        Returns
+        -------
+        ndarray
+            *Luminance* level adaptation factor :math:`F_L`.
+        """
+
+        return self._F_L
+
+    @property
+    def A_w(self):
+        """
+        Getter property for the achromatic response of the reference white
+        :math:`A_w`.
+
+        Returns
+        -------
+        ndarray
+            Achromatic response of the reference white :math:`A_w`.
+        """
+
+        return self._A_w
+
+    def forward(self, XYZ):
+        """
+        Computes the *CAM16* colour appearance model correlates from given
+        *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus in domain
+            [0, 100].
+
+        Returns
+        -------
+        CAM16_Specification
+            *CAM16* colour appearance model specification.
+        """
+
+        surround = self._surround
+
+        # Step 1 and Step 2
+        # Converting *CIE XYZ* tristimulus values to adapted sharpened *RGB*
+        # values.
+        RGB_c = dot_vector(self._XYZ_to_RGB_c_matrix, XYZ)
+
+        # Step 3
+        # Applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_c, self._F_L)
+
+        # Step 4
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
+
+        # Step 5
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h)
+        # TODO: Compute hue composition.
+
+        # Step 6
+        # Computing achromatic responses for the stimulus.
+        A = achromatic_response_forward(RGB_a, self._N_bb)
+
+        # Step 7
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, self._A_w, surround.c, self._z)
+
+        # Step 8
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = brightness_correlate(surround.c, J, self._A_w, self._F_L)
+
+        # Step 9
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, self._n, surround.N_c, self._N_cb, e_t, a, b,
+                             RGB_a)
+
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, self._F_L)
+
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
+
+        return CAM16_Specification(J, C, h, s, Q, M, H, None)
+
+    def reverse(self, CAM16_specification):
+        """
+        Converts given *CAM16* specification to *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        CAM16_specification : CAM16_Specification
+            *CAM16* colour appearance model specification. Correlate of
+            *Lightness* :math:`J`, correlate of *chroma* :math:`C` or
+            correlate of *colourfulness* :math:`M` and *hue* angle :math:`h`
+            in degrees must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``CAM16_specification`` argument.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CAM16_specification,
+                                                    CAM16_Specification)
+
+        surround = self._surround
+
+        # Step 1
+        if C is None and M is not None:
+            C = M / self._F_L ** 0.25
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "CAM16_specification" argument!')
+
+        # Step 2
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_reverse(C, J, self._n)
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = achromatic_response_reverse(self._A_w, J, surround.c, self._z)
+
+        # Computing *P_1* to *P_3*.
+        P_n = P(surround.N_c, self._N_cb, e_t, t, A, self._N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Step 3
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+
+        # Step 4
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+
+        # Step 5
+        # Applying reverse post-adaptation non linear response compression.
+        RGB_c = post_adaptation_non_linear_response_compression_reverse(
+            RGB_a, self._F_L)
+
+        # Step 6 and Step 7
+        # Reverting the chromatic adaptation and converting sharpened *RGB*
+        # values to *CIE XYZ* tristimulus values.
+        XYZ = dot_vector(self._RGB_c_to_XYZ_matrix, RGB_c)
+
+        return XYZ
+
+
 def XYZ_to_CAM16(XYZ,
                  XYZ_w,
                  L_A,
@@ -220,80 +573,8 @@ def XYZ_to_CAM16(XYZ,
 s=25.3564036..., Q=193.0617673..., M=12.4128523..., H=267.0983345..., HC=None)
     """
 
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
-
-    # Step 0
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB_w = dot_vector(M_16, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else 1)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    D_RGB = D[..., np.newaxis] * XYZ_w / RGB_w + 1 - D[..., np.newaxis]
-    RGB_wc = D_RGB * RGB_w
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_wc, F_L)
-
-    # Computing achromatic responses for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Step 1
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB = dot_vector(M_16, XYZ)
-
-    # Step 2
-    RGB_c = D_RGB * RGB
-
-    # Step 3
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_c, F_L)
-
-    # Step 4
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Step 5
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Step 6
-    # Computing achromatic responses for the stimulus.
-    A = achromatic_response_forward(RGB_a, N_bb)
-
-    # Step 7
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Step 8
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Step 9
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CAM16_Specification(J, C, h, s, Q, M, H, None)
+    return CAM16_Model(XYZ_w, L_A, Y_b, surround,
+                       discount_illuminant).forward(XYZ)
 
 
 def CAM16_to_XYZ(CAM16_specification,
@@ -364,69 +645,6 @@ def CAM16_to_XYZ(CAM16_specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CAM16_specification,
-                                                CAM16_Specification)
-
-    _X_w, Y_w, _Zw = tsplit(XYZ_w)
-
-    # Step 0
-    # Converting *CIE XYZ* tristimulus values to sharpened *RGB* values.
-    RGB_w = dot_vector(M_16, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = (np.clip(degree_of_adaptation(surround.F, L_A), 0, 1)
-         if not discount_illuminant else 1)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    D_RGB = D[..., np.newaxis] * XYZ_w / RGB_w + 1 - D[..., np.newaxis]
-    RGB_wc = D_RGB * RGB_w
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_wc, F_L)
-
-    # Computing achromatic responses for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Step 1
-    if C is None and M is not None:
-        C = M / F_L ** 0.25
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CAM16_specification" argument!')
-
-    # Step 2
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_reverse(C, J, n)
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_reverse(A_w, J, surround.c, z)
-
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
-
-    # Step 3
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
-
-    # Step 4
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = post_adaptation_non_linear_response_compression_matrix(P_2, a, b)
-
-    # Step 5
-    # Applying reverse post-adaptation non linear response compression.
-    RGB_c = post_adaptation_non_linear_response_compression_reverse(RGB_a, F_L)
-
-    # Step 6
-    RGB = RGB_c / D_RGB
-
-    # Step 7
-    XYZ = dot_vector(M_16_INVERSE, RGB)
+    model = CAM16_Model(XYZ_w, L_A, Y_b, surround, discount_illuminant)
 
-    return XYZ
+    return model.reverse(CAM16_specification)
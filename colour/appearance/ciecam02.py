@@ -8,6 +8,7 @@ Defines *CIECAM02* colour appearance model objects:
 -   :class:`colour.appearance.CIECAM02_InductionFactors`
 -   :attr:`colour.CIECAM02_VIEWING_CONDITIONS`
 -   :class:`colour.CIECAM02_Specification`
+-   :class:`colour.CIECAM02_Model`
 -   :func:`colour.XYZ_to_CIECAM02`
 -   :func:`colour.CIECAM02_to_XYZ`
 
@@ -57,7 +58,8 @@ __status__ = 'Production'
 __all__ = [
     'CAT02_INVERSE_CAT', 'CIECAM02_InductionFactors',
     'CIECAM02_VIEWING_CONDITIONS', 'HUE_DATA_FOR_HUE_QUADRATURE',
-    'CIECAM02_Specification', 'XYZ_to_CIECAM02', 'CIECAM02_to_XYZ',
+    'CIECAM02_Specification', 'CIECAM02_Model', 'XYZ_to_CIECAM02',
+    'CIECAM02_to_XYZ',
     'chromatic_induction_factors', 'base_exponential_non_linearity',
     'viewing_condition_dependent_parameters', 'degree_of_adaptation',
     'full_chromatic_adaptation_forward', 'full_chromatic_adaptation_reverse',
@@ -182,6 +184,348 @@ class CIECAM02_Specification(
             cls, J, C, h, s, Q, M, H, HC)
 
 
+class CIECAM02_Model(object):
+    """
+    Implements the *CIECAM02* colour appearance model for given reference
+    white and viewing conditions.
+
+    The quantities depending only on the reference white and the viewing
+    conditions, i.e. the viewing condition dependent parameters, the degree of
+    adaptation :math:`D`, the achromatic response of the reference white
+    :math:`A_w` and the matrices fusing the *CAT02* transform, the full
+    chromatic adaptation and the conversion to *Hunt-Pointer-Estevez*
+    :math:`\\rho\\gamma\\beta` colourspace, are computed once at
+    initialisation.
+
+    Parameters
+    ----------
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white in domain [0, 100].
+    L_A : numeric or array_like
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`, (often taken
+        to be 20% of the luminance of a white object in the scene).
+    Y_b : numeric or array_like
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CIECAM02_InductionFactors, optional
+        Surround viewing conditions induction factors.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+
+    Attributes
+    ----------
+    XYZ_w
+    L_A
+    Y_b
+    surround
+    discount_illuminant
+    D
+    F_L
+    A_w
+
+    Methods
+    -------
+    forward
+    reverse
+
+    References
+    ----------
+    -   :cite:`Fairchild2004c`
+    -   :cite:`Luo2013`
+    -   :cite:`Moroneya`
+    -   :cite:`Wikipediach`
+
+    Examples
+    --------
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+    >>> XYZ = np.array([19.01, 20.00, 21.78])
+    >>> specification = model.forward(XYZ)
+    >>> specification  # doctest: +ELLIPSIS
+    CIECAM02_Specification(J=41.7310911..., C=0.1047077..., h=219.0484326..., \
+s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
+    >>> model.reverse(specification)  # doctest: +ELLIPSIS
+    array([ 19.01...,  20...  ,  21.78...])
+    """
+
+    def __init__(self,
+                 XYZ_w,
+                 L_A,
+                 Y_b,
+                 surround=CIECAM02_VIEWING_CONDITIONS['Average'],
+                 discount_illuminant=False):
+        XYZ_w = np.asarray(XYZ_w)
+        L_A = np.asarray(L_A)
+        Y_b = np.asarray(Y_b)
+
+        self._XYZ_w = XYZ_w
+        self._L_A = L_A
+        self._Y_b = Y_b
+        self._surround = surround
+        self._discount_illuminant = discount_illuminant
+
+        _X_w, Y_w, _Z_w = tsplit(XYZ_w)
+
+        self._n, self._F_L, self._N_bb, self._N_cb, self._z = tsplit(
+            viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
+
+        # Computing degree of adaptation :math:`D`.
+        self._D = np.asarray(
+            degree_of_adaptation(surround.F, L_A)
+            if not discount_illuminant else 1)
+
+        # Fusing the conversion to *CMCCAT2000* transform sharpened *RGB*
+        # values, the full chromatic adaptation and the conversion to
+        # *Hunt-Pointer-Estevez* colourspace.
+        RGB_w = dot_vector(CAT02_CAT, XYZ_w)
+        D_RGB = full_chromatic_adaptation_forward(
+            np.ones(RGB_w.shape), RGB_w, Y_w, self._D)
+
+        self._XYZ_to_RGB_p_matrix = dot_matrix(
+            dot_matrix(XYZ_TO_HPE_MATRIX, CAT02_INVERSE_CAT),
+            D_RGB[..., np.newaxis] * CAT02_CAT)
+        self._RGB_p_to_XYZ_matrix = dot_matrix(
+            CAT02_INVERSE_CAT / D_RGB[..., np.newaxis, :],
+            dot_matrix(CAT02_CAT, HPE_TO_XYZ_MATRIX))
+
+        # Computing achromatic response for the whitepoint.
+        RGB_aw = post_adaptation_non_linear_response_compression_forward(
+            dot_vector(self._XYZ_to_RGB_p_matrix, XYZ_w), self._F_L)
+        self._A_w = achromatic_response_forward(RGB_aw, self._N_bb)
+
+    @property
+    def XYZ_w(self):
+        """
+        Getter property for the *CIE XYZ* tristimulus values of reference
+        white.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values of reference white.
+        """
+
+        return self._XYZ_w
+
+    @property
+    def L_A(self):
+        """
+        Getter property for the adapting field *luminance* :math:`L_A`.
+
+        Returns
+        -------
+        ndarray
+            Adapting field *luminance* :math:`L_A`.
+        """
+
+        return self._L_A
+
+    @property
+    def Y_b(self):
+        """
+        Getter property for the relative luminance of background :math:`Y_b`.
+
+        Returns
+        -------
+        ndarray
+            Relative luminance of background :math:`Y_b`.
+        """
+
+        return self._Y_b
+
+    @property
+    def surround(self):
+        """
+        Getter property for the surround viewing conditions induction factors.
+
+        Returns
+        -------
+        CIECAM02_InductionFactors
+            Surround viewing conditions induction factors.
+        """
+
+        return self._surround
+
+    @property
+    def discount_illuminant(self):
+        """
+        Getter property for whether the illuminant is discounted.
+
+        Returns
+        -------
+        bool
+            Whether the illuminant is discounted.
+        """
+
+        return self._discount_illuminant
+
+    @property
+    def D(self):
+        """
+        Getter property for the degree of adaptation :math:`D`.
+
+        Returns
+        -------
+        ndarray
+            Degree of adaptation :math:`D`.
+        """
+
+        return self._D
+
+    @property
+    def F_L(self):
+        """
+        Getter property for the *luminance* level adaptation factor
+        :math:`F_L`.
+
+        Returns
+        -------
+        ndarray
+            *Luminance* level adaptation factor :math:`F_L`.
+        """
+
+        return self._F_L
+
+    @property
+    def A_w(self):
+        """
+        Getter property for the achromatic response of the reference white
+        :math:`A_w`.
+
+        Returns
+        -------
+        ndarray
+            Achromatic response of the reference white :math:`A_w`.
+        """
+
+        return self._A_w
+
+    def forward(self, XYZ):
+        """
+        Computes the *CIECAM02* colour appearance model correlates from given
+        *CIE XYZ* tristimulus values.
+
+        Parameters
+        ----------
+        XYZ : array_like
+            *CIE XYZ* tristimulus values of test sample / stimulus in domain
+            [0, 100].
+
+        Returns
+        -------
+        CIECAM02_Specification
+            *CIECAM02* colour appearance model specification.
+        """
+
+        surround = self._surround
+
+        # Converting to *Hunt-Pointer-Estevez* colourspace.
+        RGB_p = dot_vector(self._XYZ_to_RGB_p_matrix, XYZ)
+
+        # Applying forward post-adaptation non linear response compression.
+        RGB_a = post_adaptation_non_linear_response_compression_forward(
+            RGB_p, self._F_L)
+
+        # Converting to preliminary cartesian coordinates.
+        a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
+
+        # Computing the *hue* angle :math:`h`.
+        h = hue_angle(a, b)
+
+        # Computing hue :math:`h` quadrature :math:`H`.
+        H = hue_quadrature(h)
+        # TODO: Compute hue composition.
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic responses for the stimulus.
+        A = achromatic_response_forward(RGB_a, self._N_bb)
+
+        # Computing the correlate of *Lightness* :math:`J`.
+        J = lightness_correlate(A, self._A_w, surround.c, self._z)
+
+        # Computing the correlate of *brightness* :math:`Q`.
+        Q = brightness_correlate(surround.c, J, self._A_w, self._F_L)
+
+        # Computing the correlate of *chroma* :math:`C`.
+        C = chroma_correlate(J, self._n, surround.N_c, self._N_cb, e_t, a, b,
+                             RGB_a)
+
+        # Computing the correlate of *colourfulness* :math:`M`.
+        M = colourfulness_correlate(C, self._F_L)
+
+        # Computing the correlate of *saturation* :math:`s`.
+        s = saturation_correlate(M, Q)
+
+        return CIECAM02_Specification(J, C, h, s, Q, M, H, None)
+
+    def reverse(self, CIECAM02_specification):
+        """
+        Converts given *CIECAM02* specification to *CIE XYZ* tristimulus
+        values.
+
+        Parameters
+        ----------
+        CIECAM02_specification : CIECAM02_Specification
+            *CIECAM02* colour appearance model specification. Correlate of
+            *Lightness* :math:`J`, correlate of *chroma* :math:`C` or
+            correlate of *colourfulness* :math:`M` and *hue* angle :math:`h`
+            in degrees must be specified, e.g. :math:`JCh` or :math:`JMh`.
+
+        Returns
+        -------
+        ndarray
+            *CIE XYZ* tristimulus values.
+
+        Raises
+        ------
+        ValueError
+            If neither *C* or *M* correlates have been defined in the
+            ``CIECAM02_specification`` argument.
+        """
+
+        J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CIECAM02_specification,
+                                                    CIECAM02_Specification)
+
+        surround = self._surround
+
+        if C is None and M is not None:
+            C = M / self._F_L ** 0.25
+        elif C is None:
+            raise ValueError('Either "C" or "M" correlate must be defined in '
+                             'the "CIECAM02_specification" argument!')
+
+        # Computing temporary magnitude quantity :math:`t`.
+        t = temporary_magnitude_quantity_reverse(C, J, self._n)
+
+        # Computing eccentricity factor *e_t*.
+        e_t = eccentricity_factor(h)
+
+        # Computing achromatic response :math:`A` for the stimulus.
+        A = achromatic_response_reverse(self._A_w, J, surround.c, self._z)
+
+        # Computing *P_1* to *P_3*.
+        P_n = P(surround.N_c, self._N_cb, e_t, t, A, self._N_bb)
+        _P_1, P_2, _P_3 = tsplit(P_n)
+
+        # Computing opponent colour dimensions :math:`a` and :math:`b`.
+        a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
+
+        # Computing post-adaptation non linear response compression matrix.
+        RGB_a = post_adaptation_non_linear_response_compression_matrix(
+            P_2, a, b)
+
+        # Applying reverse post-adaptation non linear response compression.
+        RGB_p = post_adaptation_non_linear_response_compression_reverse(
+            RGB_a, self._F_L)
+
+        # Converting *Hunt-Pointer-Estevez* colourspace values to *CIE XYZ*
+        # tristimulus values.
+        XYZ = dot_vector(self._RGB_p_to_XYZ_matrix, RGB_p)
+
+        return XYZ
+
+
 def XYZ_to_CIECAM02(XYZ,
                     XYZ_w,
                     L_A,
@@ -244,67 +588,8 @@ def XYZ_to_CIECAM02(XYZ,
 s=2.3603053..., Q=195.3713259..., M=0.1088421..., H=278.0607358..., HC=None)
     """
 
-    _X_w, Y_w, _Z_w = tsplit(XYZ_w)
-    L_A = np.asarray(L_A)
-    Y_b = np.asarray(Y_b)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB = dot_vector(CAT02_CAT, XYZ)
-    RGB_w = dot_vector(CAT02_CAT, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
-
-    # Computing full chromatic adaptation.
-    RGB_c = full_chromatic_adaptation_forward(RGB, RGB_w, Y_w, D)
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_p = RGB_to_rgb(RGB_c)
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying forward post-adaptation non linear response compression.
-    RGB_a = post_adaptation_non_linear_response_compression_forward(RGB_p, F_L)
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Converting to preliminary cartesian coordinates.
-    a, b = tsplit(opponent_colour_dimensions_forward(RGB_a))
-
-    # Computing the *hue* angle :math:`h`.
-    h = hue_angle(a, b)
-
-    # Computing hue :math:`h` quadrature :math:`H`.
-    H = hue_quadrature(h)
-    # TODO: Compute hue composition.
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic responses for the stimulus and the whitepoint.
-    A = achromatic_response_forward(RGB_a, N_bb)
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Computing the correlate of *Lightness* :math:`J`.
-    J = lightness_correlate(A, A_w, surround.c, z)
-
-    # Computing the correlate of *brightness* :math:`Q`.
-    Q = brightness_correlate(surround.c, J, A_w, F_L)
-
-    # Computing the correlate of *chroma* :math:`C`.
-    C = chroma_correlate(J, n, surround.N_c, N_cb, e_t, a, b, RGB_a)
-
-    # Computing the correlate of *colourfulness* :math:`M`.
-    M = colourfulness_correlate(C, F_L)
-
-    # Computing the correlate of *saturation* :math:`s`.
-    s = saturation_correlate(M, Q)
-
-    return CIECAM02_Specification(J, C, h, s, Q, M, H, None)
+    return CIECAM02_Model(XYZ_w, L_A, Y_b, surround,
+                          discount_illuminant).forward(XYZ)
 
 
 def CIECAM02_to_XYZ(CIECAM02_specification,
@@ -378,73 +663,9 @@ def CIECAM02_to_XYZ(CIECAM02_specification,
     array([ 19.01...,  20...  ,  21.78...])
     """
 
-    J, C, h, _s, _Q, M, _H, _HC = as_namedtuple(CIECAM02_specification,
-                                                CIECAM02_Specification)
-
-    _X_w, Y_w, _Zw = tsplit(XYZ_w)
-
-    n, F_L, N_bb, N_cb, z = tsplit(
-        viewing_condition_dependent_parameters(Y_b, Y_w, L_A))
-
-    if C is None and M is not None:
-        C = M / F_L ** 0.25
-    elif C is None:
-        raise ValueError('Either "C" or "M" correlate must be defined in '
-                         'the "CIECAM02_specification" argument!')
-
-    # Converting *CIE XYZ* tristimulus values to *CMCCAT2000* transform
-    # sharpened *RGB* values.
-    RGB_w = dot_vector(CAT02_CAT, XYZ_w)
-
-    # Computing degree of adaptation :math:`D`.
-    D = degree_of_adaptation(surround.F, L_A) if not discount_illuminant else 1
-
-    # Computing full chromatic adaptation.
-    RGB_wc = full_chromatic_adaptation_forward(RGB_w, RGB_w, Y_w, D)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_pw = RGB_to_rgb(RGB_wc)
-
-    # Applying post-adaptation non linear response compression.
-    RGB_aw = post_adaptation_non_linear_response_compression_forward(
-        RGB_pw, F_L)
-
-    # Computing achromatic response for the whitepoint.
-    A_w = achromatic_response_forward(RGB_aw, N_bb)
-
-    # Computing temporary magnitude quantity :math:`t`.
-    t = temporary_magnitude_quantity_reverse(C, J, n)
-
-    # Computing eccentricity factor *e_t*.
-    e_t = eccentricity_factor(h)
-
-    # Computing achromatic response :math:`A` for the stimulus.
-    A = achromatic_response_reverse(A_w, J, surround.c, z)
-
-    # Computing *P_1* to *P_3*.
-    P_n = P(surround.N_c, N_cb, e_t, t, A, N_bb)
-    _P_1, P_2, _P_3 = tsplit(P_n)
-
-    # Computing opponent colour dimensions :math:`a` and :math:`b`.
-    a, b = tsplit(opponent_colour_dimensions_reverse(P_n, h))
-
-    # Computing post-adaptation non linear response compression matrix.
-    RGB_a = post_adaptation_non_linear_response_compression_matrix(P_2, a, b)
-
-    # Applying reverse post-adaptation non linear response compression.
-    RGB_p = post_adaptation_non_linear_response_compression_reverse(RGB_a, F_L)
-
-    # Converting to *Hunt-Pointer-Estevez* colourspace.
-    RGB_c = rgb_to_RGB(RGB_p)
-
-    # Applying reverse full chromatic adaptation.
-    RGB = full_chromatic_adaptation_reverse(RGB_c, RGB_w, Y_w, D)
-
-    # Converting *CMCCAT2000* transform sharpened *RGB* values to *CIE XYZ*
-    # tristimulus values.
-    XYZ = dot_vector(CAT02_INVERSE_CAT, RGB)
+    model = CIECAM02_Model(XYZ_w, L_A, Y_b, surround, discount_illuminant)
 
-    return XYZ
+    return model.reverse(CIECAM02_specification)
 
 
 def chromatic_induction_factors(n):
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.appearance.adapting_field` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from scipy.ndimage.filters import gaussian_filter
+
+from colour.adaptation import chromatic_adaptation
+from colour.appearance import XYZ_to_CAM16, XYZ_to_CIECAM02, XYZ_to_Hunt
+from colour.appearance.adapting_field import (
+    adapting_field, adapting_field_Gaussian, adapting_field_box,
+    box_filter_widths)
+from colour.utilities import suppress_warnings
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestBoxFilterWidths', 'TestAdaptingFieldGaussian', 'TestAdaptingFieldBox',
+    'TestAdaptingField'
+]
+
+
+class TestBoxFilterWidths(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.adapting_field.box_filter_widths`
+    definition unit tests methods.
+    """
+
+    def test_box_filter_widths(self):
+        """
+        Tests :func:`colour.appearance.adapting_field.box_filter_widths`
+        definition.
+        """
+
+        np.testing.assert_equal(box_filter_widths(8), np.array([15, 15, 17]))
+
+        np.testing.assert_equal(box_filter_widths(1), np.array([1, 1, 3]))
+
+        np.testing.assert_equal(
+            box_filter_widths(100, 4), np.array([173, 173, 173, 173]))
+
+        for sigma in (2, 10, 50, 240):
+            widths = box_filter_widths(sigma)
+            self.assertTrue(np.all(widths % 2 == 1))
+            self.assertLess(
+                np.abs(np.sqrt(np.sum((widths ** 2 - 1) / 12)) / sigma - 1),
+                0.1)
+
+
+class TestAdaptingFieldGaussian(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.adapting_field.adapting_field_Gaussian`
+    definition unit tests methods.
+    """
+
+    def test_adapting_field_Gaussian(self):
+        """
+        Tests :func:`colour.appearance.adapting_field.adapting_field_Gaussian`
+        definition.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 100, (32, 24, 3))
+
+        np.testing.assert_almost_equal(
+            adapting_field_Gaussian(XYZ, 3),
+            gaussian_filter(XYZ, (3, 3, 0)),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            adapting_field_Gaussian(XYZ[..., 1], 3),
+            gaussian_filter(XYZ[..., 1], 3),
+            decimal=7)
+
+
+class TestAdaptingFieldBox(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.adapting_field.adapting_field_box`
+    definition unit tests methods.
+    """
+
+    def test_adapting_field_box(self):
+        """
+        Tests :func:`colour.appearance.adapting_field.adapting_field_box`
+        definition.
+        """
+
+        XYZ = np.tile(np.array([95.05, 100.00, 108.88]), (16, 12, 1))
+        np.testing.assert_almost_equal(
+            adapting_field_box(XYZ, 4), XYZ, decimal=7)
+
+        # A single box filter pass is compared to a moving average.
+        Y = np.random.RandomState(4).uniform(0, 100, (9, 7))
+        Y_p = np.pad(Y, 1, 'symmetric')
+        Y_m = sum(Y_p[i:i + 9, j:j + 7] for i in range(3)
+                  for j in range(3)) / 9
+        np.testing.assert_almost_equal(
+            adapting_field_box(Y, np.sqrt(2 / 3), 1), Y_m, decimal=7)
+
+        # The successive box filters approximate a Gaussian filter.
+        impulse = np.zeros((101, 101))
+        impulse[50, 50] = 1
+        field = adapting_field_box(impulse, 8)
+        self.assertAlmostEqual(np.sum(field), 1, places=7)
+        np.testing.assert_allclose(
+            field, gaussian_filter(impulse, 8), atol=0.1 * np.max(field))
+
+
+class TestAdaptingField(unittest.TestCase):
+    """
+    Defines :func:`colour.appearance.adapting_field.adapting_field` definition
+    unit tests methods.
+    """
+
+    def test_adapting_field(self):
+        """
+        Tests :func:`colour.appearance.adapting_field.adapting_field`
+        definition.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0, 100, (16, 12, 3))
+
+        np.testing.assert_almost_equal(
+            adapting_field(XYZ, 3), adapting_field_box(XYZ, 3), decimal=7)
+
+        np.testing.assert_almost_equal(
+            adapting_field(XYZ, 3, 'Gaussian'),
+            adapting_field_Gaussian(XYZ, 3),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            adapting_field(XYZ, 3, passes=4),
+            adapting_field_box(XYZ, 3, 4),
+            decimal=7)
+
+    def test_spatially_varying_adaptation(self):
+        """
+        Tests the colour appearance models and chromatic adaptation support
+        for the per pixel adapting field.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(5, 95, (4, 5, 3))
+        XYZ_w = adapting_field(XYZ, 1)
+        L_A = XYZ_w[..., 1] * 0.2
+        Y_b = adapting_field(XYZ[..., 1], 2)
+        XYZ_wr = np.array([95.05, 100.00, 108.88])
+
+        definitions = (
+            lambda XYZ, XYZ_w, L_A, Y_b: np.stack(
+                XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_b)[:7], -1),
+            lambda XYZ, XYZ_w, L_A, Y_b: np.stack(
+                XYZ_to_CAM16(XYZ, XYZ_w, L_A, Y_b)[:7], -1),
+            lambda XYZ, XYZ_w, L_A, Y_b: np.stack(
+                np.broadcast_arrays(*XYZ_to_Hunt(
+                    XYZ, XYZ_w, XYZ_w * (Y_b / XYZ_w[..., 1])[..., np.newaxis],
+                    L_A, CCT_w=6504)[:6]), -1),
+            lambda XYZ, XYZ_w, L_A, Y_b: chromatic_adaptation(
+                XYZ, XYZ_w, XYZ_wr, 'CMCCAT2000', L_A1=L_A, L_A2=L_A),
+            lambda XYZ, XYZ_w, L_A, Y_b: chromatic_adaptation(
+                XYZ, XYZ_w, XYZ_wr),
+        )
+
+        with suppress_warnings():
+            for definition in definitions:
+                values = definition(XYZ, XYZ_w, L_A, Y_b)
+                for i, j in np.ndindex(XYZ.shape[:2]):
+                    np.testing.assert_almost_equal(
+                        values[i, j],
+                        definition(XYZ[i, j], XYZ_w[i, j], L_A[i, j],
+                                   Y_b[i, j]),
+                        decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
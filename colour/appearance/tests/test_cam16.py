@@ -7,10 +7,11 @@ Defines unit tests for :mod:`colour.appearance.cam16` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import (CAM16_InductionFactors, CAM16_Specification,
-                               XYZ_to_CAM16, CAM16_to_XYZ)
+                               CAM16_Model, XYZ_to_CAM16, CAM16_to_XYZ)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import as_namedtuple, ignore_numpy_errors, tsplit, tstack
 
@@ -23,7 +24,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCAM16ColourAppearanceModelForward',
-    'TestCAM16ColourAppearanceModelReverse'
+    'TestCAM16ColourAppearanceModelReverse', 'TestCAM16_Model'
 ]
 
 
@@ -214,3 +215,90 @@ class TestCAM16ColourAppearanceModelReverse(ColourAppearanceModelTest):
             surround = CAM16_InductionFactors(case[0], case[0], case[0])
             CAM16_to_XYZ(
                 CAM16_Specification(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestCAM16_Model(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.cam16.CAM16_Model` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w', 'L_A', 'Y_b', 'surround',
+                               'discount_illuminant', 'D', 'F_L', 'A_w')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CAM16_Model))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'reverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CAM16_Model))
+
+    def test_forward(self):
+        """
+        Tests :func:`colour.appearance.cam16.CAM16_Model.forward` method.
+        """
+
+        XYZ = np.array([19.01, 20.00, 21.78])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        model = CAM16_Model(XYZ_w, 318.31, 20.0)
+
+        np.testing.assert_almost_equal(
+            np.array(model.forward(XYZ)[:7]),
+            np.array([41.71802505, 11.94134464, 210.38389558, 25.35640363,
+                      193.06176731, 12.41285238, 267.09833455]),
+            decimal=7)
+
+        XYZ = np.tile(XYZ, (4, 5, 1))
+        np.testing.assert_almost_equal(
+            np.array(model.forward(XYZ)[:7]),
+            np.array(XYZ_to_CAM16(XYZ, XYZ_w, 318.31, 20.0)[:7]),
+            decimal=7)
+
+        XYZ_w = np.tile(XYZ_w, (4, 5, 1))
+        L_A = np.linspace(10, 1000, 20).reshape(4, 5)
+        np.testing.assert_almost_equal(
+            np.array(CAM16_Model(XYZ_w, L_A, 20.0, discount_illuminant=True)
+                     .forward(XYZ)[:7]),
+            np.array(
+                XYZ_to_CAM16(
+                    XYZ, XYZ_w, L_A, 20.0, discount_illuminant=True)[:7]),
+            decimal=7)
+
+    def test_reverse(self):
+        """
+        Tests :func:`colour.appearance.cam16.CAM16_Model.reverse` method.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(5, 95, (4, 5, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        model = CAM16_Model(XYZ_w, 318.31, 20.0)
+
+        specification = model.forward(XYZ)
+        np.testing.assert_almost_equal(
+            model.reverse(specification), XYZ, decimal=7)
+
+        J, _C, h, _s, _Q, M, _H, _HC = specification
+        np.testing.assert_almost_equal(
+            model.reverse(CAM16_Specification(J=J, M=M, h=h)), XYZ, decimal=7)
+
+    def test_raise_exception_reverse(self):
+        """
+        Tests :func:`colour.appearance.cam16.CAM16_Model.reverse` method raised
+        exception.
+        """
+
+        model = CAM16_Model(np.array([95.05, 100.00, 108.88]), 318.31, 20.0)
+
+        self.assertRaises(ValueError, model.reverse,
+                          CAM16_Specification(41.73, None, 219.04))
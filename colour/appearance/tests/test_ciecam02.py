@@ -7,11 +7,12 @@ Defines unit tests for :mod:`colour.appearance.ciecam02` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import unittest
 from itertools import permutations
 
 from colour.appearance import (CIECAM02_InductionFactors,
-                               CIECAM02_Specification, XYZ_to_CIECAM02,
-                               CIECAM02_to_XYZ)
+                               CIECAM02_Specification, CIECAM02_Model,
+                               XYZ_to_CIECAM02, CIECAM02_to_XYZ)
 from colour.appearance.tests.common import ColourAppearanceModelTest
 from colour.utilities import as_namedtuple, ignore_numpy_errors, tsplit, tstack
 
@@ -24,7 +25,7 @@ __status__ = 'Production'
 
 __all__ = [
     'TestCIECAM02ColourAppearanceModelForward',
-    'TestCIECAM02ColourAppearanceModelReverse'
+    'TestCIECAM02ColourAppearanceModelReverse', 'TestCIECAM02_Model'
 ]
 
 
@@ -212,3 +213,92 @@ class TestCIECAM02ColourAppearanceModelReverse(ColourAppearanceModelTest):
             surround = CIECAM02_InductionFactors(case[0], case[0], case[0])
             CIECAM02_to_XYZ(
                 CIECAM02_Specification(J, C, h), XYZ_w, L_A, Y_b, surround)
+
+
+class TestCIECAM02_Model(unittest.TestCase):
+    """
+    Defines :class:`colour.appearance.ciecam02.CIECAM02_Model` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('XYZ_w', 'L_A', 'Y_b', 'surround',
+                               'discount_illuminant', 'D', 'F_L', 'A_w')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CIECAM02_Model))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('forward', 'reverse')
+
+        for method in required_methods:
+            self.assertIn(method, dir(CIECAM02_Model))
+
+    def test_forward(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.forward` method.
+        """
+
+        XYZ = np.array([19.01, 20.00, 21.78])
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+
+        np.testing.assert_almost_equal(
+            np.array(model.forward(XYZ)[:7]),
+            np.array([41.73109113, 0.10470776, 219.04843266, 2.36030533,
+                      195.37132597, 0.10884218, 278.06073586]),
+            decimal=7)
+
+        XYZ = np.tile(XYZ, (4, 5, 1))
+        np.testing.assert_almost_equal(
+            np.array(model.forward(XYZ)[:7]),
+            np.array(XYZ_to_CIECAM02(XYZ, XYZ_w, 318.31, 20.0)[:7]),
+            decimal=7)
+
+        XYZ_w = np.tile(XYZ_w, (4, 5, 1))
+        L_A = np.linspace(10, 1000, 20).reshape(4, 5)
+        np.testing.assert_almost_equal(
+            np.array(CIECAM02_Model(XYZ_w, L_A, 20.0, discount_illuminant=True)
+                     .forward(XYZ)[:7]),
+            np.array(
+                XYZ_to_CIECAM02(
+                    XYZ, XYZ_w, L_A, 20.0, discount_illuminant=True)[:7]),
+            decimal=7)
+
+    def test_reverse(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.reverse` method.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(5, 95, (4, 5, 3))
+        XYZ_w = np.array([95.05, 100.00, 108.88])
+        model = CIECAM02_Model(XYZ_w, 318.31, 20.0)
+
+        specification = model.forward(XYZ)
+        np.testing.assert_almost_equal(
+            model.reverse(specification), XYZ, decimal=7)
+
+        J, _C, h, _s, _Q, M, _H, _HC = specification
+        np.testing.assert_almost_equal(
+            model.reverse(CIECAM02_Specification(J=J, M=M, h=h)),
+            XYZ,
+            decimal=7)
+
+    def test_raise_exception_reverse(self):
+        """
+        Tests :func:`colour.appearance.ciecam02.CIECAM02_Model.reverse` method
+        raised exception.
+        """
+
+        model = CIECAM02_Model(np.array([95.05, 100.00, 108.88]), 318.31, 20.0)
+
+        self.assertRaises(ValueError, model.reverse,
+                          CIECAM02_Specification(41.73, None, 219.04))
@@ -129,6 +129,14 @@ class TestMultiSignal(unittest.TestCase):
                       [30.0, 40.0, 50.0]]) * 10,
             decimal=7)
 
+        range_ = np.random.RandomState(4).random_sample((10, 40))
+        multi_signal = MultiSignal(range_)
+
+        np.testing.assert_array_equal(multi_signal.range, range_)
+
+        np.testing.assert_almost_equal(
+            multi_signal[np.array([0, 1, 2])], range_[0:3], decimal=7)
+
     def test_interpolator(self):
         """
         Tests :func:`colour.continuous.multi_signal.MultiSignal.interpolator`
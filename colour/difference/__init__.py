@@ -33,11 +33,16 @@ from .delta_e_cam02_ucs import (delta_E_CAM02LCD, delta_E_CAM02SCD,
                                 delta_E_CAM02UCS)
 from .delta_e_cam16_ucs import (delta_E_CAM16LCD, delta_E_CAM16SCD,
                                 delta_E_CAM16UCS)
+from .streaming import DeltaE_Statistics, delta_E_image, delta_E_UCS_image
+from .search import DeltaE_Index
+
 __all__ = [
     'delta_E_CIE1976', 'delta_E_CIE1994', 'delta_E_CIE2000', 'delta_E_CMC'
 ]
 __all__ += ['delta_E_CAM02LCD', 'delta_E_CAM02SCD', 'delta_E_CAM02UCS']
 __all__ += ['delta_E_CAM16LCD', 'delta_E_CAM16SCD', 'delta_E_CAM16UCS']
+__all__ += ['DeltaE_Statistics', 'delta_E_image', 'delta_E_UCS_image']
+__all__ += ['DeltaE_Index']
 
 DELTA_E_METHODS = CaseInsensitiveMapping({
     'CIE 1976': delta_E_CIE1976,
@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+"""
+Nearest Colour Search
+=====================
+
+Defines the objects searching the nearest colours of a palette, e.g. a paint
+fan deck or the :attr:`colour.COLOURCHECKERS` patches, according to a colour
+difference :math:`\\Delta E_{ab}` computation method:
+
+-   :class:`colour.difference.DeltaE_Index`
+
+The palette colours are indexed with a *k-d tree* in the computation method
+colourspace, i.e. *CIE L\\*a\\*b\\** or :math:`J'a'b'`. For each searched
+colour, the Euclidean distance :math:`\\Delta E_{76}` is conservatively bounded
+by the computation method colour difference scaled by a factor depending on
+the searched colour and the palette extent, the *k-d tree* candidates are then
+refined with the exact colour difference.
+
+References
+----------
+-   :cite:`Bentley1975a` : Bentley, J. L. (1975). Multidimensional binary
+    search trees used for associative searching. Communications of the ACM,
+    18(9), 509-517. doi:10.1145/361002.361007
+-   :cite:`Sharma2005b` : Sharma, G., Wu, W., & Dalal, E. N. (2005). The
+    CIEDE2000 color-difference formula: Implementation notes, supplementary
+    test data, and mathematical observations. Color Research & Application,
+    30(1), 21-30. doi:10.1002/col.20070
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from functools import partial
+from scipy.spatial import cKDTree
+
+from colour.difference.delta_e import (delta_E_CIE1976, delta_E_CIE1994,
+                                       delta_E_CIE2000, delta_E_CMC)
+from colour.difference.delta_e_cam02_ucs import (
+    delta_E_CAM02LCD, delta_E_CAM02SCD, delta_E_CAM02UCS)
+from colour.models.cam02_ucs import COEFFICIENTS_UCS_LUO2006
+from colour.utilities import TILE_SIZE, as_float_array, filter_kwargs, tsplit
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['DeltaE_Index']
+
+
+def _bound_CIE1976(Lab, radii, L_p, C_p):
+    """
+    Returns the factors bounding :math:`\\Delta E_{76}` by the *CIE 1976*
+    colour difference, i.e. 1.
+    """
+
+    return np.ones(Lab.shape[:-1])
+
+
+def _bound_CIE1994(Lab, radii, L_p, C_p, textiles=False):
+    """
+    Returns the factors bounding :math:`\\Delta E_{76}` by the *CIE 1994*
+    colour difference of given reference colours.
+    """
+
+    k_1 = 0.048 if textiles else 0.045
+    k_L = 2 if textiles else 1
+
+    _L, a, b = tsplit(Lab)
+
+    # :math:`S_H\\leq S_C` and :math:`\\Delta C^2+\\Delta H^2` is the squared
+    # :math:`ab` Euclidean distance.
+    return np.maximum(k_L, 1 + k_1 * np.hypot(a, b))
+
+
+def _bound_CIE2000(Lab, radii, L_p, C_p, textiles=False):
+    """
+    Returns the factors bounding :math:`\\Delta E_{76}` by the *CIE 2000*
+    colour difference of given colours to the palette colours within given
+    :math:`\\Delta E_{76}` radii, the palette lightness range and chroma
+    maximum.
+    """
+
+    k_L = 2 if textiles else 1
+
+    L, a, b = tsplit(Lab)
+    C = np.hypot(a, b)
+
+    L_bar = np.maximum(
+        np.abs((L + np.maximum(L_p[0], L - radii)) / 2 - 50),
+        np.abs((L + np.minimum(L_p[1], L + radii)) / 2 - 50))
+    s_L = 1 + 0.015 * L_bar ** 2 / np.sqrt(20 + L_bar ** 2)
+
+    # :math:`a'=(1+G)a` where :math:`G` decreases with :math:`\\bar{C}`, thus
+    # :math:`\\bar{C}'\\leq(1+G)\\bar{C}` which increases with
+    # :math:`\\bar{C}`, and the :math:`a'b'` Euclidean distance, i.e.
+    # :math:`\\sqrt{\\Delta C'^2+\\Delta H'^2}`, is greater than the :math:`ab`
+    # one.
+    def G(C_bar):
+        """
+        Returns the :math:`G` factor of given mean chroma.
+        """
+
+        C_bar7 = C_bar ** 7
+        return 0.5 * (1 - np.sqrt(C_bar7 / (C_bar7 + 25 ** 7)))
+
+    C_bar = (C + np.minimum(C_p, C + radii)) / 2
+    C_bar_prime = (1 + G(C_bar)) * C_bar
+    s_C = 1 + 0.045 * C_bar_prime
+
+    # :math:`S_H\\leq S_C` as :math:`T\\leq1.93`, the rotation term is bounded
+    # with :math:`|R_T|\\leq2R_C\\sin(2\\Delta\\theta)` where
+    # :math:`\\Delta\\theta` is maximised over the range of :math:`\\bar{h}'`:
+    # :math:`h'` is between the hues for :math:`G=0` and the :math:`G` maximum
+    # and the palette colours hues are within :math:`\\delta` of it.
+    C_bar_prime7 = C_bar_prime ** 7
+    r_C = np.sqrt(C_bar_prime7 / (C_bar_prime7 + 25 ** 7))
+
+    G_m = 1 + G((C + np.maximum(C - radii, 0)) / 2)
+    h = np.degrees(np.arctan2(b, a))
+    h_d = (np.degrees(np.arctan2(b, G_m * a)) - h + 180) % 360 - 180
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = np.where(G_m * radii < C,
+                         np.degrees(np.arcsin(G_m * radii / C)), 180)
+    h_w = np.abs(h_d) / 2 + delta / 2
+    h_c = np.abs((h + h_d / 2 - 275 + 180) % 360 - 180)
+    delta_theta = 30 * np.exp(-(np.maximum(h_c - h_w, 0) / 25) ** 2)
+
+    return np.maximum(
+        k_L * s_L,
+        s_C / np.sqrt(1 - r_C * np.sin(np.radians(2 * delta_theta))))
+
+
+def _bound_CMC(Lab, radii, L_p, C_p, l=2, c=1):  # noqa
+    """
+    Returns the factors bounding :math:`\\Delta E_{76}` by the *CMC* colour
+    difference of given reference colours.
+    """
+
+    L, a, b = tsplit(Lab)
+    C = np.hypot(a, b)
+
+    s_l = np.where(L < 16, 0.511, (0.040975 * L) / (1 + 0.01765 * L))
+    s_c = 0.0638 * C / (1 + 0.0131 * C) + 0.638
+
+    # :math:`S_H\\leq S_C` as :math:`T\\leq0.76`.
+    return np.maximum(np.maximum(l * s_l, c * s_c), s_c)
+
+
+def _bound_Luo2006(coefficients):
+    """
+    Returns a callable returning the factors bounding :math:`\\Delta E_{76}` by
+    the *Luo et alii (2006)* colour difference with given coefficients.
+    """
+
+    def bound(Jpapbp, radii, L_p, C_p):
+        """
+        Returns the factors bounding :math:`\\Delta E_{76}`.
+        """
+
+        return np.full(Jpapbp.shape[:-1], max(coefficients[0], 1))
+
+    return bound
+
+
+_DELTA_E_BOUNDS = {
+    delta_E_CIE1976:
+        _bound_CIE1976,
+    delta_E_CIE1994:
+        _bound_CIE1994,
+    delta_E_CIE2000:
+        _bound_CIE2000,
+    delta_E_CMC:
+        _bound_CMC,
+    delta_E_CAM02LCD:
+        _bound_Luo2006(COEFFICIENTS_UCS_LUO2006['CAM02-LCD']),
+    delta_E_CAM02SCD:
+        _bound_Luo2006(COEFFICIENTS_UCS_LUO2006['CAM02-SCD']),
+    delta_E_CAM02UCS:
+        _bound_Luo2006(COEFFICIENTS_UCS_LUO2006['CAM02-UCS']),
+}
+"""
+Factors bounding :math:`\\Delta E_{76}` by the colour difference computation
+methods, the *CAM16* methods are the *CAM02* ones.
+
+_DELTA_E_BOUNDS : dict
+"""
+
+_BOUND_TOLERANCE = 1 + 1e-7
+"""
+Tolerance applied to the bounds to absorb the floating point errors.
+
+_BOUND_TOLERANCE : numeric
+"""
+
+
+class DeltaE_Index(object):
+    """
+    Indexes a palette of colours for nearest colour searches according to
+    given colour difference :math:`\\Delta E_{ab}` computation method.
+
+    The searched colours are the reference colours, i.e. the first argument of
+    the computation method, and the palette colours the sample colours.
+
+    Parameters
+    ----------
+    palette : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace palette colours of
+        shape (N, 3).
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS'}**
+        Computation method, see :attr:`colour.DELTA_E_METHODS` attribute.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the computation method, see
+        :func:`colour.delta_E` definition.
+
+    Attributes
+    ----------
+    palette
+    method
+
+    Methods
+    -------
+    query
+    query_radius
+
+    Notes
+    -----
+    -   The searches are exact: the *k-d tree* only prefilters the candidates
+        whose colour difference is then computed with the computation method.
+    -   The searched colours are processed by chunks so that the candidates
+        colour differences arrays hold at most ``tile_size`` elements.
+
+    References
+    ----------
+    -   :cite:`Bentley1975a`
+    -   :cite:`Sharma2005b`
+
+    Examples
+    --------
+    >>> from colour import COLOURCHECKERS, xyY_to_XYZ, XYZ_to_Lab
+    >>> _name, data, illuminant = COLOURCHECKERS['ColorChecker 2005']
+    >>> Lab_p = XYZ_to_Lab(
+    ...     xyY_to_XYZ(np.array([value[2] for value in data])), illuminant)
+    >>> index = DeltaE_Index(Lab_p)
+    >>> Lab = np.array([[50.0, 50.0, 0.0], [30.0, -10.0, -20.0]])
+    >>> delta_E, indexes = index.query(Lab)
+    >>> delta_E  # doctest: +ELLIPSIS
+    array([  7.2006217...,  11.1426951...])
+    >>> indexes
+    array([16, 12])
+    """
+
+    def __init__(self, palette, method='CIE 2000', **kwargs):
+        from colour.difference import DELTA_E_METHODS
+
+        self._palette = as_float_array(palette).reshape(-1, 3)
+        self._method = method
+
+        function = DELTA_E_METHODS[method]
+        self._delta_E = partial(function, **filter_kwargs(function, **kwargs))
+        bound = _DELTA_E_BOUNDS[function]
+        self._bound = partial(bound, **filter_kwargs(bound, **kwargs))
+
+        self._tree = cKDTree(self._palette)
+
+        L_p, a_p, b_p = tsplit(self._palette)
+        self._L_p = np.array([np.min(L_p), np.max(L_p)])
+        self._C_p = np.max(np.hypot(a_p, b_p))
+
+    @property
+    def palette(self):
+        """
+        Getter property for the palette colours.
+
+        Returns
+        -------
+        ndarray
+            Palette colours.
+        """
+
+        return self._palette
+
+    @property
+    def method(self):
+        """
+        Getter property for the colour difference computation method.
+
+        Returns
+        -------
+        unicode
+            Colour difference computation method.
+        """
+
+        return self._method
+
+    def _radii(self, a, delta_E):
+        """
+        Returns the :math:`\\Delta E_{76}` radii around given searched colours
+        containing the palette colours whose colour difference is lower than
+        or equal to given colour differences.
+        """
+
+        # The bounds may depend on the palette colours within the radii, they
+        # are thus successively refined.
+        radii = np.full(a.shape[:-1], np.inf)
+        for _i in range(4):
+            radii = np.minimum(
+                radii,
+                self._bound(a, radii, self._L_p, self._C_p) * delta_E)
+
+        return radii * _BOUND_TOLERANCE
+
+    def _ball(self, a, radii, tile_size):
+        """
+        Returns the searched colours rows, indexes and colour differences of
+        the palette colours within given :math:`\\Delta E_{76}` radii around
+        given searched colours, sorted by row and increasing colour difference.
+        """
+
+        # The searched colours are grouped by similar radii as the *k-d tree*
+        # radius must be a scalar, each group holding at most ``tile_size``
+        # candidates.
+        order = np.argsort(radii)
+        group_size = max(int(tile_size) // self._palette.shape[0], 1)
+
+        rows, indexes, delta_E = [], [], []
+        for start in range(0, order.size, group_size):
+            group = order[start:start + group_size]
+            balls = self._tree.query_ball_point(a[group],
+                                                np.max(radii[group]))
+            counts = np.array([len(ball) for ball in balls], np.int_)
+
+            rows.append(np.repeat(group, counts))
+            indexes.append(
+                np.array([i for ball in balls for i in ball], np.int_))
+            delta_E.append(
+                self._delta_E(a[rows[-1]], self._palette[indexes[-1]]))
+
+        rows, indexes, delta_E = (np.concatenate(rows),
+                                  np.concatenate(indexes),
+                                  np.concatenate(delta_E))
+        order = np.lexsort((delta_E, rows))
+
+        return rows[order], indexes[order], delta_E[order]
+
+    def _query_chunk(self, a, k, tile_size):
+        """
+        Returns the colour differences and indexes of the ``k`` nearest
+        palette colours of given searched colours chunk.
+        """
+
+        count = self._palette.shape[0]
+        candidates = min(max(4 * k, 16), count)
+
+        distances, indexes = self._tree.query(a, candidates)
+        distances = np.reshape(distances, (-1, candidates))
+        indexes = np.reshape(indexes, (-1, candidates))
+
+        delta_E = self._delta_E(
+            np.broadcast_to(a[:, np.newaxis], indexes.shape + (3, )),
+            self._palette[indexes])
+
+        rows = np.arange(a.shape[0])[:, np.newaxis]
+        order = np.argsort(delta_E, axis=-1)[:, :k]
+        delta_E, indexes = delta_E[rows, order], indexes[rows, order]
+
+        # The search is complete when the palette colours that are not
+        # candidates are outside the radius bounding the k-th colour
+        # difference, the other searched colours are refined with all the
+        # palette colours within the radius.
+        radii = self._radii(a, delta_E[:, -1])
+        incomplete = np.logical_and(candidates < count,
+                                    radii >= distances[:, -1])
+        if np.any(incomplete):
+            incomplete = np.where(incomplete)[0]
+            rows, ball_indexes, ball_delta_E = self._ball(
+                a[incomplete], radii[incomplete], tile_size)
+
+            starts = np.searchsorted(rows, np.arange(incomplete.size))
+            nearest = starts[:, np.newaxis] + np.arange(k)
+            delta_E[incomplete] = ball_delta_E[nearest]
+            indexes[incomplete] = ball_indexes[nearest]
+
+        return delta_E, indexes
+
+    def query(self, a, k=1, tile_size=TILE_SIZE):
+        """
+        Searches the ``k`` nearest palette colours of given colours.
+
+        Parameters
+        ----------
+        a : array_like
+            *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace colours to search
+            the nearest palette colours of.
+        k : int, optional
+            Count of nearest palette colours to search.
+        tile_size : integer, optional
+            Maximum count of colour differences computed at once.
+
+        Returns
+        -------
+        tuple
+            Colour differences :math:`\\Delta E_{ab}` and indexes of the
+            nearest palette colours sorted by increasing colour difference,
+            the last dimension of size ``k`` is squeezed when ``k`` is 1.
+
+        Examples
+        --------
+        >>> palette = np.array([[50.0, 0.0, 0.0], [50.0, 10.0, 0.0],
+        ...                     [60.0, 0.0, 0.0]])
+        >>> index = DeltaE_Index(palette, 'CIE 1976')
+        >>> index.query(np.array([52.0, 1.0, 0.0]), 2)
+        ... # doctest: +ELLIPSIS
+        (array([ 2.2360679...,  8.0622577...]), array([0, 2]))
+        """
+
+        a = as_float_array(a)
+        shape = a.shape[:-1]
+        a = np.reshape(a, (-1, 3))
+
+        k = min(int(k), self._palette.shape[0])
+        chunk_size = max(int(tile_size) // max(4 * k, 16), 1)
+
+        delta_E = np.empty((a.shape[0], k))
+        indexes = np.empty((a.shape[0], k), np.int_)
+        for start in range(0, a.shape[0], chunk_size):
+            chunk = slice(start, start + chunk_size)
+            delta_E[chunk], indexes[chunk] = self._query_chunk(
+                a[chunk], k, tile_size)
+
+        shape = shape if k == 1 else shape + (k, )
+
+        return np.reshape(delta_E, shape), np.reshape(indexes, shape)
+
+    def query_radius(self, a, radius, tile_size=TILE_SIZE):
+        """
+        Searches the palette colours whose colour difference to given colours
+        is lower than or equal to given radius.
+
+        Parameters
+        ----------
+        a : array_like
+            *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace colours to search
+            the palette colours around.
+        radius : numeric
+            Colour difference :math:`\\Delta E_{ab}` radius.
+        tile_size : integer, optional
+            Maximum count of colour differences computed at once.
+
+        Returns
+        -------
+        tuple
+            Colour differences :math:`\\Delta E_{ab}` and indexes of the
+            palette colours sorted by increasing colour difference, as arrays
+            for a single colour or object arrays of arrays otherwise.
+
+        Examples
+        --------
+        >>> palette = np.array([[50.0, 0.0, 0.0], [50.0, 10.0, 0.0],
+        ...                     [60.0, 0.0, 0.0]])
+        >>> index = DeltaE_Index(palette, 'CIE 1976')
+        >>> index.query_radius(np.array([52.0, 1.0, 0.0]), 5)
+        ... # doctest: +ELLIPSIS
+        (array([ 2.2360679...]), array([0]))
+        """
+
+        a = as_float_array(a)
+        shape = a.shape[:-1]
+        a = np.reshape(a, (-1, 3))
+
+        delta_E = np.empty(a.shape[0], np.object_)
+        indexes = np.empty(a.shape[0], np.object_)
+        chunk_size = max(int(tile_size) // 16, 1)
+        for start in range(0, a.shape[0], chunk_size):
+            a_c = a[start:start + chunk_size]
+            rows, ball_indexes, ball_delta_E = self._ball(
+                a_c, self._radii(a_c, np.full(a_c.shape[0], radius)),
+                tile_size)
+
+            within = ball_delta_E <= radius
+            rows, ball_indexes, ball_delta_E = (rows[within],
+                                                ball_indexes[within],
+                                                ball_delta_E[within])
+
+            splits = np.searchsorted(rows, np.arange(1, a_c.shape[0]))
+            for i, (delta_E_c, indexes_c) in enumerate(
+                    zip(
+                        np.split(ball_delta_E, splits),
+                        np.split(ball_indexes, splits))):
+                delta_E[start + i] = delta_E_c
+                indexes[start + i] = indexes_c
+
+        if shape == ():
+            return delta_E[0], indexes[0]
+
+        return np.reshape(delta_E, shape), np.reshape(indexes, shape)
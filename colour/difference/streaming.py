@@ -0,0 +1,619 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming Colour Difference
+===========================
+
+Defines the objects computing the colour difference between images tile by
+tile and reducing it on the fly:
+
+-   :class:`colour.difference.DeltaE_Statistics`
+-   :func:`colour.difference.delta_E_image`
+-   :func:`colour.difference.delta_E_UCS_image`
+
+References
+----------
+-   :cite:`Li2017` : Li, C., Li, Z., Wang, Z., Xu, Y., Luo, M. R., Cui, G.,
+    Pointer, M. (2017). Comprehensive color solutions: CAM16, CAT16, and
+    CAM16-UCS. Color Research & Application, 42(6), 703-718.
+    doi:10.1002/col.22131
+-   :cite:`Luo2006b` : Luo, M. R., Cui, G., & Li, C. (2006). Uniform colour
+    spaces based on CIECAM02 colour appearance model. Color Research &
+    Application, 31(4), 320-330. doi:10.1002/col.20227
+-   :cite:`Masson2019a` : Masson, C., Rim, J. E., & Lee, H. K. (2019).
+    DDSketch: A fast and fully-mergeable quantile sketch with relative-error
+    guarantees. Proceedings of the VLDB Endowment, 12(12), 2195-2205.
+    doi:10.14778/3352063.3352135
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import threading
+from functools import partial
+
+from colour.appearance import (CAM16_Model, CAM16_VIEWING_CONDITIONS,
+                               CIECAM02_Model, CIECAM02_VIEWING_CONDITIONS)
+from colour.difference.delta_e_cam02_ucs import delta_E_Luo2006
+from colour.models.cam02_ucs import (COEFFICIENTS_UCS_LUO2006,
+                                     JMh_CIECAM02_to_UCS_Luo2006)
+from colour.utilities import (CaseInsensitiveMapping, TILE_SIZE, apply_tiled,
+                              as_float_array, filter_kwargs, tstack)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['DeltaE_Statistics', 'delta_E_image', 'delta_E_UCS_image']
+
+_DELTA_E_UCS_IMAGE_MODELS = CaseInsensitiveMapping({
+    'CAM02-LCD': (CIECAM02_Model, CIECAM02_VIEWING_CONDITIONS, 'CAM02-LCD'),
+    'CAM02-SCD': (CIECAM02_Model, CIECAM02_VIEWING_CONDITIONS, 'CAM02-SCD'),
+    'CAM02-UCS': (CIECAM02_Model, CIECAM02_VIEWING_CONDITIONS, 'CAM02-UCS'),
+    'CAM16-LCD': (CAM16_Model, CAM16_VIEWING_CONDITIONS, 'CAM02-LCD'),
+    'CAM16-SCD': (CAM16_Model, CAM16_VIEWING_CONDITIONS, 'CAM02-SCD'),
+    'CAM16-UCS': (CAM16_Model, CAM16_VIEWING_CONDITIONS, 'CAM02-UCS'),
+})
+"""
+Colour appearance model, viewing conditions and *Luo et alii (2006)* fitting
+coefficients of the colourspaces supported by
+:func:`colour.difference.delta_E_UCS_image` definition.
+
+_DELTA_E_UCS_IMAGE_MODELS : CaseInsensitiveMapping
+    **{'CAM02-UCS', 'CAM02-LCD', 'CAM02-SCD', 'CAM16-UCS', 'CAM16-LCD',
+    'CAM16-SCD'}**
+"""
+
+
+class DeltaE_Statistics(object):
+    """
+    Accumulates the statistics of colour differences :math:`\\Delta E`
+    streamed by successive batches, e.g. image tiles, without storing them.
+
+    The percentiles are estimated with a logarithmically binned histogram
+    sketch whose estimates have a bounded relative error.
+
+    Parameters
+    ----------
+    relative_accuracy : numeric, optional
+        Relative accuracy :math:`\\alpha` of the percentiles estimates.
+
+    Attributes
+    ----------
+    relative_accuracy
+    count
+    mean
+    minimum
+    maximum
+
+    Methods
+    -------
+    update
+    merge
+    percentile
+
+    Notes
+    -----
+    -   The non-finite colour differences are ignored.
+    -   The colour differences lower than *1e-9* are accumulated as zero.
+    -   The instances are thread-safe.
+
+    References
+    ----------
+    -   :cite:`Masson2019a`
+
+    Examples
+    --------
+    >>> statistics = DeltaE_Statistics()
+    >>> statistics.update(np.linspace(0, 10, 1001))
+    >>> statistics.update(np.linspace(10, 20, 1001))
+    >>> statistics.count
+    2002
+    >>> statistics.mean  # doctest: +ELLIPSIS
+    10.0
+    >>> statistics.percentile([50, 95])  # doctest: +ELLIPSIS
+    array([ 10.0041526...,  18.9726881...])
+    """
+
+    _MINIMUM_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy=0.001):
+        self._relative_accuracy = relative_accuracy
+        self._log_gamma = np.log(
+            (1 + relative_accuracy) / (1 - relative_accuracy))
+
+        self._count = 0
+        self._sum = 0.0
+        self._minimum = np.inf
+        self._maximum = -np.inf
+        self._zero_count = 0
+        self._bins = np.zeros(0, np.int64)
+        self._offset = 0
+
+        self._lock = threading.Lock()
+
+    @property
+    def relative_accuracy(self):
+        """
+        Getter property for the relative accuracy of the percentiles
+        estimates.
+
+        Returns
+        -------
+        numeric
+            Relative accuracy.
+        """
+
+        return self._relative_accuracy
+
+    @property
+    def count(self):
+        """
+        Getter property for the count of accumulated colour differences.
+
+        Returns
+        -------
+        int
+            Count of accumulated colour differences.
+        """
+
+        return self._count
+
+    @property
+    def mean(self):
+        """
+        Getter property for the mean colour difference.
+
+        Returns
+        -------
+        numeric
+            Mean colour difference.
+        """
+
+        return self._sum / self._count if self._count else np.nan
+
+    @property
+    def minimum(self):
+        """
+        Getter property for the minimum colour difference.
+
+        Returns
+        -------
+        numeric
+            Minimum colour difference.
+        """
+
+        return self._minimum if self._count else np.nan
+
+    @property
+    def maximum(self):
+        """
+        Getter property for the maximum colour difference.
+
+        Returns
+        -------
+        numeric
+            Maximum colour difference.
+        """
+
+        return self._maximum if self._count else np.nan
+
+    def _add(self, count, sum_, minimum, maximum, zero_count, bins, offset):
+        """
+        Adds given partial statistics, the caller must hold the lock.
+        """
+
+        self._count += count
+        self._sum += sum_
+        self._minimum = min(self._minimum, minimum)
+        self._maximum = max(self._maximum, maximum)
+        self._zero_count += zero_count
+
+        if bins.size == 0:
+            return
+
+        if self._bins.size == 0:
+            self._bins, self._offset = bins.copy(), offset
+            return
+
+        start = min(self._offset, offset)
+        end = max(self._offset + self._bins.size, offset + bins.size)
+        if start != self._offset or end != self._offset + self._bins.size:
+            extended = np.zeros(end - start, np.int64)
+            extended[self._offset - start:self._offset - start +
+                     self._bins.size] = self._bins
+            self._bins, self._offset = extended, start
+
+        self._bins[offset - self._offset:offset - self._offset +
+                   bins.size] += bins
+
+    def update(self, delta_E):
+        """
+        Accumulates given colour differences.
+
+        Parameters
+        ----------
+        delta_E : array_like
+            Colour differences :math:`\\Delta E`.
+        """
+
+        delta_E = np.ravel(delta_E)
+        delta_E = delta_E[np.isfinite(delta_E)]
+
+        if delta_E.size == 0:
+            return
+
+        positive = delta_E[delta_E > self._MINIMUM_VALUE]
+        bins, offset = np.zeros(0, np.int64), 0
+        if positive.size:
+            indexes = np.ceil(np.log(positive) / self._log_gamma)
+            indexes = indexes.astype(np.int64)
+            offset = np.min(indexes)
+            bins = np.bincount(indexes - offset).astype(np.int64)
+
+        with self._lock:
+            self._add(delta_E.size, float(np.sum(delta_E, dtype=np.float64)),
+                      float(np.min(delta_E)), float(np.max(delta_E)),
+                      delta_E.size - positive.size, bins, offset)
+
+    def merge(self, statistics):
+        """
+        Accumulates given statistics, e.g. computed by another process.
+
+        Parameters
+        ----------
+        statistics : DeltaE_Statistics
+            Statistics to accumulate, they must have the same relative
+            accuracy.
+
+        Raises
+        ------
+        ValueError
+            If the statistics relative accuracy is different.
+        """
+
+        if statistics.relative_accuracy != self._relative_accuracy:
+            raise ValueError(
+                'Statistics with different relative accuracies cannot be '
+                'merged!')
+
+        with statistics._lock:
+            partial = (statistics._count, statistics._sum,
+                       statistics._minimum, statistics._maximum,
+                       statistics._zero_count, statistics._bins.copy(),
+                       statistics._offset)
+
+        with self._lock:
+            self._add(*partial)
+
+    def percentile(self, q):
+        """
+        Returns the estimated percentiles of the accumulated colour
+        differences.
+
+        Parameters
+        ----------
+        q : numeric or array_like
+            Percentiles to compute in domain [0, 100].
+
+        Returns
+        -------
+        numeric or ndarray
+            Percentiles estimates, their relative error to the exact
+            percentiles, as returned by :func:`numpy.percentile` definition
+            with *lower* interpolation, is bounded by the relative accuracy.
+        """
+
+        q = np.asarray(q)
+
+        if self._count == 0:
+            return np.full(q.shape, np.nan)[()]
+
+        with self._lock:
+            ranks = np.floor(q / 100 * (self._count - 1))
+            cumulative = self._zero_count + np.cumsum(self._bins)
+
+            indexes = np.searchsorted(cumulative, ranks, side='right')
+            indexes = np.minimum(indexes, self._bins.size - 1)
+            gamma = np.exp(self._log_gamma)
+            values = (2 * gamma ** (indexes + self._offset) / (gamma + 1)
+                      if self._bins.size else np.zeros(q.shape))
+            values = np.where(ranks < self._zero_count, 0, values)
+            values = np.clip(values, self._minimum, self._maximum)
+
+        return values[()]
+
+
+def _reduce_tile(delta_E, statistics, threshold, map_required):
+    """
+    Accumulates given tile colour difference in given statistics and returns
+    the tile output, i.e. the colour difference, its thresholded mask or an
+    empty per-pixel output when no map is required.
+    """
+
+    if statistics is not None:
+        statistics.update(delta_E)
+
+    if not map_required:
+        return np.empty((delta_E.shape[0], 0), delta_E.dtype)
+
+    return delta_E if threshold is None else delta_E > threshold
+
+
+def _reduce_image(function, arrays, statistics, threshold, out, tile_size,
+                  workers, **kwargs):
+    """
+    Applies given tile function to given arrays with
+    :func:`colour.utilities.apply_tiled` definition and returns the colour
+    difference map, its thresholded mask and / or the statistics.
+    """
+
+    # In the statistics only mode, the tiles return an empty per-pixel output
+    # so that no colour difference map is allocated.
+    map_required = (statistics is None or threshold is not None or
+                    out is not None)
+    output = apply_tiled(
+        function,
+        tuple(as_float_array(a) for a in arrays),
+        out=out,
+        tile_size=tile_size,
+        workers=workers,
+        statistics=statistics,
+        threshold=threshold,
+        map_required=map_required,
+        **kwargs)
+
+    if statistics is None:
+        return output
+    elif threshold is None:
+        return statistics
+    else:
+        return statistics, output
+
+
+def _delta_E_tile(a, b, delta_E, statistics, threshold, map_required):
+    """
+    Computes the colour difference :math:`\\Delta E` of given tiles with given
+    definition and reduces it.
+    """
+
+    return _reduce_tile(
+        as_float_array(delta_E(a, b)), statistics, threshold, map_required)
+
+
+def delta_E_image(a,
+                  b,
+                  method='CIE 2000',
+                  statistics=None,
+                  threshold=None,
+                  out=None,
+                  tile_size=TILE_SIZE,
+                  workers=None,
+                  **kwargs):
+    """
+    Computes the colour difference :math:`\\Delta E_{ab}` between two given
+    *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace images using given
+    method.
+
+    The images are processed tile by tile so that the intermediate arrays of
+    the computation method only hold a tile at a time, the colour difference
+    is optionally reduced on the fly to statistics and / or a thresholded
+    mask instead of being returned as a full resolution map.
+
+    Parameters
+    ----------
+    a : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace image :math:`a`.
+    b : array_like
+        *CIE L\\*a\\*b\\** or :math:`J'a'b'` colourspace image :math:`b`.
+    method : unicode, optional
+        **{'CIE 2000', 'CIE 1976', 'CIE 1994', 'CMC', 'CAM02-LCD', 'CAM02-SCD',
+        'CAM02-UCS', 'CAM16-LCD', 'CAM16-SCD', 'CAM16-UCS'}**
+        Computation method, see :attr:`colour.DELTA_E_METHODS` attribute.
+    statistics : DeltaE_Statistics, optional
+        Statistics the colour difference is accumulated in, if given, the
+        colour difference map is not returned.
+    threshold : numeric, optional
+        Colour difference threshold, if given, the mask of the pixels whose
+        colour difference is greater than the threshold is returned instead of
+        the colour difference map.
+    out : ndarray, optional
+        Contiguous array, e.g. a :class:`numpy.memmap` class instance, the
+        colour difference map or mask is written to.
+    tile_size : integer, optional
+        Count of pixels per tile, see :func:`colour.utilities.apply_tiled`
+        definition.
+    workers : integer, optional
+        Threads count, see :func:`colour.utilities.apply_tiled` definition.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the computation method, see
+        :func:`colour.delta_E` definition.
+
+    Returns
+    -------
+    ndarray or DeltaE_Statistics or tuple
+        Colour difference :math:`\\Delta E_{ab}` map or thresholded mask,
+        given statistics or given statistics and thresholded mask if both
+        ``statistics`` and ``threshold`` arguments are given.
+
+    Notes
+    -----
+    -   The peak memory usage is a few tile-sized buffers per worker, plus the
+        colour difference map or mask if required.
+
+    Examples
+    --------
+    >>> a = np.array([[100.00000000, 21.57210357, 272.22819350],
+    ...               [50.00000000, 2.67770000, -79.77750000]])
+    >>> b = np.array([[100.00000000, 426.67945353, 72.39590835],
+    ...               [50.00000000, 0.00000000, -82.74850000]])
+    >>> delta_E_image(a, b)  # doctest: +ELLIPSIS
+    array([ 94.0356490...,   2.0422188...])
+    >>> delta_E_image(a, b, 'CMC', threshold=10)
+    array([ True, False], dtype=bool)
+    >>> statistics, mask = delta_E_image(
+    ...     a, b, statistics=DeltaE_Statistics(), threshold=10)
+    >>> statistics.mean  # doctest: +ELLIPSIS
+    48.0389339...
+    """
+
+    from colour.difference import DELTA_E_METHODS
+
+    function = DELTA_E_METHODS[method]
+
+    return _reduce_image(
+        _delta_E_tile, (a, b),
+        statistics,
+        threshold,
+        out,
+        tile_size,
+        workers,
+        delta_E=partial(function, **filter_kwargs(function, **kwargs)))
+
+
+def _delta_E_UCS_tile(XYZ_1, XYZ_2, model, coefficients, statistics,
+                      threshold, map_required):
+    """
+    Computes the colour difference :math:`\\Delta E'` of given tiles and
+    reduces it.
+    """
+
+    Jpapbp = [
+        JMh_CIECAM02_to_UCS_Luo2006(
+            tstack((specification.J, specification.M, specification.h)),
+            coefficients)
+        for specification in (model.forward(XYZ_1), model.forward(XYZ_2))
+    ]
+
+    return _reduce_tile(
+        delta_E_Luo2006(Jpapbp[0], Jpapbp[1], coefficients), statistics,
+        threshold, map_required)
+
+
+def delta_E_UCS_image(XYZ_1,
+                      XYZ_2,
+                      XYZ_w,
+                      L_A,
+                      Y_b,
+                      surround=None,
+                      discount_illuminant=False,
+                      method='CAM02-UCS',
+                      statistics=None,
+                      threshold=None,
+                      out=None,
+                      tile_size=TILE_SIZE,
+                      workers=None):
+    """
+    Computes the colour difference :math:`\\Delta E'` between two given images
+    *CIE XYZ* tristimulus values in one of the *CAM02-LCD*, *CAM02-SCD*,
+    *CAM02-UCS*, *CAM16-LCD*, *CAM16-SCD* or *CAM16-UCS* colourspaces.
+
+    The images are processed tile by tile: the colour appearance model
+    specifications are only computed for a tile at a time and the colour
+    difference is optionally reduced on the fly to statistics instead of being
+    returned as a full resolution map.
+
+    Parameters
+    ----------
+    XYZ_1 : array_like
+        Standard / reference image *CIE XYZ* tristimulus values in domain
+        [0, 100].
+    XYZ_2 : array_like
+        Sample / test image *CIE XYZ* tristimulus values in domain [0, 100].
+    XYZ_w : array_like
+        *CIE XYZ* tristimulus values of reference white in domain [0, 100].
+    L_A : numeric
+        Adapting field *luminance* :math:`L_A` in :math:`cd/m^2`.
+    Y_b : numeric
+        Relative luminance of background :math:`Y_b` in :math:`cd/m^2`.
+    surround : CIECAM02_InductionFactors or CAM16_InductionFactors, optional
+        Surround viewing conditions induction factors, default to the
+        *Average* viewing conditions of the colour appearance model.
+    discount_illuminant : bool, optional
+        Truth value indicating if the illuminant should be discounted.
+    method : unicode, optional
+        **{'CAM02-UCS', 'CAM02-LCD', 'CAM02-SCD', 'CAM16-UCS', 'CAM16-LCD',
+        'CAM16-SCD'}**,
+        Colourspace the colour difference is computed in.
+    statistics : DeltaE_Statistics, optional
+        Statistics the colour difference is accumulated in, if given, the
+        colour difference map is not returned.
+    threshold : numeric, optional
+        Colour difference threshold, if given, the mask of the pixels whose
+        colour difference is greater than the threshold is returned instead of
+        the colour difference map.
+    out : ndarray, optional
+        Contiguous array, e.g. a :class:`numpy.memmap` class instance, the
+        colour difference map or mask is written to.
+    tile_size : integer, optional
+        Count of pixels per tile, see :func:`colour.utilities.apply_tiled`
+        definition.
+    workers : integer, optional
+        Threads count, see :func:`colour.utilities.apply_tiled` definition.
+
+    Returns
+    -------
+    ndarray or DeltaE_Statistics or tuple
+        Colour difference :math:`\\Delta E'` map or thresholded mask, given
+        statistics or given statistics and thresholded mask if both
+        ``statistics`` and ``threshold`` arguments are given.
+
+    Raises
+    ------
+    ValueError
+        If the colourspace is not supported.
+
+    Notes
+    -----
+    -   The viewing conditions are shared by all the pixels, the colour
+        appearance model is initialised once with them, see
+        :class:`colour.CIECAM02_Model` and :class:`colour.CAM16_Model`
+        classes.
+
+    References
+    ----------
+    -   :cite:`Li2017`
+    -   :cite:`Luo2006b`
+
+    Examples
+    --------
+    >>> XYZ_1 = np.array([[19.01, 20.00, 21.78], [57.06, 43.06, 31.96]])
+    >>> XYZ_2 = np.array([[19.51, 20.00, 21.78], [56.06, 43.06, 31.96]])
+    >>> XYZ_w = np.array([95.05, 100.00, 108.88])
+    >>> delta_E_UCS_image(XYZ_1, XYZ_2, XYZ_w, 318.31, 20.0)
+    ... # doctest: +ELLIPSIS
+    array([ 3.3687149...,  1.3609673...])
+    >>> statistics = delta_E_UCS_image(
+    ...     XYZ_1, XYZ_2, XYZ_w, 318.31, 20.0, statistics=DeltaE_Statistics())
+    >>> statistics.maximum  # doctest: +ELLIPSIS
+    3.3687149...
+    """
+
+    if method not in _DELTA_E_UCS_IMAGE_MODELS:
+        raise ValueError(
+            '"{0}" method is not supported, it must be one of {1}!'.format(
+                method, sorted(_DELTA_E_UCS_IMAGE_MODELS.keys())))
+
+    model_class, viewing_conditions, coefficients = (
+        _DELTA_E_UCS_IMAGE_MODELS[method])
+
+    if surround is None:
+        surround = viewing_conditions['Average']
+
+    model = model_class(XYZ_w, L_A, Y_b, surround, discount_illuminant)
+    coefficients = COEFFICIENTS_UCS_LUO2006[coefficients]
+
+    return _reduce_image(
+        _delta_E_UCS_tile, (XYZ_1, XYZ_2),
+        statistics,
+        threshold,
+        out,
+        tile_size,
+        workers,
+        model=model,
+        coefficients=coefficients)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.difference.search` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.difference import DeltaE_Index, delta_E
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestDeltaE_Index']
+
+
+class TestDeltaE_Index(unittest.TestCase):
+    """
+    Defines :class:`colour.difference.search.DeltaE_Index` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        random_state = np.random.RandomState(4)
+        self._palette = random_state.uniform([0, -120, -120], [100, 120, 120],
+                                             (300, 3))
+        self._Lab = random_state.uniform([0, -120, -120], [100, 120, 120],
+                                         (8, 50, 3))
+
+        # Blue hues, where the *CIE 2000* rotation term is the largest.
+        h = np.radians(random_state.uniform(240, 310, 100))
+        C = random_state.uniform(0, 120, 100)
+        self._Lab[0, :, 1] = np.tile(C * np.cos(h), 2)[:50]
+        self._Lab[0, :, 2] = np.tile(C * np.sin(h), 2)[:50]
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('palette', 'method')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(DeltaE_Index))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('query', 'query_radius')
+
+        for method in required_methods:
+            self.assertIn(method, dir(DeltaE_Index))
+
+    def test_query(self):
+        """
+        Tests :func:`colour.difference.search.DeltaE_Index.query` method.
+        """
+
+        for method, kwargs in (('CIE 1976', {}), ('CIE 1994', {}),
+                               ('CIE 1994', {'textiles': True}),
+                               ('CIE 2000', {}), ('CIE 2000', {
+                                   'textiles': True
+                               }), ('CMC', {}), ('CMC', {
+                                   'l': 1
+                               }), ('CAM02-LCD', {}), ('CAM16-SCD', {})):
+            index = DeltaE_Index(self._palette, method, **kwargs)
+            reference = delta_E(self._Lab[..., np.newaxis, :], self._palette,
+                                method, **kwargs)
+
+            delta_E_q, indexes = index.query(self._Lab, tile_size=64)
+            self.assertEqual(delta_E_q.shape, (8, 50))
+            np.testing.assert_almost_equal(
+                delta_E_q, np.min(reference, axis=-1), decimal=7)
+            np.testing.assert_almost_equal(
+                delta_E(self._Lab, self._palette[indexes], method, **kwargs),
+                delta_E_q,
+                decimal=7)
+
+            delta_E_q, indexes = index.query(self._Lab, 5, tile_size=64)
+            self.assertEqual(delta_E_q.shape, (8, 50, 5))
+            np.testing.assert_almost_equal(
+                delta_E_q, np.sort(reference, axis=-1)[..., :5], decimal=7)
+            np.testing.assert_almost_equal(
+                delta_E(self._Lab[..., np.newaxis, :],
+                        self._palette[indexes], method, **kwargs),
+                delta_E_q,
+                decimal=7)
+
+        index = DeltaE_Index(self._palette[:3], 'CIE 2000')
+        delta_E_q, indexes = index.query(self._Lab[0, 0], 5)
+        np.testing.assert_equal(
+            indexes,
+            np.argsort(delta_E(self._Lab[0, 0], self._palette[:3])))
+
+    def test_query_radius(self):
+        """
+        Tests :func:`colour.difference.search.DeltaE_Index.query_radius`
+        method.
+        """
+
+        for method in ('CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC',
+                       'CAM02-UCS'):
+            index = DeltaE_Index(self._palette, method)
+            reference = delta_E(self._Lab[..., np.newaxis, :], self._palette,
+                                method)
+
+            delta_E_q, indexes = index.query_radius(
+                self._Lab, 15, tile_size=64)
+            self.assertEqual(indexes.shape, (8, 50))
+            for i, j in np.ndindex(8, 50):
+                np.testing.assert_equal(
+                    np.sort(indexes[i, j]),
+                    np.where(reference[i, j] <= 15)[0])
+                np.testing.assert_almost_equal(
+                    delta_E_q[i, j], reference[i, j][indexes[i, j]], decimal=7)
+                self.assertTrue(np.all(np.diff(delta_E_q[i, j]) >= 0))
+
+        delta_E_q, indexes = DeltaE_Index(self._palette).query_radius(
+            self._palette[0], 0)
+        np.testing.assert_equal(indexes, np.array([0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
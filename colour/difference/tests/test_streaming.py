@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.difference.streaming` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.appearance import XYZ_to_CAM16, XYZ_to_CIECAM02
+from colour.difference import (DeltaE_Statistics, delta_E, delta_E_image,
+                               delta_E_UCS_image)
+from colour.models import (JMh_CAM16_to_CAM16LCD, JMh_CAM16_to_CAM16SCD,
+                           JMh_CAM16_to_CAM16UCS, JMh_CIECAM02_to_CAM02LCD,
+                           JMh_CIECAM02_to_CAM02SCD, JMh_CIECAM02_to_CAM02UCS)
+from colour.utilities import tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestDeltaE_Statistics', 'TestDelta_E_image', 'TestDelta_E_UCS_image'
+]
+
+
+class TestDeltaE_Statistics(unittest.TestCase):
+    """
+    Defines :class:`colour.difference.streaming.DeltaE_Statistics` class unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._delta_E = np.random.RandomState(4).lognormal(0, 1.5, 10000)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('relative_accuracy', 'count', 'mean', 'minimum',
+                               'maximum')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(DeltaE_Statistics))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('update', 'merge', 'percentile')
+
+        for method in required_methods:
+            self.assertIn(method, dir(DeltaE_Statistics))
+
+    def test_update(self):
+        """
+        Tests :func:`colour.difference.streaming.DeltaE_Statistics.update`
+        method.
+        """
+
+        statistics = DeltaE_Statistics()
+        for values in np.split(self._delta_E, 10):
+            statistics.update(values)
+        statistics.update(np.array([np.nan, np.inf]))
+
+        self.assertEqual(statistics.count, 10000)
+        self.assertAlmostEqual(
+            statistics.mean, np.mean(self._delta_E), places=7)
+        self.assertEqual(statistics.minimum, np.min(self._delta_E))
+        self.assertEqual(statistics.maximum, np.max(self._delta_E))
+
+        statistics = DeltaE_Statistics()
+        self.assertTrue(np.isnan(statistics.mean))
+        self.assertTrue(np.isnan(statistics.percentile(50)))
+
+    def test_merge(self):
+        """
+        Tests :func:`colour.difference.streaming.DeltaE_Statistics.merge`
+        method.
+        """
+
+        statistics_1, statistics_2 = DeltaE_Statistics(), DeltaE_Statistics()
+        statistics_1.update(self._delta_E[:5000])
+        statistics_2.update(self._delta_E[5000:] * 100)
+        statistics_1.merge(statistics_2)
+
+        statistics = DeltaE_Statistics()
+        statistics.update(self._delta_E[:5000])
+        statistics.update(self._delta_E[5000:] * 100)
+
+        self.assertEqual(statistics_1.count, statistics.count)
+        self.assertAlmostEqual(statistics_1.mean, statistics.mean, places=7)
+        np.testing.assert_equal(
+            statistics_1.percentile(np.arange(101)),
+            statistics.percentile(np.arange(101)))
+
+    def test_raise_exception_merge(self):
+        """
+        Tests :func:`colour.difference.streaming.DeltaE_Statistics.merge`
+        method raised exception.
+        """
+
+        self.assertRaises(ValueError,
+                          DeltaE_Statistics().merge, DeltaE_Statistics(0.01))
+
+    def test_percentile(self):
+        """
+        Tests :func:`colour.difference.streaming.DeltaE_Statistics.percentile`
+        method.
+        """
+
+        delta_E = np.hstack([self._delta_E, np.zeros(1000)])
+        q = np.linspace(0, 100, 201)
+        for relative_accuracy in (0.01, 0.001):
+            statistics = DeltaE_Statistics(relative_accuracy)
+            statistics.update(delta_E)
+
+            percentiles = np.percentile(delta_E, q, interpolation='lower')
+            np.testing.assert_array_less(
+                np.abs(statistics.percentile(q) - percentiles),
+                relative_accuracy * percentiles + 1e-12)
+
+        self.assertEqual(statistics.percentile(5), 0)
+        self.assertEqual(statistics.percentile(0), 0)
+        self.assertIsInstance(statistics.percentile(95), np.float64)
+
+
+class TestDelta_E_image(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.streaming.delta_E_image` definition unit
+    tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        random_state = np.random.RandomState(4)
+        self._Lab_1 = random_state.uniform([0, -100, -100], [100, 100, 100],
+                                           (8, 16, 3))
+        self._Lab_2 = self._Lab_1 + random_state.normal(0, 2, (8, 16, 3))
+
+    def test_delta_E_image(self):
+        """
+        Tests :func:`colour.difference.streaming.delta_E_image` definition.
+        """
+
+        for method in ('CIE 1976', 'CIE 1994', 'CIE 2000', 'CMC',
+                       'CAM02-UCS', 'CAM16-LCD'):
+            np.testing.assert_almost_equal(
+                delta_E_image(
+                    self._Lab_1, self._Lab_2, method, tile_size=20),
+                delta_E(self._Lab_1, self._Lab_2, method),
+                decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_image(
+                self._Lab_1,
+                self._Lab_2,
+                'CIE 2000',
+                tile_size=20,
+                textiles=True,
+                l=1),
+            delta_E(self._Lab_1, self._Lab_2, 'CIE 2000', textiles=True),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_image(
+                self._Lab_1, self._Lab_2, 'CMC', tile_size=20, l=1),
+            delta_E(self._Lab_1, self._Lab_2, 'CMC', l=1),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            delta_E_image(self._Lab_1[0, 0], self._Lab_2[0, 0]),
+            delta_E(self._Lab_1[0, 0], self._Lab_2[0, 0]),
+            decimal=7)
+
+    def test_reductions_delta_E_image(self):
+        """
+        Tests :func:`colour.difference.streaming.delta_E_image` definition
+        statistics and thresholded mask reductions.
+        """
+
+        reference = delta_E(self._Lab_1, self._Lab_2, 'CMC')
+
+        mask = delta_E_image(
+            self._Lab_1, self._Lab_2, 'CMC', threshold=2, tile_size=20)
+        self.assertEqual(mask.dtype, np.bool_)
+        np.testing.assert_equal(mask, reference > 2)
+
+        statistics = DeltaE_Statistics()
+        self.assertIs(
+            delta_E_image(
+                self._Lab_1,
+                self._Lab_2,
+                'CMC',
+                statistics=statistics,
+                tile_size=20), statistics)
+        self.assertEqual(statistics.count, reference.size)
+        self.assertAlmostEqual(statistics.mean, np.mean(reference), places=7)
+        self.assertEqual(statistics.maximum, np.max(reference))
+
+        out = np.zeros(reference.shape, np.bool_)
+        statistics, mask = delta_E_image(
+            self._Lab_1,
+            self._Lab_2,
+            'CMC',
+            statistics=DeltaE_Statistics(),
+            threshold=2,
+            out=out,
+            tile_size=20)
+        self.assertIs(mask, out)
+        np.testing.assert_equal(out, reference > 2)
+        self.assertEqual(statistics.count, reference.size)
+
+
+class TestDelta_E_UCS_image(unittest.TestCase):
+    """
+    Defines :func:`colour.difference.streaming.delta_E_UCS_image` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        random_state = np.random.RandomState(4)
+        self._XYZ_1 = random_state.uniform(5, 95, (8, 16, 3))
+        self._XYZ_2 = self._XYZ_1 * random_state.uniform(
+            0.95, 1.05, (8, 16, 3))
+        self._XYZ_w = np.array([95.05, 100.00, 108.88])
+
+    def test_delta_E_UCS_image(self):
+        """
+        Tests :func:`colour.difference.streaming.delta_E_UCS_image`
+        definition.
+        """
+
+        conversions = {
+            'CAM02-LCD': (XYZ_to_CIECAM02, JMh_CIECAM02_to_CAM02LCD),
+            'CAM02-SCD': (XYZ_to_CIECAM02, JMh_CIECAM02_to_CAM02SCD),
+            'CAM02-UCS': (XYZ_to_CIECAM02, JMh_CIECAM02_to_CAM02UCS),
+            'CAM16-LCD': (XYZ_to_CAM16, JMh_CAM16_to_CAM16LCD),
+            'CAM16-SCD': (XYZ_to_CAM16, JMh_CAM16_to_CAM16SCD),
+            'CAM16-UCS': (XYZ_to_CAM16, JMh_CAM16_to_CAM16UCS),
+        }
+
+        for method, (XYZ_to_CAM, JMh_to_UCS) in conversions.items():
+            Jpapbp = []
+            for XYZ in (self._XYZ_1, self._XYZ_2):
+                specification = XYZ_to_CAM(XYZ, self._XYZ_w, 318.31, 20.0)
+                Jpapbp.append(
+                    JMh_to_UCS(
+                        tstack((specification.J, specification.M,
+                                specification.h))))
+
+            np.testing.assert_almost_equal(
+                delta_E_UCS_image(
+                    self._XYZ_1,
+                    self._XYZ_2,
+                    self._XYZ_w,
+                    318.31,
+                    20.0,
+                    method=method,
+                    tile_size=20),
+                delta_E(Jpapbp[0], Jpapbp[1], method),
+                decimal=7)
+
+    def test_statistics_delta_E_UCS_image(self):
+        """
+        Tests :func:`colour.difference.streaming.delta_E_UCS_image`
+        definition statistics reduction.
+        """
+
+        reference = delta_E_UCS_image(self._XYZ_1, self._XYZ_2, self._XYZ_w,
+                                      318.31, 20.0)
+
+        statistics = DeltaE_Statistics()
+        self.assertIs(
+            delta_E_UCS_image(
+                self._XYZ_1,
+                self._XYZ_2,
+                self._XYZ_w,
+                318.31,
+                20.0,
+                statistics=statistics,
+                tile_size=20), statistics)
+        self.assertEqual(statistics.count, reference.size)
+        self.assertAlmostEqual(statistics.mean, np.mean(reference), places=7)
+        self.assertEqual(statistics.maximum, np.max(reference))
+
+        out = np.zeros(reference.shape)
+        statistics = DeltaE_Statistics()
+        delta_E_UCS_image(
+            self._XYZ_1,
+            self._XYZ_2,
+            self._XYZ_w,
+            318.31,
+            20.0,
+            statistics=statistics,
+            out=out,
+            tile_size=20)
+        np.testing.assert_almost_equal(out, reference, decimal=7)
+        self.assertEqual(statistics.count, reference.size)
+
+        statistics, mask = delta_E_UCS_image(
+            self._XYZ_1,
+            self._XYZ_2,
+            self._XYZ_w,
+            318.31,
+            20.0,
+            statistics=DeltaE_Statistics(),
+            threshold=1,
+            tile_size=20)
+        np.testing.assert_equal(mask, reference > 1)
+        self.assertEqual(statistics.count, reference.size)
+
+    def test_raise_exception_delta_E_UCS_image(self):
+        """
+        Tests :func:`colour.difference.streaming.delta_E_UCS_image`
+        definition raised exception.
+        """
+
+        for method in ('CIE 2000', 'CAM02_UCS', 'CAM16-UCSX'):
+            self.assertRaises(
+                ValueError,
+                delta_E_UCS_image,
+                self._XYZ_1,
+                self._XYZ_2,
+                self._XYZ_w,
+                318.31,
+                20.0,
+                method=method)
+
+
+if __name__ == '__main__':
+    unittest.main()
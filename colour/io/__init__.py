@@ -4,14 +4,36 @@ from __future__ import absolute_import
 
 from .ies_tm2714 import IES_TM2714_Spd
 from .image import read_image, write_image
+from .luts import (
+    LUT_CHUNK_SIZE, LUT_Error_Specification, LUT1D, LUT3D,
+    read_LUT_IridasCube, write_LUT_IridasCube, read_LUT_SonySPI1D,
+    write_LUT_SonySPI1D, read_LUT_SonySPI3D, write_LUT_SonySPI3D,
+    read_LUT_Cinespace, write_LUT_Cinespace, EXTENSION_TO_LUT_FORMAT_MAPPING,
+    LUT_READ_METHODS, read_LUT, LUT_WRITE_METHODS, write_LUT)
 from .tabular import (read_spectral_data_from_csv_file,
                       read_spds_from_csv_file, write_spds_to_csv_file)
+from .video import (RAW_VIDEO_FORMATS, read_raw_video_planes,
+                    write_raw_video_planes, read_raw_video, write_raw_video)
 from .xrite import read_spds_from_xrite_file
 
 __all__ = ['IES_TM2714_Spd']
 __all__ += ['read_image', 'write_image']
+__all__ += ['LUT_CHUNK_SIZE', 'LUT_Error_Specification', 'LUT1D', 'LUT3D']
+__all__ += [
+    'read_LUT_IridasCube', 'write_LUT_IridasCube', 'read_LUT_SonySPI1D',
+    'write_LUT_SonySPI1D', 'read_LUT_SonySPI3D', 'write_LUT_SonySPI3D',
+    'read_LUT_Cinespace', 'write_LUT_Cinespace'
+]
+__all__ += [
+    'EXTENSION_TO_LUT_FORMAT_MAPPING', 'LUT_READ_METHODS', 'read_LUT',
+    'LUT_WRITE_METHODS', 'write_LUT'
+]
 __all__ += [
     'read_spectral_data_from_csv_file', 'read_spds_from_csv_file',
     'write_spds_to_csv_file'
 ]
+__all__ += [
+    'RAW_VIDEO_FORMATS', 'read_raw_video_planes', 'write_raw_video_planes',
+    'read_raw_video', 'write_raw_video'
+]
 __all__ += ['read_spds_from_xrite_file']
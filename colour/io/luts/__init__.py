@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+References
+----------
+-   :cite:`AdobeSystems2013b` : Adobe Systems. (2013). Cube LUT
+    Specification. Retrieved from https://wwwimages2.adobe.com/content/dam/\\
+acom/en/products/speedgrade/cc/pdfs/cube-lut-specification-1.0.pdf
+"""
+
+from __future__ import absolute_import
+
+import os
+
+from colour.utilities import CaseInsensitiveMapping
+
+from .lut import LUT_CHUNK_SIZE, LUT_Error_Specification, LUT1D, LUT3D
+from .iridas_cube import read_LUT_IridasCube, write_LUT_IridasCube
+from .sony_spi1d import read_LUT_SonySPI1D, write_LUT_SonySPI1D
+from .sony_spi3d import read_LUT_SonySPI3D, write_LUT_SonySPI3D
+from .cinespace_csp import read_LUT_Cinespace, write_LUT_Cinespace
+
+__all__ = ['LUT_CHUNK_SIZE', 'LUT_Error_Specification', 'LUT1D', 'LUT3D']
+__all__ += ['read_LUT_IridasCube', 'write_LUT_IridasCube']
+__all__ += ['read_LUT_SonySPI1D', 'write_LUT_SonySPI1D']
+__all__ += ['read_LUT_SonySPI3D', 'write_LUT_SonySPI3D']
+__all__ += ['read_LUT_Cinespace', 'write_LUT_Cinespace']
+
+EXTENSION_TO_LUT_FORMAT_MAPPING = CaseInsensitiveMapping({
+    '.cube': 'Iridas Cube',
+    '.spi1d': 'Sony SPI1D',
+    '.spi3d': 'Sony SPI3D',
+    '.csp': 'Cinespace'
+})
+"""
+Extension to *LUT* format.
+
+EXTENSION_TO_LUT_FORMAT_MAPPING : CaseInsensitiveMapping
+    **{'.cube', '.spi1d', '.spi3d', '.csp'}**
+"""
+
+LUT_READ_METHODS = CaseInsensitiveMapping({
+    'Cinespace': read_LUT_Cinespace,
+    'Iridas Cube': read_LUT_IridasCube,
+    'Sony SPI1D': read_LUT_SonySPI1D,
+    'Sony SPI3D': read_LUT_SonySPI3D,
+})
+LUT_READ_METHODS.__doc__ = """
+Supported *LUT* reading methods.
+
+References
+----------
+-   :cite:`AdobeSystems2013b`
+
+LUT_READ_METHODS : CaseInsensitiveMapping
+    **{'Cinespace', 'Iridas Cube', 'Sony SPI1D', 'Sony SPI3D'}**
+"""
+
+
+def read_LUT(path, method=None):
+    """
+    Reads given *LUT* file using given method.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+    method : unicode, optional
+        **{None, 'Cinespace', 'Iridas Cube', 'Sony SPI1D', 'Sony SPI3D'}**,
+        Reading method, if *None*, the method will be auto-detected according
+        to extension.
+
+    Returns
+    -------
+    LUT1D or LUT3D
+        :class:`colour.io.LUT1D` or :class:`colour.io.LUT3D` class instance.
+
+    References
+    ----------
+    -   :cite:`AdobeSystems2013b`
+
+    Examples
+    --------
+    >>> LUT_path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'iridas_cube',
+    ...     'ColourCorrect.cube')
+    >>> read_LUT(LUT_path).name
+    'Generated by Foundry::LUT'
+    """
+
+    if method is None:
+        method = EXTENSION_TO_LUT_FORMAT_MAPPING[os.path.splitext(path)[-1]]
+
+    return LUT_READ_METHODS[method](path)
+
+
+LUT_WRITE_METHODS = CaseInsensitiveMapping({
+    'Cinespace': write_LUT_Cinespace,
+    'Iridas Cube': write_LUT_IridasCube,
+    'Sony SPI1D': write_LUT_SonySPI1D,
+    'Sony SPI3D': write_LUT_SonySPI3D,
+})
+LUT_WRITE_METHODS.__doc__ = """
+Supported *LUT* writing methods.
+
+References
+----------
+-   :cite:`AdobeSystems2013b`
+
+LUT_WRITE_METHODS : CaseInsensitiveMapping
+    **{'Cinespace', 'Iridas Cube', 'Sony SPI1D', 'Sony SPI3D'}**
+"""
+
+
+def write_LUT(LUT, path, decimals=7, method=None):
+    """
+    Writes given *LUT* to given file using given method.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3D
+        :class:`colour.io.LUT1D` or :class:`colour.io.LUT3D` class instance
+        to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+    method : unicode, optional
+        **{None, 'Cinespace', 'Iridas Cube', 'Sony SPI1D', 'Sony SPI3D'}**,
+        Writing method, if *None*, the method will be auto-detected according
+        to extension.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    References
+    ----------
+    -   :cite:`AdobeSystems2013b`
+
+    Examples
+    --------
+    >>> LUT = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'My LUT')
+    >>> write_LUT(LUT, 'My_LUT.cube')  # doctest: +SKIP
+    """
+
+    if method is None:
+        method = EXTENSION_TO_LUT_FORMAT_MAPPING[os.path.splitext(path)[-1]]
+
+    return LUT_WRITE_METHODS[method](LUT, path, decimals)
+
+
+__all__ += [
+    'EXTENSION_TO_LUT_FORMAT_MAPPING', 'LUT_READ_METHODS', 'read_LUT',
+    'LUT_WRITE_METHODS', 'write_LUT'
+]
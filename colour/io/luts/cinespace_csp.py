@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Cinespace .csp LUT Format Input / Output Utilities
+==================================================
+
+Defines *Cinespace* *.csp* *LUT* Format related input / output utilities
+objects.
+
+-   :func:`colour.io.read_LUT_Cinespace`
+-   :func:`colour.io.write_LUT_Cinespace`
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import numpy as np
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.io.luts import LUT1D, LUT3D
+from colour.io.luts.common import (iterate_lines, parse_array, format_array,
+                                   path_to_title)
+from colour.utilities import tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'CINESPACE_FILE_ENCODING', 'read_LUT_Cinespace', 'write_LUT_Cinespace'
+]
+
+CINESPACE_FILE_ENCODING = 'utf-8'
+
+
+def read_LUT_Cinespace(path):
+    """
+    Reads given *Cinespace* *.csp* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT1D or LUT3D
+        :class:`colour.io.LUT1D` or :class:`colour.io.LUT3D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a *Cinespace* *.csp* *LUT* file or if the table
+        values count does not match the *LUT* size.
+
+    Notes
+    -----
+    -   The header and metadata are parsed line by line while the numeric
+        pre-*LUT* and table are parsed at once with :func:`numpy.fromstring`
+        definition.
+    -   A pre-*LUT* made of two points per *RGB* component mapping to [0, 1]
+        defines the *LUT* domain. Any other pre-*LUT* is regularly resampled
+        and becomes the 3-D *LUT* shaper 1-D *LUT*, or is composed with the
+        1-D *LUT* table, its output is assumed to span [0, 1].
+
+    Examples
+    --------
+    Reading a 1-D *Cinespace* *.csp* *LUT*:
+
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'cinespace',
+    ...     'oetf_reverse_sRGB_1D.csp')
+    >>> LUT = read_LUT_Cinespace(path)
+    >>> LUT.name
+    'sRGB Decoding'
+    >>> LUT.domain
+    array([-0.1,  1.5])
+    >>> LUT.table.shape
+    (16, 3)
+
+    Reading a 3-D *Cinespace* *.csp* *LUT*:
+
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'cinespace',
+    ...     'ColourCorrect.csp')
+    >>> LUT = read_LUT_Cinespace(path)
+    >>> LUT.name
+    'Generated by Foundry::LUT'
+    >>> LUT.table.shape
+    (4, 4, 4, 3)
+    """
+
+    with codecs.open(path, encoding=CINESPACE_FILE_ENCODING) as csp_file:
+        text = csp_file.read()
+
+    header, metadata = [], []
+    is_metadata = False
+    body = ''
+    for line, start, _end in iterate_lines(text):
+        if not line:
+            continue
+
+        if line == 'BEGIN METADATA':
+            is_metadata = True
+        elif line == 'END METADATA':
+            is_metadata = False
+        elif is_metadata:
+            metadata.append(line)
+        elif len(header) < 2:
+            header.append(line)
+        else:
+            body = text[start:]
+            break
+
+    if not header or header[0] != 'CSPLUTV100':
+        raise ValueError(
+            '"{0}" is not a "Cinespace" ".csp" LUT file!'.format(path))
+
+    is_3D = header[1] == '3D'
+    title = metadata[0] if metadata and metadata[0] else path_to_title(path)
+    comments = metadata[1:]
+
+    values = parse_array(body)
+    index = 0
+
+    inputs, outputs = [], []
+    for _i in range(3):
+        count = int(values[index])
+        inputs.append(values[index + 1:index + 1 + count])
+        outputs.append(values[index + 1 + count:index + 1 + 2 * count])
+        index += 1 + 2 * count
+
+    domain = np.array([[np.min(x) for x in inputs],
+                       [np.max(x) for x in inputs]])
+
+    is_prelut_trivial = all(
+        len(x) == 2 and np.array_equal(y, np.array([0, 1]))
+        for x, y in zip(inputs, outputs))
+
+    size = int(values[index])
+    index += 3 if is_3D else 1
+    count = size ** 3 * 3 if is_3D else size * 3
+    table = values[index:index + count]
+    if table.size != count:
+        raise ValueError(
+            'Parsed values count "{0}" is not the expected "{1}" one, '
+            'please check the file content!'.format(table.size, count))
+
+    if not is_prelut_trivial:
+        prelut_size = max(len(x) for x in inputs)
+        prelut = tstack([
+            np.interp(
+                np.linspace(domain[0][i], domain[1][i], prelut_size),
+                inputs[i], outputs[i]) for i in range(3)
+        ])
+
+    if is_3D:
+        # The *Cinespace* *.csp* *LUT* 3-D tables are stored with the *R*
+        # component varying the fastest.
+        table = np.transpose(
+            np.reshape(table, (size, size, size, 3)), (2, 1, 0, 3))
+
+        if is_prelut_trivial:
+            return LUT3D(table, title, domain, comments=comments)
+        else:
+            return LUT3D(
+                table,
+                title,
+                shaper=LUT1D(prelut, '{0} - Shaper'.format(title), domain),
+                comments=comments)
+    else:
+        table = np.reshape(table, (size, 3))
+
+        if not is_prelut_trivial:
+            samples = np.linspace(0, 1, size)
+            table = tstack([
+                np.interp(x, samples, table[..., i])
+                for i, x in enumerate(tsplit(prelut))
+            ])
+
+        if np.all(domain == domain[..., 0:1]):
+            domain = domain[..., 0]
+
+        return LUT1D(table, title, domain, comments=comments)
+
+
+def write_LUT_Cinespace(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Cinespace* *.csp* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3D
+        :class:`colour.io.LUT1D` or :class:`colour.io.LUT3D` class instance
+        to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The numeric pre-*LUT* and table are formatted at once with
+        :func:`colour.io.luts.common.format_array` definition.
+    -   The 3-D *LUT* shaper 1-D *LUT* is written as the pre-*LUT*, its
+        output being normalised to [0, 1].
+
+    Examples
+    --------
+    Writing a 1-D *Cinespace* *.csp* *LUT*:
+
+    >>> domain = np.array([[0.0, 0.0, 0.0], [1.5, 3.0, 6.0]])
+    >>> LUT = LUT1D(
+    ...     LUT1D.linear_table(16, domain) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     domain,
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT_Cinespace(LUT, 'My_LUT.csp')  # doctest: +SKIP
+
+    Writing a 3-D *Cinespace* *.csp* *LUT*:
+
+    >>> LUT = LUT3D(
+    ...     LUT3D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT_Cinespace(LUT, 'My_LUT.csp')  # doctest: +SKIP
+    """
+
+    is_3D = isinstance(LUT, LUT3D)
+
+    domain = LUT.domain
+    if domain.ndim == 1:
+        domain = np.transpose(np.tile(domain, (3, 1)))
+
+    if is_3D and LUT.shaper is not None:
+        shaper = LUT.shaper
+        inputs = LUT1D.linear_table(shaper.size, domain)
+        outputs = shaper.table
+        if outputs.ndim == 1:
+            outputs = np.transpose(np.tile(outputs, (3, 1)))
+
+        outputs = ((outputs - np.min(outputs, axis=0)) /
+                   (np.max(outputs, axis=0) - np.min(outputs, axis=0)))
+    else:
+        inputs = domain
+        outputs = np.array([[0, 0, 0], [1, 1, 1]], dtype=DEFAULT_FLOAT_DTYPE)
+
+    lines = ['CSPLUTV100', '3D' if is_3D else '1D', '', 'BEGIN METADATA']
+    lines += [LUT.name] + list(LUT.comments)
+    lines += ['END METADATA', '']
+
+    for i in range(3):
+        lines.append('{0}'.format(len(inputs)))
+        lines.append(format_array(inputs[..., i][np.newaxis], decimals)[:-1])
+        lines.append(format_array(outputs[..., i][np.newaxis], decimals)[:-1])
+
+    lines.append('')
+
+    if is_3D:
+        lines.append('{0} {0} {0}'.format(LUT.size))
+        table = np.reshape(np.transpose(LUT.table, (2, 1, 0, 3)), (-1, 3))
+    else:
+        lines.append('{0}'.format(LUT.size))
+        table = LUT.table
+        if table.ndim == 1:
+            table = np.transpose(np.tile(table, (3, 1)))
+
+    with codecs.open(path, 'w', encoding=CINESPACE_FILE_ENCODING) as csp_file:
+        csp_file.write('\n'.join(lines))
+        csp_file.write('\n')
+        csp_file.write(format_array(table, decimals))
+
+    return True
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Processing Common Utilities
+===============================
+
+Defines the *LUT* processing common utilities objects that don't fall in any
+specific category.
+
+The *LUT* files numeric bodies are parsed and formatted in bulk rather than
+line by line, e.g. a :math:`65^3` *LUT* has :math:`274625` lines.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import re
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['iterate_lines', 'parse_array', 'format_array', 'path_to_title']
+
+
+def iterate_lines(text):
+    """
+    Iterates over the lines of given text, yielding every stripped line with
+    its start and end offsets so that the remaining text, e.g. a *LUT* file
+    numeric body, can be sliced without splitting it.
+
+    Parameters
+    ----------
+    text : unicode
+        Text to iterate the lines of.
+
+    Yields
+    ------
+    tuple
+        Stripped line, line start offset and next line start offset.
+
+    Examples
+    --------
+    >>> for line in iterate_lines('LUT_1D_SIZE 2\\n0 1'):
+    ...     print(line)
+    ('LUT_1D_SIZE 2', 0, 14)
+    ('0 1', 14, 17)
+    """
+
+    start = 0
+    while start < len(text):
+        end = text.find('\n', start)
+        end = len(text) if end == -1 else end + 1
+
+        yield text[start:end].strip(), start, end
+
+        start = end
+
+
+def parse_array(text, count=None, dtype=DEFAULT_FLOAT_DTYPE):
+    """
+    Parses given whitespace separated numeric text to a 1-dimensional array.
+
+    Parameters
+    ----------
+    text : unicode
+        Whitespace separated numeric text, lines are allowed.
+    count : int, optional
+        Expected count of values.
+    dtype : object, optional
+        Type to use for conversion.
+
+    Returns
+    -------
+    ndarray
+        Parsed array.
+
+    Raises
+    ------
+    ValueError
+        If the parsed values count is not the expected one, e.g. because the
+        text has non numeric content.
+
+    Examples
+    --------
+    >>> parse_array('-0.25 0.5\\n0.75 1.0')
+    array([-0.25,  0.5 ,  0.75,  1.  ])
+    """
+
+    array = np.fromstring(text, dtype=dtype, sep=' ')
+
+    if count is not None and array.size != count:
+        raise ValueError(
+            'Parsed values count "{0}" is not the expected "{1}" one, '
+            'please check the file content!'.format(array.size, count))
+
+    return array
+
+
+def format_array(array, decimals=7, separator=' '):
+    """
+    Formats given array to text, one row per line, using a single string
+    formatting operation.
+
+    Parameters
+    ----------
+    array : array_like
+        Array to format, 1-dimensional arrays are formatted as a single
+        column.
+    decimals : int or array_like, optional
+        Formatting decimals, either for every column or per column, e.g. to
+        format integer indexes columns with *0* decimals.
+    separator : unicode, optional
+        Columns separator.
+
+    Returns
+    -------
+    unicode
+        Formatted array.
+
+    Examples
+    --------
+    >>> print(format_array(np.array([[0.0, 0.5, 1.0], [1.0, 0.5, 0.0]]), 2))
+    0.00 0.50 1.00
+    1.00 0.50 0.00
+    <BLANKLINE>
+    >>> print(format_array(np.array([[0, 1, 0.5], [1, 0, 0.25]]), [0, 0, 2]))
+    0 1 0.50
+    1 0 0.25
+    <BLANKLINE>
+    """
+
+    array = np.asarray(array, dtype=DEFAULT_FLOAT_DTYPE)
+    if array.ndim == 1:
+        array = array[..., np.newaxis]
+
+    # *printf-style* formatting is significantly faster than
+    # :meth:`str.format` for large arrays.
+    decimals = np.ravel(decimals)
+    if decimals.size == 1:
+        decimals = np.repeat(decimals, array.shape[-1])
+
+    row = separator.join(['%.{0}f'.format(decimal) for decimal in decimals])
+
+    return ('{0}\n'.format(row) * array.shape[0]) % tuple(
+        np.ravel(array).tolist())
+
+
+def path_to_title(path):
+    """
+    Converts given file path to title.
+
+    Parameters
+    ----------
+    path : unicode
+        File path to convert to title.
+
+    Returns
+    -------
+    unicode
+        File path converted to title.
+
+    Examples
+    --------
+    >>> path_to_title(
+    ...     'colour/io/luts/tests/resources/cinespace/RGB_1_0.5_0.25.csp')
+    'RGB 1 0 5 0 25'
+    """
+
+    return re.sub('_|-|\\.', ' ', os.path.splitext(os.path.basename(path))[0])
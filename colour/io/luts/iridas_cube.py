@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Iridas .cube LUT Format Input / Output Utilities
+================================================
+
+Defines *Iridas* *.cube* *LUT* Format related input / output utilities
+objects.
+
+-   :func:`colour.io.read_LUT_IridasCube`
+-   :func:`colour.io.write_LUT_IridasCube`
+
+References
+----------
+-   :cite:`AdobeSystems2013b` : Adobe Systems. (2013). Cube LUT
+    Specification. Retrieved from https://wwwimages2.adobe.com/content/dam/\\
+acom/en/products/speedgrade/cc/pdfs/cube-lut-specification-1.0.pdf
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import numpy as np
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.io.luts import LUT1D, LUT3D
+from colour.io.luts.common import (iterate_lines, parse_array, format_array,
+                                   path_to_title)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'IRIDAS_CUBE_FILE_ENCODING', 'read_LUT_IridasCube', 'write_LUT_IridasCube'
+]
+
+IRIDAS_CUBE_FILE_ENCODING = 'utf-8'
+
+
+def read_LUT_IridasCube(path):
+    """
+    Reads given *Iridas* *.cube* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT1D or LUT3D
+        :class:`colour.io.LUT1D` or :class:`colour.io.LUT3D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If the *LUT* size is not defined or if the table values count does
+        not match it.
+
+    Notes
+    -----
+    -   The header is parsed line by line while the numeric table is parsed
+        at once with :func:`numpy.fromstring` definition.
+
+    References
+    ----------
+    -   :cite:`AdobeSystems2013b`
+
+    Examples
+    --------
+    Reading a 1-D *Iridas* *.cube* *LUT*:
+
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'iridas_cube',
+    ...     'oetf_reverse_sRGB_1D.cube')
+    >>> LUT = read_LUT_IridasCube(path)
+    >>> LUT.name
+    'sRGB Decoding'
+    >>> LUT.domain
+    array([-0.1,  1.5])
+    >>> LUT.table.shape
+    (16, 3)
+
+    Reading a 3-D *Iridas* *.cube* *LUT*:
+
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'iridas_cube',
+    ...     'ColourCorrect.cube')
+    >>> LUT = read_LUT_IridasCube(path)
+    >>> LUT.name
+    'Generated by Foundry::LUT'
+    >>> LUT.table.shape
+    (4, 4, 4, 3)
+    """
+
+    title = path_to_title(path)
+    size, dimensions = None, None
+    domain_min = np.array([0, 0, 0], dtype=DEFAULT_FLOAT_DTYPE)
+    domain_max = np.array([1, 1, 1], dtype=DEFAULT_FLOAT_DTYPE)
+    comments = []
+
+    with codecs.open(path, encoding=IRIDAS_CUBE_FILE_ENCODING) as cube_file:
+        text = cube_file.read()
+
+    body = ''
+    for line, start, _end in iterate_lines(text):
+        if not line:
+            continue
+
+        if line.startswith('#'):
+            comments.append(line[1:].strip())
+            continue
+
+        tokens = line.split()
+        keyword = tokens[0]
+        if keyword == 'TITLE':
+            title = line[len(keyword):].strip().strip('"')
+        elif keyword in ('LUT_1D_SIZE', 'LUT_3D_SIZE'):
+            size = int(tokens[1])
+            dimensions = 1 if keyword == 'LUT_1D_SIZE' else 3
+        elif keyword == 'DOMAIN_MIN':
+            domain_min = parse_array(' '.join(tokens[1:]), 3)
+        elif keyword == 'DOMAIN_MAX':
+            domain_max = parse_array(' '.join(tokens[1:]), 3)
+        elif keyword in ('LUT_1D_INPUT_RANGE', 'LUT_3D_INPUT_RANGE'):
+            domain_min, domain_max = (np.tile(value, 3) for value in
+                                      parse_array(' '.join(tokens[1:]), 2))
+        else:
+            body = text[start:]
+            break
+
+    if size is None:
+        raise ValueError(
+            '"{0}" LUT has no "LUT_1D_SIZE" or "LUT_3D_SIZE" keyword!'.format(
+                path))
+
+    domain = np.vstack([domain_min, domain_max])
+
+    if dimensions == 1:
+        table = np.reshape(parse_array(body, size * 3), (size, 3))
+
+        if np.all(domain == domain[..., 0:1]):
+            domain = domain[..., 0]
+
+        return LUT1D(table, title, domain, comments=comments)
+    else:
+        # The *Iridas* *.cube* *LUT* 3-D tables are stored with the *R*
+        # component varying the fastest.
+        table = np.reshape(
+            parse_array(body, size ** 3 * 3), (size, size, size, 3))
+        table = np.transpose(table, (2, 1, 0, 3))
+
+        return LUT3D(table, title, domain, comments=comments)
+
+
+def write_LUT_IridasCube(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Iridas* *.cube* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D or LUT3D
+        :class:`colour.io.LUT1D` or :class:`colour.io.LUT3D` class instance
+        to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the *LUT* has a shaper 1-D *LUT*, which the format does not
+        support.
+
+    Notes
+    -----
+    -   The numeric table is formatted at once with
+        :func:`colour.io.luts.common.format_array` definition.
+
+    References
+    ----------
+    -   :cite:`AdobeSystems2013b`
+
+    Examples
+    --------
+    Writing a 1-D *Iridas* *.cube* *LUT*:
+
+    >>> domain = np.array([[0.0, 0.0, 0.0], [1.5, 3.0, 6.0]])
+    >>> LUT = LUT1D(
+    ...     LUT1D.linear_table(16, domain) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     domain,
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT_IridasCube(LUT, 'My_LUT.cube')  # doctest: +SKIP
+
+    Writing a 3-D *Iridas* *.cube* *LUT*:
+
+    >>> LUT = LUT3D(
+    ...     LUT3D.linear_table(16) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT_IridasCube(LUT, 'My_LUT.cube')  # doctest: +SKIP
+    """
+
+    is_3D = isinstance(LUT, LUT3D)
+
+    if is_3D and LUT.shaper is not None:
+        raise ValueError(
+            '"{0}" LUT has a shaper 1-D LUT which is not supported by the '
+            '"Iridas" ".cube" LUT format!'.format(LUT.name))
+
+    domain = LUT.domain
+    if domain.ndim == 1:
+        domain = np.transpose(np.tile(domain, (3, 1)))
+
+    if is_3D:
+        table = np.reshape(np.transpose(LUT.table, (2, 1, 0, 3)), (-1, 3))
+    else:
+        table = LUT.table
+        if table.ndim == 1:
+            table = np.transpose(np.tile(table, (3, 1)))
+
+    lines = ['TITLE "{0}"'.format(LUT.name)]
+    lines += ['# {0}'.format(comment) for comment in LUT.comments]
+    lines.append('{0} {1}'.format('LUT_3D_SIZE'
+                                  if is_3D else 'LUT_1D_SIZE', LUT.size))
+
+    default_domain = np.array([[0, 0, 0], [1, 1, 1]])
+    if not np.array_equal(domain, default_domain):
+        lines.append('DOMAIN_MIN {0}'.format(
+            format_array(domain[0][np.newaxis], decimals).strip()))
+        lines.append('DOMAIN_MAX {0}'.format(
+            format_array(domain[1][np.newaxis], decimals).strip()))
+
+    with codecs.open(
+            path, 'w', encoding=IRIDAS_CUBE_FILE_ENCODING) as cube_file:
+        cube_file.write('\n'.join(lines))
+        cube_file.write('\n')
+        cube_file.write(format_array(table, decimals))
+
+    return True
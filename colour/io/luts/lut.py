@@ -0,0 +1,696 @@
+# -*- coding: utf-8 -*-
+"""
+LUT Processing
+==============
+
+Defines the classes handling *LUT* processing:
+
+-   :class:`colour.io.LUT1D`
+-   :class:`colour.io.LUT3D`
+-   :attr:`colour.io.LUT_Error_Specification`
+
+A *LUT* bakes an arbitrary, potentially expensive, colour transformation,
+e.g. :func:`colour.RGB_to_RGB` with colour component transfer functions, into
+a regularly sampled table that is then applied with interpolation.
+
+References
+----------
+-   :cite:`Bourkeb` : Bourke, P. (n.d.). Trilinear Interpolation. Retrieved
+    January 13, 2018, from http://paulbourke.net/miscellaneous/interpolation/
+-   :cite:`Kirk2006` : Kirk, R. (2006). Truelight Software Library 2.0.
+    Retrieved from https://www.filmlight.ltd.uk/pdf/whitepapers/\\
+FL-TL-TN-0057-SoftwareLib.pdf
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+
+from colour.algebra import table_interpolation
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LUT_CHUNK_SIZE', 'LUT_Error_Specification', 'LUT1D', 'LUT3D'
+]
+
+LUT_CHUNK_SIZE = 2 ** 18
+"""
+Default count of pixels processed per pass when applying a *LUT*, bounding
+the memory used by the interpolation intermediate arrays.
+
+LUT_CHUNK_SIZE : int
+"""
+
+LUT_Error_Specification = namedtuple('LUT_Error_Specification',
+                                     ('maximum', 'mean'))
+"""
+Defines the absolute error of a *LUT* against the exact function it has been
+generated from.
+
+Parameters
+----------
+maximum : numeric
+    Maximum absolute error.
+mean : numeric
+    Mean absolute error.
+"""
+
+
+class LUT1D(object):
+    """
+    Defines the base class for a 1-D *LUT*, either a single curve applied to
+    every *RGB* component or three curves, one per component.
+
+    Parameters
+    ----------
+    table : array_like, optional
+        Underlying *LUT* table of shape (N, ) or (N, 3), defaults to a linear
+        table.
+    name : unicode, optional
+        *LUT* name.
+    domain : array_like, optional
+        *LUT* input domain of shape (2, ) or (2, 3), i.e. the minimum and
+        maximum input values, defaults to [0, 1].
+    comments : array_like, optional
+        Comments to add to the *LUT*.
+
+    Attributes
+    ----------
+    table
+    name
+    domain
+    size
+    comments
+
+    Methods
+    -------
+    linear_table
+    generate
+    apply
+    invert
+
+    Examples
+    --------
+    >>> LUT = LUT1D()
+    >>> LUT.generate(lambda x: x ** (1 / 2.2), 16)
+    True
+    >>> LUT.apply(np.array([0.18, 0.50, 0.75]))  # doctest: +ELLIPSIS
+    array([ 0.4568...,  0.7293...,  0.8772...])
+    """
+
+    def __init__(self, table=None, name=None, domain=None, comments=None):
+        self._table = (self.linear_table() if table is None else np.asarray(
+            table, dtype=DEFAULT_FLOAT_DTYPE))
+        self._name = 'Unity {0}'.format(
+            len(self._table)) if name is None else name
+        self._domain = (np.array([0, 1], dtype=DEFAULT_FLOAT_DTYPE)
+                        if domain is None else np.asarray(
+                            domain, dtype=DEFAULT_FLOAT_DTYPE))
+        self._comments = [] if comments is None else list(comments)
+
+    @property
+    def table(self):
+        """
+        Getter property for the underlying *LUT* table.
+
+        Returns
+        -------
+        ndarray
+            Underlying *LUT* table.
+        """
+
+        return self._table
+
+    @property
+    def name(self):
+        """
+        Getter property for the *LUT* name.
+
+        Returns
+        -------
+        unicode
+            *LUT* name.
+        """
+
+        return self._name
+
+    @property
+    def domain(self):
+        """
+        Getter property for the *LUT* input domain.
+
+        Returns
+        -------
+        ndarray
+            *LUT* input domain.
+        """
+
+        return self._domain
+
+    @property
+    def size(self):
+        """
+        Getter property for the *LUT* size, i.e. the count of samples of the
+        underlying table.
+
+        Returns
+        -------
+        int
+            *LUT* size.
+        """
+
+        return self._table.shape[0]
+
+    @property
+    def comments(self):
+        """
+        Getter property for the *LUT* comments.
+
+        Returns
+        -------
+        list
+            *LUT* comments.
+        """
+
+        return self._comments
+
+    @staticmethod
+    def linear_table(size=1024, domain=np.array([0, 1])):
+        """
+        Returns a linear table of given size and domain.
+
+        Parameters
+        ----------
+        size : int, optional
+            Linear table size.
+        domain : array_like, optional
+            Linear table domain of shape (2, ) or (2, 3).
+
+        Returns
+        -------
+        ndarray
+            Linear table of shape (size, ) or (size, 3).
+
+        Examples
+        --------
+        >>> LUT1D.linear_table(5)
+        array([ 0.  ,  0.25,  0.5 ,  0.75,  1.  ])
+        """
+
+        domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+        if domain.ndim == 1:
+            return np.linspace(domain[0], domain[1], size)
+        else:
+            return tstack([
+                np.linspace(domain[0][i], domain[1][i], size)
+                for i in range(3)
+            ])
+
+    def generate(self, function, size=1024, domain=np.array([0, 1])):
+        """
+        Generates the underlying *LUT* table by sampling given function over
+        given domain.
+
+        Parameters
+        ----------
+        function : callable
+            Function to sample, it must be vectorised.
+        size : int, optional
+            *LUT* size.
+        domain : array_like, optional
+            *LUT* input domain of shape (2, ) or (2, 3).
+
+        Returns
+        -------
+        bool
+            Definition success.
+        """
+
+        self._domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+        self._table = np.asarray(
+            function(self.linear_table(size, self._domain)),
+            dtype=DEFAULT_FLOAT_DTYPE)
+
+        return True
+
+    def _samples(self):
+        """
+        Returns the input samples of the underlying *LUT* table, per *RGB*
+        component when the table or the domain are 3-dimensional.
+
+        Returns
+        -------
+        ndarray
+            Input samples of shape (N, ) or (N, 3).
+        """
+
+        domain = self._domain
+        if self._table.ndim == 2 and domain.ndim == 1:
+            domain = np.transpose(np.tile(domain, (3, 1)))
+
+        return self.linear_table(self.size, domain)
+
+    def apply(self, RGB):
+        """
+        Applies the *LUT* to given *RGB* colourspace array using linear
+        interpolation, values outside the domain are clamped.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the *LUT* onto.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+        """
+
+        RGB = np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE)
+
+        samples = self._samples()
+        if samples.ndim == 1:
+            return np.interp(RGB, samples, self._table)
+        else:
+            table = self._table
+            if table.ndim == 1:
+                table = np.transpose(np.tile(table, (3, 1)))
+
+            return tstack([
+                np.interp(RGB[..., i], samples[..., i], table[..., i])
+                for i in range(3)
+            ])
+
+    def invert(self, RGB):
+        """
+        Applies the inverse *LUT* to given *RGB* colourspace array using
+        linear interpolation, the underlying table must be strictly
+        increasing.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the inverse *LUT* onto.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+
+        Raises
+        ------
+        ValueError
+            If the underlying table is not strictly increasing.
+        """
+
+        if np.any(np.diff(self._table, axis=0) <= 0):
+            raise ValueError(
+                '"{0}" LUT table is not strictly increasing and cannot be '
+                'inverted!'.format(self._name))
+
+        RGB = np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE)
+
+        samples = self._samples()
+        if samples.ndim == 1:
+            return np.interp(RGB, self._table, samples)
+        else:
+            table = self._table
+            if table.ndim == 1:
+                table = np.transpose(np.tile(table, (3, 1)))
+
+            return tstack([
+                np.interp(RGB[..., i], table[..., i], samples[..., i])
+                for i in range(3)
+            ])
+
+
+class LUT3D(object):
+    """
+    Defines the base class for a 3-D *LUT*, optionally preceded by a shaper
+    1-D *LUT* redistributing the lattice samples, e.g. for linear scene
+    referred or high dynamic range input.
+
+    Parameters
+    ----------
+    table : array_like, optional
+        Underlying *LUT* table of shape (N, N, N, 3), indexed by the input
+        *R*, *G* and *B* components in that order, defaults to a linear
+        table.
+    name : unicode, optional
+        *LUT* name.
+    domain : array_like, optional
+        *LUT* input domain of shape (2, 3), i.e. the minimum and maximum
+        input *RGB* values, defaults to [0, 1]. It is superseded by the shaper
+        domain when a shaper is defined.
+    shaper : LUT1D, optional
+        Shaper 1-D *LUT* applied before the 3-D *LUT*, its table range is
+        mapped to the 3-D *LUT* lattice.
+    comments : array_like, optional
+        Comments to add to the *LUT*.
+
+    Attributes
+    ----------
+    table
+    name
+    domain
+    size
+    shaper
+    comments
+
+    Methods
+    -------
+    linear_table
+    generate
+    apply
+    error
+
+    References
+    ----------
+    -   :cite:`Bourkeb`
+    -   :cite:`Kirk2006`
+
+    Examples
+    --------
+    >>> from colour.models import RGB_to_RGB, sRGB_COLOURSPACE
+    >>> from colour.models import ACES_CG_COLOURSPACE
+    >>> def sRGB_to_ACEScg(RGB):
+    ...     return RGB_to_RGB(
+    ...         RGB, sRGB_COLOURSPACE, ACES_CG_COLOURSPACE,
+    ...         apply_decoding_cctf=True)
+    >>> LUT = LUT3D()
+    >>> LUT.generate(sRGB_to_ACEScg, 17)
+    True
+    >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+    >>> LUT.apply(RGB)  # doctest: +ELLIPSIS
+    array([ 0.2928...,  0.0609...,  0.0491...])
+    >>> sRGB_to_ACEScg(RGB)  # doctest: +ELLIPSIS
+    array([ 0.2920...,  0.0606...,  0.0483...])
+    """
+
+    def __init__(self,
+                 table=None,
+                 name=None,
+                 domain=None,
+                 shaper=None,
+                 comments=None):
+        self._table = (self.linear_table() if table is None else np.asarray(
+            table, dtype=DEFAULT_FLOAT_DTYPE))
+        self._name = 'Unity {0}'.format(
+            self._table.shape[0]) if name is None else name
+        self._domain = np.array(
+            [[0, 0, 0], [1, 1, 1]],
+            dtype=DEFAULT_FLOAT_DTYPE) if domain is None else np.asarray(
+                domain, dtype=DEFAULT_FLOAT_DTYPE)
+        self._shaper = shaper
+        self._comments = [] if comments is None else list(comments)
+
+    @property
+    def table(self):
+        """
+        Getter property for the underlying *LUT* table.
+
+        Returns
+        -------
+        ndarray
+            Underlying *LUT* table.
+        """
+
+        return self._table
+
+    @property
+    def name(self):
+        """
+        Getter property for the *LUT* name.
+
+        Returns
+        -------
+        unicode
+            *LUT* name.
+        """
+
+        return self._name
+
+    @property
+    def domain(self):
+        """
+        Getter property for the *LUT* input domain.
+
+        Returns
+        -------
+        ndarray
+            *LUT* input domain.
+        """
+
+        if self._shaper is not None:
+            return self._shaper_domain()
+
+        return self._domain
+
+    @property
+    def size(self):
+        """
+        Getter property for the *LUT* size, i.e. the count of samples of the
+        underlying table lattice along each axis.
+
+        Returns
+        -------
+        int
+            *LUT* size.
+        """
+
+        return self._table.shape[0]
+
+    @property
+    def shaper(self):
+        """
+        Getter property for the shaper 1-D *LUT*.
+
+        Returns
+        -------
+        LUT1D
+            Shaper 1-D *LUT*.
+        """
+
+        return self._shaper
+
+    @property
+    def comments(self):
+        """
+        Getter property for the *LUT* comments.
+
+        Returns
+        -------
+        list
+            *LUT* comments.
+        """
+
+        return self._comments
+
+    @staticmethod
+    def linear_table(size=33, domain=np.array([[0, 0, 0], [1, 1, 1]])):
+        """
+        Returns a linear table of given size and domain.
+
+        Parameters
+        ----------
+        size : int, optional
+            Linear table size.
+        domain : array_like, optional
+            Linear table domain of shape (2, 3).
+
+        Returns
+        -------
+        ndarray
+            Linear table of shape (size, size, size, 3).
+
+        Examples
+        --------
+        >>> LUT3D.linear_table(3)[1, 2, 0]
+        array([ 0.5,  1. ,  0. ])
+        """
+
+        domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+        samples = [np.linspace(domain[0][i], domain[1][i], size)
+                   for i in range(3)]
+
+        return tstack(np.meshgrid(*samples, indexing='ij'))
+
+    def _shaper_domain(self):
+        """
+        Returns the input domain of the shaper 1-D *LUT* with shape (2, 3).
+        """
+
+        domain = self._shaper.domain
+
+        return np.transpose(np.tile(domain, (3, 1))) if domain.ndim == 1 else (
+            domain)
+
+    def _shaper_range(self):
+        """
+        Returns the output range of the shaper 1-D *LUT* with shape (2, 3),
+        i.e. the range mapped to the 3-D *LUT* lattice.
+        """
+
+        table = self._shaper.table
+        if table.ndim == 1:
+            table = np.transpose(np.tile(table, (3, 1)))
+
+        return np.vstack([np.min(table, axis=0), np.max(table, axis=0)])
+
+    def _normalise(self, RGB):
+        """
+        Normalises given *RGB* colourspace array to the 3-D *LUT* lattice
+        domain [0, 1], applying the shaper 1-D *LUT* if defined.
+        """
+
+        if self._shaper is not None:
+            RGB = self._shaper.apply(RGB)
+            domain = self._shaper_range()
+        else:
+            domain = self._domain
+
+        return (RGB - domain[0]) / (domain[1] - domain[0])
+
+    def generate(self, function, size=33, domain=None, shaper=None):
+        """
+        Generates the underlying *LUT* table by sampling given function on a
+        regular lattice.
+
+        Parameters
+        ----------
+        function : callable
+            Function to sample, it must be vectorised and process *RGB*
+            colourspace arrays of shape (..., 3).
+        size : int, optional
+            *LUT* size, i.e. the count of lattice samples along each axis.
+        domain : array_like, optional
+            *LUT* input domain of shape (2, 3), defaults to [0, 1], or to the
+            shaper domain if ``shaper`` is given.
+        shaper : LUT1D, optional
+            Shaper 1-D *LUT* applied before the 3-D *LUT*. The lattice is
+            regularly sampled in the shaper output range and the function is
+            evaluated at the shaper inverse of the lattice samples, thus the
+            underlying table must be strictly increasing.
+
+        Returns
+        -------
+        bool
+            Definition success.
+        """
+
+        self._shaper = shaper
+
+        if shaper is not None:
+            lattice = self.linear_table(size, self._shaper_range())
+            RGB = shaper.invert(lattice)
+            self._domain = self._shaper_domain()
+        else:
+            if domain is None:
+                domain = np.array([[0, 0, 0], [1, 1, 1]])
+
+            self._domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+            RGB = self.linear_table(size, self._domain)
+
+        self._table = np.asarray(function(RGB), dtype=DEFAULT_FLOAT_DTYPE)
+
+        return True
+
+    def apply(self, RGB, method='Tetrahedral', chunk_size=LUT_CHUNK_SIZE):
+        """
+        Applies the *LUT* to given *RGB* colourspace array using given
+        interpolation method, values outside the domain are clamped.
+
+        The *RGB* colourspace array is processed in chunks of given size so
+        that the interpolation intermediate arrays remain bounded for large
+        images.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array to apply the *LUT* onto.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method.
+        chunk_size : int, optional
+            Count of pixels processed per pass.
+
+        Returns
+        -------
+        ndarray
+            Interpolated *RGB* colourspace array.
+        """
+
+        RGB = np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE)
+        shape = RGB.shape
+
+        RGB = np.reshape(RGB, (-1, 3))
+        RGB_o = np.empty(RGB.shape, dtype=DEFAULT_FLOAT_DTYPE)
+        for i in range(0, RGB.shape[0], chunk_size):
+            RGB_o[i:i + chunk_size] = table_interpolation(
+                self._normalise(RGB[i:i + chunk_size]), self._table, method)
+
+        return np.reshape(RGB_o, shape)
+
+    def error(self,
+              function,
+              RGB=None,
+              samples=100000,
+              method='Tetrahedral',
+              chunk_size=LUT_CHUNK_SIZE):
+        """
+        Returns the absolute error of the *LUT* against the exact function it
+        has been generated from.
+
+        Parameters
+        ----------
+        function : callable
+            Exact function, it must be vectorised and process *RGB* colourspace
+            arrays of shape (..., 3).
+        RGB : array_like, optional
+            *RGB* colourspace array the error is computed for, defaults to
+            given samples count of uniformly distributed *RGB* values in the
+            *LUT* domain, drawn with a fixed seed.
+        samples : int, optional
+            Samples count if ``RGB`` is not given.
+        method : unicode, optional
+            **{'Trilinear', 'Tetrahedral'}**,
+            Interpolation method.
+        chunk_size : int, optional
+            Count of pixels processed per pass.
+
+        Returns
+        -------
+        LUT_Error_Specification
+            Maximum and mean absolute error.
+
+        Examples
+        --------
+        >>> LUT = LUT3D()
+        >>> LUT.generate(lambda x: x ** 2, 9)
+        True
+        >>> LUT.error(lambda x: x ** 2)  # doctest: +ELLIPSIS
+        LUT_Error_Specification(maximum=0.0039..., mean=0.0026...)
+        """
+
+        if RGB is None:
+            domain = self.domain
+            RGB = np.random.RandomState(4).uniform(domain[0], domain[1],
+                                                   (samples, 3))
+
+        RGB = np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE)
+
+        delta = np.abs(
+            self.apply(RGB, method, chunk_size) - function(RGB))
+
+        return LUT_Error_Specification(np.max(delta), np.mean(delta))
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Sony .spi1d LUT Format Input / Output Utilities
+===============================================
+
+Defines *Sony* *.spi1d* *LUT* Format related input / output utilities
+objects.
+
+-   :func:`colour.io.read_LUT_SonySPI1D`
+-   :func:`colour.io.write_LUT_SonySPI1D`
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import numpy as np
+
+from colour.io.luts import LUT1D
+from colour.io.luts.common import (iterate_lines, parse_array, format_array,
+                                   path_to_title)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'SONY_SPI1D_FILE_ENCODING', 'read_LUT_SonySPI1D', 'write_LUT_SonySPI1D'
+]
+
+SONY_SPI1D_FILE_ENCODING = 'utf-8'
+
+
+def read_LUT_SonySPI1D(path):
+    """
+    Reads given *Sony* *.spi1d* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT1D
+        :class:`colour.io.LUT1D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If the *LUT* length is not defined or if the table values count does
+        not match it.
+
+    Notes
+    -----
+    -   The header is parsed line by line while the numeric table is parsed
+        at once with :func:`numpy.fromstring` definition.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'sony_spi1d',
+    ...     'oetf_reverse_sRGB_1D.spi1d')
+    >>> LUT = read_LUT_SonySPI1D(path)
+    >>> LUT.name
+    'oetf reverse sRGB 1D'
+    >>> LUT.domain
+    array([-0.1,  1.5])
+    >>> LUT.table.shape
+    (16,)
+    """
+
+    domain = None
+    size, components = None, 1
+    comments = []
+
+    with codecs.open(path, encoding=SONY_SPI1D_FILE_ENCODING) as spi1d_file:
+        text = spi1d_file.read()
+
+    body = ''
+    for line, _start, end in iterate_lines(text):
+        if not line:
+            continue
+
+        if line.startswith('#'):
+            comments.append(line[1:].strip())
+            continue
+
+        tokens = line.split()
+        keyword = tokens[0]
+        if keyword == 'From':
+            domain = parse_array(' '.join(tokens[1:]), 2)
+        elif keyword == 'Length':
+            size = int(tokens[1])
+        elif keyword == 'Components':
+            components = int(tokens[1])
+        elif keyword == '{':
+            body = text[end:text.find('}', end)]
+            break
+
+    if size is None:
+        raise ValueError('"{0}" LUT has no "Length" keyword!'.format(path))
+
+    table = parse_array(body, size * components)
+    if components != 1:
+        table = np.reshape(table, (size, components))
+
+    return LUT1D(table, path_to_title(path), domain, comments=comments)
+
+
+def write_LUT_SonySPI1D(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Sony* *.spi1d* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT1D
+        :class:`colour.io.LUT1D` class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the *LUT* domain differs per *RGB* component, which the format
+        does not support.
+
+    Notes
+    -----
+    -   The numeric table is formatted at once with
+        :func:`colour.io.luts.common.format_array` definition.
+
+    Examples
+    --------
+    >>> domain = np.array([0.0, 1.5])
+    >>> LUT = LUT1D(
+    ...     LUT1D.linear_table(16, domain) ** (1 / 2.2),
+    ...     'My LUT',
+    ...     domain,
+    ...     comments=['A first comment.', 'A second comment.'])
+    >>> write_LUT_SonySPI1D(LUT, 'My_LUT.spi1d')  # doctest: +SKIP
+    """
+
+    domain = LUT.domain
+    if domain.ndim == 2:
+        if not np.all(domain == domain[..., 0:1]):
+            raise ValueError(
+                '"{0}" LUT domain differs per "RGB" component which is not '
+                'supported by the "Sony" ".spi1d" LUT format!'.format(
+                    LUT.name))
+
+        domain = domain[..., 0]
+
+    table = LUT.table
+    components = 1 if table.ndim == 1 else table.shape[-1]
+
+    lines = ['# {0}'.format(comment) for comment in LUT.comments]
+    lines += [
+        'Version 1',
+        'From {0}'.format(format_array(domain[np.newaxis], decimals).strip()),
+        'Length {0}'.format(LUT.size),
+        'Components {0}'.format(components),
+        '{',
+    ]
+
+    with codecs.open(
+            path, 'w', encoding=SONY_SPI1D_FILE_ENCODING) as spi1d_file:
+        spi1d_file.write('\n'.join(lines))
+        spi1d_file.write('\n')
+        spi1d_file.write(format_array(table, decimals))
+        spi1d_file.write('}\n')
+
+    return True
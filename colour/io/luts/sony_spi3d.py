@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Sony .spi3d LUT Format Input / Output Utilities
+===============================================
+
+Defines *Sony* *.spi3d* *LUT* Format related input / output utilities
+objects.
+
+-   :func:`colour.io.read_LUT_SonySPI3D`
+-   :func:`colour.io.write_LUT_SonySPI3D`
+"""
+
+from __future__ import division, unicode_literals
+
+import codecs
+import numpy as np
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.io.luts import LUT3D
+from colour.io.luts.common import (iterate_lines, parse_array, format_array,
+                                   path_to_title)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'SONY_SPI3D_FILE_ENCODING', 'read_LUT_SonySPI3D', 'write_LUT_SonySPI3D'
+]
+
+SONY_SPI3D_FILE_ENCODING = 'utf-8'
+
+
+def read_LUT_SonySPI3D(path):
+    """
+    Reads given *Sony* *.spi3d* *LUT* file.
+
+    Parameters
+    ----------
+    path : unicode
+        *LUT* path.
+
+    Returns
+    -------
+    LUT3D
+        :class:`colour.io.LUT3D` class instance.
+
+    Raises
+    ------
+    ValueError
+        If the *LUT* size is not defined or if the table values count does
+        not match it.
+
+    Notes
+    -----
+    -   The header is parsed line by line while the numeric table is parsed
+        at once with :func:`numpy.fromstring` definition, the lattice
+        indexes of every row are used to fill the table.
+
+    Examples
+    --------
+    >>> import os
+    >>> path = os.path.join(
+    ...     os.path.dirname(__file__), 'tests', 'resources', 'sony_spi3d',
+    ...     'ColourCorrect.spi3d')
+    >>> LUT = read_LUT_SonySPI3D(path)
+    >>> LUT.name
+    'ColourCorrect'
+    >>> LUT.table.shape
+    (4, 4, 4, 3)
+    """
+
+    header, comments = [], []
+
+    with codecs.open(path, encoding=SONY_SPI3D_FILE_ENCODING) as spi3d_file:
+        text = spi3d_file.read()
+
+    body = ''
+    for line, start, _end in iterate_lines(text):
+        if not line:
+            continue
+
+        if line.startswith('#'):
+            comments.append(line[1:].strip())
+            continue
+
+        # The header is made of the "SPILUT 1.0" line, the input and output
+        # components count line, i.e. "3 3", and the lattice size line.
+        if len(header) < 3:
+            header.append(line.split())
+        else:
+            body = text[start:]
+            break
+
+    if len(header) < 3:
+        raise ValueError(
+            '"{0}" LUT has no lattice size definition!'.format(path))
+
+    size = int(header[2][0])
+
+    data = np.reshape(parse_array(body, size ** 3 * 6), (-1, 6))
+    indexes = data[..., 0:3].astype(np.int_)
+
+    table = np.zeros((size, size, size, 3), dtype=DEFAULT_FLOAT_DTYPE)
+    table[indexes[..., 0], indexes[..., 1], indexes[..., 2]] = data[..., 3:6]
+
+    return LUT3D(table, path_to_title(path), comments=comments)
+
+
+def write_LUT_SonySPI3D(LUT, path, decimals=7):
+    """
+    Writes given *LUT* to given *Sony* *.spi3d* *LUT* file.
+
+    Parameters
+    ----------
+    LUT : LUT3D
+        :class:`colour.io.LUT3D` class instance to write at given path.
+    path : unicode
+        *LUT* path.
+    decimals : int, optional
+        Formatting decimals.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the *LUT* has a shaper 1-D *LUT* or a domain different from
+        [0, 1], which the format does not support.
+
+    Notes
+    -----
+    -   The numeric table is formatted at once with
+        :func:`colour.io.luts.common.format_array` definition.
+    -   The format does not support comments, thus the *LUT* comments are
+        not written.
+
+    Examples
+    --------
+    >>> LUT = LUT3D(LUT3D.linear_table(16) ** (1 / 2.2), 'My LUT')
+    >>> write_LUT_SonySPI3D(LUT, 'My_LUT.spi3d')  # doctest: +SKIP
+    """
+
+    if LUT.shaper is not None:
+        raise ValueError(
+            '"{0}" LUT has a shaper 1-D LUT which is not supported by the '
+            '"Sony" ".spi3d" LUT format!'.format(LUT.name))
+
+    if not np.array_equal(LUT.domain, np.array([[0, 0, 0], [1, 1, 1]])):
+        raise ValueError(
+            '"{0}" LUT domain is not [0, 1] which is not supported by the '
+            '"Sony" ".spi3d" LUT format!'.format(LUT.name))
+
+    size = LUT.size
+    # The lattice indexes are generated so that the *B* component varies the
+    # fastest, matching the underlying table memory layout.
+    indexes = np.reshape(
+        np.transpose(np.indices((size, size, size)), (1, 2, 3, 0)), (-1, 3))
+    data = np.hstack([indexes, np.reshape(LUT.table, (-1, 3))])
+
+    lines = ['SPILUT 1.0', '3 3', '{0} {0} {0}'.format(size)]
+
+    with codecs.open(
+            path, 'w', encoding=SONY_SPI3D_FILE_ENCODING) as spi3d_file:
+        spi3d_file.write('\n'.join(lines))
+        spi3d_file.write('\n')
+        spi3d_file.write(
+            format_array(data, [0, 0, 0, decimals, decimals, decimals]))
+
+    return True
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.__init__` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io.luts import LUT1D, LUT3D, read_LUT, write_LUT
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUT', 'TestWriteLUT']
+
+LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.__init__.read_LUT` definition unit tests
+    methods.
+    """
+
+    def test_read_LUT(self):
+        """
+        Tests :func:`colour.io.luts.__init__.read_LUT` definition.
+        """
+
+        paths = [
+            os.path.join(LUTS_DIRECTORY, 'iridas_cube', 'ColourCorrect.cube'),
+            os.path.join(LUTS_DIRECTORY, 'sony_spi3d', 'ColourCorrect.spi3d'),
+            os.path.join(LUTS_DIRECTORY, 'cinespace', 'ColourCorrect.csp'),
+        ]
+
+        table = read_LUT(paths[0]).table
+        for path in paths:
+            LUT = read_LUT(path)
+            self.assertIsInstance(LUT, LUT3D)
+            np.testing.assert_equal(LUT.table, table)
+
+        LUT = read_LUT(
+            os.path.join(LUTS_DIRECTORY, 'sony_spi1d',
+                         'oetf_reverse_sRGB_1D.spi1d'))
+        self.assertIsInstance(LUT, LUT1D)
+
+        LUT = read_LUT(
+            os.path.join(LUTS_DIRECTORY, 'iridas_cube', 'ColourCorrect.cube'),
+            method='Iridas Cube')
+        self.assertIsInstance(LUT, LUT3D)
+
+
+class TestWriteLUT(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.__init__.write_LUT` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT(self):
+        """
+        Tests :func:`colour.io.luts.__init__.write_LUT` definition.
+        """
+
+        LUT_1 = read_LUT(
+            os.path.join(LUTS_DIRECTORY, 'iridas_cube', 'ColourCorrect.cube'))
+
+        for extension in ('.cube', '.spi3d', '.csp'):
+            path = os.path.join(self._temporary_directory,
+                                'ColourCorrect{0}'.format(extension))
+            self.assertTrue(write_LUT(LUT_1, path))
+
+            LUT_2 = read_LUT(path)
+            np.testing.assert_equal(LUT_1.table, LUT_2.table)
+
+        LUT_1 = LUT1D(LUT1D.linear_table(16) ** (1 / 2.2), 'My LUT')
+        path = os.path.join(self._temporary_directory, 'My_LUT.txt')
+        write_LUT(LUT_1, path, method='Sony SPI1D')
+
+        LUT_2 = read_LUT(path, method='Sony SPI1D')
+        np.testing.assert_almost_equal(LUT_1.table, LUT_2.table, decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.cinespace_csp` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io.luts import (LUT1D, LUT3D, read_LUT_Cinespace,
+                            read_LUT_IridasCube, write_LUT_Cinespace)
+from colour.models import oetf_reverse_sRGB
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUTCinespace', 'TestWriteLUTCinespace']
+
+LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUTCinespace(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.cinespace_csp.read_LUT_Cinespace`
+    definition unit tests methods.
+    """
+
+    def test_read_LUT_Cinespace(self):
+        """
+        Tests :func:`colour.io.luts.cinespace_csp.read_LUT_Cinespace`
+        definition.
+        """
+
+        LUT = read_LUT_Cinespace(
+            os.path.join(LUTS_DIRECTORY, 'cinespace',
+                         'oetf_reverse_sRGB_1D.csp'))
+
+        self.assertIsInstance(LUT, LUT1D)
+        self.assertEqual(LUT.name, 'sRGB Decoding')
+        self.assertListEqual(LUT.comments,
+                             ['Inverse sRGB OETF sampled on [-0.1, 1.5].'])
+        np.testing.assert_equal(LUT.domain, np.array([-0.1, 1.5]))
+        np.testing.assert_almost_equal(
+            LUT.table[..., 0],
+            oetf_reverse_sRGB(np.linspace(-0.1, 1.5, 16)),
+            decimal=7)
+
+        LUT = read_LUT_Cinespace(
+            os.path.join(LUTS_DIRECTORY, 'cinespace', 'ColourCorrect.csp'))
+
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertEqual(LUT.name, 'Generated by Foundry::LUT')
+        np.testing.assert_equal(
+            LUT.table,
+            read_LUT_IridasCube(
+                os.path.join(LUTS_DIRECTORY, 'iridas_cube',
+                             'ColourCorrect.cube')).table)
+
+        LUT = read_LUT_Cinespace(
+            os.path.join(LUTS_DIRECTORY, 'cinespace',
+                         'Three_Dimensional_Table_With_Shaper.csp'))
+
+        self.assertIsInstance(LUT.shaper, LUT1D)
+        self.assertEqual(LUT.shaper.size, 10)
+        np.testing.assert_almost_equal(
+            LUT.domain,
+            np.array([[0.003906, 0.003906, 0.003906], [16, 16, 16]]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.shaper.table[..., 0],
+            (np.log2(np.linspace(2 ** -8, 16, 10)) + 8) / 12,
+            decimal=4)
+
+    def test_raise_exception_read_LUT_Cinespace(self):
+        """
+        Tests :func:`colour.io.luts.cinespace_csp.read_LUT_Cinespace`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError, read_LUT_Cinespace,
+            os.path.join(LUTS_DIRECTORY, 'iridas_cube', 'ColourCorrect.cube'))
+
+
+class TestWriteLUTCinespace(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.cinespace_csp.write_LUT_Cinespace`
+    definition unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_Cinespace(self):
+        """
+        Tests :func:`colour.io.luts.cinespace_csp.write_LUT_Cinespace`
+        definition.
+        """
+
+        domain = np.array([[0.0, 0.0, 0.0], [1.5, 3.0, 6.0]])
+        LUT_1 = LUT1D(
+            LUT1D.linear_table(16, domain) ** (1 / 2.2),
+            'My LUT',
+            domain,
+            comments=['A first comment.', 'A second comment.'])
+        path = os.path.join(self._temporary_directory, 'My_LUT.csp')
+        self.assertTrue(write_LUT_Cinespace(LUT_1, path))
+
+        LUT_2 = read_LUT_Cinespace(path)
+        self.assertEqual(LUT_1.name, LUT_2.name)
+        self.assertListEqual(LUT_1.comments, LUT_2.comments)
+        np.testing.assert_equal(LUT_1.domain, LUT_2.domain)
+        np.testing.assert_almost_equal(LUT_1.table, LUT_2.table, decimal=7)
+
+        shaper = LUT1D(
+            np.log2(LUT1D.linear_table(32, np.array([2 ** -8, 16]))),
+            domain=np.array([2 ** -8, 16]))
+        LUT_1 = LUT3D(name='My LUT')
+        LUT_1.generate(lambda x: x / (1 + x), 9, shaper=shaper)
+        path = os.path.join(self._temporary_directory, 'My_LUT.csp')
+        write_LUT_Cinespace(LUT_1, path)
+
+        LUT_2 = read_LUT_Cinespace(path)
+        np.testing.assert_almost_equal(LUT_1.domain, LUT_2.domain, decimal=7)
+        np.testing.assert_almost_equal(LUT_1.table, LUT_2.table, decimal=7)
+
+        RGB = np.array([[0.18, 1.0, 8.0], [0.01, 0.5, 12.0]])
+        np.testing.assert_almost_equal(
+            LUT_1.apply(RGB), LUT_2.apply(RGB), decimal=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.common` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.io.luts.common import (iterate_lines, parse_array, format_array,
+                                   path_to_title)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestIterateLines', 'TestParseArray', 'TestFormatArray',
+    'TestPathToTitle'
+]
+
+
+class TestIterateLines(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.iterate_lines` definition unit tests
+    methods.
+    """
+
+    def test_iterate_lines(self):
+        """
+        Tests :func:`colour.io.luts.common.iterate_lines` definition.
+        """
+
+        text = 'LUT_1D_SIZE 2\n\n  0 1\n1 0\n'
+        lines = list(iterate_lines(text))
+
+        self.assertListEqual([line for line, _start, _end in lines],
+                             ['LUT_1D_SIZE 2', '', '0 1', '1 0'])
+        self.assertEqual(text[lines[2][1]:], '  0 1\n1 0\n')
+        self.assertEqual(lines[-1][-1], len(text))
+
+
+class TestParseArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.parse_array` definition unit tests
+    methods.
+    """
+
+    def test_parse_array(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_array` definition.
+        """
+
+        np.testing.assert_equal(
+            parse_array('0.0 0.5\n1.0\t-1.0\n', 4),
+            np.array([0.0, 0.5, 1.0, -1.0]))
+
+        np.testing.assert_equal(parse_array('1e-3 2E2'), np.array([1e-3, 2e2]))
+
+    def test_raise_exception_parse_array(self):
+        """
+        Tests :func:`colour.io.luts.common.parse_array` definition raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, parse_array, '0.0 0.5 1.0', 4)
+
+
+class TestFormatArray(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.format_array` definition unit tests
+    methods.
+    """
+
+    def test_format_array(self):
+        """
+        Tests :func:`colour.io.luts.common.format_array` definition.
+        """
+
+        self.assertEqual(
+            format_array(np.array([0.0, 0.5, 1.0]), 3),
+            '0.000\n0.500\n1.000\n')
+
+        self.assertEqual(
+            format_array(np.array([[0, 1], [1, 0]]), [0, 1], '\t'),
+            '0\t1.0\n1\t0.0\n')
+
+        array = np.random.RandomState(4).uniform(-1, 1, (100, 3))
+        np.testing.assert_almost_equal(
+            parse_array(format_array(array, 7)).reshape(100, 3),
+            array,
+            decimal=7)
+
+
+class TestPathToTitle(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.common.path_to_title` definition unit tests
+    methods.
+    """
+
+    def test_path_to_title(self):
+        """
+        Tests :func:`colour.io.luts.common.path_to_title` definition.
+        """
+
+        self.assertEqual(
+            path_to_title('/tmp/ACES_Proxy-10.to.ACES.cube'),
+            'ACES Proxy 10 to ACES')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.iridas_cube` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io.luts import (LUT1D, LUT3D, read_LUT_IridasCube,
+                            write_LUT_IridasCube)
+from colour.models import oetf_reverse_sRGB
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LUTS_DIRECTORY', 'TestReadLUTIridasCube', 'TestWriteLUTIridasCube'
+]
+
+LUTS_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), 'resources', 'iridas_cube')
+
+
+class TestReadLUTIridasCube(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube` definition
+    unit tests methods.
+    """
+
+    def test_read_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube`
+        definition.
+        """
+
+        LUT = read_LUT_IridasCube(
+            os.path.join(LUTS_DIRECTORY, 'oetf_reverse_sRGB_1D.cube'))
+
+        self.assertIsInstance(LUT, LUT1D)
+        self.assertEqual(LUT.name, 'sRGB Decoding')
+        self.assertListEqual(LUT.comments,
+                             ['Inverse sRGB OETF sampled on [-0.1, 1.5].'])
+        np.testing.assert_equal(LUT.domain, np.array([-0.1, 1.5]))
+        np.testing.assert_almost_equal(
+            LUT.table[..., 1],
+            oetf_reverse_sRGB(np.linspace(-0.1, 1.5, 16)),
+            decimal=7)
+
+        LUT = read_LUT_IridasCube(
+            os.path.join(LUTS_DIRECTORY, 'ColourCorrect.cube'))
+
+        self.assertIsInstance(LUT, LUT3D)
+        self.assertEqual(LUT.name, 'Generated by Foundry::LUT')
+        self.assertEqual(LUT.size, 4)
+        np.testing.assert_equal(LUT.domain,
+                                np.array([[0, 0, 0], [1, 1, 1]]))
+        np.testing.assert_almost_equal(
+            LUT.table[1, 0, 0],
+            np.array([0.4051180, -0.0141733, -0.0134647]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.table[0, 0, 1],
+            np.array([-0.0050540, -0.0048133, 0.3754273]),
+            decimal=7)
+        np.testing.assert_almost_equal(
+            LUT.table[2, 3, 1],
+            np.array([0.6549900, 1.0238000, 0.2126100]),
+            decimal=7)
+
+    def test_raise_exception_read_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.iridas_cube.read_LUT_IridasCube`
+        definition raised exception.
+        """
+
+        self.assertRaises(
+            ValueError, read_LUT_IridasCube,
+            os.path.join(
+                os.path.dirname(LUTS_DIRECTORY), 'sony_spi3d',
+                'ColourCorrect.spi3d'))
+
+
+class TestWriteLUTIridasCube(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.iridas_cube.write_LUT_IridasCube` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.iridas_cube.write_LUT_IridasCube`
+        definition.
+        """
+
+        domain = np.array([[-0.1, -0.2, -0.4], [1.5, 3.0, 6.0]])
+        LUT_1 = LUT1D(
+            LUT1D.linear_table(16, domain) ** 2,
+            'My LUT',
+            domain,
+            comments=['A first comment.', 'A second comment.'])
+        path = os.path.join(self._temporary_directory, 'My_LUT.cube')
+        self.assertTrue(write_LUT_IridasCube(LUT_1, path))
+
+        LUT_2 = read_LUT_IridasCube(path)
+        self.assertEqual(LUT_1.name, LUT_2.name)
+        self.assertListEqual(LUT_1.comments, LUT_2.comments)
+        np.testing.assert_almost_equal(LUT_1.domain, LUT_2.domain, decimal=7)
+        np.testing.assert_almost_equal(LUT_1.table, LUT_2.table, decimal=7)
+
+        LUT_1 = read_LUT_IridasCube(
+            os.path.join(LUTS_DIRECTORY, 'ColourCorrect.cube'))
+        path = os.path.join(self._temporary_directory, 'ColourCorrect.cube')
+        write_LUT_IridasCube(LUT_1, path)
+
+        LUT_2 = read_LUT_IridasCube(path)
+        np.testing.assert_equal(LUT_1.table, LUT_2.table)
+        with open(path) as cube_file_1, open(
+                os.path.join(LUTS_DIRECTORY,
+                             'ColourCorrect.cube')) as cube_file_2:
+            self.assertEqual(cube_file_1.read(), cube_file_2.read())
+
+    def test_raise_exception_write_LUT_IridasCube(self):
+        """
+        Tests :func:`colour.io.luts.iridas_cube.write_LUT_IridasCube`
+        definition raised exception.
+        """
+
+        LUT = LUT3D()
+        LUT.generate(lambda x: x, 3, shaper=LUT1D(np.linspace(0, 1, 4) ** 2))
+
+        self.assertRaises(ValueError, write_LUT_IridasCube, LUT,
+                          os.path.join(self._temporary_directory,
+                                       'My_LUT.cube'))
+
+
+if __name__ == '__main__':
+    unittest.main()
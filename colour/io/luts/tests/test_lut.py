@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.lut` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+from itertools import permutations
+
+from colour.io.luts import LUT1D, LUT3D
+from colour.models import (ACES_CG_COLOURSPACE, RGB_to_RGB,
+                           sRGB_COLOURSPACE)
+from colour.utilities import ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['sRGB_to_ACEScg', 'TestLUT1D', 'TestLUT3D']
+
+
+def sRGB_to_ACEScg(RGB):
+    """
+    Converts given *sRGB* colourspace array to *ACEScg* colourspace, the
+    function sampled by the unit tests *LUTs*.
+    """
+
+    return RGB_to_RGB(
+        RGB, sRGB_COLOURSPACE, ACES_CG_COLOURSPACE, apply_decoding_cctf=True)
+
+
+class TestLUT1D(unittest.TestCase):
+    """
+    Defines :class:`colour.io.luts.lut.LUT1D` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('table', 'name', 'domain', 'size', 'comments')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LUT1D))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('linear_table', 'generate', 'apply', 'invert')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LUT1D))
+
+    def test_linear_table(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT1D.linear_table` method.
+        """
+
+        np.testing.assert_almost_equal(
+            LUT1D.linear_table(3, np.array([-1, 1])), np.array([-1, 0, 1]))
+
+        np.testing.assert_almost_equal(
+            LUT1D.linear_table(3, np.array([[0, 0, -1], [1, 2, 1]])),
+            np.array([[0.0, 0, -1], [0.5, 1, 0], [1.0, 2, 1]]))
+
+    def test_generate(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT1D.generate` method.
+        """
+
+        LUT = LUT1D()
+        self.assertEqual(LUT.size, 1024)
+        self.assertEqual(LUT.name, 'Unity 1024')
+
+        self.assertTrue(LUT.generate(lambda x: x ** 2, 5, np.array([0, 2])))
+        np.testing.assert_almost_equal(LUT.table,
+                                       np.array([0, 0.25, 1, 2.25, 4]))
+        np.testing.assert_almost_equal(LUT.domain, np.array([0, 2]))
+
+    def test_apply(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT1D.apply` method.
+        """
+
+        LUT = LUT1D(np.array([0, 0.25, 1, 2.25, 4]), domain=np.array([0, 2]))
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([[0.25, 1.25, 3.00], [-1.0, 1.0, 1.75]])),
+            np.array([[0.125, 1.625, 4.0], [0.0, 1.0, 3.125]]))
+
+        LUT = LUT1D(
+            np.array([[0, 0, 0], [0.5, 1, 2], [1, 2, 4]]),
+            domain=np.array([[0, 0, 0], [1, 1, 2]]))
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([0.25, 0.25, 0.25])),
+            np.array([0.25, 0.5, 0.5]))
+
+    def test_invert(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT1D.invert` method.
+        """
+
+        LUT = LUT1D(np.array([0, 0.25, 1, 2.25, 4]), domain=np.array([0, 2]))
+        RGB = np.array([0.25, 1.25, 1.75])
+        np.testing.assert_almost_equal(LUT.invert(LUT.apply(RGB)), RGB)
+
+        LUT = LUT1D(np.array([0, 1, 1, 0]))
+        self.assertRaises(ValueError, LUT.invert, RGB)
+
+
+class TestLUT3D(unittest.TestCase):
+    """
+    Defines :class:`colour.io.luts.lut.LUT3D` class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('table', 'name', 'domain', 'size', 'shaper',
+                               'comments')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LUT3D))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('linear_table', 'generate', 'apply', 'error')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LUT3D))
+
+    def test_linear_table(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT3D.linear_table` method.
+        """
+
+        table = LUT3D.linear_table(3, np.array([[0, 0, -1], [1, 2, 1]]))
+        self.assertTupleEqual(table.shape, (3, 3, 3, 3))
+        np.testing.assert_almost_equal(table[0, 1, 2], np.array([0, 1, 1]))
+        np.testing.assert_almost_equal(table[2, 0, 1], np.array([1, 0, 0]))
+
+    def test_generate(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT3D.generate` method.
+        """
+
+        LUT = LUT3D()
+        self.assertEqual(LUT.size, 33)
+
+        self.assertTrue(LUT.generate(sRGB_to_ACEScg, 9))
+        self.assertTupleEqual(LUT.table.shape, (9, 9, 9, 3))
+        np.testing.assert_almost_equal(
+            LUT.table[8, 4, 2],
+            sRGB_to_ACEScg(np.array([1.0, 0.5, 0.25])),
+            decimal=7)
+
+        shaper = LUT1D()
+        shaper.generate(np.sqrt, 1024, np.array([0, 4]))
+        self.assertTrue(LUT.generate(lambda x: x, 5, shaper=shaper))
+        np.testing.assert_almost_equal(LUT.domain,
+                                       np.array([[0, 0, 0], [4, 4, 4]]))
+        np.testing.assert_almost_equal(
+            LUT.table[1, 2, 4], np.array([0.25, 1, 4]), decimal=5)
+
+    def test_apply(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT3D.apply` method.
+        """
+
+        LUT = LUT3D()
+        LUT.generate(sRGB_to_ACEScg, 33)
+
+        RGB = np.random.RandomState(4).uniform(size=(16, 16, 3))
+        for method in ('Trilinear', 'Tetrahedral'):
+            np.testing.assert_almost_equal(
+                LUT.apply(RGB, method), sRGB_to_ACEScg(RGB), decimal=3)
+            np.testing.assert_equal(
+                LUT.apply(RGB, method, chunk_size=7), LUT.apply(RGB, method))
+
+        self.assertTupleEqual(LUT.apply(RGB[0, 0]).shape, (3, ))
+
+        # Values outside the domain are clamped.
+        np.testing.assert_almost_equal(
+            LUT.apply(np.array([-1.0, 0.5, 2.0])),
+            LUT.apply(np.array([0.0, 0.5, 1.0])),
+            decimal=7)
+
+        shaper = LUT1D()
+        shaper.generate(lambda x: np.log2(x + 2 ** -8), 4096,
+                        np.array([0, 16]))
+        LUT = LUT3D()
+        LUT.generate(lambda x: x / (x + 1), 33, shaper=shaper)
+        RGB = np.array([0.01, 1, 15])
+        np.testing.assert_almost_equal(
+            LUT.apply(RGB), RGB / (RGB + 1), decimal=3)
+
+    @ignore_numpy_errors
+    def test_nan_apply(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT3D.apply` method nan support.
+        """
+
+        LUT = LUT3D()
+        LUT.generate(sRGB_to_ACEScg, 9)
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        nan = np.any(np.isnan(cases), axis=-1)
+        for method in ('Trilinear', 'Tetrahedral'):
+            RGB = LUT.apply(cases, method)
+            self.assertTrue(np.all(np.isnan(RGB[nan])))
+            self.assertTrue(np.all(np.isfinite(RGB[~nan])))
+
+    def test_error(self):
+        """
+        Tests :func:`colour.io.luts.lut.LUT3D.error` method.
+        """
+
+        LUT = LUT3D()
+        LUT.generate(sRGB_to_ACEScg, 17)
+
+        error = LUT.error(sRGB_to_ACEScg)
+        self.assertLess(error.mean, error.maximum)
+        self.assertLess(error.maximum, 0.01)
+
+        LUT.generate(sRGB_to_ACEScg, 65)
+        self.assertLess(LUT.error(sRGB_to_ACEScg).maximum, error.maximum)
+
+        error = LUT.error(sRGB_to_ACEScg, np.array([[0, 0, 0], [1, 1, 1]]))
+        np.testing.assert_almost_equal(error.maximum, 0, decimal=7)
+
+        LUT = LUT3D()
+        np.testing.assert_almost_equal(
+            LUT.error(lambda x: x, samples=1000), (0, 0), decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.sony_spi1d` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io.luts import LUT1D, read_LUT_SonySPI1D, write_LUT_SonySPI1D
+from colour.models import oetf_reverse_sRGB
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUTSonySPI1D', 'TestWriteLUTSonySPI1D']
+
+LUTS_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), 'resources', 'sony_spi1d')
+
+
+class TestReadLUTSonySPI1D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.sony_spi1d.read_LUT_SonySPI1D` definition
+    unit tests methods.
+    """
+
+    def test_read_LUT_SonySPI1D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi1d.read_LUT_SonySPI1D`
+        definition.
+        """
+
+        LUT = read_LUT_SonySPI1D(
+            os.path.join(LUTS_DIRECTORY, 'oetf_reverse_sRGB_1D.spi1d'))
+
+        self.assertEqual(LUT.name, 'oetf reverse sRGB 1D')
+        self.assertEqual(LUT.size, 16)
+        np.testing.assert_equal(LUT.domain, np.array([-0.1, 1.5]))
+        np.testing.assert_almost_equal(
+            LUT.table,
+            oetf_reverse_sRGB(np.linspace(-0.1, 1.5, 16)),
+            decimal=7)
+
+
+class TestWriteLUTSonySPI1D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.sony_spi1d.write_LUT_SonySPI1D` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_SonySPI1D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi1d.write_LUT_SonySPI1D`
+        definition.
+        """
+
+        LUT_1 = read_LUT_SonySPI1D(
+            os.path.join(LUTS_DIRECTORY, 'oetf_reverse_sRGB_1D.spi1d'))
+        path = os.path.join(self._temporary_directory,
+                            'oetf_reverse_sRGB_1D.spi1d')
+        self.assertTrue(write_LUT_SonySPI1D(LUT_1, path))
+
+        LUT_2 = read_LUT_SonySPI1D(path)
+        self.assertEqual(LUT_1.name, LUT_2.name)
+        np.testing.assert_equal(LUT_1.domain, LUT_2.domain)
+        np.testing.assert_equal(LUT_1.table, LUT_2.table)
+
+        domain = np.array([[-0.1, -0.1, -0.1], [1.5, 1.5, 1.5]])
+        LUT_1 = LUT1D(
+            LUT1D.linear_table(16, domain) ** np.array([2.0, 2.2, 2.4]),
+            'My LUT',
+            domain,
+            comments=['A first comment.', 'A second comment.'])
+        path = os.path.join(self._temporary_directory, 'My_LUT.spi1d')
+        write_LUT_SonySPI1D(LUT_1, path)
+
+        LUT_2 = read_LUT_SonySPI1D(path)
+        self.assertListEqual(LUT_1.comments, LUT_2.comments)
+        np.testing.assert_equal(LUT_2.domain, np.array([-0.1, 1.5]))
+        np.testing.assert_almost_equal(LUT_1.table, LUT_2.table, decimal=7)
+
+    def test_raise_exception_write_LUT_SonySPI1D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi1d.write_LUT_SonySPI1D`
+        definition raised exception.
+        """
+
+        LUT = LUT1D(domain=np.array([[0, 0, 0], [1, 2, 3]]))
+
+        self.assertRaises(ValueError, write_LUT_SonySPI1D, LUT,
+                          os.path.join(self._temporary_directory,
+                                       'My_LUT.spi1d'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.luts.sony_spi3d` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io.luts import (LUT1D, LUT3D, read_LUT_IridasCube,
+                            read_LUT_SonySPI3D, write_LUT_SonySPI3D)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['LUTS_DIRECTORY', 'TestReadLUTSonySPI3D', 'TestWriteLUTSonySPI3D']
+
+LUTS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'resources')
+
+
+class TestReadLUTSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition
+    unit tests methods.
+    """
+
+    def test_read_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D`
+        definition.
+        """
+
+        LUT = read_LUT_SonySPI3D(
+            os.path.join(LUTS_DIRECTORY, 'sony_spi3d', 'ColourCorrect.spi3d'))
+
+        self.assertEqual(LUT.name, 'ColourCorrect')
+        self.assertEqual(LUT.size, 4)
+        np.testing.assert_equal(
+            LUT.table,
+            read_LUT_IridasCube(
+                os.path.join(LUTS_DIRECTORY, 'iridas_cube',
+                             'ColourCorrect.cube')).table)
+
+
+class TestWriteLUTSonySPI3D(unittest.TestCase):
+    """
+    Defines :func:`colour.io.luts.sony_spi3d.write_LUT_SonySPI3D` definition
+    unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_write_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi3d.write_LUT_SonySPI3D`
+        definition.
+        """
+
+        path = os.path.join(LUTS_DIRECTORY, 'sony_spi3d',
+                            'ColourCorrect.spi3d')
+        LUT_1 = read_LUT_SonySPI3D(path)
+        path_test = os.path.join(self._temporary_directory,
+                                 'ColourCorrect.spi3d')
+        self.assertTrue(write_LUT_SonySPI3D(LUT_1, path_test))
+
+        LUT_2 = read_LUT_SonySPI3D(path_test)
+        np.testing.assert_equal(LUT_1.table, LUT_2.table)
+        with open(path) as spi3d_file_1, open(path_test) as spi3d_file_2:
+            self.assertEqual(spi3d_file_1.read(), spi3d_file_2.read())
+
+    def test_raise_exception_write_LUT_SonySPI3D(self):
+        """
+        Tests :func:`colour.io.luts.sony_spi3d.write_LUT_SonySPI3D`
+        definition raised exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'My_LUT.spi3d')
+
+        LUT = LUT3D()
+        LUT.generate(lambda x: x, 3, shaper=LUT1D(np.linspace(0, 1, 4) ** 2))
+        self.assertRaises(ValueError, write_LUT_SonySPI3D, LUT, path)
+
+        LUT = LUT3D(domain=np.array([[0, 0, 0], [2, 2, 2]]))
+        self.assertRaises(ValueError, write_LUT_SonySPI3D, LUT, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
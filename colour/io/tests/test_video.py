@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.io.video` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.io import (RAW_VIDEO_FORMATS, read_raw_video_planes,
+                       write_raw_video_planes, read_raw_video,
+                       write_raw_video)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestReadWriteRawVideoPlanes', 'TestReadWriteRawVideo']
+
+
+class TestReadWriteRawVideoPlanes(unittest.TestCase):
+    """
+    Defines :func:`colour.io.video.read_raw_video_planes` and
+    :func:`colour.io.video.write_raw_video_planes` definitions unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_write_raw_video_planes(self):
+        """
+        Tests :func:`colour.io.video.read_raw_video_planes` and
+        :func:`colour.io.video.write_raw_video_planes` definitions.
+        """
+
+        random_state = np.random.RandomState(4)
+        for pixel_format, size in (('yuv420p', 1200), ('yuv422p', 1500),
+                                   ('yuv444p10le', 4500), ('v210', 3840)):
+            specification = RAW_VIDEO_FORMATS[pixel_format]
+            sy, sx = specification.subsampling
+            chroma_shape = (-(-5 // sy), -(-50 // sx))
+            maximum = 2 ** specification.bits
+
+            planes = [(random_state.randint(0, maximum, (5, 50)),
+                       random_state.randint(0, maximum, chroma_shape),
+                       random_state.randint(0, maximum, chroma_shape))
+                      for _ in range(3)]
+            path = os.path.join(self._temporary_directory,
+                                'Video.{0}'.format(pixel_format))
+            self.assertTrue(
+                write_raw_video_planes(planes, path, pixel_format))
+            self.assertEqual(os.path.getsize(path), size)
+
+            for planes_1, planes_2 in zip(
+                    planes, read_raw_video_planes(path, 50, 5, pixel_format)):
+                if not specification.packed:
+                    self.assertIsInstance(planes_2[0], np.memmap)
+
+                for plane_1, plane_2 in zip(planes_1, planes_2):
+                    np.testing.assert_equal(plane_1, plane_2)
+
+    def test_raise_exception_read_write_raw_video_planes(self):
+        """
+        Tests :func:`colour.io.video.read_raw_video_planes` and
+        :func:`colour.io.video.write_raw_video_planes` definitions raised
+        exception.
+        """
+
+        path = os.path.join(self._temporary_directory, 'Video.yuv')
+        planes = [(np.zeros((4, 4)), np.zeros((4, 4)), np.zeros((4, 4)))]
+        self.assertRaises(ValueError, write_raw_video_planes, planes, path,
+                          'yuv420p')
+
+        write_raw_video_planes(planes, path, 'yuv444p')
+        self.assertRaises(ValueError, next,
+                          read_raw_video_planes(path, 4, 3, 'yuv444p'))
+
+
+class TestReadWriteRawVideo(unittest.TestCase):
+    """
+    Defines :func:`colour.io.video.read_raw_video` and
+    :func:`colour.io.video.write_raw_video` definitions unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_read_write_raw_video(self):
+        """
+        Tests :func:`colour.io.video.read_raw_video` and
+        :func:`colour.io.video.write_raw_video` definitions.
+        """
+
+        # The frames are constant on 2x2 blocks so that the chroma subsampling
+        # is lossless.
+        random_state = np.random.RandomState(4)
+        frames = [
+            np.repeat(
+                np.repeat(random_state.uniform(0.1, 0.9, (3, 5, 3)), 2, 0), 2,
+                1) for _ in range(3)
+        ]
+        for pixel_format in RAW_VIDEO_FORMATS:
+            path = os.path.join(self._temporary_directory,
+                                'Video.{0}'.format(pixel_format))
+            self.assertTrue(write_raw_video(frames, path, pixel_format))
+
+            bits = RAW_VIDEO_FORMATS[pixel_format].bits
+            RGB = [
+                np.copy(RGB)
+                for RGB in read_raw_video(
+                    path, 10, 6, pixel_format, tile_size=16)
+            ]
+            self.assertEqual(len(RGB), len(frames))
+            np.testing.assert_allclose(
+                RGB, frames, atol=4 / 2 ** bits)
+
+        RGB = next(
+            read_raw_video(path, 10, 6, 'v210', out_bits=10, out_int=True))
+        self.assertEqual(RGB.dtype, np.uint16)
+        np.testing.assert_allclose(RGB, frames[0] * 1023, atol=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,550 @@
+# -*- coding: utf-8 -*-
+"""
+Raw Video Input / Output Utilities
+==================================
+
+Defines raw video related input / output utilities objects:
+
+-   :func:`colour.io.read_raw_video_planes`
+-   :func:`colour.io.write_raw_video_planes`
+-   :func:`colour.io.read_raw_video`
+-   :func:`colour.io.write_raw_video`
+
+The supported raw video formats are the headerless sequences of *Y'CbCr*
+frames commonly produced by video tools, e.g. *FFmpeg* *rawvideo* muxer:
+
+-   Planar *yuv420p*, *yuv422p* and *yuv444p* 8-bit formats.
+-   Planar *yuv420p10le*, *yuv422p10le* and *yuv444p10le* 10-bit formats,
+    storing each code value in a little-endian 16-bit word.
+-   Packed *v210* 10-bit 4:2:2 format, storing 6 pixels in 4 little-endian
+    32-bit words with rows padded to 128 bytes boundaries.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import namedtuple
+
+from colour.models.rgb.ycbcr import (YCBCR_WEIGHTS, RGB_to_YCbCr,
+                                     YCbCr_to_RGB)
+from colour.utilities import TILE_SIZE, CaseInsensitiveMapping, apply_tiled
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'RawVideoFormat_Specification', 'RAW_VIDEO_FORMATS',
+    'read_raw_video_planes', 'write_raw_video_planes', 'read_raw_video',
+    'write_raw_video'
+]
+
+RawVideoFormat_Specification = namedtuple(
+    'RawVideoFormat_Specification', ('name', 'bits', 'subsampling', 'packed'))
+"""
+Raw video format specification.
+
+Parameters
+----------
+name : unicode
+    Raw video format name.
+bits : int
+    Code values bit depth.
+subsampling : tuple
+    Vertical and horizontal chroma subsampling factors.
+packed : bool
+    Whether the frames components are packed, i.e. *v210*, or stored as
+    planes.
+"""
+
+RAW_VIDEO_FORMATS = CaseInsensitiveMapping({
+    'yuv420p':
+        RawVideoFormat_Specification('yuv420p', 8, (2, 2), False),
+    'yuv422p':
+        RawVideoFormat_Specification('yuv422p', 8, (1, 2), False),
+    'yuv444p':
+        RawVideoFormat_Specification('yuv444p', 8, (1, 1), False),
+    'yuv420p10le':
+        RawVideoFormat_Specification('yuv420p10le', 10, (2, 2), False),
+    'yuv422p10le':
+        RawVideoFormat_Specification('yuv422p10le', 10, (1, 2), False),
+    'yuv444p10le':
+        RawVideoFormat_Specification('yuv444p10le', 10, (1, 1), False),
+    'v210':
+        RawVideoFormat_Specification('v210', 10, (1, 2), True),
+})
+"""
+Supported raw video formats.
+
+RAW_VIDEO_FORMATS : CaseInsensitiveMapping
+    **{'yuv420p', 'yuv422p', 'yuv444p', 'yuv420p10le', 'yuv422p10le',
+    'yuv444p10le', 'v210'}**
+"""
+
+
+def _planes_dtype(specification):
+    """
+    Returns the data type of the planes of given raw video format.
+    """
+
+    return np.dtype(np.uint8 if specification.bits <= 8 else '<u2')
+
+
+def _chroma_shape(shape, specification):
+    """
+    Returns the chroma planes shape for given luma plane shape and raw video
+    format.
+    """
+
+    (height, width), (sy, sx) = shape, specification.subsampling
+
+    return -(-height // sy), -(-width // sx)
+
+
+def _v210_stride(width):
+    """
+    Returns the *v210* row stride in bytes for given frame width, each 48
+    pixels group being stored in 128 bytes.
+    """
+
+    return -(-width // 48) * 128
+
+
+def _frame_size(width, height, specification):
+    """
+    Returns the size in bytes of a frame with given dimensions and raw video
+    format.
+    """
+
+    if specification.packed:
+        return _v210_stride(width) * height
+
+    chroma_height, chroma_width = _chroma_shape((height, width),
+                                                specification)
+
+    return ((width * height + 2 * chroma_width * chroma_height) *
+            _planes_dtype(specification).itemsize)
+
+
+def _unpack_v210(frame, width, height, planes=None):
+    """
+    Unpacks given *v210* frame into *Y'*, *Cb* and *Cr* planes, written to
+    given planes if any.
+    """
+
+    words = np.reshape(frame.view('<u4'), (height, -1, 4))
+    if planes is None:
+        chroma_shape = (height, -(-width // 2))
+        planes = (np.empty((height, width), np.uint16),
+                  np.empty(chroma_shape, np.uint16),
+                  np.empty(chroma_shape, np.uint16))
+
+    # Each group of 4 words stores 3 10-bit components per word, i.e. three
+    # consecutive "Cb Y' Cr Y'" sequences.
+    Y, Cb, Cr = planes
+    chroma_width = Cb.shape[-1]
+    components = np.empty(words.shape + (3, ), np.uint16)
+    for i in range(3):
+        np.right_shift(words, 10 * i, out=components[..., i],
+                       casting='unsafe')
+    components &= 0x3FF
+    components = np.reshape(components, (height, -1, 4))
+    Y[..., 0::2] = components[:, :-(-width // 2), 1]
+    Y[..., 1::2] = components[:, :width // 2, 3]
+    Cb[...] = components[:, :chroma_width, 0]
+    Cr[...] = components[:, :chroma_width, 2]
+
+    return planes
+
+
+def _pack_v210(planes, frame=None):
+    """
+    Packs given *Y'*, *Cb* and *Cr* planes into a *v210* frame, written to
+    given frame if any.
+    """
+
+    Y, Cb, Cr = planes
+    height, width = Y.shape
+    stride = _v210_stride(width)
+    if frame is None:
+        frame = np.zeros(stride * height, np.uint8)
+
+    components = np.zeros((height, stride // 16 * 3, 4), np.uint32)
+    components[:, :-(-width // 2), 1] = Y[..., 0::2]
+    components[:, :width // 2, 3] = Y[..., 1::2]
+    components[:, :Cb.shape[-1], 0] = Cb
+    components[:, :Cr.shape[-1], 2] = Cr
+    components = np.reshape(components, (height, -1, 4, 3))
+
+    words = np.reshape(frame.view('<u4'), (height, -1, 4))
+    words[...] = components[..., 0]
+    for i in range(1, 3):
+        words |= components[..., i] << (10 * i)
+
+    return frame
+
+
+def _upsample_chroma(planes, specification, YCbCr):
+    """
+    Writes given *Y'*, *Cb* and *Cr* planes into given full resolution
+    *Y'CbCr* array, the chroma samples being replicated.
+    """
+
+    Y, Cb, Cr = planes
+    sy, sx = specification.subsampling
+
+    YCbCr[..., 0] = Y
+    for dy in range(sy):
+        for dx in range(sx):
+            for i, C in ((1, Cb), (2, Cr)):
+                view = YCbCr[dy::sy, dx::sx, i]
+                view[...] = C[:view.shape[0], :view.shape[1]]
+
+    return YCbCr
+
+
+def _downsample_chroma(YCbCr, specification, planes, total, count):
+    """
+    Writes given full resolution *Y'CbCr* array into given *Y'*, *Cb* and
+    *Cr* planes, the chroma samples being averaged with rounding and clamped
+    to the raw video format code values range.
+    """
+
+    Y, Cb, Cr = planes
+    sy, sx = specification.subsampling
+    maximum = 2 ** specification.bits - 1
+
+    np.minimum(YCbCr[..., 0], maximum, out=Y, casting='unsafe')
+    for i, C in ((1, Cb), (2, Cr)):
+        total[...] = count // 2
+        for dy in range(sy):
+            for dx in range(sx):
+                view = YCbCr[dy::sy, dx::sx, i]
+                total[:view.shape[0], :view.shape[1]] += view
+        total //= count
+        np.minimum(total, maximum, out=C, casting='unsafe')
+
+    return planes
+
+
+def _chroma_count(shape, specification):
+    """
+    Returns the count of full resolution samples averaged into each chroma
+    sample for given luma plane shape and raw video format.
+    """
+
+    sy, sx = specification.subsampling
+    count = np.zeros(_chroma_shape(shape, specification), np.uint32)
+    for dy in range(sy):
+        for dx in range(sx):
+            count[:-(-(shape[0] - dy) // sy), :-(-(shape[1] - dx) // sx)] += 1
+
+    return count
+
+
+def read_raw_video_planes(path, width, height, pixel_format='yuv420p'):
+    """
+    Reads given raw video file and yields its frames *Y'*, *Cb* and *Cr*
+    integer code values planes.
+
+    The file is memory-mapped and the planes of the planar formats are views
+    on it, no data being read until they are accessed.
+
+    Parameters
+    ----------
+    path : unicode
+        Raw video file path.
+    width : int
+        Frames width.
+    height : int
+        Frames height.
+    pixel_format : unicode, optional
+        **{'yuv420p', 'yuv422p', 'yuv444p', 'yuv420p10le', 'yuv422p10le',
+        'yuv444p10le', 'v210'}**,
+        Raw video format.
+
+    Yields
+    ------
+    tuple
+        *Y'*, *Cb* and *Cr* planes of the current frame.
+
+    Raises
+    ------
+    ValueError
+        If the file size is not a multiple of the frame size.
+
+    Notes
+    -----
+    -   The *v210* format frames are unpacked into planes that are reused for
+        each frame, they must be copied if they are to be kept beyond the
+        current iteration.
+
+    Examples
+    --------
+    >>> path = 'Video.yuv'
+    >>> for Y, Cb, Cr in read_raw_video_planes(path, 1920, 1080):
+    ...     pass  # doctest: +SKIP
+    """
+
+    specification = RAW_VIDEO_FORMATS[pixel_format]
+    frame_size = _frame_size(width, height, specification)
+
+    video = np.memmap(path, dtype=np.uint8, mode='r')
+    if video.size % frame_size:
+        raise ValueError(
+            '"{0}" file size is not a multiple of the "{1}" frame size!'.
+            format(path, pixel_format))
+
+    dtype = _planes_dtype(specification)
+    chroma_shape = _chroma_shape((height, width), specification)
+    Y_size = width * height * dtype.itemsize
+    C_size = chroma_shape[0] * chroma_shape[1] * dtype.itemsize
+
+    planes = None
+    for i in range(video.size // frame_size):
+        frame = video[i * frame_size:(i + 1) * frame_size]
+        if specification.packed:
+            planes = _unpack_v210(frame, width, height, planes)
+        else:
+            planes = (
+                np.reshape(frame[:Y_size].view(dtype), (height, width)),
+                np.reshape(frame[Y_size:Y_size + C_size].view(dtype),
+                           chroma_shape),
+                np.reshape(frame[Y_size + C_size:].view(dtype), chroma_shape),
+            )
+
+        yield planes
+
+
+def write_raw_video_planes(planes, path, pixel_format='yuv420p'):
+    """
+    Writes given frames *Y'*, *Cb* and *Cr* integer code values planes to
+    given raw video file.
+
+    Parameters
+    ----------
+    planes : iterable
+        Iterable of *Y'*, *Cb* and *Cr* planes tuples, the chroma planes
+        shape must match the raw video format subsampling.
+    path : unicode
+        Raw video file path.
+    pixel_format : unicode, optional
+        **{'yuv420p', 'yuv422p', 'yuv444p', 'yuv420p10le', 'yuv422p10le',
+        'yuv444p10le', 'v210'}**,
+        Raw video format.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the chroma planes shape does not match the raw video format
+        subsampling.
+
+    Examples
+    --------
+    >>> planes = read_raw_video_planes('Video.yuv', 1920, 1080)
+    >>> write_raw_video_planes(planes, 'Video.v210', 'v210')
+    ... # doctest: +SKIP
+    True
+    """
+
+    specification = RAW_VIDEO_FORMATS[pixel_format]
+    dtype = _planes_dtype(specification)
+
+    frame = None
+    with open(path, 'wb') as video_file:
+        for Y, Cb, Cr in planes:
+            chroma_shape = _chroma_shape(np.shape(Y), specification)
+            if (np.shape(Cb) != chroma_shape or
+                    np.shape(Cr) != chroma_shape):
+                raise ValueError(
+                    'Chroma planes shape must be "{0}" for "{1}" format!'.
+                    format(chroma_shape, pixel_format))
+
+            if specification.packed:
+                frame = _pack_v210((Y, Cb, Cr), frame)
+                frame.tofile(video_file)
+            else:
+                for plane in (Y, Cb, Cr):
+                    np.ascontiguousarray(plane, dtype).tofile(video_file)
+
+    return True
+
+
+def read_raw_video(path,
+                   width,
+                   height,
+                   pixel_format='yuv420p',
+                   K=YCBCR_WEIGHTS['ITU-R BT.709'],
+                   in_legal=True,
+                   tile_size=TILE_SIZE,
+                   **kwargs):
+    """
+    Reads given raw video file and yields its frames as *R'G'B'* arrays.
+
+    The chroma planes are upsampled by samples replication and the frames are
+    converted with :func:`colour.YCbCr_to_RGB` definition, tile by tile, into
+    buffers reused for each frame.
+
+    Parameters
+    ----------
+    path : unicode
+        Raw video file path.
+    width : int
+        Frames width.
+    height : int
+        Frames height.
+    pixel_format : unicode, optional
+        **{'yuv420p', 'yuv422p', 'yuv444p', 'yuv420p10le', 'yuv422p10le',
+        'yuv444p10le', 'v210'}**,
+        Raw video format.
+    K : array_like, optional
+        Luma weighting coefficients of red and blue. See
+        :attr:`colour.YCBCR_WEIGHTS` for presets.
+    in_legal : bool, optional
+        Whether to treat the raw video code values as legal range.
+    tile_size : integer, optional
+        Count of pixels per tile, see :func:`colour.utilities.apply_tiled`
+        definition.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.YCbCr_to_RGB`},
+        Please refer to the documentation of the previously listed definition,
+        e.g. ``out_bits``, ``out_legal`` and ``out_int``.
+
+    Yields
+    ------
+    ndarray
+        *R'G'B'* array of the current frame.
+
+    Notes
+    -----
+    -   The yielded *R'G'B'* array is reused for each frame, it must be copied
+        if it is to be kept beyond the current iteration.
+
+    Examples
+    --------
+    >>> path = 'Video.yuv'
+    >>> for RGB in read_raw_video(path, 1920, 1080):
+    ...     pass  # doctest: +SKIP
+    """
+
+    specification = RAW_VIDEO_FORMATS[pixel_format]
+
+    YCbCr = np.empty((height, width, 3), _planes_dtype(specification))
+    RGB = None
+    for planes in read_raw_video_planes(path, width, height, pixel_format):
+        _upsample_chroma(planes, specification, YCbCr)
+        RGB = apply_tiled(
+            YCbCr_to_RGB,
+            YCbCr,
+            out=RGB,
+            tile_size=tile_size,
+            K=K,
+            in_bits=specification.bits,
+            in_legal=in_legal,
+            in_int=True,
+            **kwargs)
+
+        yield RGB
+
+
+def write_raw_video(frames,
+                    path,
+                    pixel_format='yuv420p',
+                    K=YCBCR_WEIGHTS['ITU-R BT.709'],
+                    out_legal=True,
+                    tile_size=TILE_SIZE,
+                    **kwargs):
+    """
+    Writes given *R'G'B'* frames to given raw video file.
+
+    The frames are converted with :func:`colour.RGB_to_YCbCr` definition,
+    tile by tile, into buffers reused for each frame, and their chroma is
+    downsampled by averaging.
+
+    Parameters
+    ----------
+    frames : iterable
+        Iterable of *R'G'B'* arrays of shape (height, width, 3).
+    path : unicode
+        Raw video file path.
+    pixel_format : unicode, optional
+        **{'yuv420p', 'yuv422p', 'yuv444p', 'yuv420p10le', 'yuv422p10le',
+        'yuv444p10le', 'v210'}**,
+        Raw video format.
+    K : array_like, optional
+        Luma weighting coefficients of red and blue. See
+        :attr:`colour.YCBCR_WEIGHTS` for presets.
+    out_legal : bool, optional
+        Whether to write legal range code values.
+    tile_size : integer, optional
+        Count of pixels per tile, see :func:`colour.utilities.apply_tiled`
+        definition.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        {:func:`colour.RGB_to_YCbCr`},
+        Please refer to the documentation of the previously listed definition,
+        e.g. ``in_bits``, ``in_legal`` and ``in_int``.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Notes
+    -----
+    -   The code values exceeding the raw video format bit depth, e.g. the
+        full range *Cb* and *Cr* maximum, are clamped.
+
+    Examples
+    --------
+    >>> frames = read_raw_video('Video.yuv', 1920, 1080)
+    >>> write_raw_video(frames, 'Video.v210', 'v210')  # doctest: +SKIP
+    True
+    """
+
+    specification = RAW_VIDEO_FORMATS[pixel_format]
+    dtype = _planes_dtype(specification)
+
+    def planes():
+        """
+        Yields the *Y'*, *Cb* and *Cr* planes of the frames.
+        """
+
+        YCbCr = buffers = None
+        for RGB in frames:
+            YCbCr = apply_tiled(
+                RGB_to_YCbCr,
+                RGB,
+                out=YCbCr,
+                tile_size=tile_size,
+                K=K,
+                out_bits=specification.bits,
+                out_legal=out_legal,
+                out_int=True,
+                **kwargs)
+
+            if buffers is None:
+                shape = YCbCr.shape[:-1]
+                chroma_shape = _chroma_shape(shape, specification)
+                buffers = ((np.empty(shape, dtype),
+                            np.empty(chroma_shape, dtype),
+                            np.empty(chroma_shape, dtype)),
+                           np.empty(chroma_shape, np.uint32),
+                           _chroma_count(shape, specification))
+
+            yield _downsample_chroma(YCbCr, specification, *buffers)
+
+    return write_raw_video_planes(planes(), path, pixel_format)
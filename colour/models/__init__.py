@@ -28,6 +28,8 @@ from .dataset import *  # noqa
 from . import dataset
 from .rgb import *  # noqa
 from . import rgb
+from .conversion_graph import (CONVERSION_SPECIFICATIONS, conversion_path,
+                               ColourConversion, convert)
 
 __all__ = [
     'JMh_CIECAM02_to_CAM02LCD', 'CAM02LCD_to_JMh_CIECAM02',
@@ -63,3 +65,7 @@ __all__ += [
 ]
 __all__ += dataset.__all__
 __all__ += rgb.__all__
+__all__ += [
+    'CONVERSION_SPECIFICATIONS', 'conversion_path', 'ColourConversion',
+    'convert'
+]
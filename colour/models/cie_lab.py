@@ -31,7 +31,7 @@ from colour.algebra import cartesian_to_polar, polar_to_cartesian
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import CIE_E, CIE_K
 from colour.models import xy_to_xyY, xyY_to_XYZ
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -45,7 +45,8 @@ __all__ = ['XYZ_to_Lab', 'Lab_to_XYZ', 'Lab_to_LCHab', 'LCHab_to_Lab']
 
 def XYZ_to_Lab(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE L\*a\*b\** colourspace.
 
@@ -56,6 +57,10 @@ def XYZ_to_Lab(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array the *CIE L\*a\*b\** colourspace array is written to, it can be
+        the *CIE XYZ* tristimulus values array to perform the conversion
+        in-place.
 
     Returns
     -------
@@ -80,28 +85,32 @@ def XYZ_to_Lab(
     array([ 37.9856291..., -23.6290768...,  -4.4174661...])
     """
 
-    XYZ = np.asarray(XYZ)
+    XYZ = as_float_array(XYZ)
     XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
 
     XYZ_f = XYZ / XYZ_r
 
-    XYZ_f = np.where(XYZ_f > CIE_E,
-                     np.power(XYZ_f, 1 / 3), (CIE_K * XYZ_f + 16) / 116)
+    # Computing the cube root in-place to avoid full size temporary arrays.
+    is_linear = ~(XYZ_f > CIE_E)
+    XYZ_l = (CIE_K * XYZ_f[is_linear] + 16) / 116
+    XYZ_f = np.power(XYZ_f, 1 / 3, out=XYZ_f)
+    XYZ_f[is_linear] = XYZ_l
 
-    X_f, Y_f, Z_f = tsplit(XYZ_f)
+    X_f, Y_f, Z_f = tsplit(XYZ_f, copy=False)
 
     L = 116 * Y_f - 16
     a = 500 * (X_f - Y_f)
     b = 200 * (Y_f - Z_f)
 
-    Lab = tstack((L, a, b))
+    Lab = tstack((L, a, b), out=out)
 
     return Lab
 
 
 def Lab_to_XYZ(
         Lab,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50'],
+        out=None):
     """
     Converts from *CIE L\*a\*b\** colourspace to *CIE XYZ* tristimulus values.
 
@@ -112,6 +121,9 @@ def Lab_to_XYZ(
     illuminant : array_like, optional
         Reference *illuminant* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array.
+    out : ndarray, optional
+        Array the *CIE XYZ* tristimulus values are written to, it can be the
+        *CIE L\*a\*b\** colourspace array to perform the conversion in-place.
 
     Returns
     -------
@@ -136,7 +148,7 @@ def Lab_to_XYZ(
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
-    L, a, b = tsplit(Lab)
+    L, a, b = tsplit(Lab, copy=False)
     XYZ_r = xyY_to_XYZ(xy_to_xyY(illuminant))
 
     f_y = (L + 16) / 116
@@ -147,7 +159,8 @@ def Lab_to_XYZ(
     y_r = np.where(L > CIE_K * CIE_E, ((L + 16) / 116) ** 3, L / CIE_K)
     z_r = np.where(f_z ** 3 > CIE_E, f_z ** 3, (116 * f_z - 16) / CIE_K)
 
-    XYZ = tstack((x_r, y_r, z_r)) * XYZ_r
+    XYZ = tstack((x_r, y_r, z_r), out=out)
+    XYZ *= XYZ_r
 
     return XYZ
 
@@ -34,7 +34,7 @@ import numpy as np
 
 from colour.colorimetry import ILLUMINANTS
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import tsplit, tstack
+from colour.utilities import as_float_array, tsplit, tstack
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -51,7 +51,8 @@ __all__ = [
 
 def XYZ_to_xyY(
         XYZ,
-        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']):
+        illuminant=ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50'],
+        out=None):
     """
     Converts from *CIE XYZ* tristimulus values to *CIE xyY* colourspace and
     reference *illuminant*.
@@ -62,6 +63,9 @@ def XYZ_to_xyY(
         *CIE XYZ* tristimulus values.
     illuminant : array_like, optional
         Reference *illuminant* chromaticity coordinates.
+    out : ndarray, optional
+        Array the *CIE xyY* colourspace array is written to, it can be the
+        *CIE XYZ* tristimulus values array to perform the conversion in-place.
 
     Returns
     -------
@@ -85,21 +89,20 @@ def XYZ_to_xyY(
     array([ 0.2641477...,  0.3777000...,  0.1008    ])
     """
 
-    XYZ = np.asarray(XYZ)
-    X, Y, Z = tsplit(XYZ)
+    XYZ = as_float_array(XYZ)
+    X, Y, Z = tsplit(XYZ, copy=False)
     xy_w = np.asarray(illuminant)
 
-    XYZ_n = np.zeros(XYZ.shape)
-    XYZ_n[..., 0:2] = xy_w
+    is_black = np.all(XYZ == 0, axis=-1)[..., np.newaxis]
+    XYZ_s = X + Y + Z
 
-    xyY = np.where(
-        np.all(XYZ == 0, axis=-1)[..., np.newaxis], XYZ_n,
-        tstack((X / (X + Y + Z), Y / (X + Y + Z), Y)))
+    xyY = tstack((X / XYZ_s, Y / XYZ_s, Y), out=out)
+    np.copyto(xyY[..., 0:2], xy_w, where=is_black)
 
     return xyY
 
 
-def xyY_to_XYZ(xyY):
+def xyY_to_XYZ(xyY, out=None):
     """
     Converts from *CIE xyY* colourspace to *CIE XYZ* tristimulus values.
 
@@ -107,6 +110,9 @@ def xyY_to_XYZ(xyY):
     ----------
     xyY : array_like
         *CIE xyY* colourspace array.
+    out : ndarray, optional
+        Array the *CIE XYZ* tristimulus values are written to, it can be the
+        *CIE xyY* colourspace array to perform the conversion in-place.
 
     Returns
     -------
@@ -130,11 +136,12 @@ def xyY_to_XYZ(xyY):
     array([ 0.0704953...,  0.1008    ,  0.0955831...])
     """
 
-    x, y, Y = tsplit(xyY)
+    x, y, Y = tsplit(xyY, copy=False)
+
+    is_black = (y == 0)[..., np.newaxis]
 
-    XYZ = np.where((y == 0)[..., np.newaxis],
-                   tstack((y, y, y)),
-                   tstack((x * Y / y, Y, (1 - x - y) * Y / y)))
+    XYZ = tstack((x * Y / y, Y, (1 - x - y) * Y / y), out=out)
+    np.copyto(XYZ, 0, where=is_black)
 
     return XYZ
 
@@ -187,7 +194,7 @@ def xy_to_xyY(xy, Y=1):
     array([   0.2641477...,    0.3777000...,  100.        ])
     """
 
-    xy = np.asarray(xy)
+    xy = as_float_array(xy)
 
     shape = xy.shape
     # Assuming ``xy`` is actually a *CIE xyY* colourspace array argument and
@@ -239,7 +246,7 @@ def xyY_to_xy(xyY):
     array([ 0.2641477...,  0.3777000...])
     """
 
-    xyY = np.asarray(xyY)
+    xyY = as_float_array(xyY)
 
     shape = xyY.shape
     # Assuming ``xyY`` is actually a *xy* chromaticity coordinates argument and
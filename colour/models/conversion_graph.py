@@ -0,0 +1,499 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Models Conversion Graph
+==============================
+
+Defines the automatic conversion between the colour models representations
+using a graph whose nodes are the representations and edges the conversion
+definitions:
+
+-   :attr:`colour.models.CONVERSION_SPECIFICATIONS`
+-   :func:`colour.models.conversion_path`
+-   :class:`colour.models.ColourConversion`
+-   :func:`colour.convert`
+
+The consecutive linear conversions of a conversion path, e.g. *RGB*
+colourspace to *CIE XYZ* tristimulus values to *CIE UCS* colourspace, are
+folded into a single matrix so that they are applied with a single pass over
+the converted array.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import deque
+from functools import partial
+
+from colour.colorimetry import ILLUMINANTS
+from colour.models import (
+    Hunter_Lab_to_XYZ, IPT_to_XYZ, LCHab_to_Lab, LCHuv_to_Luv, Lab_to_LCHab,
+    Lab_to_XYZ, Luv_to_LCHuv, Luv_to_XYZ, Luv_to_uv, Luv_uv_to_xy,
+    UCS_to_XYZ, UCS_to_uv, UCS_uv_to_xy, XYZ_to_Hunter_Lab, XYZ_to_Hunter_Rdab,
+    XYZ_to_IPT, XYZ_to_Lab, XYZ_to_Luv, XYZ_to_UCS, XYZ_to_UVW,
+    XYZ_to_hdr_CIELab, XYZ_to_hdr_IPT, XYZ_to_xy, XYZ_to_xyY,
+    hdr_CIELab_to_XYZ, hdr_IPT_to_XYZ, xyY_to_XYZ, xyY_to_xy, xy_to_XYZ,
+    xy_to_xyY)
+from colour.models.rgb import (
+    CMY_to_RGB, HSL_to_RGB, HSV_to_RGB, Prismatic_to_RGB, RGB_to_CMY,
+    RGB_to_HSL, RGB_to_HSV, RGB_to_Prismatic, RGB_to_XYZ, RGB_to_YCbCr,
+    XYZ_to_RGB, YCbCr_to_RGB, sRGB_COLOURSPACE)
+from colour.utilities import dot_matrix, dot_vector, filter_kwargs
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'CONVERSION_SPECIFICATIONS', 'conversion_path', 'ColourConversion',
+    'convert'
+]
+
+_DEFAULT_ILLUMINANT = ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']
+"""
+Default *illuminant* of the conversions scaling the *CIE XYZ* tristimulus
+values.
+
+_DEFAULT_ILLUMINANT : ndarray
+"""
+
+
+def _XYZ_to_UVW(XYZ, illuminant=_DEFAULT_ILLUMINANT):
+    """
+    Converts from *CIE XYZ* tristimulus values in domain [0, 1] to *CIE 1964
+    U\\*V\\*W\\** colourspace.
+    """
+
+    return XYZ_to_UVW(XYZ * 100, illuminant)
+
+
+def _XYZ_to_Hunter_Lab(XYZ, illuminant=_DEFAULT_ILLUMINANT):
+    """
+    Converts from *CIE XYZ* tristimulus values in domain [0, 1] to
+    *Hunter L,a,b* colour scale.
+    """
+
+    return XYZ_to_Hunter_Lab(XYZ * 100, xy_to_XYZ(illuminant) * 100)
+
+
+def _Hunter_Lab_to_XYZ(Lab, illuminant=_DEFAULT_ILLUMINANT):
+    """
+    Converts from *Hunter L,a,b* colour scale to *CIE XYZ* tristimulus values
+    in range [0, 1].
+    """
+
+    return Hunter_Lab_to_XYZ(Lab, xy_to_XYZ(illuminant) * 100) / 100
+
+
+def _XYZ_to_Hunter_Rdab(XYZ, illuminant=_DEFAULT_ILLUMINANT):
+    """
+    Converts from *CIE XYZ* tristimulus values in domain [0, 1] to
+    *Hunter Rd,a,b* colour scale.
+    """
+
+    return XYZ_to_Hunter_Rdab(XYZ * 100, xy_to_XYZ(illuminant) * 100)
+
+
+def _RGB_to_XYZ(RGB,
+                colourspace=sRGB_COLOURSPACE,
+                illuminant=None,
+                chromatic_adaptation_transform='CAT02'):
+    """
+    Converts from given linear *RGB* colourspace to *CIE XYZ* tristimulus
+    values, adapted to given *illuminant* or to the colourspace whitepoint.
+    """
+
+    if illuminant is None:
+        illuminant = colourspace.whitepoint
+
+    return RGB_to_XYZ(RGB, colourspace.whitepoint, illuminant,
+                      colourspace.RGB_to_XYZ_matrix,
+                      chromatic_adaptation_transform)
+
+
+def _XYZ_to_RGB(XYZ,
+                colourspace=sRGB_COLOURSPACE,
+                illuminant=None,
+                chromatic_adaptation_transform='CAT02'):
+    """
+    Converts from *CIE XYZ* tristimulus values, adapted to given *illuminant*
+    or to the colourspace whitepoint, to given linear *RGB* colourspace.
+    """
+
+    if illuminant is None:
+        illuminant = colourspace.whitepoint
+
+    return XYZ_to_RGB(XYZ, illuminant, colourspace.whitepoint,
+                      colourspace.XYZ_to_RGB_matrix,
+                      chromatic_adaptation_transform)
+
+
+def _RGB_to_RGB_encoded(RGB, colourspace=sRGB_COLOURSPACE):
+    """
+    Encodes given linear *RGB* colourspace array with the colourspace
+    encoding colour component transfer function.
+    """
+
+    return colourspace.encoding_cctf(RGB)
+
+
+def _RGB_encoded_to_RGB(RGB, colourspace=sRGB_COLOURSPACE):
+    """
+    Decodes given non-linear *RGB* colourspace array with the colourspace
+    decoding colour component transfer function.
+    """
+
+    return colourspace.decoding_cctf(RGB)
+
+
+CONVERSION_SPECIFICATIONS = (
+    ('CIE XYZ', 'CIE xyY', XYZ_to_xyY, False),
+    ('CIE xyY', 'CIE XYZ', xyY_to_XYZ, False),
+    ('CIE xyY', 'CIE xy', xyY_to_xy, False),
+    ('CIE xy', 'CIE xyY', xy_to_xyY, False),
+    ('CIE XYZ', 'CIE xy', XYZ_to_xy, False),
+    ('CIE xy', 'CIE XYZ', xy_to_XYZ, False),
+    ('CIE XYZ', 'CIE Lab', XYZ_to_Lab, False),
+    ('CIE Lab', 'CIE XYZ', Lab_to_XYZ, False),
+    ('CIE Lab', 'CIE LCHab', Lab_to_LCHab, False),
+    ('CIE LCHab', 'CIE Lab', LCHab_to_Lab, False),
+    ('CIE XYZ', 'CIE Luv', XYZ_to_Luv, False),
+    ('CIE Luv', 'CIE XYZ', Luv_to_XYZ, False),
+    ('CIE Luv', 'CIE Luv uv', Luv_to_uv, False),
+    ('CIE Luv uv', 'CIE xy', Luv_uv_to_xy, False),
+    ('CIE Luv', 'CIE LCHuv', Luv_to_LCHuv, False),
+    ('CIE LCHuv', 'CIE Luv', LCHuv_to_Luv, False),
+    ('CIE XYZ', 'CIE UCS', XYZ_to_UCS, True),
+    ('CIE UCS', 'CIE XYZ', UCS_to_XYZ, True),
+    ('CIE UCS', 'CIE UCS uv', UCS_to_uv, False),
+    ('CIE UCS uv', 'CIE xy', UCS_uv_to_xy, False),
+    ('CIE XYZ', 'CIE UVW', _XYZ_to_UVW, False),
+    ('CIE XYZ', 'Hunter Lab', _XYZ_to_Hunter_Lab, False),
+    ('Hunter Lab', 'CIE XYZ', _Hunter_Lab_to_XYZ, False),
+    ('CIE XYZ', 'Hunter Rdab', _XYZ_to_Hunter_Rdab, False),
+    ('CIE XYZ', 'IPT', XYZ_to_IPT, False),
+    ('IPT', 'CIE XYZ', IPT_to_XYZ, False),
+    ('CIE XYZ', 'hdr-CIELAB', XYZ_to_hdr_CIELab, False),
+    ('hdr-CIELAB', 'CIE XYZ', hdr_CIELab_to_XYZ, False),
+    ('CIE XYZ', 'hdr-IPT', XYZ_to_hdr_IPT, False),
+    ('hdr-IPT', 'CIE XYZ', hdr_IPT_to_XYZ, False),
+    ('RGB', 'CIE XYZ', _RGB_to_XYZ, True),
+    ('CIE XYZ', 'RGB', _XYZ_to_RGB, True),
+    ('RGB', 'R\'G\'B\'', _RGB_to_RGB_encoded, False),
+    ('R\'G\'B\'', 'RGB', _RGB_encoded_to_RGB, False),
+    ('R\'G\'B\'', 'YCbCr', RGB_to_YCbCr, False),
+    ('YCbCr', 'R\'G\'B\'', YCbCr_to_RGB, False),
+    ('R\'G\'B\'', 'HSV', RGB_to_HSV, False),
+    ('HSV', 'R\'G\'B\'', HSV_to_RGB, False),
+    ('R\'G\'B\'', 'HSL', RGB_to_HSL, False),
+    ('HSL', 'R\'G\'B\'', HSL_to_RGB, False),
+    ('R\'G\'B\'', 'CMY', RGB_to_CMY, False),
+    ('CMY', 'R\'G\'B\'', CMY_to_RGB, False),
+    ('RGB', 'Prismatic', RGB_to_Prismatic, False),
+    ('Prismatic', 'RGB', Prismatic_to_RGB, False),
+)
+"""
+Conversion specifications, i.e. the edges of the conversion graph, as
+*(source, target, function, linear)* tuples where *linear* is whether the
+conversion function is a linear map, i.e. a matrix, for any given keyword
+arguments.
+
+*RGB* refers to linear *RGB* colourspace values while *R'G'B'* refers to
+non-linear *RGB* colourspace values encoded with the colourspace encoding
+colour component transfer function.
+
+CONVERSION_SPECIFICATIONS : tuple
+"""
+
+_CONVERSION_GRAPH = None
+"""
+Conversion graph adjacency mapping, lazily built from
+:attr:`colour.models.CONVERSION_SPECIFICATIONS` attribute, keyed by lower
+case representations names.
+
+_CONVERSION_GRAPH : dict
+"""
+
+
+def _conversion_graph():
+    """
+    Returns the conversion graph adjacency mapping and builds it if not
+    existing.
+
+    Returns
+    -------
+    dict
+        Conversion graph adjacency mapping.
+    """
+
+    global _CONVERSION_GRAPH
+
+    if _CONVERSION_GRAPH is None:
+        _CONVERSION_GRAPH = {}
+        for specification in CONVERSION_SPECIFICATIONS:
+            source, target = (x.lower() for x in specification[:2])
+            _CONVERSION_GRAPH.setdefault(source, []).append(specification)
+            _CONVERSION_GRAPH.setdefault(target, [])
+
+    return _CONVERSION_GRAPH
+
+
+def conversion_path(source, target):
+    """
+    Returns the shortest conversion path, i.e. the sequence of conversion
+    specifications, from given source representation to given target
+    representation.
+
+    Parameters
+    ----------
+    source : unicode
+        Source representation, see
+        :attr:`colour.models.CONVERSION_SPECIFICATIONS` attribute for the
+        supported representations.
+    target : unicode
+        Target representation.
+
+    Returns
+    -------
+    list
+        Conversion specifications.
+
+    Raises
+    ------
+    KeyError
+        If the source or target representation is not supported.
+    ValueError
+        If no conversion path exists.
+
+    Examples
+    --------
+    >>> [specification[1] for specification in conversion_path(
+    ...     'CIE xyY', 'CIE LCHab')]
+    ['CIE XYZ', 'CIE Lab', 'CIE LCHab']
+    """
+
+    graph = _conversion_graph()
+
+    source_l, target_l = source.lower(), target.lower()
+    for representation in (source_l, target_l):
+        if representation not in graph:
+            raise KeyError(
+                '"{0}" representation is not defined! Supported '
+                'representations: "{1}".'.format(
+                    representation, ', '.join(
+                        sorted(set(specification[0] for specification in
+                                   CONVERSION_SPECIFICATIONS)))))
+
+    # Breadth-first search, the first path reaching the target is one of the
+    # shortest.
+    previous = {source_l: None}
+    queue = deque([source_l])
+    while queue and target_l not in previous:
+        node = queue.popleft()
+        for specification in graph[node]:
+            adjacent = specification[1].lower()
+            if adjacent not in previous:
+                previous[adjacent] = specification
+                queue.append(adjacent)
+
+    if target_l not in previous:
+        raise ValueError('No conversion path exists from "{0}" to "{1}"!'.
+                         format(source, target))
+
+    path = []
+    node = target_l
+    while previous[node] is not None:
+        path.append(previous[node])
+        node = previous[node][0].lower()
+
+    return path[::-1]
+
+
+class ColourConversion(object):
+    """
+    Implements a reusable conversion from given source representation to
+    given target representation following the shortest conversion path.
+
+    The conversion functions are bound to the given keyword arguments once,
+    and the consecutive linear conversions are folded into a single matrix.
+
+    Parameters
+    ----------
+    source : unicode
+        Source representation, see
+        :attr:`colour.models.CONVERSION_SPECIFICATIONS` attribute for the
+        supported representations.
+    target : unicode
+        Target representation.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the conversion functions accepting them,
+        e.g. ``illuminant``, ``colourspace`` or
+        ``chromatic_adaptation_transform``.
+
+    Attributes
+    ----------
+    source
+    target
+    path
+    stages
+
+    Methods
+    -------
+    __call__
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE
+    >>> conversion = ColourConversion(
+    ...     'RGB', 'CIE UCS', colourspace=sRGB_COLOURSPACE)
+    >>> len(conversion.path), len(conversion.stages)
+    (2, 1)
+    >>> conversion(np.array([0.45620519, 0.03081071, 0.04091952]))
+    ... # doctest: +ELLIPSIS
+    array([ 0.1376952...,  0.1219794...,  0.1053834...])
+    """
+
+    def __init__(self, source, target, **kwargs):
+        self._source = source
+        self._target = target
+        self._path = conversion_path(source, target)
+
+        stages = []
+        for _source, _target, function, linear in self._path:
+            function = partial(function, **filter_kwargs(function, **kwargs))
+            if not linear:
+                stages.append(function)
+                continue
+
+            M = np.transpose(function(np.identity(3)))
+            if stages and isinstance(stages[-1], np.ndarray):
+                stages[-1] = dot_matrix(M, stages[-1])
+            else:
+                stages.append(M)
+
+        self._stages = stages
+
+    @property
+    def source(self):
+        """
+        Getter property for the source representation.
+
+        Returns
+        -------
+        unicode
+            Source representation.
+        """
+
+        return self._source
+
+    @property
+    def target(self):
+        """
+        Getter property for the target representation.
+
+        Returns
+        -------
+        unicode
+            Target representation.
+        """
+
+        return self._target
+
+    @property
+    def path(self):
+        """
+        Getter property for the conversion path.
+
+        Returns
+        -------
+        list
+            Conversion specifications.
+        """
+
+        return self._path
+
+    @property
+    def stages(self):
+        """
+        Getter property for the conversion stages, either conversion functions
+        bound to the keyword arguments or folded linear conversions matrices.
+
+        Returns
+        -------
+        list
+            Conversion stages.
+        """
+
+        return self._stages
+
+    def __call__(self, a):
+        """
+        Converts given array from the source representation to the target
+        representation.
+
+        Parameters
+        ----------
+        a : array_like
+            Array to convert.
+
+        Returns
+        -------
+        ndarray
+            Converted array.
+        """
+
+        for stage in self._stages:
+            if isinstance(stage, np.ndarray):
+                a = dot_vector(stage, a)
+            else:
+                a = stage(a)
+
+        return a
+
+
+def convert(a, source, target, **kwargs):
+    """
+    Converts given array from given source representation to given target
+    representation following the shortest conversion path.
+
+    Parameters
+    ----------
+    a : array_like
+        Array to convert.
+    source : unicode
+        Source representation, see
+        :attr:`colour.models.CONVERSION_SPECIFICATIONS` attribute for the
+        supported representations.
+    target : unicode
+        Target representation.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments passed to the conversion functions accepting them,
+        e.g. ``illuminant``, ``colourspace`` or
+        ``chromatic_adaptation_transform``.
+
+    Returns
+    -------
+    ndarray
+        Converted array.
+
+    Notes
+    -----
+    -   A :class:`colour.models.ColourConversion` class instance should be
+        reused when converting many arrays with the same arguments.
+
+    Examples
+    --------
+    >>> xyY = np.array([0.26414772, 0.37770001, 0.10080000])
+    >>> convert(xyY, 'CIE xyY', 'CIE Lab')  # doctest: +ELLIPSIS
+    array([ 37.9856291..., -23.6290780...,  -4.4174658...])
+    """
+
+    return ColourConversion(source, target, **kwargs)(a)
@@ -7,7 +7,8 @@ from .derivation import (normalised_primary_matrix,
                          RGB_luminance_equation, RGB_luminance)
 from .rgb_colourspace import RGB_Colourspace
 from .rgb_colourspace import XYZ_to_RGB, RGB_to_XYZ
-from .rgb_colourspace import RGB_to_RGB_matrix, RGB_to_RGB
+from .rgb_colourspace import (RGB_to_RGB_matrix, RGB_ConversionPlan,
+                              RGB_conversion_plan, RGB_to_RGB)
 from .transfer_functions import *  # noqa
 from . import transfer_functions
 from .dataset import *  # noqa
@@ -20,6 +21,7 @@ from .prismatic import RGB_to_Prismatic, Prismatic_to_RGB
 from .ycbcr import (YCBCR_WEIGHTS, RGB_to_YCbCr, YCbCr_to_RGB, RGB_to_YcCbcCrc,
                     YcCbcCrc_to_RGB)
 from .ictcp import RGB_to_ICTCP, ICTCP_to_RGB
+from .hdr import HDR_Encoder
 
 __all__ = [
     'normalised_primary_matrix', 'chromatically_adapted_primaries',
@@ -27,7 +29,10 @@ __all__ = [
 ]
 __all__ += ['RGB_Colourspace']
 __all__ += ['XYZ_to_RGB', 'RGB_to_XYZ']
-__all__ += ['RGB_to_RGB_matrix', 'RGB_to_RGB']
+__all__ += [
+    'RGB_to_RGB_matrix', 'RGB_ConversionPlan', 'RGB_conversion_plan',
+    'RGB_to_RGB'
+]
 __all__ += transfer_functions.__all__
 __all__ += dataset.__all__
 __all__ += ['XYZ_to_sRGB', 'sRGB_to_XYZ']
@@ -42,3 +47,4 @@ __all__ += [
     'YcCbcCrc_to_RGB'
 ]
 __all__ += ['RGB_to_ICTCP', 'ICTCP_to_RGB']
+__all__ += ['HDR_Encoder']
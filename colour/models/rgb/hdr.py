@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+High Dynamic Range Encoding
+===========================
+
+Defines the fused high dynamic range encoding objects:
+
+-   :class:`colour.HDR_Encoder`
+
+The high dynamic range mastering output chains the conversion to
+*ITU-R BT.2020* colourspace, the *SMPTE ST 2084:2014* or
+*Recommendation ITU-R BT.2100* *Hybrid Log-Gamma* non-linear encoding,
+optionally the :math:`IC_TC_P` colour encoding and finally the quantisation
+to integer code values. :class:`colour.HDR_Encoder` class fuses the linear
+stages into two matrices surrounding a single evaluation of the non-linear
+encoding per channel, and processes the frames tile by tile so that no
+intermediate full frame is materialised.
+
+References
+----------
+-   :cite:`Dolby2016a` : Dolby. (2016). WHAT IS ICTCP? - INTRODUCTION.
+    Retrieved from https://www.dolby.com/us/en/technologies/dolby-vision/\
+ICtCp-white-paper.pdf
+-   :cite:`InternationalTelecommunicationUnion2016a` : International
+    Telecommunication Union. (2016). Recommendation ITU-R BT.2100-1 - Image
+    parameter values for high dynamic range television for use in production
+    and international programme exchange. Retrieved from
+    https://www.itu.int/dms_pubrec/itu-r/rec/bt/\
+R-REC-BT.2100-1-201706-I!!PDF-E.pdf
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.models.rgb.dataset import BT2020_COLOURSPACE
+from colour.models.rgb.ictcp import (ICTCP_RGB_TO_LMS_MATRIX,
+                                     ICTCP_LMS_P_TO_ICTCP_MATRIX)
+from colour.models.rgb.rgb_colourspace import RGB_to_RGB_matrix
+from colour.models.rgb.transfer_functions import (
+    cctf_LUT, oetf_BT2100_HLG, oetf_ST2084)
+from colour.models.rgb.ycbcr import YCbCr_ranges
+from colour.utilities import TILE_SIZE, apply_tiled, as_float_array
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['HDR_Encoder']
+
+
+class HDR_Encoder(object):
+    """
+    Implements a fused high dynamic range encoding from given linear *RGB*
+    colourspace to *ITU-R BT.2020* :math:`R'G'B'` or :math:`IC_TC_P` colour
+    encoding, optionally quantised to integer code values.
+
+    The conversion to *ITU-R BT.2020* colourspace and to the
+    :math:`IC_TC_P` normalised cone responses are fused into the input
+    matrix, the :math:`IC_TC_P` colour encoding matrix and the quantisation
+    scale are fused into the output matrix.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace, optional
+        Linear *RGB* input colourspace.
+    encoding : unicode, optional
+        **{'ICtCp', 'RGB'}**,
+        Output colour encoding.
+    transfer_function : unicode, optional
+        **{'ST 2084', 'HLG'}**,
+        Non-linear encoding, the :math:`IC_TC_P` colour encoding only supports
+        *SMPTE ST 2084:2014*.
+    L_p : numeric, optional
+        Display peak luminance :math:`cd/m^2` for *SMPTE ST 2084:2014*
+        non-linear encoding.
+    out_bits : int, optional
+        Bit depth of the integer output code values, if *None*, float values
+        are returned.
+    out_legal : bool, optional
+        Whether the integer output code values are legal range.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* transform.
+    maximum_error : numeric, optional
+        If defined, the non-linear encoding is evaluated with a
+        :class:`colour.models.CCTF_LUT` class instance with given maximum
+        absolute error instead of the exact function.
+    tile_size : integer, optional
+        Count of pixels per tile, see :func:`colour.utilities.apply_tiled`
+        definition.
+    workers : integer, optional
+        Threads count, see :func:`colour.utilities.apply_tiled` definition.
+
+    Attributes
+    ----------
+    encoding
+    transfer_function
+    input_matrix
+    output_matrix
+    offset
+    out_bits
+
+    Methods
+    -------
+    __call__
+
+    Raises
+    ------
+    ValueError
+        If the output colour encoding or non-linear encoding is not supported.
+
+    Notes
+    -----
+    -   The integer code values are quantised as per
+        :func:`colour.RGB_to_YCbCr` definition, with the *Y'* range used for
+        the :math:`R'G'B'` and :math:`I` components and the *Cb* and *Cr*
+        range used for the :math:`C_T` and :math:`C_P` components. The code
+        values are clamped to the ``out_bits`` range.
+
+    References
+    ----------
+    -   :cite:`Dolby2016a`
+    -   :cite:`InternationalTelecommunicationUnion2016a`
+
+    Examples
+    --------
+    >>> encoder = HDR_Encoder()
+    >>> RGB = np.array([0.35181454, 0.26934757, 0.21288023])
+    >>> encoder(RGB)  # doctest: +ELLIPSIS
+    array([ 0.0955407..., -0.0089063...,  0.0138928...])
+    >>> encoder = HDR_Encoder(out_bits=10)
+    >>> encoder(RGB)
+    array([148, 504, 524], dtype=uint16)
+    """
+
+    def __init__(self,
+                 colourspace=BT2020_COLOURSPACE,
+                 encoding='ICtCp',
+                 transfer_function='ST 2084',
+                 L_p=10000,
+                 out_bits=None,
+                 out_legal=True,
+                 chromatic_adaptation_transform='CAT02',
+                 maximum_error=None,
+                 tile_size=TILE_SIZE,
+                 workers=None):
+        encoding = encoding.lower()
+        transfer_function = transfer_function.lower()
+        if encoding not in ('ictcp', 'rgb'):
+            raise ValueError(
+                '"{0}" encoding is not supported, it must be one of '
+                '{{"ICtCp", "RGB"}}!'.format(encoding))
+
+        if transfer_function not in ('st 2084', 'hlg'):
+            raise ValueError(
+                '"{0}" transfer function is not supported, it must be one of '
+                '{{"ST 2084", "HLG"}}!'.format(transfer_function))
+
+        if encoding == 'ictcp' and transfer_function != 'st 2084':
+            raise ValueError('"ICtCp" encoding only supports the "ST 2084" '
+                             'transfer function!')
+
+        self._encoding = encoding
+        self._transfer_function = transfer_function
+        self._out_bits = out_bits
+        self._tile_size = tile_size
+        self._workers = workers
+
+        input_matrix = RGB_to_RGB_matrix(colourspace, BT2020_COLOURSPACE,
+                                         chromatic_adaptation_transform)
+        output_matrix = np.identity(3)
+        if encoding == 'ictcp':
+            input_matrix = np.dot(ICTCP_RGB_TO_LMS_MATRIX, input_matrix)
+            output_matrix = ICTCP_LMS_P_TO_ICTCP_MATRIX
+
+        offset = np.zeros(3)
+        if out_bits is not None:
+            Y_min, Y_max, C_min, C_max = YCbCr_ranges(out_bits, out_legal,
+                                                      True)
+            if encoding == 'ictcp':
+                scale = np.array([Y_max - Y_min, C_max - C_min, C_max - C_min])
+                offset = np.array(
+                    [Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2])
+            else:
+                scale = np.full(3, Y_max - Y_min)
+                offset = np.full(3, Y_min)
+
+            output_matrix = output_matrix * scale[..., np.newaxis]
+
+        self._input_matrix = np.array(input_matrix, dtype=DEFAULT_FLOAT_DTYPE)
+        self._output_matrix = np.array(
+            output_matrix, dtype=DEFAULT_FLOAT_DTYPE)
+        self._offset = np.array(offset, dtype=DEFAULT_FLOAT_DTYPE)
+        for array in (self._input_matrix, self._output_matrix, self._offset):
+            array.setflags(write=False)
+
+        if transfer_function == 'st 2084':
+            function, domain, kwargs = oetf_ST2084, np.array([0, L_p]), {
+                'L_p': L_p
+            }
+        else:
+            function, domain, kwargs = oetf_BT2100_HLG, np.array([0, 1]), {}
+
+        if maximum_error is None:
+            self._cctf = lambda x: function(x, **kwargs)
+        else:
+            self._cctf = cctf_LUT(function, domain, 'Logarithmic',
+                                  maximum_error, **kwargs)
+
+    @property
+    def encoding(self):
+        """
+        Getter property for the output colour encoding.
+
+        Returns
+        -------
+        unicode
+            Output colour encoding.
+        """
+
+        return self._encoding
+
+    @property
+    def transfer_function(self):
+        """
+        Getter property for the non-linear encoding.
+
+        Returns
+        -------
+        unicode
+            Non-linear encoding.
+        """
+
+        return self._transfer_function
+
+    @property
+    def input_matrix(self):
+        """
+        Getter property for the fused matrix applied before the non-linear
+        encoding.
+
+        Returns
+        -------
+        ndarray
+            Input matrix.
+        """
+
+        return self._input_matrix
+
+    @property
+    def output_matrix(self):
+        """
+        Getter property for the fused matrix applied after the non-linear
+        encoding.
+
+        Returns
+        -------
+        ndarray
+            Output matrix.
+        """
+
+        return self._output_matrix
+
+    @property
+    def offset(self):
+        """
+        Getter property for the offset added after the output matrix.
+
+        Returns
+        -------
+        ndarray
+            Offset.
+        """
+
+        return self._offset
+
+    @property
+    def out_bits(self):
+        """
+        Getter property for the bit depth of the integer output code values.
+
+        Returns
+        -------
+        int
+            Bit depth of the integer output code values.
+        """
+
+        return self._out_bits
+
+    def _encode(self, RGB):
+        """
+        Encodes given tile of linear *RGB* colourspace array.
+        """
+
+        RGB = as_float_array(RGB)
+
+        encoded = self._cctf(np.dot(RGB, self._input_matrix.T))
+        encoded = np.dot(encoded, self._output_matrix.T).astype(RGB.dtype)
+        encoded += self._offset
+
+        if self._out_bits is None:
+            return encoded
+
+        np.round(encoded, out=encoded)
+        np.clip(encoded, 0, 2 ** self._out_bits - 1, out=encoded)
+
+        return encoded.astype(np.uint8 if self._out_bits <= 8 else np.uint16)
+
+    def __call__(self, RGB, out=None):
+        """
+        Encodes given linear *RGB* colourspace array.
+
+        Parameters
+        ----------
+        RGB : array_like
+            Linear *RGB* colourspace array.
+        out : ndarray, optional
+            Contiguous array, e.g. a :class:`numpy.memmap` class instance, the
+            encoded values are written to.
+
+        Returns
+        -------
+        ndarray
+            *ITU-R BT.2020* :math:`R'G'B'` or :math:`IC_TC_P` colour encoding
+            array.
+        """
+
+        return apply_tiled(
+            self._encode,
+            as_float_array(RGB),
+            out=out,
+            tile_size=self._tile_size,
+            workers=self._workers)
@@ -10,6 +10,8 @@ dataset from :mod:`colour.models.dataset.aces_rgb`, etc... and the following
 -   :func:`colour.XYZ_to_RGB`
 -   :func:`colour.RGB_to_XYZ`
 -   :func:`colour.RGB_to_RGB_matrix`
+-   :class:`colour.models.RGB_ConversionPlan`
+-   :func:`colour.RGB_conversion_plan`
 -   :func:`colour.RGB_to_RGB`
 
 See Also
@@ -32,11 +34,14 @@ VARICAM_V-Log_V-Gamut.pdf
 from __future__ import division, unicode_literals
 
 import numpy as np
+from collections import OrderedDict
 
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models import (xy_to_XYZ, xy_to_xyY, xyY_to_XYZ)
 from colour.models.rgb import normalised_primary_matrix
 from colour.adaptation import chromatic_adaptation_matrix_VonKries
-from colour.utilities import dot_matrix, dot_vector, is_string
+from colour.utilities import (dot_matrix, dot_vector, get_float_precision,
+                              is_string)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -47,9 +52,129 @@ __status__ = 'Production'
 
 __all__ = [
     'RGB_Colourspace', 'XYZ_to_RGB', 'RGB_to_XYZ', 'RGB_to_RGB_matrix',
-    'RGB_to_RGB'
+    'RGB_ConversionPlan', 'RGB_conversion_plan', 'RGB_to_RGB'
 ]
 
+_RGB_CONVERSION_MATRICES_CACHE = OrderedDict()
+"""
+Fused *chromatic adaptation* and *normalised primary matrix* conversion
+matrices cache, keyed by the whitepoints, matrix and *chromatic adaptation*
+transform.
+
+_RGB_CONVERSION_MATRICES_CACHE : OrderedDict
+"""
+
+_RGB_CONVERSION_PLANS_CACHE = OrderedDict()
+"""
+*RGB* colourspaces conversion plans cache, keyed by the colourspaces
+definition, the *chromatic adaptation* transform and the applied colour
+component transfer functions.
+
+_RGB_CONVERSION_PLANS_CACHE : OrderedDict
+"""
+
+_RGB_CONVERSION_CACHE_SIZE = 64
+"""
+Conversion matrices and plans caches size, the least recently used entry is
+discarded when exceeded.
+
+_RGB_CONVERSION_CACHE_SIZE : integer
+"""
+
+
+def _cached(cache, key, factory):
+    """
+    Returns the value for given key from given least recently used cache,
+    computing it with given factory and storing it if not existing.
+
+    Parameters
+    ----------
+    cache : OrderedDict
+        Least recently used cache.
+    key : object
+        Hashable key.
+    factory : callable
+        Callable computing the value.
+
+    Returns
+    -------
+    object
+        Cached value.
+    """
+
+    value = cache.pop(key, None)
+    if value is None:
+        value = factory()
+
+    cache[key] = value
+    while len(cache) > _RGB_CONVERSION_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    return value
+
+
+def _RGB_conversion_matrix(illuminant_source, illuminant_target, matrix,
+                           chromatic_adaptation_transform, adapt_first):
+    """
+    Returns the matrix fusing the *chromatic adaptation* from given source
+    *illuminant* to target *illuminant* with given matrix.
+
+    The fused matrix is cached when the *illuminants* and matrix are single
+    ones, i.e. not n-dimensional arrays.
+
+    Parameters
+    ----------
+    illuminant_source : array_like
+        Source *illuminant* *xy* chromaticity coordinates or *CIE xyY*
+        colourspace array.
+    illuminant_target : array_like
+        Target *illuminant* *xy* chromaticity coordinates or *CIE xyY*
+        colourspace array.
+    matrix : array_like
+        Matrix to fuse with the *chromatic adaptation* matrix.
+    chromatic_adaptation_transform : unicode
+        *Chromatic adaptation* transform.
+    adapt_first : bool
+        Whether the *chromatic adaptation* is applied before given matrix,
+        i.e. *CIE XYZ* to *RGB* conversion, or after, i.e. *RGB* to *CIE XYZ*
+        conversion.
+
+    Returns
+    -------
+    ndarray
+        Fused matrix.
+    """
+
+    illuminant_source = np.asarray(illuminant_source, DEFAULT_FLOAT_DTYPE)
+    illuminant_target = np.asarray(illuminant_target, DEFAULT_FLOAT_DTYPE)
+    matrix = np.asarray(matrix, DEFAULT_FLOAT_DTYPE)
+
+    def factory():
+        """
+        Computes the fused matrix.
+        """
+
+        M = chromatic_adaptation_matrix_VonKries(
+            xyY_to_XYZ(xy_to_xyY(illuminant_source)),
+            xyY_to_XYZ(xy_to_xyY(illuminant_target)),
+            transform=chromatic_adaptation_transform)
+
+        M = dot_matrix(matrix, M) if adapt_first else dot_matrix(M, matrix)
+        M.setflags(write=False)
+
+        return M
+
+    if (illuminant_source.ndim > 1 or illuminant_target.ndim > 1 or
+            matrix.ndim > 2):
+        return factory()
+
+    # The matrix is computed in the current floating point precision.
+    key = (illuminant_source.tobytes(), illuminant_target.tobytes(),
+           matrix.tobytes(), chromatic_adaptation_transform, adapt_first,
+           get_float_precision())
+
+    return _cached(_RGB_CONVERSION_MATRICES_CACHE, key, factory)
+
 
 class RGB_Colourspace(object):
     """
@@ -761,7 +886,8 @@ def XYZ_to_RGB(XYZ,
                illuminant_RGB,
                XYZ_to_RGB_matrix,
                chromatic_adaptation_transform='CAT02',
-               encoding_cctf=None):
+               encoding_cctf=None,
+               out=None):
     """
     Converts from *CIE XYZ* tristimulus values to given *RGB* colourspace.
 
@@ -785,6 +911,9 @@ def XYZ_to_RGB(XYZ,
     encoding_cctf : object, optional
         Encoding colour component transfer function (Encoding CCTF) or
         opto-electronic transfer function (OETF / OECF).
+    out : ndarray, optional
+        Array the *RGB* colourspace array is written to, it can be the
+        *CIE XYZ* tristimulus values array to perform the conversion in-place.
 
     Returns
     -------
@@ -799,6 +928,8 @@ def XYZ_to_RGB(XYZ,
     -   Input *illuminant_RGB* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array are in domain [0, :math:`\infty`].
     -   Output *RGB* colourspace array is in range [0, 1].
+    -   The matrix fusing the *chromatic adaptation* and the conversion to
+        *RGB* colourspace is cached for single *illuminants* and matrix.
 
     Examples
     --------
@@ -816,18 +947,19 @@ def XYZ_to_RGB(XYZ,
     array([ 0.0110015...,  0.1273504...,  0.1163271...])
     """
 
-    M = chromatic_adaptation_matrix_VonKries(
-        xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
-        xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
-        transform=chromatic_adaptation_transform)
+    M = _RGB_conversion_matrix(illuminant_XYZ, illuminant_RGB,
+                               XYZ_to_RGB_matrix,
+                               chromatic_adaptation_transform, True)
 
-    XYZ_a = dot_vector(M, XYZ)
-
-    RGB = dot_vector(XYZ_to_RGB_matrix, XYZ_a)
+    RGB = dot_vector(M, XYZ, out)
 
     if encoding_cctf is not None:
         RGB = encoding_cctf(RGB)
 
+        if out is not None:
+            out[...] = RGB
+            RGB = out
+
     return RGB
 
 
@@ -836,7 +968,8 @@ def RGB_to_XYZ(RGB,
                illuminant_XYZ,
                RGB_to_XYZ_matrix,
                chromatic_adaptation_transform='CAT02',
-               decoding_cctf=None):
+               decoding_cctf=None,
+               out=None):
     """
     Converts from given *RGB* colourspace to *CIE XYZ* tristimulus values.
 
@@ -860,6 +993,9 @@ def RGB_to_XYZ(RGB,
     decoding_cctf : object, optional
         Decoding colour component transfer function (Decoding CCTF) or
         electro-optical transfer function (EOTF / EOCF).
+    out : ndarray, optional
+        Array the *CIE XYZ* tristimulus values are written to, it can be the
+        *RGB* colourspace array to perform the conversion in-place.
 
     Returns
     -------
@@ -874,6 +1010,9 @@ def RGB_to_XYZ(RGB,
     -   Input *illuminant_XYZ* *xy* chromaticity coordinates or *CIE xyY*
         colourspace array are in domain [0, :math:`\infty`].
     -   Output *CIE XYZ* tristimulus values are in range [0, 1].
+    -   The matrix fusing the conversion to *CIE XYZ* tristimulus values and
+        the *chromatic adaptation* is cached for single *illuminants* and
+        matrix.
 
     Examples
     --------
@@ -894,16 +1033,13 @@ def RGB_to_XYZ(RGB,
     if decoding_cctf is not None:
         RGB = decoding_cctf(RGB)
 
-    M = chromatic_adaptation_matrix_VonKries(
-        xyY_to_XYZ(xy_to_xyY(illuminant_RGB)),
-        xyY_to_XYZ(xy_to_xyY(illuminant_XYZ)),
-        transform=chromatic_adaptation_transform)
-
-    XYZ = dot_vector(RGB_to_XYZ_matrix, RGB)
+    M = _RGB_conversion_matrix(illuminant_RGB, illuminant_XYZ,
+                               RGB_to_XYZ_matrix,
+                               chromatic_adaptation_transform, False)
 
-    XYZ_a = dot_vector(M, XYZ)
+    XYZ = dot_vector(M, RGB, out)
 
-    return XYZ_a
+    return XYZ
 
 
 def RGB_to_RGB_matrix(input_colourspace,
@@ -952,6 +1088,187 @@ def RGB_to_RGB_matrix(input_colourspace,
     return M
 
 
+class RGB_ConversionPlan(object):
+    """
+    Implements a compiled *RGB* colourspaces conversion: the *chromatic
+    adaptation* and the colourspaces *normalised primary matrices* are fused
+    into a single matrix, optionally preceded by a decoding colour component
+    transfer function and followed by an encoding colour component transfer
+    function.
+
+    Parameters
+    ----------
+    matrix : array_like
+        Fused conversion matrix.
+    decoding_cctf : object, optional
+        Decoding colour component transfer function (Decoding CCTF) applied
+        before the fused conversion matrix.
+    encoding_cctf : object, optional
+        Encoding colour component transfer function (Encoding CCTF) applied
+        after the fused conversion matrix.
+
+    Attributes
+    ----------
+    matrix
+    decoding_cctf
+    encoding_cctf
+
+    Methods
+    -------
+    __call__
+
+    Examples
+    --------
+    >>> M = np.array(
+    ...     [[0.5, 0.0, 0.0],
+    ...      [0.0, 0.5, 0.0],
+    ...      [0.0, 0.0, 0.5]]
+    ... )
+    >>> plan = RGB_ConversionPlan(M, encoding_cctf=np.sqrt)
+    >>> plan(np.array([0.5, 0.5, 0.5]))
+    array([ 0.5,  0.5,  0.5])
+    """
+
+    def __init__(self, matrix, decoding_cctf=None, encoding_cctf=None):
+        self._matrix = np.array(matrix, dtype=DEFAULT_FLOAT_DTYPE)
+        self._matrix.setflags(write=False)
+        self._decoding_cctf = decoding_cctf
+        self._encoding_cctf = encoding_cctf
+
+    @property
+    def matrix(self):
+        """
+        Getter property for the fused conversion matrix.
+
+        Returns
+        -------
+        ndarray
+            Fused conversion matrix.
+        """
+
+        return self._matrix
+
+    @property
+    def decoding_cctf(self):
+        """
+        Getter property for the decoding colour component transfer function.
+
+        Returns
+        -------
+        object
+            Decoding colour component transfer function.
+        """
+
+        return self._decoding_cctf
+
+    @property
+    def encoding_cctf(self):
+        """
+        Getter property for the encoding colour component transfer function.
+
+        Returns
+        -------
+        object
+            Encoding colour component transfer function.
+        """
+
+        return self._encoding_cctf
+
+    def __call__(self, RGB):
+        """
+        Converts given *RGB* colourspace array.
+
+        Parameters
+        ----------
+        RGB : array_like
+            *RGB* colourspace array.
+
+        Returns
+        -------
+        ndarray
+            Converted *RGB* colourspace array.
+        """
+
+        if self._decoding_cctf is not None:
+            RGB = self._decoding_cctf(RGB)
+
+        RGB = dot_vector(self._matrix, RGB)
+
+        if self._encoding_cctf is not None:
+            RGB = self._encoding_cctf(RGB)
+
+        return RGB
+
+
+def RGB_conversion_plan(input_colourspace,
+                        output_colourspace,
+                        chromatic_adaptation_transform='CAT02',
+                        apply_decoding_cctf=False,
+                        apply_encoding_cctf=False):
+    """
+    Returns the compiled conversion from given input *RGB* colourspace to
+    output *RGB* colourspace using given *chromatic adaptation* method.
+
+    The conversion plans are cached, keyed by the colourspaces whitepoints,
+    matrices and colour component transfer functions, so that repeated
+    conversions, e.g. frame by frame, do not recompute the *chromatic
+    adaptation* matrix.
+
+    Parameters
+    ----------
+    input_colourspace : RGB_Colourspace
+        *RGB* input colourspace.
+    output_colourspace : RGB_Colourspace
+        *RGB* output colourspace.
+    chromatic_adaptation_transform : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* transform.
+    apply_decoding_cctf : bool, optional
+        Apply input colourspace decoding colour component transfer function /
+        electro-optical transfer function.
+    apply_encoding_cctf : bool, optional
+        Apply output colourspace encoding colour component transfer function /
+        opto-electronic transfer function.
+
+    Returns
+    -------
+    RGB_ConversionPlan
+        *RGB* colourspaces conversion plan.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE
+    >>> plan = RGB_conversion_plan(sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE)
+    >>> plan is RGB_conversion_plan(sRGB_COLOURSPACE, PROPHOTO_RGB_COLOURSPACE)
+    True
+    >>> RGB = np.array([0.01103742, 0.12734226, 0.11632971])
+    >>> plan(RGB)  # doctest: +ELLIPSIS
+    array([ 0.0643561...,  0.1157331...,  0.1158069...])
+    """
+
+    decoding_cctf = (input_colourspace.decoding_cctf
+                     if apply_decoding_cctf else None)
+    encoding_cctf = (output_colourspace.encoding_cctf
+                     if apply_encoding_cctf else None)
+
+    key = tuple([
+        np.asarray(a, DEFAULT_FLOAT_DTYPE).tobytes()
+        for a in (input_colourspace.whitepoint,
+                  input_colourspace.RGB_to_XYZ_matrix,
+                  output_colourspace.whitepoint,
+                  output_colourspace.XYZ_to_RGB_matrix)
+    ]) + (chromatic_adaptation_transform, decoding_cctf, encoding_cctf,
+          get_float_precision())
+
+    return _cached(
+        _RGB_CONVERSION_PLANS_CACHE, key, lambda: RGB_ConversionPlan(
+            RGB_to_RGB_matrix(input_colourspace, output_colourspace,
+                              chromatic_adaptation_transform),
+            decoding_cctf, encoding_cctf))
+
+
 def RGB_to_RGB(RGB,
                input_colourspace,
                output_colourspace,
@@ -1002,15 +1319,6 @@ def RGB_to_RGB(RGB,
     array([ 0.0643561...,  0.1157331...,  0.1158069...])
     """
 
-    if apply_decoding_cctf:
-        RGB = input_colourspace.decoding_cctf(RGB)
-
-    M = RGB_to_RGB_matrix(input_colourspace, output_colourspace,
-                          chromatic_adaptation_transform)
-
-    RGB = dot_vector(M, RGB)
-
-    if apply_encoding_cctf:
-        RGB = output_colourspace.encoding_cctf(RGB)
-
-    return RGB
+    return RGB_conversion_plan(input_colourspace, output_colourspace,
+                               chromatic_adaptation_transform,
+                               apply_decoding_cctf, apply_encoding_cctf)(RGB)
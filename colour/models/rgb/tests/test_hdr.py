@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.rgb.hdr` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.models import (ACES_CG_COLOURSPACE, BT2020_COLOURSPACE,
+                           HDR_Encoder, RGB_to_ICTCP, RGB_to_RGB,
+                           oetf_BT2100_HLG, oetf_ST2084)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestHDR_Encoder']
+
+
+class TestHDR_Encoder(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.hdr.HDR_Encoder` class unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._RGB = np.random.RandomState(4).uniform(0.05, 1, (4, 64, 3))
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('encoding', 'transfer_function', 'input_matrix',
+                               'output_matrix', 'offset', 'out_bits')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(HDR_Encoder))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__call__', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(HDR_Encoder))
+
+    def test__call__(self):
+        """
+        Tests :func:`colour.models.rgb.hdr.HDR_Encoder.__call__` method.
+        """
+
+        RGB = self._RGB * 1000
+        RGB_BT2020 = RGB_to_RGB(RGB, ACES_CG_COLOURSPACE, BT2020_COLOURSPACE)
+
+        ICTCP = RGB_to_ICTCP(RGB_BT2020, L_p=4000)
+        np.testing.assert_almost_equal(
+            HDR_Encoder(ACES_CG_COLOURSPACE, L_p=4000, tile_size=7)(RGB),
+            ICTCP,
+            decimal=7)
+
+        # The *I* component is quantised as *Y'* and the :math:`C_T` and
+        # :math:`C_P` components as *Cb* and *Cr*.
+        encoder = HDR_Encoder(
+            ACES_CG_COLOURSPACE, L_p=4000, out_bits=10, tile_size=7)
+        ICTCP_q = np.round(
+            ICTCP * np.array([876, 896, 896]) + np.array([64, 512, 512]))
+        np.testing.assert_equal(encoder(RGB), ICTCP_q)
+        self.assertEqual(encoder(RGB).dtype, np.uint16)
+
+        np.testing.assert_almost_equal(
+            HDR_Encoder(ACES_CG_COLOURSPACE, 'RGB')(RGB),
+            oetf_ST2084(RGB_BT2020),
+            decimal=7)
+
+        np.testing.assert_equal(
+            HDR_Encoder(ACES_CG_COLOURSPACE, 'RGB', out_bits=12,
+                        out_legal=False)(RGB),
+            np.clip(np.round(oetf_ST2084(RGB_BT2020) * 4095), 0, 4095))
+
+        np.testing.assert_almost_equal(
+            HDR_Encoder(BT2020_COLOURSPACE, 'RGB', 'HLG')(self._RGB),
+            oetf_BT2100_HLG(self._RGB),
+            decimal=7)
+
+        np.testing.assert_equal(
+            HDR_Encoder(BT2020_COLOURSPACE, 'RGB', 'HLG', out_bits=8)(
+                self._RGB),
+            np.round(oetf_BT2100_HLG(self._RGB) * 219 + 16))
+
+    def test_LUT__call__(self):
+        """
+        Tests :func:`colour.models.rgb.hdr.HDR_Encoder.__call__` method with a
+        non-linear encoding *LUT*.
+        """
+
+        RGB = self._RGB * 1000
+        np.testing.assert_allclose(
+            HDR_Encoder(ACES_CG_COLOURSPACE, maximum_error=1e-6)(RGB),
+            HDR_Encoder(ACES_CG_COLOURSPACE)(RGB),
+            atol=1e-5)
+
+        np.testing.assert_allclose(
+            HDR_Encoder(ACES_CG_COLOURSPACE, out_bits=10,
+                        maximum_error=1e-6)(RGB),
+            HDR_Encoder(ACES_CG_COLOURSPACE, out_bits=10)(RGB),
+            atol=1)
+
+    def test_raise_exception__init__(self):
+        """
+        Tests :func:`colour.models.rgb.hdr.HDR_Encoder.__init__` method raised
+        exception.
+        """
+
+        self.assertRaises(ValueError, HDR_Encoder, encoding='Undefined')
+        self.assertRaises(
+            ValueError, HDR_Encoder, transfer_function='Undefined')
+        self.assertRaises(
+            ValueError, HDR_Encoder, encoding='ICtCp', transfer_function='HLG')
+
+
+if __name__ == '__main__':
+    unittest.main()
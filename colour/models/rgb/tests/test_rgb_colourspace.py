@@ -14,11 +14,11 @@ import unittest
 from copy import deepcopy
 from itertools import permutations
 
-from colour.models import (RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB,
-                           RGB_to_XYZ, RGB_to_RGB_matrix, RGB_to_RGB,
-                           normalised_primary_matrix, oetf_sRGB,
-                           oetf_reverse_sRGB)
-from colour.utilities import ignore_numpy_errors
+from colour.models import (
+    RGB_COLOURSPACES, RGB_Colourspace, XYZ_to_RGB, RGB_to_XYZ,
+    RGB_to_RGB_matrix, RGB_ConversionPlan, RGB_conversion_plan, RGB_to_RGB,
+    normalised_primary_matrix, oetf_sRGB, oetf_reverse_sRGB)
+from colour.utilities import float_precision, ignore_numpy_errors
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -29,7 +29,8 @@ __status__ = 'Production'
 
 __all__ = [
     'TestRGB_COLOURSPACES', 'TestRGB_Colourspace', 'TestXYZ_to_RGB',
-    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_to_RGB'
+    'TestRGB_to_XYZ', 'TestRGB_to_RGB_matrix', 'TestRGB_ConversionPlan',
+    'TestRGB_conversion_plan', 'TestRGB_to_RGB'
 ]
 
 
@@ -393,6 +394,30 @@ class TestXYZ_to_RGB(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_RGB(XYZ, W_R, W_T, M), RGB, decimal=7)
 
+    def test_out_XYZ_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.XYZ_to_RGB` definition
+        output array support.
+        """
+
+        XYZ = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (6, 1))
+        W_R = np.array([0.34570, 0.35850])
+        W_T = np.array([0.31270, 0.32900])
+        M = np.array([
+            [3.24062548, -1.53720797, -0.49862860],
+            [-0.96893071, 1.87575606, 0.04151752],
+            [0.05571012, -0.20402105, 1.05699594],
+        ])
+        RGB = XYZ_to_RGB(XYZ, W_R, W_T, M, 'Bradford', oetf_sRGB)
+
+        out = np.zeros(XYZ.shape)
+        self.assertIs(
+            XYZ_to_RGB(XYZ, W_R, W_T, M, 'Bradford', oetf_sRGB, out), out)
+        np.testing.assert_almost_equal(out, RGB, decimal=7)
+
+        XYZ_to_RGB(XYZ, W_R, W_T, M, 'Bradford', oetf_sRGB, XYZ)
+        np.testing.assert_almost_equal(XYZ, RGB, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_RGB(self):
         """
@@ -499,6 +524,31 @@ class TestRGB_to_XYZ(unittest.TestCase):
         np.testing.assert_almost_equal(
             RGB_to_XYZ(RGB, W_R, W_T, M), XYZ, decimal=7)
 
+    def test_out_RGB_to_XYZ(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_XYZ` definition
+        output array support.
+        """
+
+        RGB = np.tile(np.array([0.45286611, 0.31735742, 0.26418007]), (6, 1))
+        W_R = np.array([0.31270, 0.32900])
+        W_T = np.array([0.34570, 0.35850])
+        M = np.array([
+            [0.41240000, 0.35760000, 0.18050000],
+            [0.21260000, 0.71520000, 0.07220000],
+            [0.01930000, 0.11920000, 0.95050000],
+        ])
+        XYZ = RGB_to_XYZ(RGB, W_R, W_T, M, 'Bradford', oetf_reverse_sRGB)
+
+        out = np.zeros(RGB.shape)
+        self.assertIs(
+            RGB_to_XYZ(RGB, W_R, W_T, M, 'Bradford', oetf_reverse_sRGB, out),
+            out)
+        np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+        RGB_to_XYZ(RGB, W_R, W_T, M, 'Bradford', oetf_reverse_sRGB, RGB)
+        np.testing.assert_almost_equal(RGB, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_RGB_to_XYZ(self):
         """
@@ -561,6 +611,107 @@ class TestRGB_to_RGB_matrix(unittest.TestCase):
             decimal=7)
 
 
+class TestRGB_ConversionPlan(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.rgb_colourspace.RGB_ConversionPlan`
+    class unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('matrix', 'decoding_cctf', 'encoding_cctf')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(RGB_ConversionPlan))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__call__', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(RGB_ConversionPlan))
+
+    def test__call__(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_ConversionPlan.\
+__call__` method.
+        """
+
+        M = np.array([
+            [0.5, 0.0, 0.0],
+            [0.0, 0.25, 0.0],
+            [0.0, 0.0, 2.0],
+        ])
+        RGB = np.array([0.25, 0.50, 0.75])
+
+        np.testing.assert_almost_equal(
+            RGB_ConversionPlan(M)(RGB),
+            np.array([0.125, 0.125, 1.5]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_ConversionPlan(M, np.square, np.sqrt)(RGB),
+            np.sqrt(np.array([0.03125, 0.0625, 1.125])),
+            decimal=7)
+
+        RGB = np.reshape(np.tile(RGB, (6, 1)), (2, 3, 3))
+        self.assertTupleEqual(RGB_ConversionPlan(M)(RGB).shape, (2, 3, 3))
+
+
+class TestRGB_conversion_plan(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.rgb_colourspace.RGB_conversion_plan`
+    definition unit tests methods.
+    """
+
+    def test_RGB_conversion_plan(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_conversion_plan`
+        definition.
+        """
+
+        aces_2065_1_colourspace = RGB_COLOURSPACES['ACES2065-1']
+        aces_cc_colourspace = RGB_COLOURSPACES['ACEScc']
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+
+        plan = RGB_conversion_plan(aces_2065_1_colourspace, sRGB_colourspace)
+        np.testing.assert_almost_equal(
+            plan.matrix,
+            RGB_to_RGB_matrix(aces_2065_1_colourspace, sRGB_colourspace),
+            decimal=7)
+        self.assertIsNone(plan.decoding_cctf)
+        self.assertIsNone(plan.encoding_cctf)
+        self.assertFalse(plan.matrix.flags.writeable)
+
+        self.assertIs(
+            RGB_conversion_plan(aces_2065_1_colourspace, sRGB_colourspace),
+            plan)
+        self.assertIsNot(
+            RGB_conversion_plan(aces_2065_1_colourspace, sRGB_colourspace,
+                                'Bradford'), plan)
+
+        plan = RGB_conversion_plan(
+            aces_cc_colourspace,
+            sRGB_colourspace,
+            apply_decoding_cctf=True,
+            apply_encoding_cctf=True)
+        self.assertIs(plan.decoding_cctf, aces_cc_colourspace.decoding_cctf)
+        self.assertIs(plan.encoding_cctf, sRGB_colourspace.encoding_cctf)
+
+        # Modified colourspaces yield a different conversion plan.
+        colourspace = deepcopy(sRGB_colourspace)
+        colourspace.use_derived_transformation_matrices(True)
+        self.assertIsNot(
+            RGB_conversion_plan(aces_2065_1_colourspace, colourspace),
+            RGB_conversion_plan(aces_2065_1_colourspace, sRGB_colourspace))
+
+
 class TestRGB_to_RGB(unittest.TestCase):
     """
     Defines :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB` definition
@@ -619,6 +770,39 @@ class TestRGB_to_RGB(unittest.TestCase):
             np.array([0.60983062, 0.67896356, 0.50435764]),
             decimal=7)
 
+    def test_float_precision_RGB_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB` definition
+        when the floating point precision changes between calls.
+        """
+
+        RGB = np.array([0.45620519, 0.03081071, 0.04091952])
+        sRGB_colourspace = RGB_COLOURSPACES['sRGB']
+        aces_cg_colourspace = RGB_COLOURSPACES['ACEScg']
+
+        # The first call is performed at a lower precision so that the cached
+        # objects are created at that precision.
+        for precision in ('float16', 'float32'):
+            with float_precision(precision):
+                RGB_to_RGB(RGB, sRGB_colourspace, aces_cg_colourspace,
+                           'Sharp')
+                RGB_conversion_plan(sRGB_colourspace, aces_cg_colourspace,
+                                    'Sharp')(RGB)
+
+            np.testing.assert_almost_equal(
+                RGB_to_RGB(RGB, sRGB_colourspace, aces_cg_colourspace,
+                           'Sharp'),
+                np.array([0.29255150, 0.06094459, 0.04824824]),
+                decimal=7)
+            np.testing.assert_almost_equal(
+                RGB_conversion_plan(sRGB_colourspace, aces_cg_colourspace,
+                                    'Sharp')(RGB),
+                np.array([0.29255150, 0.06094459, 0.04824824]),
+                decimal=7)
+            self.assertEqual(
+                RGB_to_RGB_matrix(sRGB_colourspace, aces_cg_colourspace,
+                                  'Sharp').dtype, np.float64)
+
     def test_n_dimensional_RGB_to_RGB(self):
         """
         Tests :func:`colour.models.rgb.rgb_colourspace.RGB_to_RGB` definition
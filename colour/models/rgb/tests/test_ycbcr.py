@@ -9,9 +9,10 @@ import numpy as np
 import unittest
 from itertools import permutations
 
+from colour.models.rgb import CV_range
 from colour.models.rgb.ycbcr import (RGB_to_YCbCr, YCbCr_to_RGB,
                                      RGB_to_YcCbcCrc, YcCbcCrc_to_RGB,
-                                     YCBCR_WEIGHTS)
+                                     YCBCR_WEIGHTS, YCbCr_ranges)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -98,6 +99,89 @@ class TestRGB_to_YCbCr(unittest.TestCase):
         YCbCr = np.reshape(YCbCr, (4, 4, 4, 3))
         np.testing.assert_almost_equal(RGB_to_YCbCr(RGB), YCbCr)
 
+    def test_int_RGB_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr` definition integer
+        code values fixed-point conversion.
+        """
+
+        RGB = np.reshape(
+            np.stack(
+                np.meshgrid(*[np.arange(0, 256, 5, dtype=np.uint8)] * 3),
+                axis=-1), (-1, 3))
+        for K in YCBCR_WEIGHTS.values():
+            for out_bits, out_legal, dtype in ((8, True, np.uint8),
+                                               (8, False, np.uint16),
+                                               (10, True, np.uint16)):
+                YCbCr = RGB_to_YCbCr(
+                    RGB,
+                    K=K,
+                    in_bits=8,
+                    in_int=True,
+                    out_bits=out_bits,
+                    out_legal=out_legal,
+                    out_int=True)
+
+                self.assertEqual(YCbCr.dtype, dtype)
+
+                # Ties within the float computation precision are ignored.
+                YCbCr_f = RGB_to_YCbCr(
+                    RGB,
+                    K=K,
+                    in_bits=8,
+                    in_int=True,
+                    out_range=YCbCr_ranges(out_bits, out_legal, True))
+                is_tie = np.abs(YCbCr_f - np.floor(YCbCr_f) - 0.5) < 1e-9
+                np.testing.assert_equal(YCbCr[~is_tie],
+                                        np.round(YCbCr_f[~is_tie]))
+
+        np.testing.assert_equal(
+            RGB_to_YCbCr(
+                np.array([1023, 1023, 2047], dtype=np.uint16),
+                in_bits=10,
+                in_int=True,
+                out_bits=8,
+                out_int=True), np.array([235, 128, 128]))
+
+    def test_clamping_RGB_to_YCbCr(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.RGB_to_YCbCr` definition
+        out-of-range and super-white code values clamping consistency between
+        the fixed-point and float conversions.
+        """
+
+        CV = np.array([0, 4, 64, 512, 940, 1019, 1023, 1029, 2047])
+        RGB = np.reshape(
+            np.stack(np.meshgrid(*[CV] * 3), axis=-1), (-1, 3)).astype(
+                np.uint16)
+        for in_legal, out_bits, out_legal in ((True, 10, True),
+                                              (False, 8, True),
+                                              (True, 12, False)):
+            kwargs = {
+                'in_bits': 10,
+                'in_legal': in_legal,
+                'in_int': True,
+                'out_bits': out_bits,
+                'out_legal': out_legal,
+            }
+            YCbCr_i = RGB_to_YCbCr(RGB, out_int=True, **kwargs)
+            YCbCr_f = RGB_to_YCbCr(
+                RGB.astype(np.float_), out_int=True, **kwargs)
+
+            self.assertEqual(YCbCr_i.dtype, YCbCr_f.dtype)
+            self.assertLessEqual(
+                np.max(YCbCr_f),
+                max(2 ** out_bits - 1,
+                    np.max(YCbCr_ranges(out_bits, out_legal, True))))
+
+            # Ties within the float computation precision are ignored.
+            YCbCr = RGB_to_YCbCr(
+                RGB,
+                out_range=YCbCr_ranges(out_bits, out_legal, True),
+                **kwargs)
+            is_tie = np.abs(YCbCr - np.floor(YCbCr) - 0.5) < 1e-9
+            np.testing.assert_equal(YCbCr_i[~is_tie], YCbCr_f[~is_tie])
+
     @ignore_numpy_errors
     def test_nan_RGB_to_YCbCr(self):
         """
@@ -177,6 +261,86 @@ class TestYCbCr_to_RGB(unittest.TestCase):
         YCbCr = np.reshape(YCbCr, (4, 4, 4, 3))
         np.testing.assert_almost_equal(YCbCr_to_RGB(YCbCr), RGB)
 
+    def test_int_YCbCr_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_to_RGB` definition integer
+        code values fixed-point conversion.
+        """
+
+        YCbCr = np.reshape(
+            np.stack(
+                np.meshgrid(*[np.arange(64, 961, 16, dtype=np.uint16)] * 3),
+                axis=-1), (-1, 3))
+        for K in YCBCR_WEIGHTS.values():
+            for out_bits, out_legal, dtype in ((8, False, np.uint8),
+                                               (10, True, np.uint16),
+                                               (12, False, np.uint16)):
+                RGB = YCbCr_to_RGB(
+                    YCbCr,
+                    K=K,
+                    in_bits=10,
+                    in_int=True,
+                    out_bits=out_bits,
+                    out_legal=out_legal,
+                    out_int=True)
+
+                self.assertEqual(RGB.dtype, dtype)
+
+                # Ties within the float computation precision are ignored.
+                RGB_f = YCbCr_to_RGB(
+                    YCbCr,
+                    K=K,
+                    in_bits=10,
+                    in_int=True,
+                    out_range=CV_range(out_bits, out_legal, True))
+                is_tie = np.abs(RGB_f - np.floor(RGB_f) - 0.5) < 1e-9
+                np.testing.assert_equal(
+                    RGB[~is_tie],
+                    np.clip(np.round(RGB_f[~is_tie]), 0, 2 ** out_bits - 1))
+
+    def test_clamping_YCbCr_to_RGB(self):
+        """
+        Tests :func:`colour.models.rgb.ycbcr.YCbCr_to_RGB` definition
+        out-of-range and super-white code values clamping consistency between
+        the fixed-point and float conversions.
+        """
+
+        CV = np.array([0, 4, 64, 512, 940, 1019, 1023, 1029, 2047])
+        YCbCr = np.reshape(
+            np.stack(np.meshgrid(*[CV] * 3), axis=-1), (-1, 3)).astype(
+                np.uint16)
+        for in_legal, out_bits, out_legal in ((True, 10, False),
+                                              (True, 8, True),
+                                              (False, 12, False)):
+            kwargs = {
+                'in_bits': 10,
+                'in_legal': in_legal,
+                'in_int': True,
+                'out_bits': out_bits,
+                'out_legal': out_legal,
+            }
+            RGB_i = YCbCr_to_RGB(YCbCr, out_int=True, **kwargs)
+            RGB_f = YCbCr_to_RGB(
+                YCbCr.astype(np.float_), out_int=True, **kwargs)
+
+            self.assertEqual(RGB_i.dtype, RGB_f.dtype)
+            self.assertLessEqual(np.max(RGB_f), 2 ** out_bits - 1)
+
+            # Ties within the float computation precision are ignored.
+            RGB = YCbCr_to_RGB(
+                YCbCr, out_range=CV_range(out_bits, out_legal, True), **kwargs)
+            is_tie = np.abs(RGB - np.floor(RGB) - 0.5) < 1e-9
+            np.testing.assert_equal(RGB_i[~is_tie], RGB_f[~is_tie])
+
+        # Round-trip of the legal range *Cb* and *Cr* code values above the
+        # 10-bit range.
+        YCbCr = np.array([[940, 1029, 1029], [64, 1029, 4]], dtype=np.uint16)
+        np.testing.assert_equal(
+            YCbCr_to_RGB(YCbCr, in_bits=10, in_int=True, out_int=True),
+            YCbCr_to_RGB(
+                YCbCr.astype(np.float_), in_bits=10, in_int=True,
+                out_int=True))
+
     @ignore_numpy_errors
     def test_nan_YCbCr_to_RGB(self):
         """
@@ -217,6 +381,16 @@ class TestRGB_to_YcCbcCrc(unittest.TestCase):
             np.array([422, 512, 512]),
             decimal=7)
 
+        self.assertEqual(
+            RGB_to_YcCbcCrc(
+                np.array([0.18, 0.18, 0.18]), out_bits=8,
+                out_int=True).dtype, np.uint8)
+
+        np.testing.assert_equal(
+            RGB_to_YcCbcCrc(
+                np.array([-0.5, 0.18, 1.5]), out_legal=False, out_int=True),
+            np.array([259, 1024, 0]))
+
     def test_n_dimensional_RGB_to_YcCbcCrc(self):
         """
         Tests :func:`colour.models.rgb.ycbcr.RGB_to_YcCbcCrc` definition
@@ -2,6 +2,8 @@
 
 from __future__ import absolute_import
 
+import numpy as np
+
 from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 
 from .common import CV_range, legal_to_full, full_to_legal
@@ -29,6 +31,9 @@ from .itur_bt_2100 import (
     oetf_BT2100_HLG, oetf_reverse_BT2100_HLG, eotf_BT2100_HLG,
     eotf_reverse_BT2100_HLG, ootf_BT2100_HLG, ootf_reverse_BT2100_HLG)
 from .linear import function_linear
+from .lut import (CCTF_LUT_MINIMUM_SIZE, CCTF_LUT_MAXIMUM_SIZE,
+                  CCTF_LUT_LOGARITHMIC_DYNAMIC_RANGE, CCTF_LUT_CHUNK_SIZE,
+                  CCTF_LUT, cctf_LUT)
 from .panalog import log_encoding_Panalog, log_decoding_Panalog
 from .panasonic_vlog import log_encoding_VLog, log_decoding_VLog
 from .pivoted_log import log_encoding_PivotedLog, log_decoding_PivotedLog
@@ -75,6 +80,11 @@ __all__ += [
     'eotf_reverse_BT2100_HLG', 'ootf_BT2100_HLG', 'ootf_reverse_BT2100_HLG'
 ]
 __all__ += ['function_linear']
+__all__ += [
+    'CCTF_LUT_MINIMUM_SIZE', 'CCTF_LUT_MAXIMUM_SIZE',
+    'CCTF_LUT_LOGARITHMIC_DYNAMIC_RANGE', 'CCTF_LUT_CHUNK_SIZE', 'CCTF_LUT',
+    'cctf_LUT'
+]
 __all__ += ['log_encoding_Panalog', 'log_decoding_Panalog']
 __all__ += ['log_encoding_VLog', 'log_decoding_VLog']
 __all__ += ['log_encoding_PivotedLog', 'log_decoding_PivotedLog']
@@ -761,3 +771,219 @@ def ootf_reverse(value, function='ITU-R BT.2100 PQ', **kwargs):
 
 __all__ += ['OOTFS', 'OOTFS_REVERSE']
 __all__ += ['ootf', 'ootf_reverse']
+
+
+def oetf_LUT(value,
+             function='sRGB',
+             maximum_error=1e-6,
+             domain=np.array([0, 1]),
+             sampling='Logarithmic',
+             **kwargs):
+    """
+    Encodes estimated tristimulus values in a scene to :math:`R'G'B'` video
+    component signal value using a cached 1-D *LUT* of given opto-electronic
+    transfer function (OETF / OECF).
+
+    Parameters
+    ----------
+    value : numeric or array_like
+        Value.
+    function : unicode, optional
+        {:attr:`colour.OETFS`},
+        Opto-electronic transfer function (OETF / OECF).
+    maximum_error : numeric, optional
+        Maximum absolute interpolation error.
+    domain : array_like, optional
+        *LUT* input domain, values outside of it are evaluated with the exact
+        function.
+    sampling : unicode, optional
+        **{'Linear', 'Logarithmic'}**,
+        *LUT* samples spacing.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        {:func:`colour.oetf`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    numeric or ndarray
+        :math:`R'G'B'` video component signal value.
+
+    Examples
+    --------
+    >>> oetf_LUT(0.18)  # doctest: +ELLIPSIS
+    0.461356...
+    >>> oetf_LUT(np.array([0.18, 0.5]), function='ST 2084', L_p=1000)
+    ... # doctest: +ELLIPSIS
+    array([ 0.182011...,  0.247847...])
+    """
+
+    function = OETFS[function]
+
+    return cctf_LUT(function, domain, sampling, maximum_error,
+                    **filter_kwargs(function, **kwargs))(value)
+
+
+def eotf_LUT(value,
+             function='ITU-R BT.1886',
+             maximum_error=1e-6,
+             domain=np.array([0, 1]),
+             sampling='Linear',
+             **kwargs):
+    """
+    Decodes :math:`R'G'B'` video component signal value to tristimulus values
+    at the display using a cached 1-D *LUT* of given electro-optical transfer
+    function (EOTF / EOCF).
+
+    Parameters
+    ----------
+    value : numeric or array_like
+        Value.
+    function : unicode, optional
+        {:attr:`colour.EOTFS`},
+        Electro-optical transfer function (EOTF / EOCF).
+    maximum_error : numeric, optional
+        Maximum absolute interpolation error.
+    domain : array_like, optional
+        *LUT* input domain, values outside of it are evaluated with the exact
+        function.
+    sampling : unicode, optional
+        **{'Linear', 'Logarithmic'}**,
+        *LUT* samples spacing.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        {:func:`colour.eotf`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    numeric or ndarray
+        Tristimulus values at the display.
+
+    Examples
+    --------
+    >>> eotf_LUT(0.461356129500442)  # doctest: +ELLIPSIS
+    0.1...
+    >>> eotf_LUT(0.182011532850008, function='ST 2084', L_p=1000,
+    ...          maximum_error=1e-4)
+    ... # doctest: +ELLIPSIS
+    0.1...
+    """
+
+    function = EOTFS[function]
+
+    return cctf_LUT(function, domain, sampling, maximum_error,
+                    **filter_kwargs(function, **kwargs))(value)
+
+
+def log_encoding_curve_LUT(value,
+                           curve='Cineon',
+                           maximum_error=1e-6,
+                           domain=np.array([0, 16]),
+                           sampling='Logarithmic',
+                           **kwargs):
+    """
+    Encodes linear-light values to :math:`R'G'B'` video component signal
+    value using a cached 1-D *LUT* of given *log* curve.
+
+    Parameters
+    ----------
+    value : numeric or array_like
+        Value.
+    curve : unicode, optional
+        {:attr:`colour.LOG_ENCODING_CURVES`},
+        Computation curve.
+    maximum_error : numeric, optional
+        Maximum absolute interpolation error.
+    domain : array_like, optional
+        *LUT* input domain, values outside of it are evaluated with the exact
+        function.
+    sampling : unicode, optional
+        **{'Linear', 'Logarithmic'}**,
+        *LUT* samples spacing.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        {:func:`colour.log_encoding_curve`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    numeric or ndarray
+        *Log* value.
+
+    Examples
+    --------
+    >>> log_encoding_curve_LUT(0.18)  # doctest: +ELLIPSIS
+    0.4573196...
+    >>> log_encoding_curve_LUT(0.18, curve='ALEXA Log C', EI=400)
+    ... # doctest: +ELLIPSIS
+    0.3910065...
+    """
+
+    function = LOG_ENCODING_CURVES[curve]
+
+    return cctf_LUT(function, domain, sampling, maximum_error,
+                    **filter_kwargs(function, **kwargs))(value)
+
+
+def log_decoding_curve_LUT(value,
+                           curve='Cineon',
+                           maximum_error=1e-6,
+                           domain=np.array([0, 1]),
+                           sampling='Linear',
+                           **kwargs):
+    """
+    Decodes :math:`R'G'B'` video component signal value to linear-light values
+    using a cached 1-D *LUT* of given *log* curve.
+
+    Parameters
+    ----------
+    value : numeric or array_like
+        Value.
+    curve : unicode, optional
+        {:attr:`colour.LOG_DECODING_CURVES`},
+        Computation curve.
+    maximum_error : numeric, optional
+        Maximum absolute interpolation error.
+    domain : array_like, optional
+        *LUT* input domain, values outside of it are evaluated with the exact
+        function.
+    sampling : unicode, optional
+        **{'Linear', 'Logarithmic'}**,
+        *LUT* samples spacing.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        {:func:`colour.log_decoding_curve`},
+        Please refer to the documentation of the previously listed definition.
+
+    Returns
+    -------
+    numeric or ndarray
+        Linear-light value.
+
+    Examples
+    --------
+    >>> log_decoding_curve_LUT(0.457319613085418)  # doctest: +ELLIPSIS
+    0.1...
+    >>> log_decoding_curve_LUT(0.391006832034084, curve='ALEXA Log C', EI=400)
+    ... # doctest: +ELLIPSIS
+    0.18...
+    """
+
+    function = LOG_DECODING_CURVES[curve]
+
+    return cctf_LUT(function, domain, sampling, maximum_error,
+                    **filter_kwargs(function, **kwargs))(value)
+
+
+__all__ += [
+    'oetf_LUT', 'eotf_LUT', 'log_encoding_curve_LUT', 'log_decoding_curve_LUT'
+]
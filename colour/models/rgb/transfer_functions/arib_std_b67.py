@@ -28,7 +28,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import Structure, as_numeric
+from colour.utilities import Structure, as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -78,7 +78,7 @@ def oetf_ARIBSTDB67(E, r=0.5):
     0.2121320...
     """
 
-    E = np.asarray(E)
+    E = as_float_array(E)
 
     a = ARIBSTDB67_CONSTANTS.a
     b = ARIBSTDB67_CONSTANTS.b
@@ -118,7 +118,7 @@ def oetf_reverse_ARIBSTDB67(E_p, r=0.5):
     0.1799999...
     """
 
-    E_p = np.asarray(E_p)
+    E_p = as_float_array(E_p)
 
     a = ARIBSTDB67_CONSTANTS.a
     b = ARIBSTDB67_CONSTANTS.b
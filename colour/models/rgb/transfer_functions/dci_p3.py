@@ -25,7 +25,7 @@ DCI_DCinema_System_Spec_v1_1.pdf
 
 from __future__ import division, unicode_literals
 
-import numpy as np
+from colour.utilities import as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -62,9 +62,9 @@ def oetf_DCIP3(XYZ):
     461.9922059...
     """
 
-    XYZ = np.asarray(XYZ)
+    XYZ = as_float_array(XYZ)
 
-    return 4095 * (XYZ / 52.37) ** (1 / 2.6)
+    return as_numeric(4095 * (XYZ / 52.37) ** (1 / 2.6))
 
 
 def eotf_DCIP3(XYZ_p):
@@ -92,6 +92,6 @@ def eotf_DCIP3(XYZ_p):
     0.18...
     """
 
-    XYZ_p = np.asarray(XYZ_p)
+    XYZ_p = as_float_array(XYZ_p)
 
-    return 52.37 * (XYZ_p / 4095) ** 2.6
+    return as_numeric(52.37 * (XYZ_p / 4095) ** 2.6)
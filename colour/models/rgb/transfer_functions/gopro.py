@@ -26,6 +26,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
+from colour.utilities import as_float_array, as_numeric
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -61,9 +63,9 @@ def log_encoding_Protune(x):
     0.6456234...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
-    return np.log(x * 112 + 1) / np.log(113)
+    return as_numeric(np.log(x * 112 + 1) / np.log(113))
 
 
 def log_decoding_Protune(y):
@@ -91,6 +93,6 @@ def log_decoding_Protune(y):
     0.1...
     """
 
-    y = np.asarray(y)
+    y = as_float_array(y)
 
-    return (113 ** y - 1) / 112
+    return as_numeric((113 ** y - 1) / 112)
@@ -29,7 +29,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import Structure, as_numeric
+from colour.utilities import Structure, as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -79,7 +79,7 @@ def oetf_BT2020(E, is_12_bits_system=False):
     0.4090077...
     """
 
-    E = np.asarray(E)
+    E = as_float_array(E)
 
     a = BT2020_CONSTANTS.alpha(is_12_bits_system)
     b = BT2020_CONSTANTS.beta(is_12_bits_system)
@@ -114,7 +114,7 @@ def eotf_BT2020(E_p, is_12_bits_system=False):
     0.4999999...
     """
 
-    E_p = np.asarray(E_p)
+    E_p = as_float_array(E_p)
 
     a = BT2020_CONSTANTS.alpha(is_12_bits_system)
     b = BT2020_CONSTANTS.beta(is_12_bits_system)
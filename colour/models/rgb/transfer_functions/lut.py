@@ -0,0 +1,492 @@
+# -*- coding: utf-8 -*-
+"""
+Colour Component Transfer Functions 1-D LUTs
+============================================
+
+Defines the objects accelerating the colour component transfer functions
+(CCTFs) evaluation with dense 1-D *LUTs*:
+
+-   :class:`colour.models.CCTF_LUT`
+-   :func:`colour.models.cctf_LUT`
+
+The transfer functions, e.g. *SMPTE ST 2084:2014* or *ALEXA Log C*, are
+evaluating transcendental functions per element. A *LUT* densely sampling a
+given curve over a given domain is generated once, refined until the
+absolute linear interpolation error is below a given maximum, and then
+evaluated with vectorised linear interpolation. Values outside the domain are
+evaluated with the exact curve.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+from collections import OrderedDict
+
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.utilities import (as_float_array, as_numeric,
+                              get_float_precision, warning)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'CCTF_LUT_MINIMUM_SIZE', 'CCTF_LUT_MAXIMUM_SIZE',
+    'CCTF_LUT_LOGARITHMIC_DYNAMIC_RANGE', 'CCTF_LUT_CHUNK_SIZE', 'CCTF_LUT',
+    'cctf_LUT'
+]
+
+CCTF_LUT_MINIMUM_SIZE = 256
+"""
+Initial *LUT* size, it is doubled until the maximum error is reached.
+
+CCTF_LUT_MINIMUM_SIZE : integer
+"""
+
+CCTF_LUT_MAXIMUM_SIZE = 2 ** 20
+"""
+Maximum *LUT* size, a warning is issued if the maximum error is not reached.
+
+CCTF_LUT_MAXIMUM_SIZE : integer
+"""
+
+CCTF_LUT_LOGARITHMIC_DYNAMIC_RANGE = 2 ** 16
+"""
+Dynamic range covered by a logarithmically sampled *LUT* whose domain lower
+bound is not positive, i.e. the lower bound is set to the upper bound divided
+by that dynamic range.
+
+CCTF_LUT_LOGARITHMIC_DYNAMIC_RANGE : numeric
+"""
+
+CCTF_LUT_CHUNK_SIZE = 2 ** 14
+"""
+Count of elements evaluated per pass by a *LUT*, small enough for the
+intermediate arrays to remain in the processor cache.
+
+CCTF_LUT_CHUNK_SIZE : integer
+"""
+
+_CCTF_LUTS_CACHE = OrderedDict()
+"""
+*LUTs* cache, keyed by curve, keyword arguments, domain, sampling and maximum
+error.
+
+_CCTF_LUTS_CACHE : OrderedDict
+"""
+
+_CCTF_LUTS_CACHE_SIZE = 64
+"""
+*LUTs* cache size, the least recently used *LUT* is discarded when exceeded.
+
+_CCTF_LUTS_CACHE_SIZE : integer
+"""
+
+
+class CCTF_LUT(object):
+    """
+    Defines a dense 1-D *LUT* approximating given colour component transfer
+    function over given domain with a bounded absolute error.
+
+    The *LUT* size is doubled from :attr:`colour.models.CCTF_LUT_MINIMUM_SIZE`
+    until the absolute error of the linear interpolation, estimated at the
+    middle of every *LUT* interval, is lower than the maximum error.
+
+    Parameters
+    ----------
+    function : callable
+        Colour component transfer function, it must be vectorised.
+    domain : array_like, optional
+        *LUT* input domain, values outside of it are evaluated with the exact
+        function.
+    sampling : unicode, optional
+        **{'Linear', 'Logarithmic'}**,
+        *LUT* samples spacing, *Logarithmic* sampling is better suited to
+        linear-light input values, e.g. for *OETFs* and *log* encoding curves.
+    maximum_error : numeric, optional
+        Maximum absolute interpolation error.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the colour component transfer function.
+
+    Attributes
+    ----------
+    function
+    kwargs
+    domain
+    sampling
+    maximum_error
+    x
+    y
+    error
+
+    Methods
+    -------
+    __call__
+
+    Examples
+    --------
+    >>> from colour.models import eotf_ST2084
+    >>> LUT = CCTF_LUT(eotf_ST2084, maximum_error=1e-3)
+    >>> LUT(0.5)  # doctest: +ELLIPSIS
+    92.2457...
+    >>> eotf_ST2084(0.5)  # doctest: +ELLIPSIS
+    92.2457...
+    >>> LUT.error < 1e-3
+    True
+    """
+
+    def __init__(self,
+                 function,
+                 domain=np.array([0, 1]),
+                 sampling='Linear',
+                 maximum_error=1e-6,
+                 **kwargs):
+        self._function = function
+        self._kwargs = kwargs
+        self._domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+        self._sampling = sampling
+        self._maximum_error = maximum_error
+
+        self._x = None
+        self._y = None
+        self._error = None
+
+        self._generate()
+
+    @property
+    def function(self):
+        """
+        Getter property for the colour component transfer function.
+
+        Returns
+        -------
+        callable
+            Colour component transfer function.
+        """
+
+        return self._function
+
+    @property
+    def kwargs(self):
+        """
+        Getter property for the colour component transfer function keywords
+        arguments.
+
+        Returns
+        -------
+        dict
+            Colour component transfer function keywords arguments.
+        """
+
+        return self._kwargs
+
+    @property
+    def domain(self):
+        """
+        Getter property for the *LUT* input domain.
+
+        Returns
+        -------
+        ndarray
+            *LUT* input domain.
+        """
+
+        return self._domain
+
+    @property
+    def sampling(self):
+        """
+        Getter property for the *LUT* samples spacing.
+
+        Returns
+        -------
+        unicode
+            *LUT* samples spacing.
+        """
+
+        return self._sampling
+
+    @property
+    def maximum_error(self):
+        """
+        Getter property for the maximum absolute interpolation error.
+
+        Returns
+        -------
+        numeric
+            Maximum absolute interpolation error.
+        """
+
+        return self._maximum_error
+
+    @property
+    def x(self):
+        """
+        Getter property for the *LUT* input samples.
+
+        Returns
+        -------
+        ndarray
+            *LUT* input samples.
+        """
+
+        return self._x
+
+    @property
+    def y(self):
+        """
+        Getter property for the *LUT* output samples.
+
+        Returns
+        -------
+        ndarray
+            *LUT* output samples.
+        """
+
+        return self._y
+
+    @property
+    def error(self):
+        """
+        Getter property for the estimated absolute interpolation error of the
+        *LUT*.
+
+        Returns
+        -------
+        numeric
+            Estimated absolute interpolation error.
+        """
+
+        return self._error
+
+    def _is_logarithmic(self):
+        """
+        Returns whether the *LUT* samples are logarithmically spaced.
+
+        Raises
+        ------
+        ValueError
+            If the sampling is invalid.
+        """
+
+        sampling = self._sampling.lower()
+        if sampling not in ('linear', 'logarithmic'):
+            raise ValueError(
+                '"{0}" sampling is invalid, it must be one of {1}!'.format(
+                    self._sampling, ['Linear', 'Logarithmic']))
+
+        return sampling == 'logarithmic'
+
+    def _generate(self):
+        """
+        Generates the *LUT* by doubling its size until the maximum error is
+        reached.
+
+        The *LUT* is interpolated linearly in the sampling space, i.e. the
+        input values space for linear sampling and their base-2 logarithm
+        space for logarithmic sampling.
+
+        Raises
+        ------
+        ValueError
+            If the function is not finite over the *LUT* domain.
+        """
+
+        minimum, maximum = self._domain
+        if self._is_logarithmic():
+            if minimum <= 0:
+                minimum = maximum / CCTF_LUT_LOGARITHMIC_DYNAMIC_RANGE
+
+            u_minimum, u_maximum = np.log2(minimum), np.log2(maximum)
+        else:
+            u_minimum, u_maximum = minimum, maximum
+
+        def u_to_x(u):
+            """
+            Converts from sampling space to input values space.
+            """
+
+            return 2 ** u if self._is_logarithmic() else u
+
+        size = CCTF_LUT_MINIMUM_SIZE
+        while True:
+            u = np.linspace(u_minimum, u_maximum, size)
+            x = u_to_x(u)
+            x[0], x[-1] = minimum, maximum
+            y = np.asarray(
+                self._function(x, **self._kwargs), dtype=DEFAULT_FLOAT_DTYPE)
+
+            if not np.all(np.isfinite(y)):
+                raise ValueError(
+                    '"{0}" function is not finite over "{1}" domain!'.format(
+                        self._function.__name__, self._domain))
+
+            # The linear interpolation error is estimated at the middle of
+            # every interval, where it is maximum for a locally quadratic
+            # function.
+            y_m = np.asarray(
+                self._function(u_to_x((u[:-1] + u[1:]) / 2), **self._kwargs),
+                dtype=DEFAULT_FLOAT_DTYPE)
+            error = np.max(np.abs(y_m - (y[:-1] + y[1:]) / 2))
+
+            if error <= self._maximum_error:
+                break
+
+            if size >= CCTF_LUT_MAXIMUM_SIZE:
+                warning(('"{0}" function maximum error "{1}" could not be '
+                         'reached, the "LUT" error is "{2}"!').format(
+                             self._function.__name__, self._maximum_error,
+                             error))
+                break
+
+            size *= 2
+
+        self._x = x
+        self._y = y
+        self._error = error
+
+        self._u_minimum = u_minimum
+        self._u_scale = (size - 1) / (u_maximum - u_minimum)
+        self._slopes = np.append(np.diff(y), 0)
+
+    def _evaluate(self, value):
+        """
+        Evaluates the *LUT* at given 1-dimensional value array.
+        """
+
+        if self._is_logarithmic():
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = np.log2(value)
+        else:
+            t = np.copy(value)
+
+        t -= self._u_minimum
+        t *= self._u_scale
+
+        # Values outside the domain, including non-finite ones, are evaluated
+        # with the exact function.
+        outside = ~np.logical_and(t >= 0, t <= len(self._y) - 1)
+        is_outside = np.any(outside)
+        if is_outside:
+            t[outside] = 0
+
+        i = t.astype(np.int_)
+        np.minimum(i, len(self._y) - 2, out=i)
+
+        # In-place operations, the fractional part is converted to the output.
+        t -= i
+        t *= np.take(self._slopes, i)
+        t += np.take(self._y, i)
+
+        if is_outside:
+            t[outside] = self._function(value[outside], **self._kwargs)
+
+        return t
+
+    def __call__(self, value):
+        """
+        Evaluates the *LUT* at given value.
+
+        The *LUT* index is computed directly from the value as the samples
+        are regularly spaced in the sampling space, which is significantly
+        faster than a binary search. The value is processed in chunks of
+        :attr:`colour.models.CCTF_LUT_CHUNK_SIZE` elements so that the
+        intermediate arrays remain in the processor cache.
+
+        Parameters
+        ----------
+        value : numeric or array_like
+            Value.
+
+        Returns
+        -------
+        numeric or ndarray
+            Interpolated value.
+        """
+
+        value = as_float_array(value)
+        shape = value.shape
+
+        value = np.ravel(value)
+        output = np.empty(value.shape, dtype=value.dtype)
+        for i in range(0, value.size, CCTF_LUT_CHUNK_SIZE):
+            output[i:i + CCTF_LUT_CHUNK_SIZE] = self._evaluate(
+                value[i:i + CCTF_LUT_CHUNK_SIZE])
+
+        return as_numeric(np.reshape(output, shape))
+
+
+def cctf_LUT(function,
+             domain=np.array([0, 1]),
+             sampling='Linear',
+             maximum_error=1e-6,
+             **kwargs):
+    """
+    Returns a dense 1-D *LUT* approximating given colour component transfer
+    function, the *LUT* is cached per function, keywords arguments, domain,
+    sampling and maximum error.
+
+    Parameters
+    ----------
+    function : callable
+        Colour component transfer function, it must be vectorised.
+    domain : array_like, optional
+        *LUT* input domain, values outside of it are evaluated with the exact
+        function.
+    sampling : unicode, optional
+        **{'Linear', 'Logarithmic'}**,
+        *LUT* samples spacing.
+    maximum_error : numeric, optional
+        Maximum absolute interpolation error.
+
+    Other Parameters
+    ----------------
+    \\**kwargs : dict, optional
+        Keywords arguments for the colour component transfer function.
+
+    Returns
+    -------
+    CCTF_LUT
+        Colour component transfer function *LUT*.
+
+    Notes
+    -----
+    -   *LUTs* for non hashable keywords arguments, e.g. *ndarray*, are not
+        cached.
+
+    Examples
+    --------
+    >>> from colour.models import log_encoding_ALEXALogC
+    >>> LUT = cctf_LUT(log_encoding_ALEXALogC, np.array([0, 16]),
+    ...                'Logarithmic', EI=400)
+    >>> LUT is cctf_LUT(log_encoding_ALEXALogC, np.array([0, 16]),
+    ...                 'Logarithmic', EI=400)
+    True
+    >>> LUT(0.18)  # doctest: +ELLIPSIS
+    0.3910065...
+    """
+
+    domain = np.asarray(domain, dtype=DEFAULT_FLOAT_DTYPE)
+
+    # The function is evaluated in the current floating point precision.
+    key = (function, tuple(domain), sampling.lower(), maximum_error,
+           tuple(sorted(kwargs.items())), get_float_precision())
+    try:
+        LUT = _CCTF_LUTS_CACHE.pop(key, None)
+    except TypeError:
+        return CCTF_LUT(function, domain, sampling, maximum_error, **kwargs)
+
+    if LUT is None:
+        LUT = CCTF_LUT(function, domain, sampling, maximum_error, **kwargs)
+
+    _CCTF_LUTS_CACHE[key] = LUT
+    while len(_CCTF_LUTS_CACHE) > _CCTF_LUTS_CACHE_SIZE:
+        _CCTF_LUTS_CACHE.popitem(last=False)
+
+    return LUT
@@ -26,7 +26,7 @@ from __future__ import division, unicode_literals
 import numpy as np
 
 from colour.models.rgb.transfer_functions import full_to_legal, legal_to_full
-from colour.utilities import Structure, as_numeric
+from colour.utilities import Structure, as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -78,7 +78,7 @@ def log_encoding_VLog(L_in, bit_depth=10, out_legal=True, in_reflection=True):
     0.4233114...
     """
 
-    L_in = np.asarray(L_in)
+    L_in = as_float_array(L_in)
 
     if not in_reflection:
         L_in = L_in * 0.9
@@ -128,7 +128,7 @@ def log_decoding_VLog(V_out, bit_depth=10, in_legal=True, out_reflection=True):
     0.1799999...
     """
 
-    V_out = np.asarray(V_out)
+    V_out = as_float_array(V_out)
 
     V_out = V_out if in_legal else full_to_legal(V_out, bit_depth)
 
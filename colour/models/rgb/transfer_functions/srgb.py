@@ -34,7 +34,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import as_numeric
+from colour.utilities import as_float_array, as_numeric
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -72,7 +72,7 @@ def oetf_sRGB(L):
     0.4613561...
     """
 
-    L = np.asarray(L)
+    L = as_float_array(L)
 
     return as_numeric(
         np.where(L <= 0.0031308, L * 12.92, 1.055 * (L ** (1 / 2.4)) - 0.055))
@@ -104,7 +104,7 @@ def oetf_reverse_sRGB(V):
     0.1...
     """
 
-    V = np.asarray(V)
+    V = as_float_array(V)
 
     return as_numeric(
         np.where(V <= oetf_sRGB(0.0031308), V / 12.92, ((V + 0.055) / 1.055) **
@@ -31,7 +31,7 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.utilities import Structure
+from colour.utilities import Structure, as_float_array, as_numeric, warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -88,14 +88,14 @@ def oetf_ST2084(C, L_p=10000):
     0.5080784...
     """
 
-    C = np.asarray(C)
+    C = as_float_array(C)
 
     Y_p = (C / L_p) ** ST2084_CONSTANTS.m_1
 
     N = ((ST2084_CONSTANTS.c_1 + ST2084_CONSTANTS.c_2 * Y_p) /
          (ST2084_CONSTANTS.c_3 * Y_p + 1)) ** ST2084_CONSTANTS.m_2
 
-    return N
+    return as_numeric(N)
 
 
 def eotf_ST2084(N, L_p=10000):
@@ -122,6 +122,12 @@ def eotf_ST2084(N, L_p=10000):
           Target optical output :math:`C` in :math:`cd/m^2` of the ideal
           reference display.
 
+    Warning
+    -------
+    The *float16* floating point precision is not supported: the large
+    :math:`1 / m_2` and :math:`1 / m_1` exponents amplify its rounding error
+    up to a relative error of the order of 1 and a warning is issued.
+
     References
     ----------
     -   :cite:`Miller2014a`
@@ -133,7 +139,11 @@ def eotf_ST2084(N, L_p=10000):
     100.0000000...
     """
 
-    N = np.asarray(N)
+    N = as_float_array(N)
+
+    if N.dtype == np.float16:
+        warning('"SMPTE ST 2084:2014" EOTF does not support "float16" '
+                'floating point precision, use "float32" precision instead!')
 
     m_1_d = 1 / ST2084_CONSTANTS.m_1
     m_2_d = 1 / ST2084_CONSTANTS.m_2
@@ -147,4 +157,4 @@ def eotf_ST2084(N, L_p=10000):
     L = (n / (ST2084_CONSTANTS.c_2 - ST2084_CONSTANTS.c_3 * V_p)) ** m_1_d
     C = L_p * L
 
-    return C
+    return as_numeric(C)
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.rgb.transfer_functions.__init__`
+module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+import warnings
+
+from colour.models.rgb.transfer_functions import (
+    EOTFS, EOTFS_REVERSE, LOG_DECODING_CURVES, LOG_ENCODING_CURVES, OETFS,
+    OETFS_REVERSE, OOTFS, OOTFS_REVERSE)
+from colour.utilities import ColourWarning, float_precision, suppress_warnings
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'PRECISION_TOLERANCES', 'PRECISION_TOLERANCES_OVERRIDES',
+    'PRECISION_UNSUPPORTED', 'TestTransferFunctionsFloatPrecision'
+]
+
+PRECISION_TOLERANCES = {'float32': 1e-6, 'float16': 1e-2}
+"""
+Default maximum error, relative to the *float64* reference and to the unit
+above it, of the transfer functions evaluated at given floating point
+precision.
+
+PRECISION_TOLERANCES : dict
+"""
+
+PRECISION_TOLERANCES_OVERRIDES = {
+    ('OETFS', 'DICOM GSDF'): {
+        'float32': 1e-5,
+        'float16': 1e-1
+    },
+    ('EOTFS', 'DICOM GSDF'): {
+        'float32': 1e-5,
+        'float16': 1e-1
+    },
+    ('OETFS', 'ITU-R BT.2100 PQ'): {
+        'float32': 1e-4
+    },
+    ('OETFS', 'ST 2084'): {
+        'float32': 1e-5
+    },
+    ('OETFS_REVERSE', 'ITU-R BT.2100 PQ'): {
+        'float32': 1e-4
+    },
+    ('EOTFS_REVERSE', 'ITU-R BT.2100 PQ'): {
+        'float32': 1e-5
+    },
+    ('EOTFS', 'ST 2084'): {
+        'float32': 1e-4
+    },
+    ('EOTFS', 'ITU-R BT.2100 PQ'): {
+        'float32': 1e-4
+    },
+}
+"""
+Transfer functions maximum error overrides for the transfer functions that
+are ill-conditioned at given floating point precision.
+
+PRECISION_TOLERANCES_OVERRIDES : dict
+"""
+
+PRECISION_UNSUPPORTED = {
+    ('OETFS_REVERSE', 'ITU-R BT.2100 PQ'): ('float16', ),
+    ('EOTFS', 'ST 2084'): ('float16', ),
+    ('EOTFS', 'ITU-R BT.2100 PQ'): ('float16', ),
+}
+"""
+Floating point precisions unsupported by the transfer functions, e.g. the
+*SMPTE ST 2084:2014* EOTF large exponents make it unusable with *float16*, a
+warning is expected instead.
+
+PRECISION_UNSUPPORTED : dict
+"""
+
+
+class TestTransferFunctionsFloatPrecision(unittest.TestCase):
+    """
+    Defines :mod:`colour.models.rgb.transfer_functions` transfer functions
+    floating point precision policy unit tests methods.
+    """
+
+    def _assert_precision(self, mapping, name, function, value):
+        """
+        Asserts that given transfer function returns the floating point
+        precision policy type with an error within the pinned tolerances.
+        """
+
+        reference = function(value)
+        for precision in ('float32', 'float16'):
+            if precision in PRECISION_UNSUPPORTED.get((mapping, name), ()):
+                with float_precision(precision), warnings.catch_warnings(
+                        record=True) as records:
+                    warnings.simplefilter('always')
+                    function(value)
+
+                self.assertTrue(
+                    any(
+                        issubclass(record.category, ColourWarning)
+                        for record in records),
+                    '"{0}" "{1}" does not warn at "{2}" precision!'.format(
+                        mapping, name, precision))
+                continue
+
+            with float_precision(precision):
+                output = function(value)
+
+            # *ACESproxy* encoding returns integer code values.
+            if (mapping, name) == ('LOG_ENCODING_CURVES', 'ACESproxy'):
+                np.testing.assert_allclose(output, reference, atol=1)
+                continue
+
+            self.assertEqual(output.dtype, np.dtype(precision))
+
+            tolerance = PRECISION_TOLERANCES_OVERRIDES.get(
+                (mapping, name), {}).get(precision,
+                                         PRECISION_TOLERANCES[precision])
+            # Values outside the transfer function domain are not compared.
+            domain = np.isfinite(reference)
+            error = np.max(
+                np.abs(output[domain].astype(np.float64) - reference[domain]) /
+                np.maximum(np.abs(reference[domain]), 1))
+
+            self.assertLess(
+                error, tolerance,
+                '"{0}" "{1}" error is {2} at "{3}" precision!'.format(
+                    mapping, name, error, precision))
+
+    def test_transfer_functions_float_precision(self):
+        """
+        Tests :mod:`colour.models.rgb.transfer_functions` transfer functions
+        accuracy with the supported floating point precisions.
+        """
+
+        x = np.linspace(0.01, 1, 1000)
+        with suppress_warnings():
+            for encodings, encodings_name, decodings, decodings_name in (
+                (OETFS, 'OETFS', OETFS_REVERSE, 'OETFS_REVERSE'),
+                (OETFS, 'OETFS', EOTFS, 'EOTFS'),
+                (EOTFS_REVERSE, 'EOTFS_REVERSE', EOTFS, 'EOTFS'),
+                (LOG_ENCODING_CURVES, 'LOG_ENCODING_CURVES',
+                 LOG_DECODING_CURVES, 'LOG_DECODING_CURVES'),
+                (OOTFS, 'OOTFS', OOTFS_REVERSE, 'OOTFS_REVERSE'),
+            ):
+                for name, encoding in encodings.items():
+                    self._assert_precision(encodings_name, name, encoding, x)
+
+                    if name not in decodings:
+                        continue
+
+                    self._assert_precision(decodings_name, name,
+                                           decodings[name], encoding(x))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.rgb.transfer_functions.lut`
+module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.models.rgb.transfer_functions import (
+    CCTF_LUT, cctf_LUT, eotf_LUT, eotf_ST2084, log_decoding_curve_LUT,
+    log_decoding_VLog, log_encoding_ALEXALogC, log_encoding_Cineon,
+    log_encoding_curve_LUT,
+    oetf_LUT, oetf_sRGB)
+from colour.utilities import float_precision, ignore_numpy_errors
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestCCTF_LUT', 'TestCctf_LUT', 'TestCCTF_LUTDispatchers']
+
+
+class TestCCTF_LUT(unittest.TestCase):
+    """
+    Defines :class:`colour.models.rgb.transfer_functions.lut.CCTF_LUT` class
+    unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('function', 'kwargs', 'domain', 'sampling',
+                               'maximum_error', 'x', 'y', 'error')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(CCTF_LUT))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__call__', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(CCTF_LUT))
+
+    def test__init__(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.lut.CCTF_LUT.\
+__init__` method.
+        """
+
+        LUT = CCTF_LUT(eotf_ST2084, maximum_error=1e-4)
+        self.assertLess(LUT.error, 1e-4)
+        np.testing.assert_almost_equal(LUT.x[[0, -1]], np.array([0, 1]))
+        np.testing.assert_almost_equal(LUT.y, eotf_ST2084(LUT.x), decimal=7)
+
+        # A lower maximum error requires a larger "LUT".
+        self.assertGreater(
+            len(CCTF_LUT(eotf_ST2084, maximum_error=1e-6).x), len(LUT.x))
+
+        LUT = CCTF_LUT(oetf_sRGB, sampling='Logarithmic')
+        np.testing.assert_almost_equal(LUT.x[[0, -1]],
+                                       np.array([2 ** -16, 1]))
+        np.testing.assert_almost_equal(
+            LUT.x[1] / LUT.x[0], LUT.x[-1] / LUT.x[-2], decimal=7)
+
+    def test_raise_exception__init__(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.lut.CCTF_LUT.\
+__init__` method raised exception.
+        """
+
+        self.assertRaises(ValueError, CCTF_LUT, oetf_sRGB, sampling='Cubic')
+
+        self.assertRaises(ValueError, CCTF_LUT, np.log)
+
+    def test__call__(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.lut.CCTF_LUT.\
+__call__` method.
+        """
+
+        L = np.linspace(0, 16, 1000)
+
+        LUT = CCTF_LUT(
+            log_encoding_ALEXALogC,
+            np.array([0, 16]),
+            'Logarithmic',
+            1e-6,
+            EI=400)
+        np.testing.assert_allclose(
+            LUT(L), log_encoding_ALEXALogC(L, EI=400), atol=1e-6)
+
+        LUT = CCTF_LUT(log_decoding_VLog, maximum_error=1e-5)
+        V = np.linspace(0, 1, 1000)
+        np.testing.assert_allclose(LUT(V), log_decoding_VLog(V), atol=1e-5)
+
+        self.assertAlmostEqual(
+            LUT(0.5), log_decoding_VLog(0.5), places=5)
+
+    def test_n_dimensional__call__(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.lut.CCTF_LUT.\
+__call__` method n-dimensional arrays support.
+        """
+
+        LUT = CCTF_LUT(oetf_sRGB, sampling='Logarithmic')
+
+        L = 0.18
+        V = LUT(L)
+
+        L = np.tile(L, 6)
+        V = np.tile(V, 6)
+        np.testing.assert_almost_equal(LUT(L), V, decimal=7)
+
+        L = np.reshape(L, (2, 3))
+        V = np.reshape(V, (2, 3))
+        np.testing.assert_almost_equal(LUT(L), V, decimal=7)
+
+        L = np.reshape(L, (2, 3, 1))
+        V = np.reshape(V, (2, 3, 1))
+        np.testing.assert_almost_equal(LUT(L), V, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan__call__(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.lut.CCTF_LUT.\
+__call__` method nan support, values outside the domain are evaluated with the
+        exact function.
+        """
+
+        LUT = CCTF_LUT(oetf_sRGB, sampling='Logarithmic')
+
+        L = np.array([-1.0, 0.0, 1e-6, 2.0, -np.inf, np.inf, np.nan])
+        np.testing.assert_equal(LUT(L), oetf_sRGB(L))
+
+
+class TestCctf_LUT(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.lut.cctf_LUT`
+    definition unit tests methods.
+    """
+
+    def test_cctf_LUT(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.lut.cctf_LUT`
+        definition.
+        """
+
+        LUT = cctf_LUT(log_encoding_ALEXALogC, EI=400)
+        self.assertIs(LUT, cctf_LUT(log_encoding_ALEXALogC, EI=400))
+        self.assertIsNot(LUT, cctf_LUT(log_encoding_ALEXALogC, EI=800))
+        self.assertIsNot(
+            LUT, cctf_LUT(log_encoding_ALEXALogC, maximum_error=1e-5, EI=400))
+
+        with float_precision('float16'):
+            LUT_h = cctf_LUT(log_encoding_ALEXALogC, EI=400)
+            self.assertIsNot(LUT_h, LUT)
+            self.assertIs(LUT_h, cctf_LUT(log_encoding_ALEXALogC, EI=400))
+
+        self.assertIs(LUT, cctf_LUT(log_encoding_ALEXALogC, EI=400))
+
+        # Non hashable keywords arguments are not cached.
+        self.assertIsInstance(
+            cctf_LUT(log_encoding_Cineon, black_offset=np.array([0.01])),
+            CCTF_LUT)
+
+
+class TestCCTF_LUTDispatchers(unittest.TestCase):
+    """
+    Defines :func:`colour.models.rgb.transfer_functions.oetf_LUT`,
+    :func:`colour.models.rgb.transfer_functions.eotf_LUT`,
+    :func:`colour.models.rgb.transfer_functions.log_encoding_curve_LUT` and
+    :func:`colour.models.rgb.transfer_functions.log_decoding_curve_LUT`
+    definitions unit tests methods.
+    """
+
+    def test_dispatchers(self):
+        """
+        Tests :func:`colour.models.rgb.transfer_functions.oetf_LUT`,
+        :func:`colour.models.rgb.transfer_functions.eotf_LUT`,
+        :func:`colour.models.rgb.transfer_functions.log_encoding_curve_LUT`
+        and :func:`colour.models.rgb.transfer_functions.\
+log_decoding_curve_LUT` definitions.
+        """
+
+        self.assertAlmostEqual(oetf_LUT(0.18), 0.461356129500442, places=5)
+
+        # The *LUTs* are cached per floating point precision.
+        with float_precision('float16'):
+            oetf_LUT(0.18, maximum_error=1e-5)
+        self.assertAlmostEqual(
+            oetf_LUT(0.18, maximum_error=1e-5), 0.461356129500442, places=5)
+
+        self.assertAlmostEqual(
+            eotf_LUT(0.182011532850008, 'ST 2084', L_p=1000),
+            0.18,
+            places=5)
+
+        self.assertAlmostEqual(
+            log_encoding_curve_LUT(0.18, 'S-Log3'),
+            0.410557184750733,
+            places=5)
+
+        self.assertAlmostEqual(
+            log_decoding_curve_LUT(0.410557184750733, 'S-Log3'),
+            0.18,
+            places=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -25,6 +25,8 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
+from colour.utilities import as_float_array, as_numeric
+
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
 __license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
@@ -60,9 +62,9 @@ def log_encoding_ViperLog(x):
     0.6360080...
     """
 
-    x = np.asarray(x)
+    x = as_float_array(x)
 
-    return (1023 + 500 * np.log10(x)) / 1023
+    return as_numeric((1023 + 500 * np.log10(x)) / 1023)
 
 
 def log_decoding_ViperLog(y):
@@ -90,6 +92,6 @@ def log_decoding_ViperLog(y):
     0.1799999...
     """
 
-    y = np.asarray(y)
+    y = as_float_array(y)
 
-    return 10 ** ((1023 * y - 1023) / 500)
+    return as_numeric(10 ** ((1023 * y - 1023) / 500))
@@ -53,10 +53,10 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 
-from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.models.rgb.transfer_functions import (CV_range, oetf_BT2020,
                                                   eotf_BT2020)
-from colour.utilities import CaseInsensitiveMapping, tsplit, tstack
+from colour.utilities import (CaseInsensitiveMapping, get_float_precision,
+                              tsplit, tstack)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -129,7 +129,7 @@ def YCbCr_ranges(bits, is_legal, is_int):
         ranges = np.array([0, 2 ** bits - 1, 0, 2 ** bits - 1])
 
     if not is_int:
-        ranges = ranges.astype(DEFAULT_FLOAT_DTYPE) / (2 ** bits - 1)
+        ranges = ranges.astype(get_float_precision()) / (2 ** bits - 1)
 
     if is_int and not is_legal:
         ranges[3] = 2 ** bits
@@ -141,6 +141,172 @@ def YCbCr_ranges(bits, is_legal, is_int):
     return ranges
 
 
+def _YCbCr_matrix(K):
+    """
+    Returns the normalised *R'G'B'* to *Y'CbCr* colour encoding matrix for
+    given luma weighting coefficients.
+
+    Parameters
+    ----------
+    K : array_like
+        Luma weighting coefficients of red and blue.
+
+    Returns
+    -------
+    ndarray
+        Normalised *R'G'B'* to *Y'CbCr* colour encoding matrix.
+    """
+
+    Kr, Kb = K
+    Kg = 1 - Kr - Kb
+
+    return np.array([
+        [Kr, Kg, Kb],
+        [-0.5 * Kr / (1 - Kb), -0.5 * Kg / (1 - Kb), 0.5],
+        [0.5, -0.5 * Kg / (1 - Kr), -0.5 * Kb / (1 - Kr)],
+    ])
+
+
+def _code_values_dtype(minimum, maximum):
+    """
+    Returns the smallest integer data type able to represent the code values
+    in given range, e.g. *uint8* for 8-bit legal range and *uint16* for
+    10-bit and 12-bit code values.
+
+    Parameters
+    ----------
+    minimum : numeric
+        Code values range minimum.
+    maximum : numeric
+        Code values range maximum.
+
+    Returns
+    -------
+    dtype
+        Code values integer data type.
+    """
+
+    return np.promote_types(
+        np.min_scalar_type(min(int(np.floor(minimum)), 0)),
+        np.min_scalar_type(int(np.ceil(maximum))))
+
+
+def _code_values_range(minimum, maximum, bits):
+    """
+    Returns the range of the code values that given bit depth can represent,
+    extended to given code values range, e.g. *[0, 1023]* for 10-bit legal
+    range.
+
+    Parameters
+    ----------
+    minimum : numeric
+        Code values range minimum.
+    maximum : numeric
+        Code values range maximum.
+    bits : int
+        Code values bit depth.
+
+    Returns
+    -------
+    tuple
+        Code values range.
+    """
+
+    return (min(int(np.floor(minimum)), 0),
+            max(int(np.ceil(maximum)), 2 ** bits - 1))
+
+
+def _round_code_values(a, a_range):
+    """
+    Rounds given float array to integer code values in given range, the
+    values outside the range are clamped.
+
+    Parameters
+    ----------
+    a : ndarray
+        Float array to round, it is modified in place.
+    a_range : array_like
+        Code values range, see
+        :func:`colour.models.rgb.ycbcr._code_values_range` definition.
+
+    Returns
+    -------
+    ndarray
+        Integer code values array.
+    """
+
+    a = np.round(a, out=a)
+    a = np.clip(a, a_range[0], a_range[1], out=a)
+
+    return a.astype(_code_values_dtype(*a_range))
+
+
+def _fixed_point_transform(a, M, offset, a_range, b_range):
+    """
+    Applies given affine transformation to given integer code values array
+    using fixed-point integer arithmetic, the rounding matches the float
+    computation with :func:`np.round` definition, to the nearest half.
+
+    Parameters
+    ----------
+    a : ndarray
+        Integer code values array.
+    M : array_like
+        Transformation matrix.
+    offset : array_like
+        Transformation offset.
+    a_range : array_like
+        Input code values range, the code values outside it are clamped.
+    b_range : array_like
+        Output code values range, the code values outside it are clamped.
+
+    Returns
+    -------
+    ndarray
+        Transformed integer code values array.
+    """
+
+    a_min, a_max = a_range
+    info = np.iinfo(a.dtype)
+    if info.min < a_min or info.max > a_max:
+        a = np.clip(a, a_min, a_max)
+
+    # The products are accumulated with as many fractional bits as the 64-bit
+    # accumulator allows, the coefficients quantisation error bounds the
+    # remainders that are rounded as ties.
+    magnitude = (np.max(np.sum(np.abs(M), axis=-1)) * max(
+        abs(a_min), abs(a_max)) + np.max(np.abs(offset)) + 1)
+    shift = min(int(np.floor(np.log2(2 ** 62 / magnitude))), 40)
+    one = 2 ** shift
+    tolerance = int(np.ceil(1.5 * max(abs(a_min), abs(a_max)))) + 2
+
+    M = np.round(np.asarray(M) * one).astype(np.int64)
+    offset = np.round(np.asarray(offset) * one).astype(np.int64) + one // 2
+
+    b = np.empty(a.shape, _code_values_dtype(*b_range))
+    remainder = np.empty(a.shape[:-1], np.int64)
+    total = np.empty(a.shape[:-1], np.int64)
+    for i in range(3):
+        total.fill(offset[i])
+        for j in range(3):
+            np.multiply(
+                a[..., j], M[i, j], out=remainder, dtype=np.int64,
+                casting='unsafe')
+            total += remainder
+        np.bitwise_and(total, one - 1, out=remainder)
+        total >>= shift
+
+        # Ties are rounded to even as :func:`np.round` definition does.
+        odd = (total & 1) == 1
+        total -= odd & (remainder <= tolerance)
+        total += odd & (remainder >= one - tolerance)
+
+        np.clip(total, b_range[0], b_range[1], out=total)
+        b[..., i] = total
+
+    return b
+
+
 def RGB_to_YCbCr(RGB,
                  K=YCBCR_WEIGHTS['ITU-R BT.709'],
                  in_bits=10,
@@ -217,6 +383,15 @@ def RGB_to_YCbCr(RGB,
         [16 / 255, 240./255]. The float values are calculated based on an
         [0, 255] integer range, but no 8-bit quantisation or clamping are
         performed.
+    -   Integer code values are returned with the smallest integer data type
+        able to represent the output range, e.g. *uint8* for 8-bit legal
+        range and *uint16* for 10-bit code values, the code values outside
+        the ``out_bits`` range are clamped.
+    -   The input code values outside the ``in_bits`` range are clamped if
+        ``in_int`` is *True*.
+    -   Integer code values input, i.e. an integer array with ``in_int`` and
+        ``out_int`` set to *True*, is converted with fixed-point integer
+        arithmetic whose rounding and clamping match the float computation.
 
     References
     ----------
@@ -247,7 +422,7 @@ def RGB_to_YCbCr(RGB,
     Creating integer code values as per standard 10-bit SDI:
 
     >>> RGB_to_YCbCr(RGB, out_legal=True, out_bits=10, out_int=True)
-    array([940, 512, 512])
+    array([940, 512, 512], dtype=uint16)
 
     For JFIF JPEG conversion as per ITU-T T.871
     :cite:`InternationalTelecommunicationUnion2011e`:
@@ -255,7 +430,7 @@ def RGB_to_YCbCr(RGB,
     >>> RGB = np.array([102, 0, 51])
     >>> RGB_to_YCbCr(RGB, K=YCBCR_WEIGHTS['ITU-R BT.601'], in_range=(0, 255),
     ...              out_range=(0, 255, 0, 256), out_int=True)
-    array([ 36, 136, 175])
+    array([ 36, 136, 175], dtype=uint16)
 
     Note the use of 256 for the max *Cb / Cr* value, which is required so that
     the *Cb* and *Cr* output is centered about 128. Using 255 centres it
@@ -269,7 +444,7 @@ def RGB_to_YCbCr(RGB,
 
     >>> RGB_to_YCbCr(RGB, K=YCBCR_WEIGHTS['ITU-R BT.601'], in_bits=8,
     ...              in_int=True, out_legal=False, out_int=True)
-    array([ 36, 136, 175])
+    array([ 36, 136, 175], dtype=uint16)
     """
 
     RGB = np.asarray(RGB)
@@ -280,9 +455,28 @@ def RGB_to_YCbCr(RGB,
                                             YCbCr_ranges(
                                                 out_bits, out_legal, out_int))
 
-    RGB_float = RGB.astype(DEFAULT_FLOAT_DTYPE) - RGB_min
+    # Both the fixed-point and float computations clamp the integer code
+    # values to the ``in_bits`` and ``out_bits`` ranges.
+    if in_int:
+        in_range = _code_values_range(RGB_min, RGB_max, in_bits)
+    if out_int:
+        out_range = _code_values_range(
+            min(Y_min, C_min), max(Y_max, C_max), out_bits)
+
+    if in_int and out_int and np.issubdtype(RGB.dtype, np.integer):
+        scale = np.array([Y_max - Y_min, C_max - C_min, C_max - C_min])
+        M = _YCbCr_matrix(K) * (scale / (RGB_max - RGB_min))[..., np.newaxis]
+        offset = np.array([Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2])
+        offset -= np.sum(M, axis=-1) * RGB_min
+
+        return _fixed_point_transform(RGB, M, offset, in_range, out_range)
+
+    RGB_float = RGB.astype(get_float_precision())
+    if in_int:
+        RGB_float = np.clip(RGB_float, in_range[0], in_range[1], out=RGB_float)
+    RGB_float -= RGB_min
     RGB_float *= 1 / (RGB_max - RGB_min)
-    R, G, B = tsplit(RGB_float)
+    R, G, B = tsplit(RGB_float, copy=False)
 
     Y = Kr * R + (1 - Kr - Kb) * G + Kb * B
     Cb = 0.5 * (B - Y) / (1 - Kb)
@@ -295,7 +489,7 @@ def RGB_to_YCbCr(RGB,
     Cr += (C_max + C_min) / 2
 
     YCbCr = tstack((Y, Cb, Cr))
-    YCbCr = np.round(YCbCr).astype(np.int_) if out_int else YCbCr
+    YCbCr = _round_code_values(YCbCr, out_range) if out_int else YCbCr
 
     return YCbCr
 
@@ -366,6 +560,17 @@ def YCbCr_to_RGB(YCbCr,
     :func:`colour.YcCbcCrc_to_RGB` definition should be used for the constant
     luminance case as per :cite:`InternationalTelecommunicationUnion2015h`.
 
+    Notes
+    -----
+    -   Integer code values are returned with the smallest integer data type
+        able to represent the output range, the code values outside the
+        ``out_bits`` range are clamped.
+    -   The input code values outside the ``in_bits`` range are clamped if
+        ``in_int`` is *True*.
+    -   Integer code values input, i.e. an integer array with ``in_int`` and
+        ``out_int`` set to *True*, is converted with fixed-point integer
+        arithmetic whose rounding and clamping match the float computation.
+
     References
     ----------
     -   :cite:`InternationalTelecommunicationUnion2011e`
@@ -381,7 +586,6 @@ def YCbCr_to_RGB(YCbCr,
     """
 
     YCbCr = np.asarray(YCbCr)
-    Y, Cb, Cr = tsplit(YCbCr.astype(DEFAULT_FLOAT_DTYPE))
     Kr, Kb = K
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
@@ -389,6 +593,30 @@ def YCbCr_to_RGB(YCbCr,
     RGB_min, RGB_max = kwargs.get('out_range',
                                   CV_range(out_bits, out_legal, out_int))
 
+    # Both the fixed-point and float computations clamp the integer code
+    # values to the ``in_bits`` and ``out_bits`` ranges.
+    if in_int:
+        in_range = _code_values_range(
+            min(Y_min, C_min), max(Y_max, C_max), in_bits)
+    if out_int:
+        out_range = _code_values_range(RGB_min, RGB_max, out_bits)
+
+    if in_int and out_int and np.issubdtype(YCbCr.dtype, np.integer):
+        M = (np.linalg.inv(_YCbCr_matrix(K)) /
+             np.array([Y_max - Y_min, C_max - C_min, C_max - C_min]) *
+             (RGB_max - RGB_min))
+        offset = np.full(3, RGB_min, dtype=np.float_)
+        offset -= np.dot(
+            M, np.array([Y_min, (C_max + C_min) / 2, (C_max + C_min) / 2]))
+
+        return _fixed_point_transform(YCbCr, M, offset, in_range, out_range)
+
+    YCbCr_float = YCbCr.astype(get_float_precision())
+    if in_int:
+        YCbCr_float = np.clip(
+            YCbCr_float, in_range[0], in_range[1], out=YCbCr_float)
+    Y, Cb, Cr = tsplit(YCbCr_float, copy=False)
+
     Y -= Y_min
     Cb -= (C_max + C_min) / 2
     Cr -= (C_max + C_min) / 2
@@ -402,7 +630,7 @@ def YCbCr_to_RGB(YCbCr,
     RGB = tstack((R, G, B))
     RGB *= RGB_max - RGB_min
     RGB += RGB_min
-    RGB = np.round(RGB).astype(np.int_) if out_int else RGB
+    RGB = _round_code_values(RGB, out_range) if out_int else RGB
 
     return RGB
 
@@ -454,6 +682,12 @@ def RGB_to_YcCbcCrc(RGB,
     *Recommendation ITU-R BT.2020* when adopting the constant luminance
     implementation.
 
+    Notes
+    -----
+    -   Integer code values are returned with the smallest integer data type
+        able to represent the output range, the code values outside the
+        ``out_bits`` range are clamped.
+
     References
     ----------
     -   :cite:`InternationalTelecommunicationUnion2015h`
@@ -464,7 +698,7 @@ def RGB_to_YcCbcCrc(RGB,
     >>> RGB = np.array([0.18, 0.18, 0.18])
     >>> RGB_to_YcCbcCrc(RGB, out_legal=True, out_bits=10, out_int=True,
     ...                 is_12_bits_system=False)
-    array([422, 512, 512])
+    array([422, 512, 512], dtype=uint16)
     """
 
     RGB = np.asarray(RGB)
@@ -487,7 +721,10 @@ def RGB_to_YcCbcCrc(RGB,
     Crc += (C_max + C_min) / 2
 
     YcCbcCrc = tstack((Yc, Cbc, Crc))
-    YcCbcCrc = np.round(YcCbcCrc).astype(np.int_) if out_int else YcCbcCrc
+    YcCbcCrc = (_round_code_values(
+        YcCbcCrc,
+        _code_values_range(min(Y_min, C_min), max(Y_max, C_max), out_bits))
+                if out_int else YcCbcCrc)
 
     return YcCbcCrc
 
@@ -553,7 +790,7 @@ def YcCbcCrc_to_RGB(YcCbcCrc,
     """
 
     YcCbcCrc = np.asarray(YcCbcCrc)
-    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(DEFAULT_FLOAT_DTYPE))
+    Yc, Cbc, Crc = tsplit(YcCbcCrc.astype(get_float_precision()))
     Y_min, Y_max, C_min, C_max = kwargs.get('in_range',
                                             YCbCr_ranges(
                                                 in_bits, in_legal, in_int))
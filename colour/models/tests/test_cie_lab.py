@@ -105,6 +105,22 @@ class TestXYZ_to_Lab(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_Lab(XYZ, illuminant), Lab, decimal=7)
 
+    def test_out_XYZ_to_Lab(self):
+        """
+        Tests :func:`colour.models.cie_lab.XYZ_to_Lab` definition output array
+        support.
+        """
+
+        XYZ = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (6, 1))
+        Lab = XYZ_to_Lab(XYZ)
+
+        out = np.zeros(XYZ.shape)
+        self.assertIs(XYZ_to_Lab(XYZ, out=out), out)
+        np.testing.assert_almost_equal(out, Lab, decimal=7)
+
+        XYZ_to_Lab(XYZ, out=XYZ)
+        np.testing.assert_almost_equal(XYZ, Lab, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_Lab(self):
         """
@@ -200,6 +216,23 @@ class TestLab_to_XYZ(unittest.TestCase):
         np.testing.assert_almost_equal(
             Lab_to_XYZ(Lab, illuminant), XYZ, decimal=7)
 
+    def test_out_Lab_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_lab.Lab_to_XYZ` definition output array
+        support.
+        """
+
+        Lab = np.tile(
+            np.array([37.98562910, -23.62907688, -4.41746615]), (6, 1))
+        XYZ = Lab_to_XYZ(Lab)
+
+        out = np.zeros(Lab.shape)
+        self.assertIs(Lab_to_XYZ(Lab, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+        Lab_to_XYZ(Lab, out=Lab)
+        np.testing.assert_almost_equal(Lab, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_Lab_to_XYZ(self):
         """
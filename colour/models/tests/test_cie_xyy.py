@@ -103,6 +103,31 @@ class TestXYZ_to_xyY(unittest.TestCase):
         np.testing.assert_almost_equal(
             XYZ_to_xyY(XYZ, illuminant), xyY, decimal=7)
 
+    def test_out_XYZ_to_xyY(self):
+        """
+        Tests :func:`colour.models.cie_xyy.XYZ_to_xyY` definition output array
+        support.
+        """
+
+        XYZ = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (6, 1))
+        xyY = XYZ_to_xyY(XYZ)
+
+        out = np.zeros(XYZ.shape)
+        self.assertIs(XYZ_to_xyY(XYZ, out=out), out)
+        np.testing.assert_almost_equal(out, xyY, decimal=7)
+
+        XYZ_to_xyY(XYZ, out=XYZ)
+        np.testing.assert_almost_equal(XYZ, xyY, decimal=7)
+
+        XYZ = np.array([[0.00000000, 0.00000000, 0.00000000],
+                        [0.07049534, 0.10080000, 0.09558313]])
+        XYZ_to_xyY(XYZ, out=XYZ)
+        np.testing.assert_almost_equal(
+            XYZ,
+            np.array([[0.34570000, 0.35850000, 0.00000000],
+                      [0.26414772, 0.37770001, 0.10080000]]),
+            decimal=7)
+
     @ignore_numpy_errors
     def test_nan_XYZ_to_xyY(self):
         """
@@ -166,6 +191,22 @@ class TestxyY_to_XYZ(unittest.TestCase):
         XYZ = np.reshape(XYZ, (2, 3, 3))
         np.testing.assert_almost_equal(xyY_to_XYZ(xyY), XYZ, decimal=7)
 
+    def test_out_xyY_to_XYZ(self):
+        """
+        Tests :func:`colour.models.cie_xyy.xyY_to_XYZ` definition output array
+        support.
+        """
+
+        xyY = np.tile(np.array([0.26414772, 0.37770001, 0.10080000]), (6, 1))
+        XYZ = xyY_to_XYZ(xyY)
+
+        out = np.zeros(xyY.shape)
+        self.assertIs(xyY_to_XYZ(xyY, out=out), out)
+        np.testing.assert_almost_equal(out, XYZ, decimal=7)
+
+        xyY_to_XYZ(xyY, out=xyY)
+        np.testing.assert_almost_equal(xyY, XYZ, decimal=7)
+
     @ignore_numpy_errors
     def test_nan_xyY_to_XYZ(self):
         """
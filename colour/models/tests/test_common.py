@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.common` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.models import COLOURSPACE_MODELS, XYZ_to_colourspace_model
+from colour.utilities import float_precision
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['PRECISION_TOLERANCES', 'TestXYZ_to_colourspace_model']
+
+PRECISION_TOLERANCES = {
+    'CIE xyY': {
+        'float32': 1e-6,
+        'float16': 1e-2
+    },
+    'CIE Lab': {
+        'float32': 1e-4,
+        'float16': 5e-1
+    },
+    'CIE LCHab': {
+        'float32': 1e-4,
+        'float16': 5e-1
+    },
+    'CIE Luv': {
+        'float32': 1e-4,
+        'float16': 5e-1
+    },
+    'CIE Luv uv': {
+        'float32': 1e-6,
+        'float16': 1e-2
+    },
+    'CIE LCHuv': {
+        'float32': 1e-4,
+        'float16': 5e-1
+    },
+    'CIE UCS': {
+        'float32': 1e-6,
+        'float16': 1e-2
+    },
+    'CIE UCS uv': {
+        'float32': 1e-6,
+        'float16': 1e-2
+    },
+    'CIE UVW': {
+        'float32': 1e-4,
+        'float16': 1
+    },
+    'IPT': {
+        'float32': 1e-5,
+        'float16': 1e-2
+    },
+    'Hunter Lab': {
+        'float32': 1e-4,
+        'float16': 5e-1
+    },
+    'Hunter Rdab': {
+        'float32': 1e-4,
+        'float16': 5e-1
+    },
+}
+"""
+Colourspace models maximum error, relative to the *float64* reference and to
+the unit above it, at given floating point precision.
+
+PRECISION_TOLERANCES : dict
+"""
+
+
+class TestXYZ_to_colourspace_model(unittest.TestCase):
+    """
+    Defines :func:`colour.models.common.XYZ_to_colourspace_model` definition
+    unit tests methods.
+    """
+
+    def test_XYZ_to_colourspace_model(self):
+        """
+        Tests :func:`colour.models.common.XYZ_to_colourspace_model`
+        definition.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        W = np.array([0.34570, 0.35850])
+
+        np.testing.assert_almost_equal(
+            XYZ_to_colourspace_model(XYZ, W, 'CIE xyY'),
+            np.array([0.26414772, 0.37770001, 0.10080000]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            XYZ_to_colourspace_model(XYZ, W, 'CIE Lab'),
+            np.array([37.98562910, -23.62907688, -4.41746615]),
+            decimal=7)
+
+    def test_raise_exception_XYZ_to_colourspace_model(self):
+        """
+        Tests :func:`colour.models.common.XYZ_to_colourspace_model`
+        definition raised exception.
+        """
+
+        self.assertRaises(ValueError, XYZ_to_colourspace_model,
+                          np.array([0.07049534, 0.10080000, 0.09558313]),
+                          np.array([0.34570, 0.35850]), 'Undefined')
+
+    def test_float_precision_XYZ_to_colourspace_model(self):
+        """
+        Tests :func:`colour.models.common.XYZ_to_colourspace_model`
+        definition accuracy with the supported floating point precisions.
+        """
+
+        XYZ = np.random.RandomState(4).uniform(0.05, 0.95, (1000, 3))
+        W = np.array([0.31270, 0.32900])
+
+        for model in COLOURSPACE_MODELS:
+            # *CIE XYZ* tristimulus values are returned unchanged.
+            if model == 'CIE XYZ':
+                continue
+
+            reference = XYZ_to_colourspace_model(XYZ, W, model)
+            for precision in ('float32', 'float16'):
+                with float_precision(precision):
+                    values = XYZ_to_colourspace_model(XYZ, W, model)
+
+                self.assertEqual(values.dtype, np.dtype(precision))
+
+                error = np.max(
+                    np.abs(values.astype(np.float64) - reference) /
+                    np.maximum(np.abs(reference), 1))
+
+                self.assertLess(
+                    error, PRECISION_TOLERANCES[model][precision],
+                    '"{0}" error is {1} at "{2}" precision!'.format(
+                        model, error, precision))
+
+
+if __name__ == '__main__':
+    unittest.main()
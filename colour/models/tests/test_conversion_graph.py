@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.models.conversion_graph` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import unittest
+
+from colour.colorimetry import ILLUMINANTS
+from colour.models import (
+    ColourConversion, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_UCS, XYZ_to_xyY,
+    conversion_path, convert, oetf_reverse_sRGB, sRGB_COLOURSPACE,
+    BT2020_COLOURSPACE)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = ['TestConversionPath', 'TestColourConversion', 'TestConvert']
+
+D50 = ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']
+
+
+class TestConversionPath(unittest.TestCase):
+    """
+    Defines :func:`colour.models.conversion_graph.conversion_path` definition
+    unit tests methods.
+    """
+
+    def test_conversion_path(self):
+        """
+        Tests :func:`colour.models.conversion_graph.conversion_path`
+        definition.
+        """
+
+        self.assertListEqual(
+            [specification[:2] for specification in conversion_path(
+                'R\'G\'B\'', 'CIE LCHab')],
+            [('R\'G\'B\'', 'RGB'), ('RGB', 'CIE XYZ'), ('CIE XYZ', 'CIE Lab'),
+             ('CIE Lab', 'CIE LCHab')])
+
+        self.assertListEqual(
+            [specification[:2] for specification in conversion_path(
+                'cie xyz', 'CIE XYZ')], [])
+
+        self.assertListEqual(
+            [specification[:2] for specification in conversion_path(
+                'CIE UVW', 'CIE UVW')], [])
+
+    def test_raise_exception_conversion_path(self):
+        """
+        Tests :func:`colour.models.conversion_graph.conversion_path`
+        definition raised exception.
+        """
+
+        self.assertRaises(KeyError, conversion_path, 'CIE XYZ', 'Undefined')
+
+        self.assertRaises(ValueError, conversion_path, 'CIE UVW', 'CIE XYZ')
+
+
+class TestColourConversion(unittest.TestCase):
+    """
+    Defines :class:`colour.models.conversion_graph.ColourConversion` class
+    unit tests methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('source', 'target', 'path', 'stages')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(ColourConversion))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('__call__', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(ColourConversion))
+
+    def test_stages(self):
+        """
+        Tests :attr:`colour.models.conversion_graph.ColourConversion.stages`
+        attribute.
+        """
+
+        conversion = ColourConversion(
+            'RGB',
+            'CIE UCS',
+            colourspace=BT2020_COLOURSPACE,
+            illuminant=D50,
+            chromatic_adaptation_transform='Bradford')
+
+        self.assertEqual(len(conversion.path), 2)
+        self.assertEqual(len(conversion.stages), 1)
+
+        M = XYZ_to_UCS(
+            RGB_to_XYZ(
+                np.identity(3), BT2020_COLOURSPACE.whitepoint, D50,
+                BT2020_COLOURSPACE.RGB_to_XYZ_matrix, 'Bradford')).T
+        np.testing.assert_almost_equal(conversion.stages[0], M, decimal=7)
+
+        conversion = ColourConversion('R\'G\'B\'', 'CIE Lab')
+        self.assertEqual(len(conversion.stages), 3)
+        self.assertIsInstance(conversion.stages[1], np.ndarray)
+
+    def test__call__(self):
+        """
+        Tests :func:`colour.models.conversion_graph.ColourConversion.__call__`
+        method.
+        """
+
+        RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+        XYZ = RGB_to_XYZ(
+            oetf_reverse_sRGB(RGB), sRGB_COLOURSPACE.whitepoint, D50,
+            sRGB_COLOURSPACE.RGB_to_XYZ_matrix)
+
+        conversion = ColourConversion(
+            'R\'G\'B\'', 'CIE Lab', illuminant=D50)
+        np.testing.assert_almost_equal(
+            conversion(RGB), XYZ_to_Lab(XYZ, D50), decimal=7)
+
+        # The *sRGB* colourspace normalised primary matrices are rounded and
+        # not exactly inverse of each other.
+        np.testing.assert_almost_equal(
+            ColourConversion('CIE Lab', 'R\'G\'B\'', illuminant=D50)(
+                conversion(RGB)),
+            RGB,
+            decimal=4)
+
+        RGB = np.reshape(np.tile(RGB, (6, 1)), (2, 3, 3))
+        XYZ = np.reshape(np.tile(XYZ, (6, 1)), (2, 3, 3))
+        np.testing.assert_almost_equal(
+            conversion(RGB), XYZ_to_Lab(XYZ, D50), decimal=7)
+
+
+class TestConvert(unittest.TestCase):
+    """
+    Defines :func:`colour.models.conversion_graph.convert` definition unit
+    tests methods.
+    """
+
+    def test_convert(self):
+        """
+        Tests :func:`colour.models.conversion_graph.convert` definition.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+
+        np.testing.assert_almost_equal(
+            convert(XYZ_to_xyY(XYZ), 'CIE xyY', 'CIE Lab'),
+            XYZ_to_Lab(XYZ),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            convert(XYZ, 'CIE XYZ', 'CIE UCS'), XYZ_to_UCS(XYZ), decimal=7)
+
+        np.testing.assert_almost_equal(
+            convert(
+                convert(XYZ, 'CIE XYZ', 'Hunter Lab', illuminant=D50),
+                'Hunter Lab',
+                'CIE XYZ',
+                illuminant=D50),
+            XYZ,
+            decimal=7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,9 @@
 """
 References
 ----------
+-   :cite:`Jakob2019` : Jakob, W., & Hanika, J. (2019). A Low-Dimensional
+    Function Space for Efficient Spectral Upsampling. Computer Graphics Forum,
+    38(2), 147-155. doi:10.1111/cgf.13626
 -   :cite:`Meng2015c` : Meng, J., Simon, F., Hanika, J., & Dachsbacher, C.
     (2015). Physically Meaningful Rendering using Tristimulus Colours. Computer
     Graphics Forum, 34(4), 31-40. doi:10.1111/cgf.12676
@@ -18,17 +21,29 @@ from colour.utilities import CaseInsensitiveMapping, filter_kwargs
 
 from .dataset import *  # noqa
 from . import dataset
-from .meng2015 import XYZ_to_spectral_Meng2015
-from .smits1999 import RGB_to_spectral_Smits1999
+from .meng2015 import (XYZ_to_spectral_Meng2015, Meng2015_BatchStatistics,
+                       XYZ_to_spectral_batch_Meng2015)
+from .smits1999 import (RGB_to_spectral_values_Smits1999,
+                        RGB_to_spectral_Smits1999)
+from .jakob2019 import (spectral_model_Jakob2019, find_coefficients_Jakob2019,
+                        XYZ_to_spectral_Jakob2019, LUT3D_Jakob2019)
 
 __all__ = []
 __all__ += dataset.__all__
-__all__ += ['XYZ_to_spectral_Meng2015']
-__all__ += ['RGB_to_spectral_Smits1999']
+__all__ += [
+    'XYZ_to_spectral_Meng2015', 'Meng2015_BatchStatistics',
+    'XYZ_to_spectral_batch_Meng2015'
+]
+__all__ += ['RGB_to_spectral_values_Smits1999', 'RGB_to_spectral_Smits1999']
+__all__ += [
+    'spectral_model_Jakob2019', 'find_coefficients_Jakob2019',
+    'XYZ_to_spectral_Jakob2019', 'LUT3D_Jakob2019'
+]
 
 REFLECTANCE_RECOVERY_METHODS = CaseInsensitiveMapping({
     'Meng 2015': XYZ_to_spectral_Meng2015,
     'Smits 1999': RGB_to_spectral_Smits1999,
+    'Jakob 2019': XYZ_to_spectral_Jakob2019,
 })
 REFLECTANCE_RECOVERY_METHODS.__doc__ = """
 Supported reflectance recovery methods.
@@ -37,9 +52,10 @@ References
 ----------
 -   :cite:`Meng2015c`
 -   :cite:`Smits1999a`
+-   :cite:`Jakob2019`
 
 REFLECTANCE_RECOVERY_METHODS : CaseInsensitiveMapping
-    **{'Meng 2015', 'Smits 1999'}**
+    **{'Meng 2015', 'Smits 1999', 'Jakob 2019'}**
 """
 
 
@@ -54,24 +70,31 @@ def XYZ_to_spectral(XYZ, method='Meng 2015', **kwargs):
         *CIE XYZ* tristimulus values to recover the spectral power distribution
         from.
     method : unicode, optional
-        **{'Meng 2015', 'Smits 1999'}**,
+        **{'Meng 2015', 'Smits 1999', 'Jakob 2019'}**,
         Computation method.
 
     Other Parameters
     ----------------
     cmfs : XYZ_ColourMatchingFunctions
-        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`},
+        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`,
+        :func:`colour.recovery.XYZ_to_spectral_Jakob2019`},
         Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        {:func:`colour.recovery.XYZ_to_spectral_Jakob2019`},
+        Illuminant spectral power distribution.
     interval : numeric, optional
-        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`},
+        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`,
+        :func:`colour.recovery.XYZ_to_spectral_Jakob2019`},
         Wavelength :math:`\lambda_{i}` range interval in nm. The smaller
         ``interval`` is, the longer the computations will be.
     tolerance : numeric, optional
-        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`},
+        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`,
+        :func:`colour.recovery.XYZ_to_spectral_Jakob2019`},
         Tolerance for termination. The lower ``tolerance`` is, the smoother
         the recovered spectral power distribution will be.
     maximum_iterations : int, optional
-        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`},
+        {:func:`colour.recovery.XYZ_to_spectral_Meng2015`,
+        :func:`colour.recovery.XYZ_to_spectral_Jakob2019`},
         Maximum number of iterations to perform.
 
     Returns
@@ -89,6 +112,7 @@ def XYZ_to_spectral(XYZ, method='Meng 2015', **kwargs):
     ----------
     -   :cite:`Meng2015c`
     -   :cite:`Smits1999a`
+    -   :cite:`Jakob2019`
 
     Examples
     --------
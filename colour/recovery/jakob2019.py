@@ -0,0 +1,818 @@
+# -*- coding: utf-8 -*-
+"""
+Jakob and Hanika (2019) - Reflectance Recovery
+==============================================
+
+Defines objects for reflectance recovery, i.e. spectral upsampling, using
+*Jakob and Hanika (2019)* method:
+
+-   :func:`colour.recovery.spectral_model_Jakob2019`
+-   :func:`colour.recovery.find_coefficients_Jakob2019`
+-   :func:`colour.recovery.XYZ_to_spectral_Jakob2019`
+-   :class:`colour.recovery.LUT3D_Jakob2019`
+
+The reflectances are modeled with a sigmoid applied to a quadratic
+polynomial of the wavelength, the three polynomial coefficients being found
+with a *Gauss-Newton* optimisation in *CIE L\*a\*b\** colourspace. Spectrally
+upsampling large amounts of colours, e.g. whole images, is done by
+precomputing the coefficients over a 3D lattice covering a given *RGB*
+colourspace and trilinearly interpolating them.
+
+References
+----------
+-   :cite:`Jakob2019` : Jakob, W., & Hanika, J. (2019). A Low-Dimensional
+    Function Space for Efficient Spectral Upsampling. Computer Graphics Forum,
+    38(2), 147-155. doi:10.1111/cgf.13626
+"""
+
+from __future__ import division, unicode_literals
+
+import multiprocessing
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from colour.colorimetry import (DEFAULT_SPECTRAL_SHAPE,
+                                ILLUMINANTS_RELATIVE_SPDS,
+                                STANDARD_OBSERVERS_CMFS,
+                                SpectralPowerDistribution, SpectralShape)
+from colour.constants import CIE_E, CIE_K, DEFAULT_FLOAT_DTYPE
+from colour.models import RGB_to_XYZ, XYZ_to_xy
+from colour.utilities import tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'spectral_model_Jakob2019', 'find_coefficients_Jakob2019',
+    'XYZ_to_spectral_Jakob2019', 'LUT3D_Jakob2019'
+]
+
+
+def _spectral_model(coefficients, wavelengths):
+    """
+    Evaluates the *Jakob and Hanika (2019)* sigmoid-polynomial spectral model
+    for given coefficients at given wavelengths.
+
+    Parameters
+    ----------
+    coefficients : array_like, (..., 3)
+        Quadratic polynomial coefficients.
+    wavelengths : array_like, (W, )
+        Wavelengths to evaluate the model at.
+
+    Returns
+    -------
+    ndarray, (..., W)
+        Spectral model values.
+    """
+
+    c_0, c_1, c_2 = [c[..., np.newaxis] for c in tsplit(coefficients)]
+
+    x = c_0 * wavelengths ** 2 + c_1 * wavelengths + c_2
+
+    return 1 / 2 + x / (2 * np.sqrt(1 + x ** 2))
+
+
+def _dimensionalise_coefficients(coefficients, shape):
+    """
+    Converts given coefficients defined over the normalised [0, 1] wavelength
+    domain of given spectral shape to coefficients defined over wavelengths in
+    nanometers.
+
+    Parameters
+    ----------
+    coefficients : array_like, (..., 3)
+        Coefficients defined over the normalised wavelength domain.
+    shape : SpectralShape
+        Spectral shape the normalised wavelength domain is derived from.
+
+    Returns
+    -------
+    ndarray, (..., 3)
+        Coefficients defined over wavelengths in nanometers.
+    """
+
+    c_0, c_1, c_2 = tsplit(coefficients)
+    s, r = shape.start, shape.end - shape.start
+
+    return tstack((c_0 / r ** 2, c_1 / r - 2 * c_0 * s / r ** 2,
+                   c_0 * s ** 2 / r ** 2 - c_1 * s / r + c_2))
+
+
+def _spectral_integration_data(cmfs, illuminant, shape):
+    """
+    Returns the data required to integrate the spectral model: the normalised
+    wavelengths, the weighting matrix converting spectral values to
+    *CIE XYZ* tristimulus values and the perfect reflecting diffuser
+    *CIE XYZ* tristimulus values.
+
+    Parameters
+    ----------
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution
+        Illuminant spectral power distribution.
+    shape : SpectralShape
+        Spectral shape the data is aligned to.
+
+    Returns
+    -------
+    tuple
+        Normalised wavelengths, weighting matrix and perfect reflecting
+        diffuser *CIE XYZ* tristimulus values.
+    """
+
+    cmfs = cmfs.copy().align(shape)
+    illuminant = illuminant.copy().align(shape)
+
+    wavelengths = cmfs.wavelengths
+    wavelengths_n = ((wavelengths - shape.start) / (shape.end - shape.start))
+
+    M = cmfs.values * illuminant.values[..., np.newaxis]
+    M /= np.sum(M[..., 1])
+
+    return wavelengths_n, M, np.sum(M, axis=0)
+
+
+def _XYZ_to_Lab(XYZ, XYZ_n):
+    """
+    Converts from *CIE XYZ* tristimulus values to *CIE L\*a\*b\** colourspace
+    using given reference white *CIE XYZ* tristimulus values and returns the
+    Jacobian matrices of the conversion.
+
+    Parameters
+    ----------
+    XYZ : array_like, (K, 3)
+        *CIE XYZ* tristimulus values.
+    XYZ_n : array_like, (3, )
+        Reference white *CIE XYZ* tristimulus values.
+
+    Returns
+    -------
+    tuple
+        *CIE L\*a\*b\** colourspace array and Jacobian matrices.
+    """
+
+    XYZ_f = XYZ / XYZ_n
+    XYZ_c = np.maximum(XYZ_f, CIE_E)
+
+    is_linear = XYZ_f <= CIE_E
+    f = np.where(is_linear, (CIE_K * XYZ_f + 16) / 116, np.cbrt(XYZ_c))
+    d_f = np.where(is_linear, CIE_K / 116, 1 / (3 * np.cbrt(XYZ_c) ** 2))
+
+    X_f, Y_f, Z_f = tsplit(f)
+    Lab = tstack((116 * Y_f - 16, 500 * (X_f - Y_f), 200 * (Y_f - Z_f)))
+
+    J = np.array([[0, 116, 0], [500, -500, 0], [0, 200, -200]])
+    J = J * (d_f / XYZ_n)[..., np.newaxis, :]
+
+    return Lab, J
+
+
+def _solve_coefficients(XYZ,
+                        wavelengths_n,
+                        M,
+                        XYZ_n,
+                        coefficients=None,
+                        maximum_iterations=50,
+                        tolerance=1e-5):
+    """
+    Finds the normalised wavelength domain coefficients of given *CIE XYZ*
+    tristimulus values with a batched and damped *Gauss-Newton*, i.e.
+    *Levenberg-Marquardt*, optimisation.
+
+    Parameters
+    ----------
+    XYZ : array_like, (K, 3)
+        *CIE XYZ* tristimulus values to find the coefficients of.
+    wavelengths_n : array_like, (W, )
+        Normalised wavelengths.
+    M : array_like, (W, 3)
+        Weighting matrix converting spectral values to *CIE XYZ* tristimulus
+        values.
+    XYZ_n : array_like, (3, )
+        Perfect reflecting diffuser *CIE XYZ* tristimulus values.
+    coefficients : array_like, (K, 3), optional
+        Starting coefficients, default to zeros, i.e. a flat 0.5 reflectance.
+    maximum_iterations : int, optional
+        Maximum number of iterations to perform.
+    tolerance : numeric, optional
+        *CIE L\*a\*b\** colourspace residual tolerance for termination.
+
+    Returns
+    -------
+    ndarray, (K, 3)
+        Normalised wavelength domain coefficients.
+    """
+
+    Lab_t, _J = _XYZ_to_Lab(XYZ, XYZ_n)
+
+    coefficients = (np.zeros(XYZ.shape) if coefficients is None else
+                    np.array(coefficients, dtype=DEFAULT_FLOAT_DTYPE))
+
+    basis = np.vstack(
+        [wavelengths_n ** 2, wavelengths_n,
+         np.ones(wavelengths_n.shape)])
+
+    def residual_jacobian(coefficients):
+        """
+        Returns the *CIE L\*a\*b\** colourspace residual and its Jacobian
+        matrices for given coefficients.
+        """
+
+        x = np.dot(coefficients, basis)
+        r = 1 + x ** 2
+        spectrum = 1 / 2 + x / (2 * np.sqrt(r))
+
+        Lab, J_Lab = _XYZ_to_Lab(np.dot(spectrum, M), XYZ_n)
+        J_XYZ = np.einsum('kw,wi,jw->kij', 1 / (2 * r ** (3 / 2)), M, basis)
+
+        return Lab - Lab_t, np.matmul(J_Lab, J_XYZ)
+
+    # Levenberg-Marquardt damping, adjusted independently for each colour
+    # so that diverging colours do not hinder the converging ones.
+    damping = np.full(XYZ.shape[0], 1e-3)
+    residual, J = residual_jacobian(coefficients)
+    error = np.sum(residual ** 2, axis=-1)
+    for _ in range(maximum_iterations):
+        if np.max(np.abs(residual)) < tolerance:
+            break
+
+        J_T = np.swapaxes(J, -1, -2)
+        J_TJ = np.matmul(J_T, J)
+        J_TJ += (damping[..., np.newaxis, np.newaxis] *
+                 (J_TJ * np.identity(3) + np.identity(3) * 1e-12))
+
+        coefficients_c = coefficients - np.linalg.solve(
+            J_TJ, np.matmul(J_T, residual[..., np.newaxis]))[..., 0]
+        residual_c, J_c = residual_jacobian(coefficients_c)
+        error_c = np.sum(residual_c ** 2, axis=-1)
+
+        accepted = error_c < error
+        coefficients[accepted] = coefficients_c[accepted]
+        residual[accepted] = residual_c[accepted]
+        J[accepted] = J_c[accepted]
+        error[accepted] = error_c[accepted]
+        damping = np.clip(
+            np.where(accepted, damping / 10, damping * 10), 1e-12, 1e12)
+
+    return coefficients
+
+
+def spectral_model_Jakob2019(coefficients,
+                             shape=DEFAULT_SPECTRAL_SHAPE,
+                             name=None):
+    """
+    Returns a spectral power distribution following the spectral model given
+    by *Jakob and Hanika (2019)*.
+
+    Parameters
+    ----------
+    coefficients : array_like, (3,)
+        Dimensionful coefficients for a quadratic polynomial.
+    shape : SpectralShape, optional
+        Shape used by the spectral power distribution.
+    name : unicode, optional
+        Name for the spectral power distribution.
+
+    Returns
+    -------
+    SpectralPowerDistribution
+        Spectral power distribution following the spectral model.
+
+    References
+    ----------
+    -   :cite:`Jakob2019`
+
+    Examples
+    --------
+    >>> spd = spectral_model_Jakob2019([1.3728e-04, -1.3519e-01, 3.0850e+01])
+    >>> spd[400]  # doctest: +ELLIPSIS
+    0.108...
+    """
+
+    wavelengths = shape.range()
+
+    return SpectralPowerDistribution(
+        _spectral_model(np.asarray(coefficients), wavelengths),
+        wavelengths,
+        name='Jakob (2019) - {0}'.format(coefficients)
+        if name is None else name)
+
+
+def find_coefficients_Jakob2019(
+        XYZ,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=ILLUMINANTS_RELATIVE_SPDS['D65'],
+        interval=5,
+        maximum_iterations=50,
+        tolerance=1e-5):
+    """
+    Computes the coefficients of the *Jakob and Hanika (2019)* spectral model
+    reproducing given *CIE XYZ* tristimulus values.
+
+    Parameters
+    ----------
+    XYZ : array_like
+        *CIE XYZ* tristimulus values to find the coefficients of.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    interval : numeric, optional
+        Wavelength :math:`\lambda_{i}` range interval in nm used for the
+        spectral integration. The smaller ``interval`` is, the longer the
+        computations will be.
+    maximum_iterations : int, optional
+        Maximum number of *Gauss-Newton* iterations to perform.
+    tolerance : numeric, optional
+        *CIE L\*a\*b\** colourspace residual tolerance for termination.
+
+    Returns
+    -------
+    ndarray
+        Dimensionful coefficients for a quadratic polynomial.
+
+    Notes
+    -----
+    -   Input *CIE XYZ* tristimulus values are in domain [0, 1] and relative
+        to ``illuminant``.
+    -   The optimisation is vectorised, any number of *CIE XYZ* tristimulus
+        values can be processed at once.
+
+    References
+    ----------
+    -   :cite:`Jakob2019`
+
+    Examples
+    --------
+    >>> XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+    >>> find_coefficients_Jakob2019(XYZ)  # doctest: +ELLIPSIS
+    array([  1.3728...e-04,  -1.3519...e-01,   3.0850...e+01])
+    """
+
+    XYZ = np.asarray(XYZ)
+
+    shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
+    wavelengths_n, M, XYZ_n = _spectral_integration_data(
+        cmfs, illuminant, shape)
+
+    coefficients = _solve_coefficients(
+        np.reshape(XYZ, (-1, 3)),
+        wavelengths_n,
+        M,
+        XYZ_n,
+        maximum_iterations=maximum_iterations,
+        tolerance=tolerance)
+
+    return np.reshape(
+        _dimensionalise_coefficients(coefficients, shape), XYZ.shape)
+
+
+def XYZ_to_spectral_Jakob2019(
+        XYZ,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        illuminant=ILLUMINANTS_RELATIVE_SPDS['D65'],
+        interval=5,
+        maximum_iterations=50,
+        tolerance=1e-5):
+    """
+    Recovers the spectral power distribution of given *CIE XYZ* tristimulus
+    values using *Jakob and Hanika (2019)* method.
+
+    Parameters
+    ----------
+    XYZ : array_like, (3,)
+        *CIE XYZ* tristimulus values to recover the spectral power distribution
+        from.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    illuminant : SpectralPowerDistribution, optional
+        Illuminant spectral power distribution.
+    interval : numeric, optional
+        Wavelength :math:`\lambda_{i}` range interval in nm. The smaller
+        ``interval`` is, the longer the computations will be.
+    maximum_iterations : int, optional
+        Maximum number of *Gauss-Newton* iterations to perform.
+    tolerance : numeric, optional
+        *CIE L\*a\*b\** colourspace residual tolerance for termination.
+
+    Returns
+    -------
+    SpectralPowerDistribution
+        Recovered spectral power distribution.
+
+    Notes
+    -----
+    -   Input *CIE XYZ* tristimulus values are in domain [0, 1] and relative
+        to ``illuminant``.
+
+    References
+    ----------
+    -   :cite:`Jakob2019`
+
+    Examples
+    --------
+    >>> from colour.colorimetry import spectral_to_XYZ_integration
+    >>> XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+    >>> spd = XYZ_to_spectral_Jakob2019(XYZ)
+    >>> spectral_to_XYZ_integration(
+    ...     spd, illuminant=ILLUMINANTS_RELATIVE_SPDS['D65']) / 100
+    ... # doctest: +ELLIPSIS
+    array([ 0.2065398...,  0.1219723...,  0.0513673...])
+    """
+
+    shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
+    coefficients = find_coefficients_Jakob2019(
+        XYZ, cmfs, illuminant, interval, maximum_iterations, tolerance)
+
+    return spectral_model_Jakob2019(
+        coefficients, shape, name='Jakob (2019) - {0}'.format(XYZ))
+
+
+def _wrapper_generate_LUT3D_Jakob2019(args):
+    """
+    Convenient wrapper to be able to call
+    :func:`colour.recovery.jakob2019._generate_LUT3D_Jakob2019_slice`
+    definition with multiple arguments.
+
+    Parameters
+    ----------
+    args : array_like, optional
+        Arguments.
+
+    Returns
+    -------
+    ndarray
+        Coefficients slice.
+    """
+
+    return _generate_LUT3D_Jakob2019_slice(*args)
+
+
+def _generate_LUT3D_Jakob2019_slice(i, x, lattice, scale, whitepoint,
+                                    RGB_to_XYZ_matrix,
+                                    chromatic_adaptation_transform,
+                                    wavelengths_n, M, XYZ_n,
+                                    maximum_iterations, tolerance):
+    """
+    Computes a slice of the *Jakob and Hanika (2019)* coefficients table: all
+    the coefficients for given maximum *RGB* component index :math:`i` and
+    given first normalised *RGB* component :math:`x`.
+
+    The slice is solved layer by layer along the scale axis, each layer being
+    solved as a batch and warm-started with the previous layer coefficients.
+
+    Returns
+    -------
+    ndarray, (N, N, 3)
+        Coefficients slice indexed by scale and second normalised *RGB*
+        component :math:`y`.
+    """
+
+    size = len(scale)
+    coefficients = np.zeros((size, size, 3))
+    xy_n = XYZ_to_xy(XYZ_n)
+
+    def solve_layer(j, coefficients_0):
+        """
+        Solves given scale layer.
+        """
+
+        z = scale[j]
+        RGB = np.zeros((size, 3))
+        RGB[..., i] = z
+        RGB[..., (i + 1) % 3] = x * z
+        RGB[..., (i + 2) % 3] = lattice * z
+
+        XYZ = RGB_to_XYZ(RGB, whitepoint, xy_n, RGB_to_XYZ_matrix,
+                         chromatic_adaptation_transform)
+
+        coefficients[j] = _solve_coefficients(
+            XYZ, wavelengths_n, M, XYZ_n, coefficients_0, maximum_iterations,
+            tolerance)
+
+        return coefficients[j]
+
+    start = size // 5
+    coefficients_0 = solve_layer(start, None)
+    for j in range(start + 1, size):
+        coefficients_0 = solve_layer(j, coefficients_0)
+
+    coefficients_0 = coefficients[start]
+    for j in reversed(range(start)):
+        coefficients_0 = solve_layer(j, coefficients_0)
+
+    return coefficients
+
+
+class LUT3D_Jakob2019(object):
+    """
+    Implements a precomputed *Jakob and Hanika (2019)* coefficients table
+    enabling fast spectral upsampling of *RGB* colourspace arrays, e.g.
+    images, with one trilinear interpolation per colour.
+
+    The table is indexed by the maximum *RGB* component index, the maximum
+    *RGB* component value, sampled along a non-linear scale, and the two
+    remaining *RGB* components normalised by the maximum one.
+
+    Attributes
+    ----------
+    size
+    scale
+    coefficients
+    shape
+
+    Methods
+    -------
+    generate
+    RGB_to_coefficients
+    RGB_to_spectral
+    read
+    write
+
+    References
+    ----------
+    -   :cite:`Jakob2019`
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE
+    >>> LUT = LUT3D_Jakob2019()
+    >>> LUT.generate(sRGB_COLOURSPACE, size=5, processes=1)
+    True
+    >>> RGB = np.array([0.70573936, 0.19248266, 0.22354169])
+    >>> LUT.RGB_to_coefficients(RGB)  # doctest: +ELLIPSIS
+    array([  9.4357...e-05,  -9.4375...e-02,   2.2623...e+01])
+    """
+
+    def __init__(self):
+        self._coefficients = None
+        self._scale = None
+        self._shape = None
+        self._interpolators = None
+
+    @property
+    def size(self):
+        """
+        Getter property for the coefficients table lattice size.
+
+        Returns
+        -------
+        int
+            Coefficients table lattice size.
+        """
+
+        return 0 if self._scale is None else len(self._scale)
+
+    @property
+    def scale(self):
+        """
+        Getter property for the coefficients table non-linear scale, i.e. the
+        sampled maximum *RGB* component values.
+
+        Returns
+        -------
+        ndarray
+            Coefficients table non-linear scale.
+        """
+
+        return self._scale
+
+    @property
+    def coefficients(self):
+        """
+        Getter property for the coefficients table.
+
+        Returns
+        -------
+        ndarray, (3, N, N, N, 3)
+            Dimensionful coefficients table.
+        """
+
+        return self._coefficients
+
+    @property
+    def shape(self):
+        """
+        Getter property for the spectral shape the coefficients table has
+        been generated with.
+
+        Returns
+        -------
+        SpectralShape
+            Coefficients table spectral shape.
+        """
+
+        return self._shape
+
+    def _update_interpolators(self):
+        """
+        Builds the trilinear interpolators, one per maximum *RGB* component
+        index.
+        """
+
+        lattice = np.linspace(0, 1, self.size)
+        self._interpolators = [
+            RegularGridInterpolator(
+                (self._scale, lattice, lattice), self._coefficients[i])
+            for i in range(3)
+        ]
+
+    def generate(self,
+                 colourspace,
+                 cmfs=STANDARD_OBSERVERS_CMFS[
+                     'CIE 1931 2 Degree Standard Observer'],
+                 illuminant=ILLUMINANTS_RELATIVE_SPDS['D65'],
+                 size=64,
+                 interval=5,
+                 chromatic_adaptation_transform='CAT02',
+                 maximum_iterations=50,
+                 tolerance=1e-5,
+                 processes=None):
+        """
+        Generates the coefficients table for given *RGB* colourspace using
+        multiprocessing.
+
+        Parameters
+        ----------
+        colourspace : RGB_Colourspace
+            *RGB* colourspace the coefficients table is generated for.
+        cmfs : XYZ_ColourMatchingFunctions, optional
+            Standard observer colour matching functions.
+        illuminant : SpectralPowerDistribution, optional
+            Illuminant spectral power distribution.
+        size : int, optional
+            Coefficients table lattice size.
+        interval : numeric, optional
+            Wavelength :math:`\lambda_{i}` range interval in nm used for the
+            spectral integration.
+        chromatic_adaptation_transform : unicode, optional
+            **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+            'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT',
+            'Bianco', 'Bianco PC'}**,
+            *Chromatic adaptation* transform from the *RGB* colourspace
+            whitepoint to the illuminant whitepoint.
+        maximum_iterations : int, optional
+            Maximum number of *Gauss-Newton* iterations to perform per
+            colour.
+        tolerance : numeric, optional
+            *CIE L\*a\*b\** colourspace residual tolerance for termination.
+        processes : integer, optional
+            Processes count, default to :func:`multiprocessing.cpu_count`
+            definition.
+
+        Returns
+        -------
+        bool
+            Definition success.
+        """
+
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
+        wavelengths_n, M, XYZ_n = _spectral_integration_data(
+            cmfs, illuminant, shape)
+
+        lattice = np.linspace(0, 1, size)
+        # Smoothstep applied twice, concentrating the samples around the
+        # darkest and brightest colours where the coefficients vary quickly.
+        scale = lattice ** 2 * (3 - 2 * lattice)
+        scale = scale ** 2 * (3 - 2 * scale)
+
+        arguments = [(i, x, lattice, scale, colourspace.whitepoint,
+                      colourspace.RGB_to_XYZ_matrix,
+                      chromatic_adaptation_transform, wavelengths_n, M, XYZ_n,
+                      maximum_iterations, tolerance) for i in range(3)
+                     for x in lattice]
+
+        cpu_count = processes if processes else multiprocessing.cpu_count()
+        pool = multiprocessing.Pool(processes=cpu_count)
+        try:
+            slices = pool.map(_wrapper_generate_LUT3D_Jakob2019, arguments)
+        finally:
+            pool.close()
+            pool.join()
+
+        # Slices are indexed by "x" then by scale and "y", the table is
+        # indexed by maximum component index, scale, "x" and "y".
+        coefficients = np.reshape(slices, (3, size, size, size, 3))
+        coefficients = np.transpose(coefficients, (0, 2, 1, 3, 4))
+
+        self._coefficients = _dimensionalise_coefficients(coefficients, shape)
+        self._scale = scale
+        self._shape = shape
+        self._update_interpolators()
+
+        return True
+
+    def RGB_to_coefficients(self, RGB):
+        """
+        Looks up the dimensionful coefficients of given *RGB* colourspace
+        array using trilinear interpolation.
+
+        Parameters
+        ----------
+        RGB : array_like, (..., 3)
+            *RGB* colourspace array.
+
+        Returns
+        -------
+        ndarray, (..., 3)
+            Dimensionful coefficients.
+
+        Notes
+        -----
+        -   Input *RGB* colourspace array is in domain [0, 1], values outside
+            the domain are clipped.
+        """
+
+        RGB = np.clip(np.asarray(RGB, dtype=DEFAULT_FLOAT_DTYPE), 0, 1)
+        RGB_f = np.reshape(RGB, (-1, 3))
+        indexes = np.arange(RGB_f.shape[0])
+
+        i_m = np.argmax(RGB_f, axis=-1)
+        z = RGB_f[indexes, i_m]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = np.where(z == 0, 0, RGB_f[indexes, (i_m + 1) % 3] / z)
+            y = np.where(z == 0, 0, RGB_f[indexes, (i_m + 2) % 3] / z)
+        points = tstack((z, x, y))
+
+        coefficients = np.zeros(RGB_f.shape)
+        for i in range(3):
+            mask = i_m == i
+            if np.any(mask):
+                coefficients[mask] = self._interpolators[i](points[mask])
+
+        return np.reshape(coefficients, RGB.shape)
+
+    def RGB_to_spectral(self, RGB, shape=DEFAULT_SPECTRAL_SHAPE):
+        """
+        Spectrally upsamples given *RGB* colourspace array.
+
+        Parameters
+        ----------
+        RGB : array_like, (..., 3)
+            *RGB* colourspace array.
+        shape : SpectralShape, optional
+            Spectral shape the recovered spectral values are sampled at.
+
+        Returns
+        -------
+        ndarray, (..., W)
+            Recovered spectral values.
+        """
+
+        return _spectral_model(
+            self.RGB_to_coefficients(RGB), shape.range())
+
+    def read(self, path):
+        """
+        Reads the coefficients table from given *.npz* file path.
+
+        Parameters
+        ----------
+        path : unicode
+            *.npz* file path.
+
+        Returns
+        -------
+        bool
+            Definition success.
+        """
+
+        data = np.load(path)
+
+        self._coefficients = data['coefficients']
+        self._scale = data['scale']
+        self._shape = SpectralShape(*data['shape'])
+        self._update_interpolators()
+
+        return True
+
+    def write(self, path):
+        """
+        Writes the coefficients table to given *.npz* file path.
+
+        Parameters
+        ----------
+        path : unicode
+            *.npz* file path.
+
+        Returns
+        -------
+        bool
+            Definition success.
+        """
+
+        np.savez(
+            path,
+            coefficients=self._coefficients,
+            scale=self._scale,
+            shape=np.array([
+                self._shape.start, self._shape.end, self._shape.interval
+            ]))
+
+        return True
@@ -7,6 +7,7 @@ Defines objects for reflectance recovery using *Meng, Simon and Hanika (2015)*
 method:
 
 -   :func:`colour.recovery.XYZ_to_spectral_Meng2015`
+-   :func:`colour.recovery.XYZ_to_spectral_batch_Meng2015`
 
 See Also
 --------
@@ -23,12 +24,14 @@ References
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
 import numpy as np
+from collections import namedtuple
 from scipy.optimize import minimize
 
 from colour.colorimetry import (STANDARD_OBSERVERS_CMFS,
-                                SpectralPowerDistribution, SpectralShape,
-                                ones_spd, spectral_to_XYZ_integration)
+                                SpectralPowerDistribution, SpectralShape)
+from colour.utilities import message_box, tsplit, warning
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -37,7 +40,70 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['XYZ_to_spectral_Meng2015']
+__all__ = [
+    'XYZ_to_spectral_Meng2015', 'Meng2015_BatchStatistics',
+    'XYZ_to_spectral_batch_Meng2015'
+]
+
+
+def _minimize_Meng2015(XYZ, cmfs, x_0, tolerance, maximum_iterations):
+    """
+    Performs the *Meng et alii (2015)* constrained optimisation of given
+    *CIE XYZ* tristimulus values.
+
+    Parameters
+    ----------
+    XYZ : array_like, (3,)
+        *CIE XYZ* tristimulus values to recover the spectral values from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions aligned to the spectral
+        shape of the recovered spectral values.
+    x_0 : array_like, (W,)
+        Initial guess.
+    tolerance : numeric
+        Tolerance for termination.
+    maximum_iterations : int
+        Maximum number of iterations to perform.
+
+    Returns
+    -------
+    OptimizeResult
+        Optimisation result.
+    """
+
+    def function_objective(a):
+        """
+        Objective function.
+        """
+
+        return np.sum(np.diff(a) ** 2)
+
+    # Inlined equal energy illuminant case of
+    # :func:`colour.colorimetry.spectral_to_XYZ_integration` definition,
+    # avoiding the spectral power distribution creation on each evaluation.
+    cmfs_t = tsplit(cmfs.values)
+    dw = cmfs.shape.interval
+    k = 100 / (np.sum(cmfs_t[1]) * dw)
+
+    def function_constraint(a):
+        """
+        Function defining the constraint.
+        """
+
+        return k * np.sum(a * cmfs_t * dw, axis=-1) - XYZ
+
+    constraints = {'type': 'eq', 'fun': function_constraint}
+
+    bounds = np.tile(np.array([0, 1000]), (cmfs_t.shape[-1], 1))
+
+    return minimize(
+        function_objective,
+        x_0,
+        method='SLSQP',
+        constraints=constraints,
+        bounds=bounds,
+        options={'ftol': tolerance,
+                 'maxiter': maximum_iterations})
 
 
 def XYZ_to_spectral_Meng2015(
@@ -85,6 +151,7 @@ def XYZ_to_spectral_Meng2015(
 
     Examples
     --------
+    >>> from colour.colorimetry import spectral_to_XYZ_integration
     >>> from colour.utilities import numpy_print_options
     >>> XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
     >>> spd = XYZ_to_spectral_Meng2015(XYZ, interval=10)
@@ -149,46 +216,308 @@ def XYZ_to_spectral_Meng2015(
     XYZ = np.asarray(XYZ)
     shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
     cmfs = cmfs.copy().align(shape)
-    illuminant = ones_spd(shape)
-    spd = ones_spd(shape)
 
-    def function_objective(a):
-        """
-        Objective function.
-        """
+    result = _minimize_Meng2015(XYZ, cmfs, np.ones(cmfs.wavelengths.shape),
+                                tolerance, maximum_iterations)
 
-        return np.sum(np.diff(a) ** 2)
+    if not result.success:
+        raise RuntimeError(
+            'Optimization failed for {0} after {1} iterations: "{2}".'.format(
+                XYZ, result.nit, result.message))
 
-    def function_constraint(a):
-        """
-        Function defining the constraint.
-        """
+    return SpectralPowerDistribution(
+        dict(zip(cmfs.wavelengths, result.x * 100)),
+        name='Meng (2015) - {0}'.format(XYZ))
 
-        spd[:] = a
-        return spectral_to_XYZ_integration(
-            spd, cmfs=cmfs, illuminant=illuminant) - XYZ
 
-    wavelengths = spd.wavelengths
-    bins = wavelengths.size
+Meng2015_BatchStatistics = namedtuple(
+    'Meng2015_BatchStatistics',
+    ('batch', 'colours', 'converged', 'iterations_mean', 'iterations_max'))
+"""
+Defines the convergence statistics of a batch of colours processed by
+:func:`colour.recovery.XYZ_to_spectral_batch_Meng2015` definition.
 
-    constraints = {'type': 'eq', 'fun': function_constraint}
+Parameters
+----------
+batch : int
+    Batch index.
+colours : int
+    Count of colours optimised in the batch, i.e. excluding cached colours.
+converged : int
+    Count of colours for which the optimisation converged.
+iterations_mean : numeric
+    Mean count of iterations per colour.
+iterations_max : int
+    Maximum count of iterations for a colour.
+"""
 
-    bounds = np.tile(np.array([0, 1000]), (bins, 1))
+_XYZ_TO_SPECTRAL_MENG2015_CACHE_SIZE = 2 ** 16
 
-    result = minimize(
-        function_objective,
-        spd.values,
-        method='SLSQP',
-        constraints=constraints,
-        bounds=bounds,
-        options={'ftol': tolerance,
-                 'maxiter': maximum_iterations})
 
-    if not result.success:
-        raise RuntimeError(
-            'Optimization failed for {0} after {1} iterations: "{2}".'.format(
-                XYZ, result.nit, result.message))
+def _Morton_order(a, bits=10):
+    """
+    Returns the indices sorting given triplets along the *Morton* (Z-order)
+    space filling curve so that consecutive triplets are close to each other.
 
-    return SpectralPowerDistribution(
-        dict(zip(wavelengths, result.x * 100)),
-        name='Meng (2015) - {0}'.format(XYZ))
+    Parameters
+    ----------
+    a : array_like, (N, 3)
+        Triplets to sort.
+    bits : int, optional
+        Quantisation bits per triplet component.
+
+    Returns
+    -------
+    ndarray, (N,)
+        Sorting indices.
+    """
+
+    a = np.asarray(a)
+    minimum, maximum = np.min(a, axis=0), np.max(a, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a_n = np.where(maximum > minimum, (a - minimum) / (maximum - minimum),
+                       0)
+
+    quantised = (a_n * (2 ** bits - 1)).astype(np.uint64)
+    code = np.zeros(a.shape[0], dtype=np.uint64)
+    for bit in range(bits):
+        for i in range(3):
+            code |= (((quantised[..., i] >> np.uint64(bit)) & np.uint64(1))
+                     << np.uint64(3 * bit + i))
+
+    return np.argsort(code, kind='mergesort')
+
+
+def _wrapper_XYZ_to_spectral_batch_Meng2015(args):
+    """
+    Convenient wrapper to be able to call
+    :func:`colour.recovery.meng2015._XYZ_to_spectral_chunk_Meng2015`:
+    definition with multiple arguments.
+
+    Parameters
+    ----------
+    args : array_like, optional
+        Arguments.
+
+    Returns
+    -------
+    tuple
+        Recovered spectral values, iterations count and convergence state.
+    """
+
+    return _XYZ_to_spectral_chunk_Meng2015(*args)
+
+
+def _XYZ_to_spectral_chunk_Meng2015(XYZ, cmfs, tolerance,
+                                    maximum_iterations):
+    """
+    Recovers the spectral values of given chunk of sorted *CIE XYZ*
+    tristimulus values, each optimisation being warm-started with the
+    luminance scaled solution of the previous colour.
+
+    Parameters
+    ----------
+    XYZ : array_like, (N, 3)
+        *CIE XYZ* tristimulus values to recover the spectral values from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions aligned to the spectral
+        shape of the recovered spectral values.
+    tolerance : numeric
+        Tolerance for termination.
+    maximum_iterations : int
+        Maximum number of iterations to perform.
+
+    Returns
+    -------
+    tuple
+        Recovered spectral values, iterations count and convergence state.
+    """
+
+    count = XYZ.shape[0]
+    values = np.zeros((count, cmfs.wavelengths.shape[0]))
+    iterations = np.zeros(count, dtype=np.int_)
+    converged = np.zeros(count, dtype=np.bool_)
+
+    x_0 = np.ones(values.shape[-1])
+    for i in range(count):
+        if i > 0 and XYZ[i - 1, 1] > 0:
+            x_0 = values[i - 1] * XYZ[i, 1] / XYZ[i - 1, 1]
+
+        result = _minimize_Meng2015(XYZ[i], cmfs, x_0, tolerance,
+                                    maximum_iterations)
+
+        values[i] = result.x
+        iterations[i] = result.nit
+        converged[i] = result.success
+
+    return values, iterations, converged
+
+
+def XYZ_to_spectral_batch_Meng2015(
+        XYZ,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5,
+        tolerance=1e-10,
+        maximum_iterations=2000,
+        chunk_size=64,
+        processes=None,
+        cache=None,
+        verbose=False,
+        additional_data=False):
+    """
+    Recovers the spectral values of given array of *CIE XYZ* tristimulus
+    values using *Meng et alii (2015)* method, multiprocessing and
+    warm-starting.
+
+    Identical colours are optimised once, the unique colours are sorted along
+    a space filling curve and split into chunks of ``chunk_size`` colours
+    distributed to the processes. Within a chunk, each optimisation starts
+    from the solution of the previous, neighbouring, colour instead of a flat
+    spectrum.
+
+    Parameters
+    ----------
+    XYZ : array_like, (..., 3)
+        *CIE XYZ* tristimulus values to recover the spectral values from.
+    cmfs : XYZ_ColourMatchingFunctions
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\lambda_{i}` range interval in nm. The smaller
+        ``interval`` is, the longer the computations will be.
+    tolerance : numeric, optional
+        Tolerance for termination. The lower ``tolerance`` is, the smoother
+        the recovered spectral values will be.
+    maximum_iterations : int, optional
+        Maximum number of iterations to perform.
+    chunk_size : int, optional
+        Count of colours per chunk, i.e. per task sent to the processes.
+    processes : integer, optional
+        Processes count, default to :func:`multiprocessing.cpu_count`
+        definition.
+    cache : dict_like, optional
+        Mapping storing the recovered spectral values across calls, keyed by
+        the colour and the optimisation parameters. It is bounded to 65536
+        entries, entries being evicted in iteration order once full.
+    verbose : bool, optional
+        Whether to print the progress and convergence statistics of each
+        batch.
+    additional_data : bool, optional
+        Whether to output additional data, i.e. the convergence statistics
+        of each batch.
+
+    Returns
+    -------
+    ndarray or tuple
+        Recovered spectral values, sampled at the wavelengths of ``cmfs``
+        aligned to ``interval``, or recovered spectral values and list of
+        :class:`colour.recovery.Meng2015_BatchStatistics` class instances.
+
+    Warning
+    -------
+    Contrary to :func:`colour.recovery.XYZ_to_spectral_Meng2015` definition,
+    a failed optimisation does not raise an exception, its result is kept and
+    a warning is issued instead.
+
+    Notes
+    -----
+    -   Input *CIE XYZ* tristimulus values are in domain [0, 1].
+    -   The batches are the groups of ``processes`` chunks whose progress is
+        reported.
+
+    References
+    ----------
+    -   :cite:`Meng2015c`
+
+    Examples
+    --------
+    >>> XYZ = np.array([[0.07049534, 0.10080000, 0.09558313],
+    ...                 [0.07049534, 0.10080000, 0.09558313],
+    ...                 [0.47097710, 0.34950000, 0.11301649]])
+    >>> values = XYZ_to_spectral_batch_Meng2015(XYZ, interval=10, processes=1)
+    >>> values.shape
+    (3, 48)
+    >>> values[0, 20]  # doctest: +ELLIPSIS
+    0.1152622...
+    """
+
+    XYZ = np.asarray(XYZ)
+    shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
+    cmfs = cmfs.copy().align(shape)
+
+    XYZ_u, inverse = np.unique(
+        np.reshape(XYZ, (-1, 3)), axis=0, return_inverse=True)
+    values = np.zeros((XYZ_u.shape[0], shape.range().shape[0]))
+
+    keys = [(cmfs.name, interval, tolerance, maximum_iterations, tuple(x))
+            for x in XYZ_u]
+    solve = np.ones(XYZ_u.shape[0], dtype=np.bool_)
+    if cache is not None:
+        for i, key in enumerate(keys):
+            cached = cache.get(key)
+            if cached is not None:
+                values[i] = cached
+                solve[i] = False
+
+    indexes = np.where(solve)[0]
+    if indexes.size:
+        indexes = indexes[_Morton_order(XYZ_u[indexes])]
+    chunks = [
+        indexes[i:i + chunk_size]
+        for i in range(0, indexes.shape[0], chunk_size)
+    ]
+
+    cpu_count = processes if processes else multiprocessing.cpu_count()
+    statistics = []
+    progress = failed = 0
+    if chunks:
+        pool = multiprocessing.Pool(processes=cpu_count)
+        try:
+            results = pool.imap(_wrapper_XYZ_to_spectral_batch_Meng2015,
+                                [(XYZ_u[chunk], cmfs, tolerance,
+                                  maximum_iterations) for chunk in chunks])
+
+            for batch, offset in enumerate(range(0, len(chunks), cpu_count)):
+                iterations, converged = [], []
+                for chunk in chunks[offset:offset + cpu_count]:
+                    values_c, iterations_c, converged_c = next(results)
+                    values[chunk] = values_c * 100
+                    iterations.append(iterations_c)
+                    converged.append(converged_c)
+
+                iterations = np.hstack(iterations)
+                converged = np.hstack(converged)
+                failed += np.sum(~converged)
+                statistics.append(
+                    Meng2015_BatchStatistics(
+                        batch, iterations.shape[0], int(np.sum(converged)),
+                        np.mean(iterations), int(np.max(iterations))))
+
+                progress += iterations.shape[0]
+                if verbose:
+                    message_box(
+                        ('Batch {0}: {1} / {2} colours, {3} converged, '
+                         '{4:.1f} mean iterations, {5} maximum '
+                         'iterations.').format(
+                             batch, progress, indexes.shape[0],
+                             statistics[-1].converged,
+                             statistics[-1].iterations_mean,
+                             statistics[-1].iterations_max))
+        finally:
+            pool.close()
+            pool.join()
+
+    if failed:
+        warning('Optimization failed for {0} colour(s).'.format(failed))
+
+    if cache is not None:
+        for i in indexes:
+            if len(cache) >= _XYZ_TO_SPECTRAL_MENG2015_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[keys[i]] = values[i]
+
+    values = np.reshape(values[inverse], XYZ.shape[:-1] + values.shape[-1:])
+
+    if additional_data:
+        return values, statistics
+    else:
+        return values
@@ -3,7 +3,10 @@
 Smits (1999) - Reflectance Recovery
 ===================================
 
-Defines objects for reflectance recovery using *Smits (1999)* method.
+Defines objects for reflectance recovery using *Smits (1999)* method:
+
+-   :func:`colour.recovery.RGB_to_spectral_values_Smits1999`
+-   :func:`colour.recovery.RGB_to_spectral_Smits1999`
 
 See Also
 --------
@@ -26,6 +29,7 @@ from colour.colorimetry import ILLUMINANTS
 from colour.models import (XYZ_to_RGB, normalised_primary_matrix,
                            sRGB_COLOURSPACE)
 from colour.recovery import SMITS_1999_SPDS
+from colour.utilities import tsplit
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -37,7 +41,7 @@ __status__ = 'Production'
 __all__ = [
     'SMITS1999_PRIMARIES', 'SMITS1999_WHITEPOINT',
     'SMITS1999_XYZ_TO_RGB_MATRIX', 'XYZ_to_RGB_Smits1999',
-    'RGB_to_spectral_Smits1999'
+    'RGB_to_spectral_values_Smits1999', 'RGB_to_spectral_Smits1999'
 ]
 
 SMITS1999_PRIMARIES = sRGB_COLOURSPACE.primaries
@@ -64,6 +68,17 @@ Current *Smits (1999)* method implementation *RGB* colourspace to
 SMITS1999_XYZ_TO_RGB_MATRIX : array_like, (3, 3)
 """
 
+_SMITS1999_BASIS = np.array([
+    SMITS_1999_SPDS[basis].values
+    for basis in ('white', 'cyan', 'magenta', 'yellow', 'red', 'green', 'blue')
+])
+"""
+*Smits (1999)* basis spectral values: *white*, *cyan*, *magenta*, *yellow*,
+*red*, *green* and *blue*.
+
+_SMITS1999_BASIS : ndarray, (7, 10)
+"""
+
 
 def XYZ_to_RGB_Smits1999(XYZ):
     """
@@ -100,6 +115,75 @@ def XYZ_to_RGB_Smits1999(XYZ):
         encoding_cctf=None)
 
 
+def RGB_to_spectral_values_Smits1999(RGB):
+    """
+    Recovers the spectral values of given *RGB* colourspace array using
+    *Smits (1999)* method.
+
+    Contrary to :func:`colour.recovery.RGB_to_spectral_Smits1999` definition,
+    the definition processes arrays of any shape, e.g. images, as weighted
+    sums of the basis spectral values, without creating any spectral power
+    distribution.
+
+    Parameters
+    ----------
+    RGB : array_like, (..., 3)
+        *RGB* colourspace array to recover the spectral values from.
+
+    Returns
+    -------
+    ndarray, (..., 10)
+        Recovered spectral values sampled at the wavelengths of
+        :attr:`colour.recovery.SMITS_1999_SPDS` attribute spectral power
+        distributions.
+
+    References
+    ----------
+    -   :cite:`Smits1999a`
+
+    Examples
+    --------
+    >>> RGB = np.array([0.02144962, 0.13154603, 0.09287601])
+    >>> RGB_to_spectral_values_Smits1999(RGB)[:4]  # doctest: +ELLIPSIS
+    array([ 0.0908046...,  0.0887761...,  0.0939795...,  0.1236033...])
+    >>> RGB = np.tile(RGB, (1920, 1080, 1))
+    >>> RGB_to_spectral_values_Smits1999(RGB).shape
+    (1920, 1080, 10)
+    """
+
+    R, G, B = tsplit(RGB)
+
+    # Branches of the original algorithm: the minimum component drives the
+    # *white* weight, the middle one the secondary colour weight and the
+    # maximum one the primary colour weight.
+    is_R_min = np.logical_and(R <= G, R <= B)
+    is_G_min = np.logical_and(~is_R_min, np.logical_and(G <= R, G <= B))
+    is_B_min = np.logical_and(~is_R_min, ~is_G_min)
+
+    zeros = np.zeros(R.shape)
+    weights = np.zeros(R.shape + (7, ))
+
+    weights[..., 0] = np.where(is_R_min, R, np.where(is_G_min, G, B))
+
+    # Secondary colours: *cyan*, *magenta* and *yellow*.
+    weights[..., 1] = np.where(is_R_min, np.minimum(G, B) - R, zeros)
+    weights[..., 2] = np.where(is_G_min, np.minimum(R, B) - G, zeros)
+    weights[..., 3] = np.where(is_B_min, np.minimum(R, G) - B, zeros)
+
+    # Primary colours: *red*, *green* and *blue*.
+    weights[..., 4] = np.where(
+        np.logical_and(is_G_min, R > B), R - B,
+        np.where(np.logical_and(is_B_min, R > G), R - G, zeros))
+    weights[..., 5] = np.where(
+        np.logical_and(is_R_min, G > B), G - B,
+        np.where(np.logical_and(is_B_min, R <= G), G - R, zeros))
+    weights[..., 6] = np.where(
+        np.logical_and(is_R_min, G <= B), B - G,
+        np.where(np.logical_and(is_G_min, R <= B), B - R, zeros))
+
+    return np.dot(weights, _SMITS1999_BASIS)
+
+
 def RGB_to_spectral_Smits1999(RGB):
     """
     Recovers the spectral power distribution of given *RGB* colourspace array
@@ -142,41 +226,8 @@ def RGB_to_spectral_Smits1999(RGB):
                               extrapolator_args={...})
     """
 
-    white_spd = SMITS_1999_SPDS['white'].copy()
-    cyan_spd = SMITS_1999_SPDS['cyan'].copy()
-    magenta_spd = SMITS_1999_SPDS['magenta'].copy()
-    yellow_spd = SMITS_1999_SPDS['yellow'].copy()
-    red_spd = SMITS_1999_SPDS['red'].copy()
-    green_spd = SMITS_1999_SPDS['green'].copy()
-    blue_spd = SMITS_1999_SPDS['blue'].copy()
-
-    R, G, B = np.ravel(RGB)
-    spd = white_spd.copy() * 0
+    spd = SMITS_1999_SPDS['white'].copy()
     spd.name = 'Smits (1999) - {0}'.format(RGB)
-
-    if R <= G and R <= B:
-        spd += white_spd * R
-        if G <= B:
-            spd += cyan_spd * (G - R)
-            spd += blue_spd * (B - G)
-        else:
-            spd += cyan_spd * (B - R)
-            spd += green_spd * (G - B)
-    elif G <= R and G <= B:
-        spd += white_spd * G
-        if R <= B:
-            spd += magenta_spd * (R - G)
-            spd += blue_spd * (B - R)
-        else:
-            spd += magenta_spd * (B - G)
-            spd += red_spd * (R - B)
-    else:
-        spd += white_spd * B
-        if R <= G:
-            spd += yellow_spd * (R - B)
-            spd += green_spd * (G - R)
-        else:
-            spd += yellow_spd * (G - B)
-            spd += red_spd * (R - G)
+    spd.values = RGB_to_spectral_values_Smits1999(np.ravel(RGB))
 
     return spd
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.recovery.jakob2019` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.colorimetry import (
+    ILLUMINANTS_RELATIVE_SPDS, STANDARD_OBSERVERS_CMFS, SpectralShape,
+    spectral_to_XYZ_integration)
+from colour.models import XYZ_to_Lab, XYZ_to_xy, sRGB_COLOURSPACE
+from colour.recovery import (
+    spectral_model_Jakob2019, find_coefficients_Jakob2019,
+    XYZ_to_spectral_Jakob2019, LUT3D_Jakob2019)
+from colour.recovery.jakob2019 import _spectral_integration_data
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'TestSpectralModel_Jakob2019', 'TestFindCoefficients_Jakob2019',
+    'TestXYZ_to_spectral_Jakob2019', 'TestLUT3D_Jakob2019'
+]
+
+CMFS = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+
+ILLUMINANT = ILLUMINANTS_RELATIVE_SPDS['D65']
+
+
+class TestSpectralModel_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.spectral_model_Jakob2019`
+    definition unit tests methods.
+    """
+
+    def test_spectral_model_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.spectral_model_Jakob2019`
+        definition.
+        """
+
+        spd = spectral_model_Jakob2019([0, 0, 0])
+        np.testing.assert_almost_equal(spd.values, 0.5, decimal=7)
+
+        spd = spectral_model_Jakob2019([0, 0, 1e10],
+                                       SpectralShape(400, 700, 1))
+        np.testing.assert_almost_equal(spd.values, 1, decimal=7)
+        self.assertEqual(spd.shape, SpectralShape(400, 700, 1))
+
+
+class TestFindCoefficients_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+    definition unit tests methods.
+    """
+
+    def test_find_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+        definition.
+        """
+
+        np.testing.assert_almost_equal(
+            find_coefficients_Jakob2019(
+                np.array([0.20654008, 0.12197225, 0.05136952])),
+            np.array([1.37285361e-04, -1.35192825e-01, 3.08503791e+01]),
+            decimal=5)
+
+    def test_n_dimensional_find_coefficients_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.find_coefficients_Jakob2019`
+        definition n-dimensional arrays support.
+        """
+
+        XYZ = np.array([0.20654008, 0.12197225, 0.05136952])
+        coefficients = find_coefficients_Jakob2019(XYZ)
+
+        XYZ = np.tile(XYZ, (6, 1))
+        coefficients = np.tile(coefficients, (6, 1))
+        np.testing.assert_almost_equal(
+            find_coefficients_Jakob2019(XYZ), coefficients, decimal=7)
+
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        coefficients = np.reshape(coefficients, (2, 3, 3))
+        np.testing.assert_almost_equal(
+            find_coefficients_Jakob2019(XYZ), coefficients, decimal=7)
+
+
+class TestXYZ_to_spectral_Jakob2019(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.jakob2019.XYZ_to_spectral_Jakob2019`
+    definition unit tests methods.
+    """
+
+    def test_XYZ_to_spectral_Jakob2019(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.XYZ_to_spectral_Jakob2019`
+        definition.
+        """
+
+        shape = SpectralShape(CMFS.shape.start, CMFS.shape.end, 5)
+        cmfs = CMFS.copy().align(shape)
+        illuminant = ILLUMINANT.copy().align(shape)
+
+        for XYZ in (np.array([0.20654008, 0.12197225, 0.05136952]),
+                    np.array([0.14222010, 0.23042768, 0.10495772]),
+                    np.array([0.07818780, 0.06157201, 0.28099326])):
+            np.testing.assert_almost_equal(
+                spectral_to_XYZ_integration(
+                    XYZ_to_spectral_Jakob2019(XYZ), cmfs, illuminant) / 100,
+                XYZ,
+                decimal=4)
+
+
+class TestLUT3D_Jakob2019(unittest.TestCase):
+    """
+    Defines :class:`colour.recovery.jakob2019.LUT3D_Jakob2019` definition
+    unit tests methods.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Generates the common coefficients table.
+        """
+
+        cls._LUT = LUT3D_Jakob2019()
+        cls._LUT.generate(sRGB_COLOURSPACE, size=5, processes=1)
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('size', 'scale', 'coefficients', 'shape')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(LUT3D_Jakob2019))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('generate', 'RGB_to_coefficients',
+                            'RGB_to_spectral', 'read', 'write')
+
+        for method in required_methods:
+            self.assertIn(method, dir(LUT3D_Jakob2019))
+
+    def test_generate(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.LUT3D_Jakob2019.generate`
+        method.
+        """
+
+        self.assertEqual(self._LUT.size, 5)
+        self.assertTupleEqual(self._LUT.coefficients.shape, (3, 5, 5, 5, 3))
+        np.testing.assert_almost_equal(self._LUT.scale[[0, -1]],
+                                       np.array([0, 1]))
+
+    def test_RGB_to_spectral(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.LUT3D_Jakob2019.RGB_to_spectral`
+        method.
+        """
+
+        shape = SpectralShape(CMFS.shape.start, CMFS.shape.end, 5)
+        _wavelengths_n, M, XYZ_n = _spectral_integration_data(
+            CMFS, ILLUMINANT, shape)
+        xy_n = XYZ_to_xy(XYZ_n)
+
+        # The table nodes are reproduced exactly, everything else is
+        # interpolated.
+        RGB = np.array([[0.0, 0.0, 0.0], [1.0, 1.0, 1.0], [0.5, 0.5, 0.5],
+                        [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        XYZ = np.dot(self._LUT.RGB_to_spectral(RGB, shape), M)
+
+        np.testing.assert_allclose(
+            XYZ_to_Lab(XYZ, xy_n),
+            XYZ_to_Lab(
+                sRGB_COLOURSPACE.RGB_to_XYZ_matrix.dot(RGB.T).T, xy_n),
+            atol=0.05)
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (2, 3, 3))
+        self.assertTupleEqual(
+            self._LUT.RGB_to_spectral(RGB, shape).shape, (2, 3, 95))
+
+    def test_read_write(self):
+        """
+        Tests :func:`colour.recovery.jakob2019.LUT3D_Jakob2019.read` and
+        :func:`colour.recovery.jakob2019.LUT3D_Jakob2019.write` methods.
+        """
+
+        path = os.path.join(self._temporary_directory, 'sRGB.npz')
+        self.assertTrue(self._LUT.write(path))
+
+        LUT = LUT3D_Jakob2019()
+        self.assertTrue(LUT.read(path))
+
+        np.testing.assert_array_equal(LUT.coefficients,
+                                      self._LUT.coefficients)
+        self.assertEqual(LUT.shape, self._LUT.shape)
+
+        RGB = np.random.RandomState(4).uniform(0, 1, (16, 3))
+        np.testing.assert_array_equal(
+            LUT.RGB_to_coefficients(RGB),
+            self._LUT.RGB_to_coefficients(RGB))
+
+
+if __name__ == '__main__':
+    unittest.main()
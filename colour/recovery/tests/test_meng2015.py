@@ -10,7 +10,8 @@ import unittest
 
 from colour.colorimetry import (STANDARD_OBSERVERS_CMFS, SpectralShape,
                                 spectral_to_XYZ_integration)
-from colour.recovery import XYZ_to_spectral_Meng2015
+from colour.recovery import (XYZ_to_spectral_Meng2015,
+                             XYZ_to_spectral_batch_Meng2015)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -19,7 +20,9 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestXYZ_to_spectral_Meng2015']
+__all__ = [
+    'TestXYZ_to_spectral_Meng2015', 'TestXYZ_to_spectral_batch_Meng2015'
+]
 
 
 class TestXYZ_to_spectral_Meng2015(unittest.TestCase):
@@ -70,5 +73,105 @@ class TestXYZ_to_spectral_Meng2015(unittest.TestCase):
             decimal=7)
 
 
+class TestXYZ_to_spectral_batch_Meng2015(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.meng2015.XYZ_to_spectral_batch_Meng2015`
+    definition unit tests methods.
+    """
+
+    def test_XYZ_to_spectral_batch_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_batch_Meng2015`
+        definition.
+        """
+
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, 10)
+        cmfs_c = cmfs.copy().align(shape)
+
+        XYZ = np.array([
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.47097710, 0.34950000, 0.11301649],
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.11809043, 0.10300000, 0.03547624],
+        ])
+        values = XYZ_to_spectral_batch_Meng2015(
+            XYZ, interval=10, chunk_size=2, processes=1)
+
+        self.assertTupleEqual(values.shape, (4, 48))
+        np.testing.assert_array_equal(values[0], values[2])
+
+        for i in range(XYZ.shape[0]):
+            np.testing.assert_almost_equal(
+                np.dot(values[i], cmfs_c.values) / np.sum(
+                    cmfs_c.values[..., 1]),
+                XYZ[i],
+                decimal=7)
+
+            np.testing.assert_allclose(
+                values[i],
+                XYZ_to_spectral_Meng2015(XYZ[i], interval=10).values,
+                rtol=0.01,
+                atol=0.01)
+
+    def test_n_dimensional_XYZ_to_spectral_batch_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_batch_Meng2015`
+        definition n-dimensional arrays support.
+        """
+
+        XYZ = np.array([0.07049534, 0.10080000, 0.09558313])
+        values = XYZ_to_spectral_batch_Meng2015(XYZ, interval=10, processes=1)
+        self.assertTupleEqual(values.shape, (48, ))
+
+        XYZ = np.tile(XYZ, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_batch_Meng2015(XYZ, interval=10, processes=1),
+            values,
+            decimal=7)
+
+        XYZ = np.reshape(XYZ, (2, 3, 3))
+        values = np.reshape(values, (2, 3, 48))
+        np.testing.assert_almost_equal(
+            XYZ_to_spectral_batch_Meng2015(XYZ, interval=10, processes=1),
+            values,
+            decimal=7)
+
+    def test_cache_XYZ_to_spectral_batch_Meng2015(self):
+        """
+        Tests :func:`colour.recovery.meng2015.XYZ_to_spectral_batch_Meng2015`
+        definition cache and additional data support.
+        """
+
+        XYZ = np.array([
+            [0.07049534, 0.10080000, 0.09558313],
+            [0.11809043, 0.10300000, 0.03547624],
+        ])
+
+        cache = {}
+        values, statistics = XYZ_to_spectral_batch_Meng2015(
+            XYZ,
+            interval=10,
+            processes=1,
+            cache=cache,
+            additional_data=True)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(len(statistics), 1)
+        self.assertEqual(statistics[0].colours, 2)
+        self.assertEqual(statistics[0].converged, 2)
+
+        values_c, statistics = XYZ_to_spectral_batch_Meng2015(
+            XYZ,
+            interval=10,
+            processes=1,
+            cache=cache,
+            additional_data=True)
+
+        np.testing.assert_array_equal(values_c, values)
+        self.assertListEqual(statistics, [])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -7,8 +7,11 @@ from __future__ import division, unicode_literals
 
 import numpy as np
 import unittest
+from itertools import permutations
 
-from colour.recovery import RGB_to_spectral_Smits1999
+from colour.recovery import (RGB_to_spectral_values_Smits1999,
+                             RGB_to_spectral_Smits1999)
+from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -17,7 +20,145 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestRGB_to_spectral_Smits1999']
+__all__ = [
+    'TestRGB_to_spectral_values_Smits1999', 'TestRGB_to_spectral_Smits1999'
+]
+
+
+class TestRGB_to_spectral_values_Smits1999(unittest.TestCase):
+    """
+    Defines :func:`colour.recovery.smits1999.\
+RGB_to_spectral_values_Smits1999` definition unit tests methods.
+    """
+
+    def test_RGB_to_spectral_values_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_values_Smits1999` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(
+                np.array([0.45293517, 0.31732158, 0.26414773])),
+            np.array([
+                0.27787714, 0.27113183, 0.26990663, 0.29932875, 0.31711026,
+                0.31726875, 0.43019862, 0.45275442, 0.45328084, 0.45410503
+            ]),
+            decimal=7)
+
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(
+                np.array([0.35505307, 0.47995567, 0.61088035])),
+            np.array([
+                0.60725817, 0.60371094, 0.59674004, 0.52330084, 0.47975906,
+                0.47997209, 0.37462711, 0.35988419, 0.36137673, 0.36154693
+            ]),
+            decimal=7)
+
+        RGB = np.array([
+            [0.96702984, 0.54723225, 0.97268436],
+            [0.71481599, 0.69772882, 0.21608950],
+            [0.97627445, 0.00623026, 0.25298236],
+            [0.43479153, 0.77938292, 0.19768507],
+            [0.50000000, 0.50000000, 0.50000000],
+            [0.20000000, 0.20000000, 0.50000000],
+            [0.50000000, 0.20000000, 0.20000000],
+            [0.20000000, 0.50000000, 0.20000000],
+            [0.50000000, 0.50000000, 0.20000000],
+            [0.50000000, 0.20000000, 0.50000000],
+            [0.20000000, 0.50000000, 0.50000000],
+        ])
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(RGB),
+            np.array([
+                [
+                    0.97268436, 0.97268436, 0.95879306, 0.64230107,
+                    0.54679446, 0.56634953, 0.89856255, 0.96723849,
+                    0.96730295, 0.96558913
+                ],
+                [
+                    0.21786688, 0.21696948, 0.26847025, 0.53627655,
+                    0.69755595, 0.69768561, 0.71176124, 0.69513072,
+                    0.69989895, 0.70736436
+                ],
+                [
+                    0.32617952, 0.29023191, 0.24520905, 0.06122694,
+                    0.00622527, 0.01753026, 0.81487776, 0.98705151,
+                    0.98705151, 0.98603982
+                ],
+                [
+                    0.19770879, 0.19768507, 0.23286983, 0.62874839,
+                    0.77922477, 0.75928817, 0.49393195, 0.42497533,
+                    0.42732268, 0.43185931
+                ],
+                [
+                    0.50000000, 0.50000000, 0.49995000, 0.49965000,
+                    0.49960000, 0.49990000, 0.50000000, 0.50000000,
+                    0.50000000, 0.50000000
+                ],
+                [
+                    0.50000000, 0.50000000, 0.46746000, 0.29955000,
+                    0.19984000, 0.19996000, 0.20009000, 0.21107000,
+                    0.21449000, 0.21488000
+                ],
+                [
+                    0.23036000, 0.21545000, 0.19998000, 0.19986000,
+                    0.19984000, 0.19996000, 0.44975000, 0.50447000,
+                    0.50447000, 0.50447000
+                ],
+                [
+                    0.20000000, 0.20000000, 0.20817000, 0.43797000,
+                    0.49984000, 0.48250000, 0.25157000, 0.20000000,
+                    0.20000000, 0.20075000
+                ],
+                [
+                    0.20003000, 0.20000000, 0.23262000, 0.39939000,
+                    0.49984000, 0.49996000, 0.49988000, 0.48758000,
+                    0.49055000, 0.49520000
+                ],
+                [
+                    0.50000000, 0.50000000, 0.49053000, 0.26673000,
+                    0.19984000, 0.21370000, 0.45107000, 0.50000000,
+                    0.50000000, 0.49877000
+                ],
+                [
+                    0.49130000, 0.48278000, 0.50019000, 0.50007000,
+                    0.50005000, 0.50017000, 0.24692000, 0.20000000,
+                    0.20000000, 0.20000000
+                ],
+            ]),
+            decimal=7)
+
+    def test_n_dimensional_RGB_to_spectral_values_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_values_Smits1999` definition n-dimensional arrays support.
+        """
+
+        RGB = np.array([0.45293517, 0.31732158, 0.26414773])
+        values = RGB_to_spectral_values_Smits1999(RGB)
+
+        RGB = np.tile(RGB, (6, 1))
+        values = np.tile(values, (6, 1))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(RGB), values, decimal=7)
+
+        RGB = np.reshape(RGB, (2, 3, 3))
+        values = np.reshape(values, (2, 3, 10))
+        np.testing.assert_almost_equal(
+            RGB_to_spectral_values_Smits1999(RGB), values, decimal=7)
+
+    @ignore_numpy_errors
+    def test_nan_RGB_to_spectral_values_Smits1999(self):
+        """
+        Tests :func:`colour.recovery.smits1999.\
+RGB_to_spectral_values_Smits1999` definition nan support.
+        """
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = set(permutations(cases * 3, r=3))
+        for case in cases:
+            RGB_to_spectral_values_Smits1999(np.array(case))
 
 
 class TestRGB_to_spectral_Smits1999(unittest.TestCase):
@@ -7,10 +7,13 @@ from .common import (handle_numpy_errors, ignore_numpy_errors,
                      ignore_python_warnings, batch, is_openimageio_installed,
                      is_pandas_installed, is_iterable, is_string, is_numeric,
                      is_integer, filter_kwargs, first_item)
-from .array import (as_numeric, as_namedtuple, closest_indexes, closest,
-                    normalise_maximum, interval, is_uniform, in_array, tstack,
-                    tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
-                    centroid, linear_conversion, fill_nan, ndarray_write)
+from .array import (
+    FLOATING_POINT_PRECISIONS, get_float_precision, set_float_precision,
+    float_precision, as_float_array, as_numeric, as_namedtuple,
+    closest_indexes, closest, normalise_maximum, interval, is_uniform,
+    in_array, tstack, tsplit, row_as_diagonal, dot_vector, dot_matrix, orient,
+    centroid, linear_conversion, fill_nan, ndarray_write, TILE_SIZE,
+    apply_tiled)
 from .data_structures import Lookup, Structure, CaseInsensitiveMapping
 from .verbose import (ColourWarning, message_box, warning, filter_warnings,
                       suppress_warnings, numpy_print_options)
@@ -22,10 +25,12 @@ __all__ = [
     'is_string', 'is_numeric', 'is_integer', 'filter_kwargs', 'first_item'
 ]
 __all__ += [
-    'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'FLOATING_POINT_PRECISIONS', 'get_float_precision', 'set_float_precision',
+    'float_precision', 'as_float_array', 'as_numeric', 'as_namedtuple',
+    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
+    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
+    'dot_vector', 'dot_matrix', 'orient', 'centroid', 'linear_conversion',
+    'fill_nan', 'ndarray_write', 'TILE_SIZE', 'apply_tiled'
 ]
 __all__ += ['Lookup', 'Structure', 'CaseInsensitiveMapping']
 __all__ += [
@@ -19,11 +19,15 @@ numpy-fastest-way-of-computing-diagonal-for-each-row-of-a-2d-array/\
 
 from __future__ import division, unicode_literals
 
+import multiprocessing
 import numpy as np
 from collections import Mapping
 from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 
 from colour.constants import DEFAULT_FLOAT_DTYPE, EPSILON
+from colour.utilities.common import is_string
+from colour.utilities.data_structures import CaseInsensitiveMapping
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -33,14 +37,194 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'as_numeric', 'as_namedtuple', 'closest_indexes', 'closest',
-    'normalise_maximum', 'interval', 'is_uniform', 'in_array', 'tstack',
-    'tsplit', 'row_as_diagonal', 'dot_vector', 'dot_matrix', 'orient',
-    'centroid', 'linear_conversion', 'fill_nan', 'ndarray_write'
+    'FLOATING_POINT_PRECISIONS', 'get_float_precision', 'set_float_precision',
+    'float_precision', 'as_float_array', 'as_numeric', 'as_namedtuple',
+    'closest_indexes', 'closest', 'normalise_maximum', 'interval',
+    'is_uniform', 'in_array', 'tstack', 'tsplit', 'row_as_diagonal',
+    'dot_vector', 'dot_matrix', 'orient', 'centroid', 'linear_conversion',
+    'fill_nan', 'ndarray_write', 'TILE_SIZE', 'apply_tiled'
 ]
 
 
-def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
+FLOATING_POINT_PRECISIONS = CaseInsensitiveMapping({
+    'float16': np.float16,
+    'float32': np.float32,
+    'float64': np.float64
+})
+FLOATING_POINT_PRECISIONS.__doc__ = """
+Supported floating point precisions.
+
+FLOATING_POINT_PRECISIONS : CaseInsensitiveMapping
+    **{'float16', 'float32', 'float64'}**
+"""
+
+_FLOAT_PRECISION = DEFAULT_FLOAT_DTYPE
+"""
+Current floating point precision, i.e. the data type the computations are
+performed in.
+
+_FLOAT_PRECISION : type
+"""
+
+TILE_SIZE = 2 ** 16
+"""
+Default count of pixels processed per tile by
+:func:`colour.utilities.apply_tiled` definition, small enough for the
+intermediate arrays of most per-pixel functions to remain in the processor
+cache.
+
+TILE_SIZE : integer
+"""
+
+
+def get_float_precision():
+    """
+    Returns the current floating point precision, i.e. the data type the
+    computations are performed in.
+
+    Returns
+    -------
+    type
+        Current floating point precision.
+
+    Examples
+    --------
+    >>> get_float_precision()
+    <class 'numpy.float64'>
+    """
+
+    return _FLOAT_PRECISION
+
+
+def set_float_precision(precision=DEFAULT_FLOAT_DTYPE):
+    """
+    Sets the current floating point precision, i.e. the data type the
+    computations are performed in.
+
+    The :mod:`colour.models` and colour component transfer functions convert
+    their input to the current floating point precision and return arrays of
+    that precision. Single and half precisions halve and quarter the memory
+    used by large images at the expense of accuracy.
+
+    Parameters
+    ----------
+    precision : unicode or type, optional
+        **{'float64', 'float32', 'float16'}**,
+        Floating point precision.
+
+    Returns
+    -------
+    bool
+        Definition success.
+
+    Raises
+    ------
+    ValueError
+        If the floating point precision is not supported.
+
+    Examples
+    --------
+    >>> from colour.models import oetf_sRGB
+    >>> set_float_precision('float32')
+    True
+    >>> oetf_sRGB(np.array([0.18, 0.5])).dtype
+    dtype('float32')
+    >>> set_float_precision()
+    True
+    """
+
+    global _FLOAT_PRECISION
+
+    dtype = (FLOATING_POINT_PRECISIONS.get(precision)
+             if is_string(precision) else np.dtype(precision).type)
+
+    if dtype not in FLOATING_POINT_PRECISIONS.values():
+        raise ValueError(
+            '"{0}" floating point precision is not supported, it must be one '
+            'of {1}!'.format(precision, sorted(
+                FLOATING_POINT_PRECISIONS.keys())))
+
+    _FLOAT_PRECISION = dtype
+
+    return True
+
+
+@contextmanager
+def float_precision(precision):
+    """
+    A context manager setting the current floating point precision.
+
+    Parameters
+    ----------
+    precision : unicode or type
+        **{'float64', 'float32', 'float16'}**,
+        Floating point precision.
+
+    Examples
+    --------
+    >>> from colour.models import oetf_sRGB
+    >>> with float_precision('float16'):
+    ...     oetf_sRGB(np.array([0.18, 0.5]))
+    array([ 0.4612,  0.735 ], dtype=float16)
+    """
+
+    previous_precision = get_float_precision()
+    set_float_precision(precision)
+    try:
+        yield
+    finally:
+        set_float_precision(previous_precision)
+
+
+def as_float_array(a, dtype=None):
+    """
+    Converts given :math:`a` variable to *ndarray* using given floating point
+    data type, the conversion is avoided if :math:`a` already has the
+    required data type.
+
+    Parameters
+    ----------
+    a : object
+        Variable to convert.
+    dtype : type, optional
+        Floating point data type to use for conversion, defaults to the
+        current floating point precision.
+
+    Returns
+    -------
+    ndarray
+        :math:`a` variable converted to *ndarray*.
+
+    Examples
+    --------
+    >>> as_float_array([1, 2, 3])
+    array([ 1.,  2.,  3.])
+    >>> as_float_array([1, 2, 3], np.float16).dtype
+    dtype('float16')
+    """
+
+    if dtype is None:
+        dtype = get_float_precision()
+
+    return np.asarray(a, dtype)
+
+
+def _as_precision_array(a):
+    """
+    Converts given :math:`a` variable to *ndarray*, floating point arrays are
+    converted to the current floating point precision while other arrays,
+    e.g. integer arrays, are kept as is.
+    """
+
+    a = np.asarray(a)
+
+    if a.dtype.kind == 'f':
+        a = a.astype(get_float_precision(), copy=False)
+
+    return a
+
+
+def as_numeric(a, type_=None):
     """
     Converts given :math:`a` variable to *numeric*. In the event where
     :math:`a` cannot be converted, it is passed as is.
@@ -49,8 +233,9 @@ def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
     ----------
     a : object
         Variable to convert.
-    type_ : object
-        Type to use for conversion.
+    type_ : object, optional
+        Type to use for conversion, defaults to the current floating point
+        precision.
 
     Returns
     -------
@@ -65,6 +250,9 @@ def as_numeric(a, type_=DEFAULT_FLOAT_DTYPE):
     array([ 0.,  1.,  2.,  3.,  4.,  5.,  6.,  7.,  8.,  9.])
     """
 
+    if type_ is None:
+        type_ = get_float_precision()
+
     try:
         return type_(a)
     except TypeError:
@@ -339,7 +527,7 @@ def in_array(a, b, tolerance=EPSILON):
     return np.any(d <= tolerance, axis=0).reshape(a.shape)
 
 
-def tstack(a):
+def tstack(a, out=None):
     """
     Stacks arrays in sequence along the last axis (tail).
 
@@ -349,11 +537,24 @@ def tstack(a):
     ----------
     a : array_like
         Array to perform the stacking.
+    out : ndarray, optional
+        Array the stacked arrays are written to, it must have the shape of the
+        stacked arrays with an additional last dimension. It can be one of
+        the arrays being stacked to perform the stacking in-place.
 
     Returns
     -------
     ndarray
 
+    Notes
+    -----
+    -   Floating point arrays are converted to the current floating point
+        precision, see :func:`colour.utilities.set_float_precision`
+        definition.
+    -   The stacked array is allocated once and the arrays are written into
+        it, if ``out`` is given, no allocation is performed at all unless an
+        array to stack shares memory with it.
+
     Examples
     --------
     >>> a = 0
@@ -383,14 +584,38 @@ def tstack(a):
              [3, 3, 3],
              [4, 4, 4],
              [5, 5, 5]]]])
+    >>> a = np.arange(0, 6)
+    >>> b = np.zeros((6, 3), dtype=np.int_)
+    >>> tstack((a, a, a), out=b) is b
+    True
     """
 
-    a = np.asarray(a)
+    a = [np.asarray(x) for x in a]
+
+    if out is None:
+        dtype = np.result_type(*a)
+        if dtype.kind == 'f':
+            dtype = get_float_precision()
 
-    return np.concatenate([x[..., np.newaxis] for x in a], axis=-1)
+        # :class:`numpy.broadcast` accepts at most 32 arrays, the broadcast
+        # shape is thus accumulated over batches of arrays.
+        shape = ()
+        for i in range(0, len(a), 31):
+            shape = np.broadcast(np.broadcast_to(False, shape),
+                                 *a[i:i + 31]).shape
+
+        out = np.empty(shape + (len(a), ), dtype)
+    else:
+        # Copying the arrays that would be overwritten before being read.
+        a = [np.copy(x) if np.may_share_memory(x, out) else x for x in a]
+
+    for i, x in enumerate(a):
+        out[..., i] = x
+
+    return out
 
 
-def tsplit(a):
+def tsplit(a, copy=True):
     """
     Splits arrays in sequence along the last axis (tail).
 
@@ -398,11 +623,20 @@ def tsplit(a):
     ----------
     a : array_like
         Array to perform the splitting.
+    copy : bool, optional
+        Whether to return a copy of the array or a view on it, the view avoids
+        allocating memory but writing to it modifies the array.
 
     Returns
     -------
     ndarray
 
+    Notes
+    -----
+    -   Floating point arrays are converted to the current floating point
+        precision, see :func:`colour.utilities.set_float_precision`
+        definition.
+
     Examples
     --------
     >>> a = np.array([0, 0, 0])
@@ -434,11 +668,16 @@ def tsplit(a):
            [[0, 1, 2, 3, 4, 5]],
     <BLANKLINE>
            [[0, 1, 2, 3, 4, 5]]])
+    >>> a = np.array([[0, 0, 0], [1, 1, 1]])
+    >>> np.may_share_memory(tsplit(a, copy=False), a)
+    True
     """
 
-    a = np.asarray(a)
+    a = _as_precision_array(a)
+
+    a = np.rollaxis(a, -1)
 
-    return np.array([a[..., x] for x in range(a.shape[-1])])
+    return a.copy() if copy else a
 
 
 def row_as_diagonal(a):
@@ -494,7 +733,7 @@ def row_as_diagonal(a):
     return np.eye(a.shape[-1]) * a
 
 
-def dot_vector(m, v):
+def dot_vector(m, v, out=None):
     """
     Convenient wrapper around :func:`np.einsum` with the following subscripts:
     *'...ij,...j->...i'*.
@@ -508,6 +747,10 @@ def dot_vector(m, v):
         Array of 3x3 matrices.
     v : array_like
         Array of vectors.
+    out : ndarray, optional
+        Array the dot product is written to, it must have the shape of the
+        dot product. It can be the array of vectors to perform the dot product
+        in-place at the expense of a copy of the array of vectors.
 
     Returns
     -------
@@ -532,7 +775,18 @@ def dot_vector(m, v):
            [ 0.0794399...,  0.1220905...,  0.0955788...]])
     """
 
-    return np.einsum('...ij,...j->...i', m, v)
+    m = _as_precision_array(m)
+    v = _as_precision_array(v)
+
+    if out is None:
+        return np.einsum('...ij,...j->...i', m, v)
+
+    # :func:`np.einsum` definition does not support overlapping operands.
+    if np.may_share_memory(v, out):
+        v = np.copy(v)
+
+    return np.einsum(
+        '...ij,...j->...i', m, v, out=out, casting='same_kind')
 
 
 def dot_matrix(a, b):
@@ -590,6 +844,9 @@ def dot_matrix(a, b):
             [-0.0044203...,  0.0377490...,  0.9666713...]]])
     """
 
+    a = _as_precision_array(a)
+    b = _as_precision_array(b)
+
     return np.einsum('...ij,...jk->...ik', a, b)
 
 
@@ -797,3 +1054,117 @@ def ndarray_write(a):
     yield a
 
     a.setflags(write=False)
+
+
+def apply_tiled(function, a, out=None, tile_size=TILE_SIZE, workers=None,
+                **kwargs):
+    """
+    Applies given per-pixel function to given array by splitting it into tiles
+    processed concurrently by a pool of threads.
+
+    The array is processed as a sequence of pixels along its last dimension,
+    each tile holding ``tile_size`` pixels so that the function intermediate
+    arrays remain small and in the processor cache. As *Numpy* releases the
+    *Global Interpreter Lock* in its computations, the tiles are processed in
+    parallel.
+
+    Parameters
+    ----------
+    function : callable
+        Per-pixel function to apply, it must be vectorised and return an array
+        whose leading dimension is the count of pixels of its input, e.g.
+        :func:`colour.XYZ_to_Lab` or :func:`colour.delta_E` definitions.
+    a : array_like or tuple
+        Array of shape (..., C) to apply the function to or tuple of arrays
+        with the same leading dimensions for functions taking multiple
+        per-pixel arguments, e.g. :func:`colour.delta_E` definition.
+    out : ndarray, optional
+        Contiguous array, e.g. a :class:`numpy.memmap` class instance, the
+        function output is written to. It must have the shape of the function
+        output.
+    tile_size : integer, optional
+        Count of pixels per tile.
+    workers : integer, optional
+        Threads count, default to :func:`multiprocessing.cpu_count`
+        definition.
+
+    Other Parameters
+    ----------------
+    \**kwargs : dict, optional
+        Keywords arguments passed to the function.
+
+    Returns
+    -------
+    ndarray
+        Function output.
+
+    Raises
+    ------
+    ValueError
+        If the output array is not contiguous.
+
+    Notes
+    -----
+    -   The function must be thread-safe and must only depend on the pixels of
+        each tile, i.e. it cannot use neighbourhood or image statistics.
+
+    Examples
+    --------
+    >>> from colour.models import XYZ_to_Lab
+    >>> XYZ = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (4, 1))
+    >>> apply_tiled(XYZ_to_Lab, XYZ, tile_size=3)  # doctest: +ELLIPSIS
+    array([[ 37.9856291..., -23.6290768...,  -4.4174661...],
+           [ 37.9856291..., -23.6290768...,  -4.4174661...],
+           [ 37.9856291..., -23.6290768...,  -4.4174661...],
+           [ 37.9856291..., -23.6290768...,  -4.4174661...]])
+    """
+
+    arrays = [np.asarray(x) for x in (a if isinstance(a, tuple) else (a, ))]
+
+    shape = arrays[0].shape[:-1]
+    count = int(np.prod(shape))
+    arrays = [np.reshape(x, (count, x.shape[-1])) for x in arrays]
+    tile_size = max(int(tile_size), 1)
+
+    def process(start):
+        """
+        Applies the function to the tile starting at given pixel.
+        """
+
+        return function(*[x[start:start + tile_size] for x in arrays],
+                        **kwargs)
+
+    # The first tile defines the output shape and type.
+    tile = np.asarray(process(0))
+    tile_shape = tile.shape[1:]
+
+    if out is None:
+        out = np.empty(shape + tile_shape, tile.dtype)
+    elif not out.flags.c_contiguous:
+        raise ValueError('"out" array must be contiguous!')
+
+    output = np.reshape(out, (count, ) + tile_shape)
+
+    def write(start):
+        """
+        Writes the function output for the tile starting at given pixel.
+        """
+
+        output[start:start + tile_size] = process(start)
+
+    output[0:tile_size] = tile
+
+    starts = range(tile_size, count, tile_size)
+    workers = workers if workers else multiprocessing.cpu_count()
+    if workers == 1 or len(starts) <= 1:
+        for start in starts:
+            write(start)
+    else:
+        pool = ThreadPool(processes=workers)
+        try:
+            pool.map(write, starts)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    return out
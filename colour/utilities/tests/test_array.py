@@ -6,15 +6,19 @@ Defines unit tests for :mod:`colour.utilities.array` module.
 from __future__ import division, unicode_literals
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 from collections import namedtuple
 
 from colour.constants import DEFAULT_FLOAT_DTYPE
-from colour.utilities import (as_numeric, as_namedtuple, closest_indexes,
-                              closest, normalise_maximum, interval, is_uniform,
-                              in_array, tstack, tsplit, row_as_diagonal,
-                              dot_vector, dot_matrix, orient, centroid,
-                              linear_conversion, fill_nan, ndarray_write)
+from colour.utilities import (
+    get_float_precision, set_float_precision, float_precision, as_float_array,
+    as_numeric, as_namedtuple, closest_indexes, closest, normalise_maximum,
+    interval, is_uniform, in_array, tstack, tsplit, row_as_diagonal,
+    dot_vector, dot_matrix, orient, centroid, linear_conversion, fill_nan,
+    ndarray_write, apply_tiled)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -24,14 +28,126 @@ __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
 __all__ = [
-    'TestAsNumeric', 'TestAsNametuple', 'TestClosestIndexes', 'TestClosest',
-    'TestNormaliseMaximum', 'TestInterval', 'TestIsUniform', 'TestInArray',
-    'TestTstack', 'TestTsplit', 'TestRowAsDiagonal', 'TestDotVector',
-    'TestDotMatrix', 'TestOrient', 'TestCentroid', 'TestLinearConversion',
-    'TestFillNan', 'TestNdarrayWrite'
+    'TestGetFloatPrecision', 'TestSetFloatPrecision', 'TestFloatPrecision',
+    'TestAsFloatArray', 'TestAsNumeric', 'TestAsNametuple',
+    'TestClosestIndexes', 'TestClosest', 'TestNormaliseMaximum',
+    'TestInterval', 'TestIsUniform', 'TestInArray', 'TestTstack', 'TestTsplit',
+    'TestRowAsDiagonal', 'TestDotVector', 'TestDotMatrix', 'TestOrient',
+    'TestCentroid', 'TestLinearConversion', 'TestFillNan', 'TestNdarrayWrite',
+    'TestApplyTiled'
 ]
 
 
+class TestGetFloatPrecision(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.get_float_precision` definition unit
+    tests methods.
+    """
+
+    def test_get_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.get_float_precision` definition.
+        """
+
+        self.assertEqual(get_float_precision(), DEFAULT_FLOAT_DTYPE)
+
+
+class TestSetFloatPrecision(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.set_float_precision` definition unit
+    tests methods.
+    """
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        set_float_precision()
+
+    def test_set_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.set_float_precision` definition.
+        """
+
+        self.assertTrue(set_float_precision('float32'))
+        self.assertEqual(get_float_precision(), np.float32)
+
+        set_float_precision('Float16')
+        self.assertEqual(get_float_precision(), np.float16)
+
+        set_float_precision(np.float32)
+        self.assertEqual(get_float_precision(), np.float32)
+
+        set_float_precision()
+        self.assertEqual(get_float_precision(), DEFAULT_FLOAT_DTYPE)
+
+    def test_raise_exception_set_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.set_float_precision` definition
+        raised exception.
+        """
+
+        self.assertRaises(ValueError, set_float_precision, np.int32)
+
+        self.assertRaises(ValueError, set_float_precision, 'Undefined')
+
+
+class TestFloatPrecision(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.float_precision` definition unit
+    tests methods.
+    """
+
+    def test_float_precision(self):
+        """
+        Tests :func:`colour.utilities.array.float_precision` definition.
+        """
+
+        with float_precision('float32'):
+            self.assertEqual(get_float_precision(), np.float32)
+
+            with float_precision('float16'):
+                self.assertEqual(get_float_precision(), np.float16)
+
+            self.assertEqual(get_float_precision(), np.float32)
+
+        self.assertEqual(get_float_precision(), DEFAULT_FLOAT_DTYPE)
+
+        try:
+            with float_precision('float16'):
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+        self.assertEqual(get_float_precision(), DEFAULT_FLOAT_DTYPE)
+
+
+class TestAsFloatArray(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.as_float_array` definition unit
+    tests methods.
+    """
+
+    def test_as_float_array(self):
+        """
+        Tests :func:`colour.utilities.array.as_float_array` definition.
+        """
+
+        np.testing.assert_equal(as_float_array([1, 2, 3]), np.array([1, 2, 3]))
+
+        self.assertEqual(as_float_array([1, 2, 3]).dtype, DEFAULT_FLOAT_DTYPE)
+
+        self.assertEqual(
+            as_float_array([1, 2, 3], np.float16).dtype, np.float16)
+
+        a = np.array([1, 2, 3], dtype=DEFAULT_FLOAT_DTYPE)
+        self.assertIs(as_float_array(a), a)
+
+        with float_precision('float32'):
+            self.assertEqual(as_float_array([1, 2, 3]).dtype, np.float32)
+
+
 class TestAsNumeric(unittest.TestCase):
     """
     Defines :func:`colour.utilities.array.as_numeric` definition unit tests
@@ -54,6 +170,9 @@ class TestAsNumeric(unittest.TestCase):
 
         self.assertIsInstance(as_numeric(1, int), int)
 
+        with float_precision('float32'):
+            self.assertIsInstance(as_numeric(1), np.float32)
+
 
 class TestAsNametuple(unittest.TestCase):
     """
@@ -353,6 +472,44 @@ class TestTstack(unittest.TestCase):
                 [[3, 3, 3], [4, 4, 4], [5, 5, 5]],
             ]]))
 
+        a = [np.arange(0, 6) + i for i in range(40)]
+        np.testing.assert_almost_equal(
+            tstack(a), np.arange(0, 6)[:, np.newaxis] + np.arange(40))
+
+        a[-1] = np.tile(a[-1], (2, 1, 1))
+        self.assertEqual(tstack(a).shape, (2, 1, 6, 40))
+
+    def test_out_tstack(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition output array
+        support.
+        """
+
+        a = np.linspace(0, 1, 6)
+        b = np.zeros((6, 3))
+        self.assertIs(tstack((a, a * 2, a * 3), out=b), b)
+        np.testing.assert_almost_equal(b, tstack((a, a * 2, a * 3)))
+
+        a = np.reshape(np.linspace(0, 1, 18), (6, 3))
+        b = a[..., ::-1].copy()
+        c, d, e = tsplit(a, copy=False)
+        tstack((e, d, c), out=a)
+        np.testing.assert_almost_equal(a, b)
+
+    def test_float_precision_tstack(self):
+        """
+        Tests :func:`colour.utilities.array.tstack` definition floating point
+        precision handling.
+        """
+
+        a = np.linspace(0, 1, 6)
+        with float_precision('float32'):
+            self.assertEqual(tstack((a, a, a)).dtype, np.float32)
+
+        a = np.arange(0, 6)
+        with float_precision('float32'):
+            self.assertEqual(tstack((a, a, a)).dtype, a.dtype)
+
 
 class TestTsplit(unittest.TestCase):
     """
@@ -406,6 +563,33 @@ class TestTsplit(unittest.TestCase):
                 [[[0, 1, 2], [3, 4, 5]]],
             ]))
 
+    def test_copy_tsplit(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition copy
+        support.
+        """
+
+        a = np.reshape(np.linspace(0, 1, 6), (2, 3))
+        self.assertFalse(np.may_share_memory(tsplit(a), a))
+
+        b = tsplit(a, copy=False)
+        self.assertTrue(np.may_share_memory(b, a))
+        np.testing.assert_equal(b, tsplit(a))
+
+    def test_float_precision_tsplit(self):
+        """
+        Tests :func:`colour.utilities.array.tsplit` definition floating point
+        precision handling.
+        """
+
+        a = np.reshape(np.linspace(0, 1, 6), (2, 3))
+        with float_precision('float16'):
+            self.assertEqual(tsplit(a).dtype, np.float16)
+
+        a = np.reshape(np.arange(0, 6), (2, 3))
+        with float_precision('float16'):
+            self.assertEqual(tsplit(a).dtype, a.dtype)
+
 
 class TestRowAsDiagonal(unittest.TestCase):
     """
@@ -479,6 +663,31 @@ class TestDotVector(unittest.TestCase):
             ]),
             decimal=7)
 
+    def test_out_dot_vector(self):
+        """
+        Tests :func:`colour.utilities.array.dot_vector` definition output
+        array support.
+        """
+
+        m = np.array([
+            [0.7328, 0.4296, -0.1624],
+            [-0.7036, 1.6975, 0.0061],
+            [0.0030, 0.0136, 0.9834],
+        ])
+        v = np.tile(np.array([0.07049534, 0.10080000, 0.09558313]), (6, 1))
+        d = dot_vector(m, v)
+
+        out = np.zeros(v.shape)
+        self.assertIs(dot_vector(m, v, out), out)
+        np.testing.assert_almost_equal(out, d, decimal=7)
+
+        out = np.zeros(v.shape, dtype=np.float32)
+        dot_vector(m, v, out)
+        np.testing.assert_almost_equal(out, d, decimal=7)
+
+        dot_vector(m, v, v)
+        np.testing.assert_almost_equal(v, d, decimal=7)
+
 
 class TestDotMatrix(unittest.TestCase):
     """
@@ -683,5 +892,92 @@ class TestNdarrayWrite(unittest.TestCase):
             a += 1
 
 
+class TestApplyTiled(unittest.TestCase):
+    """
+    Defines :func:`colour.utilities.array.apply_tiled` definition unit tests
+    methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_apply_tiled(self):
+        """
+        Tests :func:`colour.utilities.array.apply_tiled` definition.
+        """
+
+        a = np.reshape(np.linspace(0, 1, 7 * 5 * 3), (7, 5, 3))
+        for tile_size in (1, 4, 6, 35, 64):
+            for workers in (1, 3):
+                np.testing.assert_equal(
+                    apply_tiled(
+                        np.sqrt, a, tile_size=tile_size, workers=workers),
+                    np.sqrt(a))
+
+                np.testing.assert_equal(
+                    apply_tiled(
+                        np.sum,
+                        a,
+                        tile_size=tile_size,
+                        workers=workers,
+                        axis=-1), np.sum(a, axis=-1))
+
+                np.testing.assert_equal(
+                    apply_tiled(
+                        np.add, (a, a[::-1]),
+                        tile_size=tile_size,
+                        workers=workers), a + a[::-1])
+
+        np.testing.assert_equal(
+            apply_tiled(np.sqrt, np.array([0.25, 0.5, 1.0])),
+            np.sqrt(np.array([0.25, 0.5, 1.0])))
+
+        np.testing.assert_equal(
+            apply_tiled(lambda x: x[..., 0:2], a, tile_size=4), a[..., 0:2])
+
+    def test_out_apply_tiled(self):
+        """
+        Tests :func:`colour.utilities.array.apply_tiled` definition output
+        array support.
+        """
+
+        a = np.reshape(np.linspace(0, 1, 7 * 5 * 3), (7, 5, 3))
+
+        out = np.zeros(a.shape)
+        self.assertIs(apply_tiled(np.sqrt, a, out, 4, 3), out)
+        np.testing.assert_equal(out, np.sqrt(a))
+
+        out = np.memmap(
+            os.path.join(self._temporary_directory, 'out.dat'),
+            dtype=np.float32,
+            mode='w+',
+            shape=a.shape)
+        apply_tiled(np.sqrt, a, out, 4, 3)
+        np.testing.assert_almost_equal(out, np.sqrt(a), decimal=7)
+        del out
+
+    def test_raise_exception_apply_tiled(self):
+        """
+        Tests :func:`colour.utilities.array.apply_tiled` definition raised
+        exception.
+        """
+
+        a = np.reshape(np.linspace(0, 1, 7 * 5 * 3), (7, 5, 3))
+
+        self.assertRaises(ValueError, apply_tiled, np.sqrt, a,
+                          np.zeros((5, 7, 3)).transpose(1, 0, 2))
+
+
 if __name__ == '__main__':
     unittest.main()
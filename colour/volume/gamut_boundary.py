@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+"""
+Gamut Boundary Descriptor
+=========================
+
+Defines objects related to gamut boundary description using the segment
+maxima method.
+
+-   :class:`colour.volume.GamutBoundaryDescriptor`
+-   :func:`colour.volume.gamut_boundary_descriptor_RGB_colourspace`
+
+References
+----------
+-   :cite:`Morovic2000a` : Morovic, J., & Luo, M. R. (2000). Calculating
+    medium and image gamut boundaries for gamut mapping. Color Research &
+    Application, 25(6), 394-401. doi:10.1002/1520-6378(200012)25:6<394::\
+AID-COL3>3.0.CO;2-Y
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+
+from colour.algebra import cartesian_to_polar
+from colour.colorimetry import ILLUMINANTS
+from colour.constants import DEFAULT_FLOAT_DTYPE
+from colour.models import RGB_to_XYZ, XYZ_to_Lab
+from colour.utilities import as_numeric, filter_kwargs, tsplit, tstack
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'GamutBoundaryDescriptor', 'gamut_boundary_descriptor_RGB_colourspace'
+]
+
+
+def _Jab_to_JCh(Jab):
+    """
+    Converts given colour model values to lightness, chroma and hue angle in
+    degrees.
+
+    Parameters
+    ----------
+    Jab : array_like
+        Colour model values, lightness first, followed by the two opponent
+        axes.
+
+    Returns
+    -------
+    tuple
+        Lightness, chroma and hue angle.
+    """
+
+    J, a, b = tsplit(Jab)
+
+    C, h = tsplit(cartesian_to_polar(tstack((a, b))))
+
+    return J, C, np.degrees(h) % 360
+
+
+class GamutBoundaryDescriptor(object):
+    """
+    Implements a *Gamut Boundary Descriptor* (GBD) using the segment maxima
+    method: the colour model is divided into segments along a polar grid of
+    lightness and hue angle and the maximum chroma of the gamut colours
+    falling in each segment is stored. The boundary chroma at any lightness
+    and hue angle is bilinearly interpolated from the segments maxima.
+
+    The colour model is expected to be an opponent colour model whose first
+    axis is the lightness, e.g. *CIE L\\*a\\*b\\**, *IPT* or a *CIECAM02*
+    :math:`Jab` colour model.
+
+    Attributes
+    ----------
+    segments
+    L
+    h
+    maxima
+
+    Methods
+    -------
+    generate
+    chroma
+    boundary
+    contains
+    read
+    write
+
+    References
+    ----------
+    -   :cite:`Morovic2000a`
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE
+    >>> GBD = gamut_boundary_descriptor_RGB_colourspace(sRGB_COLOURSPACE)
+    >>> GBD.segments
+    (128, 256)
+    >>> Lab = np.array([[50.0, 0.0, 0.0], [50.0, 80.0, 0.0]])
+    >>> GBD.contains(Lab)
+    array([ True, False], dtype=bool)
+    """
+
+    def __init__(self):
+        self._L = None
+        self._maxima = None
+
+    @property
+    def segments(self):
+        """
+        Getter property for the lightness and hue angle segments counts.
+
+        Returns
+        -------
+        tuple
+            Lightness and hue angle segments counts.
+        """
+
+        return None if self._maxima is None else self._maxima.shape
+
+    @property
+    def L(self):
+        """
+        Getter property for the lightness of the segments centres.
+
+        Returns
+        -------
+        ndarray
+            Segments centres lightness.
+        """
+
+        return self._L
+
+    @property
+    def h(self):
+        """
+        Getter property for the hue angle, in degrees, of the segments
+        centres.
+
+        Returns
+        -------
+        ndarray
+            Segments centres hue angle.
+        """
+
+        if self._maxima is None:
+            return None
+
+        return np.linspace(0, 360, self._maxima.shape[1], endpoint=False)
+
+    @property
+    def maxima(self):
+        """
+        Getter property for the segments maxima, i.e. the maximum chroma of
+        each lightness and hue angle segment.
+
+        Returns
+        -------
+        ndarray, (L, h)
+            Segments maxima.
+        """
+
+        return self._maxima
+
+    def generate(self, Jab, segments=(128, 256)):
+        """
+        Generates the segments maxima from given gamut colours.
+
+        The gamut colours should densely sample the gamut boundary, e.g. the
+        converted surface of an *RGB* colourspace cube or the subdivided
+        triangles of a mesh, the interior colours do not contribute to the
+        segments maxima. The segments not containing any colour are
+        interpolated from their neighbours.
+
+        Parameters
+        ----------
+        Jab : array_like
+            Gamut colours in the colour model.
+        segments : array_like, optional
+            Lightness and hue angle segments counts.
+
+        Returns
+        -------
+        bool
+            Definition success.
+
+        Examples
+        --------
+        >>> Lab = np.array(
+        ...     [[0.0, 0.0, 0.0],
+        ...      [50.0, 40.0, 0.0],
+        ...      [50.0, 0.0, 40.0],
+        ...      [50.0, -40.0, 0.0],
+        ...      [50.0, 0.0, -40.0],
+        ...      [100.0, 0.0, 0.0]])
+        >>> GBD = GamutBoundaryDescriptor()
+        >>> GBD.generate(Lab, (3, 4))
+        True
+        >>> GBD.maxima
+        array([[  0.,   0.,   0.,   0.],
+               [ 40.,  40.,  40.,  40.],
+               [  0.,   0.,   0.,   0.]])
+        """
+
+        L, C, h = (np.ravel(x) for x in _Jab_to_JCh(Jab))
+        L_s, h_s = (int(x) for x in segments)
+
+        assert L_s >= 2, 'At least 2 lightness segments are required!'
+
+        self._L = np.linspace(np.min(L), np.max(L), L_s)
+
+        i = np.rint((L - self._L[0]) / (self._L[-1] - self._L[0]) *
+                    (L_s - 1)).astype(np.int_)
+        j = np.rint(h / 360 * h_s).astype(np.int_) % h_s
+
+        indexes = i * h_s + j
+        order = np.argsort(indexes, kind='mergesort')
+        indexes = indexes[order]
+        starts = np.flatnonzero(np.hstack([True, np.diff(indexes) != 0]))
+
+        maxima = np.full(L_s * h_s, np.nan, dtype=DEFAULT_FLOAT_DTYPE)
+        maxima[indexes[starts]] = np.maximum.reduceat(C[order], starts)
+        maxima = np.reshape(maxima, (L_s, h_s))
+
+        # The empty segments are interpolated along the hue angle first, and
+        # then along the lightness for the lightness without any segment.
+        h_c = np.linspace(0, 360, h_s, endpoint=False)
+        for row in maxima:
+            defined = ~np.isnan(row)
+            if np.any(defined) and not np.all(defined):
+                row[~defined] = np.interp(
+                    h_c[~defined], h_c[defined], row[defined], period=360)
+
+        defined = ~np.isnan(maxima[..., 0])
+        if not np.all(defined):
+            for column in np.transpose(maxima):
+                column[~defined] = np.interp(self._L[~defined],
+                                             self._L[defined],
+                                             column[defined])
+
+        self._maxima = maxima
+
+        return True
+
+    def chroma(self, L, h):
+        """
+        Returns the gamut boundary chroma at given lightness and hue angle.
+
+        Parameters
+        ----------
+        L : array_like
+            Lightness.
+        h : array_like
+            Hue angle in degrees.
+
+        Returns
+        -------
+        ndarray
+            Gamut boundary chroma, zero outside the gamut lightness range.
+
+        Examples
+        --------
+        >>> from colour.models import sRGB_COLOURSPACE
+        >>> GBD = gamut_boundary_descriptor_RGB_colourspace(sRGB_COLOURSPACE)
+        >>> GBD.chroma(50, 30)  # doctest: +ELLIPSIS
+        88.8...
+        """
+
+        L = np.asarray(L, dtype=DEFAULT_FLOAT_DTYPE)
+        h = np.asarray(h, dtype=DEFAULT_FLOAT_DTYPE)
+
+        L_s, h_s = self._maxima.shape
+
+        i = (L - self._L[0]) / (self._L[-1] - self._L[0]) * (L_s - 1)
+        outside = np.logical_or(i < 0, i > L_s - 1)
+        i = np.clip(i, 0, L_s - 1)
+        i_0 = np.minimum(np.floor(i), L_s - 2).astype(np.int_)
+        t_i = i - i_0
+
+        j = (h % 360) / 360 * h_s
+        j_f = np.floor(j)
+        t_j = j - j_f
+        j_0 = j_f.astype(np.int_) % h_s
+        j_1 = (j_0 + 1) % h_s
+
+        C_0 = (1 - t_j) * self._maxima[i_0, j_0] + t_j * self._maxima[i_0, j_1]
+        C_1 = ((1 - t_j) * self._maxima[i_0 + 1, j_0] +
+               t_j * self._maxima[i_0 + 1, j_1])
+        C = (1 - t_i) * C_0 + t_i * C_1
+
+        return as_numeric(np.where(outside, 0, C))
+
+    def boundary(self, L, h):
+        """
+        Returns the gamut boundary colours at given lightness and hue angle.
+
+        Parameters
+        ----------
+        L : array_like
+            Lightness.
+        h : array_like
+            Hue angle in degrees.
+
+        Returns
+        -------
+        ndarray
+            Gamut boundary colours in the colour model.
+
+        Examples
+        --------
+        >>> from colour.models import sRGB_COLOURSPACE
+        >>> GBD = gamut_boundary_descriptor_RGB_colourspace(sRGB_COLOURSPACE)
+        >>> GBD.boundary(50, 30)  # doctest: +ELLIPSIS
+        array([ 50.        ,  76.9...,  44.4...])
+        """
+
+        C = self.chroma(L, h)
+        h = np.radians(h)
+
+        return tstack((L * np.ones(np.shape(C)), C * np.cos(h), C * np.sin(h)))
+
+    def contains(self, Jab, tolerance=0):
+        """
+        Returns if given colours are within the gamut.
+
+        Parameters
+        ----------
+        Jab : array_like
+            Colours in the colour model.
+        tolerance : numeric, optional
+            Chroma tolerance allowed in the inside-outside check.
+
+        Returns
+        -------
+        ndarray
+            Whether given colours are within the gamut.
+
+        Examples
+        --------
+        >>> from colour.models import sRGB_COLOURSPACE
+        >>> GBD = gamut_boundary_descriptor_RGB_colourspace(sRGB_COLOURSPACE)
+        >>> GBD.contains(np.array([[50.0, 76.0, 44.0], [50.0, 78.0, 46.0]]))
+        array([ True, False], dtype=bool)
+        """
+
+        L, C, h = _Jab_to_JCh(Jab)
+
+        return np.logical_and.reduce([
+            L >= self._L[0], L <= self._L[-1],
+            C <= self.chroma(L, h) + tolerance
+        ])
+
+    def read(self, path):
+        """
+        Reads the segments maxima from given *.npz* file path.
+
+        Parameters
+        ----------
+        path : unicode
+            *.npz* file path.
+
+        Returns
+        -------
+        bool
+            Definition success.
+        """
+
+        data = np.load(path)
+
+        self._L = data['L']
+        self._maxima = data['maxima']
+
+        return True
+
+    def write(self, path):
+        """
+        Writes the segments maxima to given *.npz* file path.
+
+        Parameters
+        ----------
+        path : unicode
+            *.npz* file path.
+
+        Returns
+        -------
+        bool
+            Definition success.
+        """
+
+        np.savez(path, L=self._L, maxima=self._maxima)
+
+        return True
+
+
+def gamut_boundary_descriptor_RGB_colourspace(
+        colourspace,
+        segments=(128, 256),
+        samples=256,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02',
+        XYZ_to_model=XYZ_to_Lab):
+    """
+    Generates the *Gamut Boundary Descriptor* (GBD) of given *RGB*
+    colourspace.
+
+    The *RGB* colourspace cube surface is regularly sampled, converted to
+    *CIE L\\*a\\*b\\** colourspace, or any other opponent colour model, and
+    the segments maxima are generated from the converted samples.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to generate the *Gamut Boundary Descriptor* of.
+    segments : array_like, optional
+        Lightness and hue angle segments counts.
+    samples : integer, optional
+        Samples count along each edge of the *RGB* colourspace cube faces.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    XYZ_to_model : callable, optional
+        Callable converting from *CIE XYZ* colourspace to the colour model the
+        *Gamut Boundary Descriptor* is generated in, it is given
+        ``illuminant_Lab`` as ``illuminant`` argument if it accepts it.
+
+    Returns
+    -------
+    GamutBoundaryDescriptor
+        *Gamut Boundary Descriptor*.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> GBD = gamut_boundary_descriptor_RGB_colourspace(sRGB)
+    >>> GBD.L[[0, -1]]  # doctest: +ELLIPSIS
+    array([   0.        ,  100.0000...])
+    """
+
+    u, v = (np.ravel(x) for x in np.meshgrid(
+        np.linspace(0, 1, int(samples)), np.linspace(0, 1, int(samples))))
+    w = np.ones(u.shape)
+
+    RGB = np.vstack([
+        np.roll(tstack((u, v, w * value)), axis, axis=-1)
+        for axis in range(3) for value in (0, 1)
+    ])
+
+    XYZ = RGB_to_XYZ(
+        RGB,
+        colourspace.whitepoint,
+        illuminant_Lab,
+        colourspace.RGB_to_XYZ_matrix,
+        chromatic_adaptation_transform=chromatic_adaptation_method)
+
+    GBD = GamutBoundaryDescriptor()
+    GBD.generate(
+        XYZ_to_model(XYZ, **filter_kwargs(
+            XYZ_to_model, illuminant=illuminant_Lab)), segments)
+
+    return GBD
@@ -5,6 +5,9 @@ Optimal Colour Stimuli - MacAdam Limits
 
 Defines objects related to *Optimal Colour Stimuli* computations.
 
+-   :func:`colour.volume.XYZ_optimal_colour_stimuli`
+-   :func:`colour.is_within_macadam_limits`
+
 See Also
 --------
 `Optimal Colour Stimuli - MacAdam Limits Jupyter Notebook
@@ -15,10 +18,13 @@ blob/master/notebooks/volume/macadam_limits.ipynb>`_
 from __future__ import division, unicode_literals
 
 import numpy as np
-from scipy.spatial import Delaunay
+from collections import OrderedDict
 
+from colour.colorimetry import STANDARD_OBSERVERS_CMFS, SpectralShape
 from colour.models import xyY_to_XYZ
+from colour.utilities import is_string
 from colour.volume import ILLUMINANTS_OPTIMAL_COLOUR_STIMULI
+from colour.volume.mesh import prepare_mesh_volume
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -27,10 +33,23 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['is_within_macadam_limits']
+__all__ = ['XYZ_optimal_colour_stimuli', 'is_within_macadam_limits']
+
+_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE = OrderedDict()
+"""
+Illuminants *Optimal Colour Stimuli* in *CIE XYZ* tristimulus values cache,
+keyed by illuminant.
+
+_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE : OrderedDict
+"""
+
+_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE_SIZE = 16
+"""
+Illuminants *Optimal Colour Stimuli* cache size, the least recently used
+*Optimal Colour Stimuli* are discarded when exceeded.
 
-_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE = {}
-_XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE = {}
+_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE_SIZE : integer
+"""
 
 
 def _XYZ_optimal_colour_stimuli(illuminant):
@@ -56,14 +75,96 @@ def _XYZ_optimal_colour_stimuli(illuminant):
                            illuminant,
                            sorted(ILLUMINANTS_OPTIMAL_COLOUR_STIMULI.keys())))
 
-    cached_ocs = _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE.get(illuminant)
+    cached_ocs = _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE.pop(illuminant, None)
     if cached_ocs is None:
-        _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE[illuminant] = cached_ocs = (
-            xyY_to_XYZ(optimal_colour_stimuli) / 100)
+        cached_ocs = xyY_to_XYZ(optimal_colour_stimuli) / 100
+
+    _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE[illuminant] = cached_ocs
+    while len(_XYZ_OPTIMAL_COLOUR_STIMULI_CACHE) > \
+            _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE_SIZE:
+        _XYZ_OPTIMAL_COLOUR_STIMULI_CACHE.popitem(last=False)
+
     return cached_ocs
 
 
-def is_within_macadam_limits(xyY, illuminant, tolerance=None):
+def XYZ_optimal_colour_stimuli(
+        illuminant,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5):
+    """
+    Computes the *Optimal Colour Stimuli*, i.e. the *MacAdam* limits or
+    optimal colour solid, of given illuminant relative spectral power
+    distribution and colour matching functions in *CIE XYZ* tristimulus
+    values.
+
+    The optimal colours reflectances have values of 0 or 1 with at most two
+    transitions: every band-pass and band-stop reflectance is enumerated at
+    once from the cumulative sum of the illuminant weighted colour matching
+    functions, a band-stop reflectance being a band-pass reflectance wrapping
+    around the spectrum.
+
+    Parameters
+    ----------
+    illuminant : SpectralPowerDistribution
+        Illuminant relative spectral power distribution.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions.
+    interval : numeric, optional
+        Wavelength :math:`\\lambda_{i}` range interval used to sample the
+        reflectances transitions.
+
+    Returns
+    -------
+    ndarray, (W * (W - 1) + 2, 3)
+        *Optimal Colour Stimuli* in *CIE XYZ* tristimulus values, the
+        illuminant, i.e. the perfect reflecting diffuser, has a luminance
+        :math:`Y` of 1.
+
+    References
+    ----------
+    -   :cite:`MacAdam1935a`
+
+    Examples
+    --------
+    >>> from colour import ILLUMINANTS_RELATIVE_SPDS
+    >>> XYZ = XYZ_optimal_colour_stimuli(ILLUMINANTS_RELATIVE_SPDS['D65'])
+    >>> XYZ.shape
+    (8932, 3)
+    >>> XYZ[-1]  # doctest: +ELLIPSIS
+    array([ 0.9504...,  1.        ,  1.0889...])
+    """
+
+    shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, interval)
+    cmfs = cmfs.copy().align(shape)
+    illuminant = illuminant.copy().align(cmfs.shape)
+
+    weights = cmfs.values * illuminant[cmfs.wavelengths][..., np.newaxis]
+    weights /= np.sum(weights[..., 1])
+
+    # The cumulative sum is computed over the doubled spectrum so that the
+    # band-stop reflectances are band-pass reflectances wrapping around it.
+    W = weights.shape[0]
+    weights_c = np.vstack(
+        [np.zeros((1, 3)),
+         np.cumsum(np.vstack([weights, weights]), axis=0)])
+
+    starts = np.arange(W)[..., np.newaxis]
+    widths = np.arange(1, W)[np.newaxis, ...]
+    XYZ = weights_c[starts + widths] - weights_c[starts]
+
+    return np.vstack([
+        np.zeros((1, 3)),
+        np.reshape(XYZ, (-1, 3)),
+        np.sum(weights, axis=0)[np.newaxis, ...],
+    ])
+
+
+def is_within_macadam_limits(
+        xyY,
+        illuminant,
+        tolerance=None,
+        cmfs=STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer'],
+        interval=5):
     """
     Returns if given *CIE xyY* colourspace array is within MacAdam limits of
     given illuminant.
@@ -72,10 +173,22 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
     ----------
     xyY : array_like
         *CIE xyY* colourspace array.
-    illuminant : unicode
-        Illuminant.
+    illuminant : unicode or SpectralPowerDistribution
+        Illuminant name in
+        :attr:`colour.ILLUMINANTS_OPTIMAL_COLOUR_STIMULI` attribute or
+        illuminant relative spectral power distribution, in which case the
+        *Optimal Colour Stimuli* are computed with
+        :func:`colour.volume.XYZ_optimal_colour_stimuli` definition.
     tolerance : numeric, optional
-        Tolerance allowed in the inside-triangle check.
+        Tolerance allowed in the inside-triangle check, or on the signed
+        distance to the *Optimal Colour Stimuli* convex hull facets with an
+        illuminant relative spectral power distribution.
+    cmfs : XYZ_ColourMatchingFunctions, optional
+        Standard observer colour matching functions used with an illuminant
+        relative spectral power distribution.
+    interval : numeric, optional
+        Wavelength :math:`\\lambda_{i}` range interval used with an illuminant
+        relative spectral power distribution.
 
     Returns
     -------
@@ -88,22 +201,31 @@ def is_within_macadam_limits(xyY, illuminant, tolerance=None):
 
     Examples
     --------
+    >>> import numpy as np
     >>> is_within_macadam_limits(np.array([0.3205, 0.4131, 0.51]), 'A')
     array(True, dtype=bool)
     >>> a = np.array([[0.3205, 0.4131, 0.51],
     ...               [0.0005, 0.0031, 0.001]])
     >>> is_within_macadam_limits(a, 'A')
     array([ True, False], dtype=bool)
-    """
 
-    optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
-    triangulation = _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE.get(
-        illuminant)
-    if triangulation is None:
-        _XYZ_OPTIMAL_COLOUR_STIMULI_TRIANGULATIONS_CACHE[illuminant] = \
-            triangulation = Delaunay(optimal_colour_stimuli)
+    Using an illuminant relative spectral power distribution:
 
-    simplex = triangulation.find_simplex(xyY_to_XYZ(xyY), tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    >>> from colour import ILLUMINANTS_RELATIVE_SPDS
+    >>> is_within_macadam_limits(a, ILLUMINANTS_RELATIVE_SPDS['A'])
+    array([ True, False], dtype=bool)
+    """
 
-    return simplex
+    if is_string(illuminant):
+        optimal_colour_stimuli = _XYZ_optimal_colour_stimuli(illuminant)
+        method = 'Delaunay'
+    else:
+        # The computed *Optimal Colour Stimuli* convex hull has thousands of
+        # facets, testing the half-spaces is faster than locating the
+        # points in the triangulation.
+        optimal_colour_stimuli = XYZ_optimal_colour_stimuli(
+            illuminant, cmfs, interval)
+        method = 'Half-spaces'
+
+    return prepare_mesh_volume(optimal_colour_stimuli).contains(
+        xyY_to_XYZ(xyY), tolerance, method)
@@ -4,12 +4,23 @@ Mesh Volume Computations Helpers
 ================================
 
 Defines helpers objects related to volume computations.
+
+-   :class:`colour.volume.PreparedMeshVolume`
+-   :func:`colour.volume.prepare_mesh_volume`
+-   :func:`colour.volume.is_within_mesh_volume`
+-   :func:`colour.volume.subdivide_triangles`
+-   :func:`colour.volume.mesh_volume`
 """
 
 from __future__ import division, unicode_literals
 
+import hashlib
 import numpy as np
-from scipy.spatial import Delaunay
+from collections import OrderedDict
+from scipy.spatial import ConvexHull, Delaunay
+from scipy.spatial.qhull import QhullError
+
+from colour.constants import DEFAULT_FLOAT_DTYPE, EPSILON
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -18,13 +29,341 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['is_within_mesh_volume']
+__all__ = [
+    'PreparedMeshVolume', 'prepare_mesh_volume', 'is_within_mesh_volume',
+    'subdivide_triangles', 'mesh_volume'
+]
+
+_PREPARED_MESH_VOLUMES_CACHE = OrderedDict()
+"""
+Prepared mesh volumes cache, keyed by the mesh points content hash.
+
+_PREPARED_MESH_VOLUMES_CACHE : OrderedDict
+"""
+
+_PREPARED_MESH_VOLUMES_CACHE_SIZE = 16
+"""
+Prepared mesh volumes cache size, the least recently used prepared mesh volume
+is discarded when exceeded.
+
+_PREPARED_MESH_VOLUMES_CACHE_SIZE : integer
+"""
 
 
-def is_within_mesh_volume(points, mesh, tolerance=None):
+class PreparedMeshVolume(object):
+    """
+    Defines a mesh volume prepared for repeated containment tests: the convex
+    hull of the mesh points, the *Delaunay* triangulation of its vertices and
+    its facets equations are computed once, on first use.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume.
+
+    Attributes
+    ----------
+    mesh
+    hull
+    triangulation
+    equations
+
+    Methods
+    -------
+    contains
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> volume = PreparedMeshVolume(mesh)
+    >>> a = np.array([[0.0005, 0.0031, 0.0010],
+    ...               [0.3205, 0.4131, 0.5100]])
+    >>> volume.contains(a)
+    array([ True, False], dtype=bool)
+    >>> volume.contains(a, method='Half-spaces')
+    array([ True, False], dtype=bool)
+    """
+
+    def __init__(self, mesh):
+        self._mesh = np.array(mesh, dtype=DEFAULT_FLOAT_DTYPE)
+        self._mesh.setflags(write=False)
+        self._hull = None
+        self._triangulation = None
+        self._inner_hull_equations = None
+
+    @property
+    def mesh(self):
+        """
+        Getter property for the mesh points, read-only.
+
+        Returns
+        -------
+        ndarray
+            Mesh points.
+        """
+
+        return self._mesh
+
+    @property
+    def hull(self):
+        """
+        Getter property for the mesh points convex hull, computed on first
+        access.
+
+        Returns
+        -------
+        ConvexHull
+            Convex hull.
+        """
+
+        if self._hull is None:
+            self._hull = ConvexHull(self._mesh)
+
+        return self._hull
+
+    @property
+    def triangulation(self):
+        """
+        Getter property for the *Delaunay* triangulation of the mesh points
+        convex hull vertices, computed on first access.
+
+        Returns
+        -------
+        Delaunay
+            *Delaunay* triangulation.
+
+        Notes
+        -----
+        -   The mesh points that are not vertices of the convex hull do not
+            change the triangulated volume, they are discarded.
+        """
+
+        if self._triangulation is None:
+            self._triangulation = Delaunay(self._mesh[self.hull.vertices])
+
+        return self._triangulation
+
+    @property
+    def equations(self):
+        """
+        Getter property for the mesh points convex hull facets equations, in
+        the form :math:`n \\cdot x + d = 0` with outward normals :math:`n`,
+        computed on first access.
+
+        Returns
+        -------
+        ndarray
+            Convex hull facets equations.
+        """
+
+        return self.hull.equations
+
+    def _inner_equations(self, vertices=64):
+        """
+        Returns the facets equations of an inner convex hull built from a
+        subset of the convex hull vertices, the points within it are within
+        the convex hull.
+
+        Parameters
+        ----------
+        vertices : integer, optional
+            Vertices count of the inner convex hull.
+
+        Returns
+        -------
+        ndarray
+            Inner convex hull facets equations, empty if the convex hull has
+            too few vertices to benefit from it.
+        """
+
+        if self._inner_hull_equations is None:
+            equations = np.zeros((0, 4))
+
+            hull_vertices = self.hull.points[self.hull.vertices]
+            if hull_vertices.shape[0] > vertices * 2:
+                try:
+                    equations = ConvexHull(hull_vertices[np.linspace(
+                        0, hull_vertices.shape[0] - 1,
+                        vertices).astype(np.int_)]).equations
+                except QhullError:
+                    pass
+
+            self._inner_hull_equations = equations
+
+        return self._inner_hull_equations
+
+    def contains(self,
+                 points,
+                 tolerance=None,
+                 method='Delaunay',
+                 chunk_size=2 ** 16):
+        """
+        Returns if given points are within the mesh volume.
+
+        Parameters
+        ----------
+        points : array_like
+            Points to check if they are within the mesh volume.
+        tolerance : numeric, optional
+            Tolerance allowed in the inside-triangle check with the
+            *Delaunay* method, or on the signed distance to the convex hull
+            facets with the *Half-spaces* method.
+        method : unicode, optional
+            **{'Delaunay', 'Half-spaces'}**,
+            Containment test method, the *Half-spaces* method tests the
+            points against the convex hull facets equations and is
+            preferable for large convex hulls, e.g. computed
+            *Optimal Colour Stimuli* volumes with thousands of facets.
+        chunk_size : integer, optional
+            Count of points tested at once, bounding the memory usage.
+
+        Returns
+        -------
+        ndarray
+            Is within mesh volume.
+        """
+
+        points = np.asarray(points)
+        shape = points.shape[:-1]
+        points = np.reshape(points, (-1, points.shape[-1]))
+
+        # The points outside of the convex hull bounding box are rejected
+        # beforehand, they are slow to locate in the triangulation.
+        vertices = self.hull.points[self.hull.vertices]
+        margin = 3 * (tolerance if tolerance is not None else
+                      100 * EPSILON) * np.ptp(vertices, axis=0)
+        minimum = np.min(vertices, axis=0) - margin
+        maximum = np.max(vertices, axis=0) + margin
+
+        if method.lower() == 'delaunay':
+
+            def contains_bounded(chunk):
+                """
+                Tests given points chunk with the *Delaunay* triangulation.
+                """
+
+                return self.triangulation.find_simplex(
+                    chunk, tol=tolerance) >= 0
+
+        elif method.lower() == 'half-spaces':
+            tolerance = (tolerance
+                         if tolerance is not None else 100 * EPSILON)
+            normals = self.equations[..., :-1]
+            offsets = self.equations[..., -1]
+            inner_equations = self._inner_equations()
+
+            def contains_bounded(chunk):
+                """
+                Tests given points chunk with the convex hull facets
+                equations, the points within the inner convex hull are
+                accepted beforehand and the points outside of a facets block
+                are not tested against the next blocks.
+                """
+
+                if inner_equations.size:
+                    within = np.all(
+                        np.dot(chunk, inner_equations[..., :-1].T) <=
+                        -inner_equations[..., -1],
+                        axis=-1)
+                else:
+                    within = np.zeros(chunk.shape[0], dtype=np.bool_)
+
+                indexes = np.where(~within)[0]
+                for j in range(0, offsets.shape[0], 32):
+                    indexes = indexes[np.all(
+                        np.dot(chunk[indexes], normals[j:j + 32].T) <=
+                        tolerance - offsets[j:j + 32],
+                        axis=-1)]
+
+                within[indexes] = True
+
+                return within
+
+        else:
+            raise ValueError(
+                '"{0}" method is invalid, it must be one of {1}!'.format(
+                    method, ['Delaunay', 'Half-spaces']))
+
+        def contains(chunk):
+            """
+            Tests given points chunk.
+            """
+
+            within = np.all(
+                np.logical_and(chunk >= minimum, chunk <= maximum), axis=-1)
+            within[within] = contains_bounded(chunk[within])
+
+            return within
+
+        within = np.zeros(points.shape[0], dtype=np.bool_)
+        chunk_size = int(chunk_size)
+        for i in range(0, points.shape[0], chunk_size):
+            within[i:i + chunk_size] = contains(points[i:i + chunk_size])
+
+        return np.reshape(within, shape)
+
+
+def prepare_mesh_volume(mesh):
+    """
+    Returns the prepared mesh volume of given mesh points, the prepared mesh
+    volumes are cached and keyed by the mesh points content hash so that they
+    are reused across calls.
+
+    Parameters
+    ----------
+    mesh : array_like
+        Points of the volume.
+
+    Returns
+    -------
+    PreparedMeshVolume
+        Prepared mesh volume.
+
+    Examples
+    --------
+    >>> mesh = np.array(
+    ...     [[-1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, 1.0],
+    ...       [1.0, -1.0, -1.0],
+    ...       [-1.0, -1.0, -1.0],
+    ...       [0.0, 1.0, 0.0]]
+    ... )
+    >>> prepare_mesh_volume(mesh) is prepare_mesh_volume(mesh.copy())
+    True
+    """
+
+    mesh = np.ascontiguousarray(mesh, dtype=DEFAULT_FLOAT_DTYPE)
+
+    key = (mesh.shape, hashlib.sha1(mesh.tobytes()).hexdigest())
+    prepared_mesh_volume = _PREPARED_MESH_VOLUMES_CACHE.pop(key, None)
+    if prepared_mesh_volume is None:
+        prepared_mesh_volume = PreparedMeshVolume(mesh)
+
+    _PREPARED_MESH_VOLUMES_CACHE[key] = prepared_mesh_volume
+    while len(_PREPARED_MESH_VOLUMES_CACHE) > \
+            _PREPARED_MESH_VOLUMES_CACHE_SIZE:
+        _PREPARED_MESH_VOLUMES_CACHE.popitem(last=False)
+
+    return prepared_mesh_volume
+
+
+def is_within_mesh_volume(points,
+                          mesh,
+                          tolerance=None,
+                          method='Delaunay',
+                          chunk_size=2 ** 16):
     """
     Returns if given points are within given mesh volume using Delaunay
-    triangulation.
+    triangulation or the convex hull facets equations.
+
+    The mesh volume is prepared once and cached, see
+    :func:`colour.volume.prepare_mesh_volume` definition.
 
     Parameters
     ----------
@@ -34,6 +373,11 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
         Points of the volume used to generate the Delaunay triangulation.
     tolerance : numeric, optional
         Tolerance allowed in the inside-triangle check.
+    method : unicode, optional
+        **{'Delaunay', 'Half-spaces'}**,
+        Containment test method.
+    chunk_size : integer, optional
+        Count of points tested at once, bounding the memory usage.
 
     Returns
     -------
@@ -55,11 +399,131 @@ def is_within_mesh_volume(points, mesh, tolerance=None):
     ...               [0.3205, 0.4131, 0.5100]])
     >>> is_within_mesh_volume(a, mesh)
     array([ True, False], dtype=bool)
+    >>> is_within_mesh_volume(a, mesh, method='Half-spaces')
+    array([ True, False], dtype=bool)
+    """
+
+    return prepare_mesh_volume(mesh).contains(points, tolerance, method,
+                                              chunk_size)
+
+
+def subdivide_triangles(triangles, subdivisions=1, grading=1):
+    """
+    Subdivides given triangles into ``subdivisions`` :math:`^2` triangles
+    each, the sub-triangles orientation is the orientation of their parent
+    triangle.
+
+    Parameters
+    ----------
+    triangles : array_like, (n, 3, 3)
+        Triangles to subdivide.
+    subdivisions : integer, optional
+        Subdivisions count of each triangle edge.
+    grading : numeric, optional
+        Exponent grading the subdivision toward the first vertex of each
+        triangle, the sub-triangles are uniform if equal to 1. The
+        subdivision of the edge opposite to the first vertex is always
+        uniform.
+
+    Returns
+    -------
+    ndarray, (n * subdivisions ** 2, 3, 3)
+        Subdivided triangles.
+
+    Examples
+    --------
+    >>> triangles = np.array([[[0.0, 0.0, 0.0],
+    ...                        [1.0, 0.0, 0.0],
+    ...                        [0.0, 1.0, 0.0]]])
+    >>> subdivide_triangles(triangles, 2)
+    array([[[ 0. ,  0. ,  0. ],
+            [ 0.5,  0. ,  0. ],
+            [ 0. ,  0.5,  0. ]],
+    <BLANKLINE>
+           [[ 0. ,  0.5,  0. ],
+            [ 0.5,  0.5,  0. ],
+            [ 0. ,  1. ,  0. ]],
+    <BLANKLINE>
+           [[ 0.5,  0. ,  0. ],
+            [ 1. ,  0. ,  0. ],
+            [ 0.5,  0.5,  0. ]],
+    <BLANKLINE>
+           [[ 0.5,  0. ,  0. ],
+            [ 0.5,  0.5,  0. ],
+            [ 0. ,  0.5,  0. ]]])
+    """
+
+    triangles = np.asarray(triangles)
+    subdivisions = int(subdivisions)
+
+    # Barycentric coordinates of the sub-triangles vertices, "upward"
+    # sub-triangles first then "downward" sub-triangles.
+    i, j = np.meshgrid(
+        np.arange(subdivisions), np.arange(subdivisions), indexing='ij')
+    upward = i + j <= subdivisions - 1
+    downward = i + j <= subdivisions - 2
+    i_u, j_u = i[upward], j[upward]
+    i_d, j_d = i[downward], j[downward]
+
+    u = np.concatenate([
+        np.column_stack([i_u, i_u + 1, i_u]),
+        np.column_stack([i_d + 1, i_d + 1, i_d]),
+    ]) / subdivisions
+    v = np.concatenate([
+        np.column_stack([j_u, j_u, j_u + 1]),
+        np.column_stack([j_d, j_d + 1, j_d + 1]),
+    ]) / subdivisions
+
+    if grading != 1:
+        s = u + v
+        w = np.where(s == 0, 0, s ** (grading - 1))
+        u, v = u * w, v * w
+
+    a = triangles[:, np.newaxis, np.newaxis, 0, :]
+    b = triangles[:, np.newaxis, np.newaxis, 1, :]
+    c = triangles[:, np.newaxis, np.newaxis, 2, :]
+
+    vertices = (a + u[np.newaxis, ..., np.newaxis] * (b - a) +
+                v[np.newaxis, ..., np.newaxis] * (c - a))
+
+    return np.reshape(vertices, (-1, 3, 3))
+
+
+def mesh_volume(triangles):
     """
+    Returns the volume enclosed by given closed and consistently oriented
+    triangle mesh using the divergence theorem.
 
-    triangulation = Delaunay(mesh)
+    Parameters
+    ----------
+    triangles : array_like, (n, 3, 3)
+        Triangles of the closed mesh.
+
+    Returns
+    -------
+    numeric
+        Mesh volume, positive if the triangles are oriented outward.
+
+    Examples
+    --------
+    >>> triangles = np.array([[[0.0, 0.0, 0.0],
+    ...                        [0.0, 1.0, 0.0],
+    ...                        [1.0, 0.0, 0.0]],
+    ...                       [[0.0, 0.0, 0.0],
+    ...                        [1.0, 0.0, 0.0],
+    ...                        [0.0, 0.0, 1.0]],
+    ...                       [[0.0, 0.0, 0.0],
+    ...                        [0.0, 0.0, 1.0],
+    ...                        [0.0, 1.0, 0.0]],
+    ...                       [[1.0, 0.0, 0.0],
+    ...                        [0.0, 1.0, 0.0],
+    ...                        [0.0, 0.0, 1.0]]])
+    >>> mesh_volume(triangles)  # doctest: +ELLIPSIS
+    0.1666666...
+    """
 
-    simplex = triangulation.find_simplex(points, tol=tolerance)
-    simplex = np.where(simplex >= 0, True, False)
+    triangles = np.asarray(triangles)
 
-    return simplex
+    return np.sum(
+        np.einsum('...i,...i->...', triangles[..., 0, :],
+                  np.cross(triangles[..., 1, :], triangles[..., 2, :]))) / 6
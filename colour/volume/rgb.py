@@ -10,6 +10,9 @@ Defines various RGB colourspace volume computation objects:
 -   :func:`colour.RGB_colourspace_volume_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_pointer_gamut_coverage_MonteCarlo`
 -   :func:`colour.RGB_colourspace_visible_spectrum_coverage_MonteCarlo`
+-   :func:`colour.RGB_colourspace_volume_mesh`
+-   :func:`colour.RGB_colourspaces_intersection_volume_mesh`
+-   :func:`colour.RGB_colourspace_coverage_mesh`
 
 See Also
 --------
@@ -23,11 +26,15 @@ from __future__ import division, unicode_literals
 import itertools
 import multiprocessing
 import numpy as np
+from scipy.spatial import ConvexHull, HalfspaceIntersection
+from scipy.stats import norm
 
 from colour.algebra import random_triplet_generator
 from colour.colorimetry import ILLUMINANTS
 from colour.models import (Lab_to_XYZ, RGB_to_XYZ, XYZ_to_Lab, XYZ_to_RGB)
-from colour.volume import is_within_pointer_gamut, is_within_visible_spectrum
+from colour.utilities import filter_kwargs
+from colour.volume import (is_within_pointer_gamut, is_within_visible_spectrum,
+                           mesh_volume, subdivide_triangles)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -40,9 +47,134 @@ __all__ = [
     'sample_RGB_colourspace_volume_MonteCarlo', 'RGB_colourspace_limits',
     'RGB_colourspace_volume_MonteCarlo',
     'RGB_colourspace_pointer_gamut_coverage_MonteCarlo',
-    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo'
+    'RGB_colourspace_visible_spectrum_coverage_MonteCarlo',
+    'RGB_colourspace_volume_mesh', 'RGB_colourspaces_intersection_volume_mesh',
+    'RGB_colourspace_coverage_mesh'
 ]
 
+_MINIMUM_REPLICATES = 10
+"""
+Minimum count of independent replicates the standard error of the *Monte
+Carlo* estimates is computed from, the binomial standard error is used below.
+
+_MINIMUM_REPLICATES : integer
+"""
+
+
+def _replicates_standard_error(within, count):
+    """
+    Returns the standard error of the ratio of the pooled within samples count
+    to the pooled samples count of given independent replicates.
+
+    The standard error is estimated from the spread of the replicates ratios,
+    thus accounting for the variance reduction of the randomised quasi-random
+    triplets. Below :attr:`colour.volume.rgb._MINIMUM_REPLICATES` replicates,
+    the normal approximation of the binomial distribution of the pooled within
+    samples count is used, it is conservative with quasi-random triplets.
+
+    Parameters
+    ----------
+    within : array_like
+        Within samples count of each replicate.
+    count : array_like
+        Samples count of each replicate.
+
+    Returns
+    -------
+    numeric
+        Standard error of the pooled ratio.
+    """
+
+    within, count = np.asarray(within), np.asarray(count)
+    replicates = len(count)
+    pooled_within, pooled_count = np.sum(within), np.sum(count)
+    ratio = pooled_within / pooled_count
+
+    if replicates < _MINIMUM_REPLICATES:
+        return np.sqrt(ratio * (1 - ratio) / pooled_count)
+
+    # Linearisation of the ratio estimator variance.
+    return np.sqrt(replicates / (replicates - 1) * np.sum(
+        (within - ratio * count) ** 2)) / pooled_count
+
+
+def _random_triplets_blocks(generator, chunk_size):
+    """
+    Yields blocks of random triplets from given random generator, the
+    generator can either yield the triplets one at a time, e.g.
+    :func:`colour.algebra.random_triplet_generator` definition, or in blocks,
+    e.g. :func:`colour.algebra.halton_triplet_generator` definition.
+
+    Parameters
+    ----------
+    generator : generator
+        Random triplets or random triplets blocks generator.
+    chunk_size : integer
+        Triplets count of the blocks built from a triplets generator.
+
+    Returns
+    -------
+    generator
+        Random triplets blocks generator.
+    """
+
+    triplets = []
+    for sample in generator:
+        sample = np.asarray(sample)
+        if sample.ndim == 2:
+            yield sample
+            continue
+
+        triplets.append(sample)
+        if len(triplets) == chunk_size:
+            yield np.asarray(triplets)
+            triplets = []
+
+    if triplets:
+        yield np.asarray(triplets)
+
+
+def _random_triplets_replicates(random_generator, samples, random_state,
+                                chunk_size):
+    """
+    Yields independent replicates of random triplets, each replicate is drawn
+    from its own random triplet generator seeded from given ``random_state``,
+    so that the randomised quasi-random triplets replicates are independent.
+
+    Parameters
+    ----------
+    random_generator : generator
+        Random triplet generator, either yielding the triplets one at a time
+        or in blocks.
+    samples : integer
+        Triplets count.
+    random_state : RandomState
+        Mersenne Twister pseudo-random number generator used to seed the
+        replicates random triplet generators.
+    chunk_size : integer
+        Triplets count of the replicates.
+
+    Returns
+    -------
+    generator
+        Random triplets replicates generator.
+    """
+
+    replicates_samples = [
+        min(chunk_size, samples - i) for i in range(0, samples, chunk_size)
+    ]
+    seeds = random_state.randint(
+        0, np.iinfo(np.int32).max, len(replicates_samples))
+
+    for replicate_samples, seed in zip(replicates_samples, seeds):
+        yield np.vstack(
+            list(
+                _random_triplets_blocks(
+                    random_generator(
+                        replicate_samples,
+                        random_state=np.random.RandomState(seed)),
+                    chunk_size)))
+
 
 def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
     """
@@ -50,6 +182,9 @@ def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
     :func:`colour.volume.rgb.sample_RGB_colourspace_volume_MonteCarlo`:
     definition with multiple arguments.
 
+    The last argument is the seed of the task independent
+    :class:`np.random.RandomState` class instance.
+
     Parameters
     ----------
     args : array_like, optional
@@ -61,6 +196,9 @@ def _wrapper_RGB_colourspace_volume_MonteCarlo(args):
         Inside *RGB* colourspace volume samples count.
     """
 
+    args = list(args)
+    args[-1] = np.random.RandomState(args[-1])
+
     return sample_RGB_colourspace_volume_MonteCarlo(*args)
 
 
@@ -72,9 +210,10 @@ def sample_RGB_colourspace_volume_MonteCarlo(
             'D50'],
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=10e4):
     """
-    Randomly samples the *Lab* colourspace volume and returns the ratio of
+    Randomly samples the *Lab* colourspace volume and returns the count of
     samples within the given *RGB* colourspace volume.
 
     Parameters
@@ -94,10 +233,12 @@ def sample_RGB_colourspace_volume_MonteCarlo(
         *Chromatic adaptation* method.
     random_generator : generator, optional
         Random triplet generator providing the random samples within the *Lab*
-        colourspace volume.
+        colourspace volume, either one at a time or in blocks.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : numeric, optional
+        Count of samples tested at once, bounding the memory usage.
 
     Returns
     -------
@@ -127,16 +268,22 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    Lab = np.asarray(list(random_generator(samples, limits, random_state)))
-    RGB = XYZ_to_RGB(
-        Lab_to_XYZ(Lab, illuminant_Lab),
-        illuminant_Lab,
-        colourspace.whitepoint,
-        colourspace.XYZ_to_RGB_matrix,
-        chromatic_adaptation_transform=(chromatic_adaptation_method))
-    RGB_w = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0, np.max(RGB, axis=-1) <= 1)]
-    return len(RGB_w)
+    samples, chunk_size = int(samples), int(chunk_size)
+
+    within = 0
+    for Lab in _random_triplets_blocks(
+            random_generator(samples, limits, random_state), chunk_size):
+        RGB = XYZ_to_RGB(
+            Lab_to_XYZ(Lab, illuminant_Lab),
+            illuminant_Lab,
+            colourspace.whitepoint,
+            colourspace.XYZ_to_RGB_matrix,
+            chromatic_adaptation_transform=(chromatic_adaptation_method))
+        within += np.sum(
+            np.logical_and(
+                np.min(RGB, axis=-1) >= 0, np.max(RGB, axis=-1) <= 1))
+
+    return int(within)
 
 
 def RGB_colourspace_limits(
@@ -190,11 +337,20 @@ def RGB_colourspace_volume_MonteCarlo(
         chromatic_adaptation_method='CAT02',
         random_generator=random_triplet_generator,
         random_state=None,
-        processes=None):
+        processes=None,
+        chunk_size=10e4,
+        confidence=0.95,
+        standard_error=None,
+        additional_data=False):
     """
     Performs given *RGB* colourspace volume computation using *Monte Carlo*
     method and multiprocessing.
 
+    The samples are split into tasks of ``chunk_size`` samples, each task
+    drawing from its own pseudo-random number generator seeded from
+    ``random_state``: the tasks streams are independent and the result does
+    not depend on the processes count.
+
     Parameters
     ----------
     colourspace : RGB_Colourspace
@@ -212,18 +368,29 @@ def RGB_colourspace_volume_MonteCarlo(
         *Chromatic adaptation* method.
     random_generator : generator, optional
         Random triplet generator providing the random samples within the *Lab*
-        colourspace volume.
+        colourspace volume, either one at a time or in blocks, e.g.
+        :func:`colour.algebra.halton_triplet_generator` definition.
     random_state : RandomState, optional
-        Mersenne Twister pseudo-random number generator to use in the random
-        number generator.
+        Mersenne Twister pseudo-random number generator used to seed the
+        tasks pseudo-random number generators.
     processes : integer, optional
         Processes count, default to :func:`multiprocessing.cpu_count`
         definition.
+    chunk_size : numeric, optional
+        Samples count per task.
+    confidence : numeric, optional
+        Confidence level of the returned confidence interval.
+    standard_error : numeric, optional
+        Target standard error of the volume, the computation stops once the
+        tasks completed so far reach it.
+    additional_data : bool, optional
+        Whether to output additional data, i.e. the confidence interval.
 
     Returns
     -------
-    float
-        *RGB* colourspace volume.
+    float or tuple
+        *RGB* colourspace volume or *RGB* colourspace volume and its
+        confidence interval.
 
     Notes
     -----
@@ -235,6 +402,14 @@ def RGB_colourspace_volume_MonteCarlo(
         pseudo-random numbers across systems and versions? Retrieved January
         20, 2015, from http://stackoverflow.com/questions/8786084/\
 reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
+    -   The tasks being independent replicates, the standard error and
+        confidence interval are estimated from the spread of the tasks within
+        volume samples ratios, thus reflecting the faster convergence of the
+        randomised quasi-random triplets. Below 10 completed tasks, the
+        normal approximation of the binomial distribution of the within volume
+        samples count is used, it is conservative with quasi-random triplets.
+    -   The tasks results are consumed in order, thus stopping early on a
+        target standard error is deterministic.
 
     Examples
     --------
@@ -243,24 +418,64 @@ reproducibility-of-python-pseudo-random-numbers-across-systems-and-versions
     >>> processes = 1
     >>> RGB_colourspace_volume_MonteCarlo(sRGB, 10e3, random_state=prng,
     ...                                   processes=processes)
-    ... # doctest: +ELLIPSIS
-    858...
-    """
+    884700.0
 
-    cpu_count = processes if processes else multiprocessing.cpu_count()
-    pool = multiprocessing.Pool(processes=cpu_count)
+    Using quasi-random triplets:
+
+    >>> from colour.algebra import halton_triplet_generator
+    >>> prng = np.random.RandomState(2)
+    >>> RGB_colourspace_volume_MonteCarlo(
+    ...     sRGB, 10e3, random_generator=halton_triplet_generator,
+    ...     random_state=prng, processes=processes)
+    854100.0
+    """
 
-    process_samples = int(np.round(samples / cpu_count))
+    random_state = (random_state
+                    if random_state is not None else np.random.RandomState())
 
-    arguments = (colourspace, process_samples, limits, illuminant_Lab,
-                 chromatic_adaptation_method, random_generator, random_state)
+    samples, chunk_size = int(samples), int(chunk_size)
+    tasks_samples = [
+        min(chunk_size, samples - i) for i in range(0, samples, chunk_size)
+    ]
+    seeds = random_state.randint(
+        0, np.iinfo(np.int32).max, len(tasks_samples))
 
-    results = pool.map(_wrapper_RGB_colourspace_volume_MonteCarlo,
-                       [arguments for _ in range(cpu_count)])
+    arguments = [(colourspace, task_samples, limits, illuminant_Lab,
+                  chromatic_adaptation_method, random_generator, seed)
+                 for task_samples, seed in zip(tasks_samples, seeds)]
 
     Lab_volume = np.product([np.sum(np.abs(x)) for x in limits])
 
-    return Lab_volume * np.sum(results) / (process_samples * cpu_count)
+    within, count = [], []
+    cpu_count = processes if processes else multiprocessing.cpu_count()
+    pool = multiprocessing.Pool(processes=cpu_count)
+    try:
+        for task_samples, result in zip(
+                tasks_samples,
+                pool.imap(_wrapper_RGB_colourspace_volume_MonteCarlo,
+                          arguments)):
+            within.append(result)
+            count.append(task_samples)
+
+            if (standard_error is not None and
+                    0 < np.sum(within) < np.sum(count)):
+                error = Lab_volume * _replicates_standard_error(within, count)
+                if error <= standard_error:
+                    break
+    finally:
+        pool.terminate()
+        pool.join()
+
+    ratio = np.sum(within) / np.sum(count)
+    volume = Lab_volume * ratio
+
+    if additional_data:
+        error = Lab_volume * _replicates_standard_error(within, count)
+        z = norm.ppf(1 - (1 - confidence) / 2)
+
+        return volume, np.array([volume - z * error, volume + z * error])
+    else:
+        return volume
 
 
 def RGB_colourspace_volume_coverage_MonteCarlo(
@@ -268,7 +483,9 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
         coverage_sampler,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=10e4,
+        standard_error=None):
     """
     Returns given *RGB* colourspace percentage coverage of an arbitrary volume.
 
@@ -281,16 +498,34 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     samples : numeric, optional
         Samples count.
     random_generator : generator, optional
-        Random triplet generator providing the random samples.
+        Random triplet generator providing the random samples, either one at
+        a time or in blocks, e.g.
+        :func:`colour.algebra.halton_triplet_generator` definition.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : numeric, optional
+        Count of samples tested at once, bounding the memory usage.
+    standard_error : numeric, optional
+        Target standard error of the percentage coverage, the computation
+        stops once the samples tested so far reach it.
 
     Returns
     -------
     float
         Percentage coverage of volume.
 
+    Notes
+    -----
+    -   With a target standard error, the samples are drawn by independent
+        replicates of ``chunk_size`` samples, each one from its own random
+        triplet generator seeded from ``random_state``. The standard error is
+        estimated from the spread of the replicates percentage coverages, thus
+        reflecting the faster convergence of the randomised quasi-random
+        triplets. Below 10 replicates, the normal approximation of the
+        binomial distribution of the covered samples count is used, it is
+        conservative with quasi-random triplets.
+
     Examples
     --------
     >>> from colour import sRGB_COLOURSPACE as sRGB
@@ -304,25 +539,44 @@ def RGB_colourspace_volume_coverage_MonteCarlo(
     random_state = (random_state
                     if random_state is not None else np.random.RandomState())
 
-    # TODO: Investigate for generator yielding directly a ndarray.
-    XYZ = np.asarray(
-        list(random_generator(samples, random_state=random_state)))
-    XYZ_vs = XYZ[coverage_sampler(XYZ)]
+    samples, chunk_size = int(samples), int(chunk_size)
+    if standard_error is None:
+        blocks = _random_triplets_blocks(
+            random_generator(samples, random_state=random_state), chunk_size)
+    else:
+        blocks = _random_triplets_replicates(random_generator, samples,
+                                             random_state, chunk_size)
+
+    within, count = [], []
+    for XYZ in blocks:
+        XYZ_vs = XYZ[coverage_sampler(XYZ)]
 
-    RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint, colourspace.whitepoint,
-                     colourspace.XYZ_to_RGB_matrix)
+        RGB = XYZ_to_RGB(XYZ_vs, colourspace.whitepoint,
+                         colourspace.whitepoint,
+                         colourspace.XYZ_to_RGB_matrix)
 
-    RGB_c = RGB[np.logical_and(
-        np.min(RGB, axis=-1) >= 0, np.max(RGB, axis=-1) <= 1)]
+        within.append(
+            np.sum(
+                np.logical_and(
+                    np.min(RGB, axis=-1) >= 0, np.max(RGB, axis=-1) <= 1)))
+        count.append(len(XYZ_vs))
 
-    return 100 * RGB_c.size / XYZ_vs.size
+        if (standard_error is not None and
+                0 < np.sum(within) < np.sum(count)):
+            error = 100 * _replicates_standard_error(within, count)
+            if error <= standard_error:
+                break
+
+    return 100 * np.sum(within) / np.sum(count)
 
 
 def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=10e4,
+        standard_error=None):
     """
     Returns given *RGB* colourspace percentage coverage of Pointer's Gamut
     volume using *Monte Carlo* method.
@@ -334,10 +588,19 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
     samples : numeric, optional
         Samples count.
     random_generator : generator, optional
-        Random triplet generator providing the random samples.
+        Random triplet generator providing the random samples, either one at
+        a time or in blocks, e.g.
+        :func:`colour.algebra.halton_triplet_generator` definition.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : numeric, optional
+        Count of samples tested at once, bounding the memory usage.
+    standard_error : numeric, optional
+        Target standard error of the percentage coverage, the computation
+        stops once the samples tested so far reach it. See
+        :func:`colour.volume.RGB_colourspace_volume_coverage_MonteCarlo`
+        definition for the standard error estimation.
 
     Returns
     -------
@@ -354,15 +617,22 @@ def RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
     """
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
-        colourspace, is_within_pointer_gamut, samples, random_generator,
-        random_state)
+        colourspace,
+        is_within_pointer_gamut,
+        samples,
+        random_generator,
+        random_state,
+        chunk_size=chunk_size,
+        standard_error=standard_error)
 
 
 def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
         colourspace,
         samples=10e6,
         random_generator=random_triplet_generator,
-        random_state=None):
+        random_state=None,
+        chunk_size=10e4,
+        standard_error=None):
     """
     Returns given *RGB* colourspace percentage coverage of visible spectrum
     volume using *Monte Carlo* method.
@@ -374,10 +644,19 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     samples : numeric, optional
         Samples count.
     random_generator : generator, optional
-        Random triplet generator providing the random samples.
+        Random triplet generator providing the random samples, either one at
+        a time or in blocks, e.g.
+        :func:`colour.algebra.halton_triplet_generator` definition.
     random_state : RandomState, optional
         Mersenne Twister pseudo-random number generator to use in the random
         number generator.
+    chunk_size : numeric, optional
+        Count of samples tested at once, bounding the memory usage.
+    standard_error : numeric, optional
+        Target standard error of the percentage coverage, the computation
+        stops once the samples tested so far reach it. See
+        :func:`colour.volume.RGB_colourspace_volume_coverage_MonteCarlo`
+        definition for the standard error estimation.
 
     Returns
     -------
@@ -391,8 +670,345 @@ def RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     >>> RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
     ...     sRGB, 10e3, random_state=prng)  # doctest: +ELLIPSIS
     36...
+
+    Using quasi-random triplets:
+
+    >>> from colour.algebra import halton_triplet_generator
+    >>> prng = np.random.RandomState(2)
+    >>> RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
+    ...     sRGB, 10e3, halton_triplet_generator,
+    ...     random_state=prng)  # doctest: +ELLIPSIS
+    3...
     """
 
     return RGB_colourspace_volume_coverage_MonteCarlo(
-        colourspace, is_within_visible_spectrum, samples, random_generator,
-        random_state)
+        colourspace,
+        is_within_visible_spectrum,
+        samples,
+        random_generator,
+        random_state,
+        chunk_size=chunk_size,
+        standard_error=standard_error)
+
+
+def _RGB_colourspace_halfspaces(colourspace, illuminant,
+                                chromatic_adaptation_method):
+    """
+    Returns the half-spaces, in the form :math:`Ax + b \\leq 0`, bounding
+    given *RGB* colourspace volume in *CIE XYZ* colourspace, adapted to given
+    *illuminant*.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the half-spaces of.
+    illuminant : array_like
+        *CIE XYZ* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    ndarray, (6, 4)
+        Half-spaces.
+    """
+
+    XYZ_to_RGB_matrix = XYZ_to_RGB(
+        np.identity(3),
+        illuminant,
+        colourspace.whitepoint,
+        colourspace.XYZ_to_RGB_matrix,
+        chromatic_adaptation_transform=chromatic_adaptation_method).T
+
+    return np.vstack([
+        np.hstack([-XYZ_to_RGB_matrix, np.zeros((3, 1))]),
+        np.hstack([XYZ_to_RGB_matrix, -np.ones((3, 1))]),
+    ])
+
+
+def _RGB_colourspaces_triangles(colourspaces, illuminant,
+                                chromatic_adaptation_method):
+    """
+    Returns the outward oriented triangles of the boundary of the
+    intersection of given *RGB* colourspaces volumes in *CIE XYZ* colourspace.
+
+    The *RGB* colourspaces volumes being parallelepipeds in *CIE XYZ*
+    colourspace, their intersection is a convex polytope.
+
+    Parameters
+    ----------
+    colourspaces : array_like
+        *RGB* colourspaces to intersect.
+    illuminant : array_like
+        *CIE XYZ* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode
+        *Chromatic adaptation* method.
+
+    Returns
+    -------
+    ndarray, (n, 3, 3)
+        Triangles.
+    """
+
+    halfspaces = np.vstack([
+        _RGB_colourspace_halfspaces(colourspace, illuminant,
+                                    chromatic_adaptation_method)
+        for colourspace in colourspaces
+    ])
+
+    # The achromatic axis is shared by all the *RGB* colourspaces adapted to
+    # the same *illuminant*, its middle is thus an interior point.
+    interior_point = RGB_to_XYZ(
+        np.array([0.5, 0.5, 0.5]),
+        colourspaces[0].whitepoint,
+        illuminant,
+        colourspaces[0].RGB_to_XYZ_matrix,
+        chromatic_adaptation_transform=chromatic_adaptation_method)
+
+    hull = ConvexHull(
+        HalfspaceIntersection(halfspaces, interior_point).intersections)
+
+    triangles = hull.points[hull.simplices]
+    normals = np.cross(triangles[:, 1] - triangles[:, 0],
+                       triangles[:, 2] - triangles[:, 0])
+    inward = np.einsum('...i,...i->...', normals, hull.equations[:, :3]) < 0
+    triangles[inward] = triangles[inward][:, ::-1]
+
+    return triangles
+
+
+def _triangles_volume(triangles,
+                      resolution,
+                      illuminant_Lab,
+                      XYZ_to_model,
+                      grading=3):
+    """
+    Returns the volume enclosed by given *CIE XYZ* colourspace triangles once
+    subdivided and converted to given colour model.
+
+    The volume is *Richardson* extrapolated from the volumes computed with
+    ``resolution`` and ``resolution // 2`` subdivisions, cancelling the
+    quadratic error term of the tessellation.
+
+    Parameters
+    ----------
+    triangles : array_like, (n, 3, 3)
+        Outward oriented triangles in *CIE XYZ* colourspace.
+    resolution : integer
+        Subdivisions count of each triangle edge.
+    illuminant_Lab : array_like
+        Colour model *illuminant* chromaticity coordinates.
+    XYZ_to_model : callable
+        Callable converting from *CIE XYZ* colourspace to the colour model.
+    grading : numeric, optional
+        Exponent grading the subdivision of the triangles sharing the black
+        vertex toward it.
+
+    Returns
+    -------
+    numeric
+        Volume.
+    """
+
+    # The colour models non-linearity is the strongest around the black
+    # vertex, the subdivision of the triangles sharing it is graded toward it.
+    origin = np.all(np.abs(triangles) < 1e-10, axis=-1)
+    graded = np.any(origin, axis=-1)
+    rolls = np.argmax(origin[graded], axis=-1)
+    indexes = (np.arange(3)[np.newaxis] + rolls[:, np.newaxis]) % 3
+    triangles_g = triangles[graded][np.arange(len(indexes))[:, np.newaxis],
+                                    indexes]
+
+    def volume(subdivisions):
+        """
+        Returns the volume for given subdivisions count.
+        """
+
+        triangles_s = np.vstack([
+            subdivide_triangles(triangles[~graded], subdivisions),
+            subdivide_triangles(triangles_g, subdivisions, grading),
+        ])
+
+        return abs(
+            mesh_volume(
+                XYZ_to_model(triangles_s, **filter_kwargs(
+                    XYZ_to_model, illuminant=illuminant_Lab))))
+
+    resolution = int(resolution)
+    if resolution < 2:
+        return volume(resolution)
+
+    ratio = (resolution / (resolution // 2)) ** 2
+
+    return ((ratio * volume(resolution) - volume(resolution // 2)) /
+            (ratio - 1))
+
+
+def RGB_colourspace_volume_mesh(
+        colourspace,
+        resolution=64,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02',
+        XYZ_to_model=XYZ_to_Lab):
+    """
+    Computes given *RGB* colourspace volume by tessellating its boundary and
+    using the divergence theorem.
+
+    The *RGB* colourspace cube surface is triangulated in *CIE XYZ*
+    colourspace, the triangles are subdivided, converted to *CIE L\\*a\\*b\\**
+    colourspace, or any other colour model, and the enclosed volume is
+    computed. The tessellation error decreases quadratically with
+    ``resolution`` and its leading term is cancelled by *Richardson*
+    extrapolation.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume of.
+    resolution : integer, optional
+        Subdivisions count of each edge of the triangles tessellating the
+        *RGB* colourspace cube surface.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    XYZ_to_model : callable, optional
+        Callable converting from *CIE XYZ* colourspace to the colour model the
+        volume is computed in, it is given ``illuminant_Lab`` as
+        ``illuminant`` argument if it accepts it.
+
+    Returns
+    -------
+    float
+        *RGB* colourspace volume.
+
+    Examples
+    --------
+    >>> from colour.models import sRGB_COLOURSPACE as sRGB
+    >>> RGB_colourspace_volume_mesh(sRGB)  # doctest: +ELLIPSIS
+    8572...
+    """
+
+    return _triangles_volume(
+        _RGB_colourspaces_triangles([colourspace], illuminant_Lab,
+                                    chromatic_adaptation_method), resolution,
+        illuminant_Lab, XYZ_to_model)
+
+
+def RGB_colourspaces_intersection_volume_mesh(
+        colourspace_1,
+        colourspace_2,
+        resolution=64,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02',
+        XYZ_to_model=XYZ_to_Lab):
+    """
+    Computes the volume of the intersection of given *RGB* colourspaces
+    volumes by tessellating its boundary and using the divergence theorem.
+
+    Parameters
+    ----------
+    colourspace_1 : RGB_Colourspace
+        First *RGB* colourspace.
+    colourspace_2 : RGB_Colourspace
+        Second *RGB* colourspace.
+    resolution : integer, optional
+        Subdivisions count of each edge of the triangles tessellating the
+        intersection boundary.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    XYZ_to_model : callable, optional
+        Callable converting from *CIE XYZ* colourspace to the colour model the
+        volume is computed in, it is given ``illuminant_Lab`` as
+        ``illuminant`` argument if it accepts it.
+
+    Returns
+    -------
+    float
+        *RGB* colourspaces intersection volume.
+
+    Examples
+    --------
+    >>> from colour.models import (
+    ...     ADOBE_RGB_1998_COLOURSPACE as AdobeRGB, sRGB_COLOURSPACE as sRGB)
+    >>> RGB_colourspaces_intersection_volume_mesh(sRGB, AdobeRGB)
+    ... # doctest: +ELLIPSIS
+    8571...
+    """
+
+    return _triangles_volume(
+        _RGB_colourspaces_triangles([colourspace_1, colourspace_2],
+                                    illuminant_Lab,
+                                    chromatic_adaptation_method), resolution,
+        illuminant_Lab, XYZ_to_model)
+
+
+def RGB_colourspace_coverage_mesh(
+        colourspace,
+        colourspace_reference,
+        resolution=64,
+        illuminant_Lab=ILLUMINANTS['CIE 1931 2 Degree Standard Observer'][
+            'D50'],
+        chromatic_adaptation_method='CAT02',
+        XYZ_to_model=XYZ_to_Lab):
+    """
+    Returns given *RGB* colourspace percentage coverage of given reference
+    *RGB* colourspace volume.
+
+    Parameters
+    ----------
+    colourspace : RGB_Colourspace
+        *RGB* colourspace to compute the volume coverage percentage.
+    colourspace_reference : RGB_Colourspace
+        Reference *RGB* colourspace.
+    resolution : integer, optional
+        Subdivisions count of each edge of the triangles tessellating the
+        volumes boundaries.
+    illuminant_Lab : array_like, optional
+        *Lab* colourspace *illuminant* chromaticity coordinates.
+    chromatic_adaptation_method : unicode, optional
+        **{'CAT02', 'XYZ Scaling', 'Von Kries', 'Bradford', 'Sharp',
+        'Fairchild', 'CMCCAT97', 'CMCCAT2000', 'CAT02_BRILL_CAT', 'Bianco',
+        'Bianco PC'}**,
+        *Chromatic adaptation* method.
+    XYZ_to_model : callable, optional
+        Callable converting from *CIE XYZ* colourspace to the colour model the
+        volumes are computed in, it is given ``illuminant_Lab`` as
+        ``illuminant`` argument if it accepts it.
+
+    Returns
+    -------
+    float
+        Percentage coverage of reference *RGB* colourspace volume.
+
+    Examples
+    --------
+    >>> from colour.models import (
+    ...     BT2020_COLOURSPACE as BT2020, sRGB_COLOURSPACE as sRGB)
+    >>> RGB_colourspace_coverage_mesh(sRGB, BT2020)  # doctest: +ELLIPSIS
+    44.1...
+    """
+
+    settings = {
+        'resolution': resolution,
+        'illuminant_Lab': illuminant_Lab,
+        'chromatic_adaptation_method': chromatic_adaptation_method,
+        'XYZ_to_model': XYZ_to_model,
+    }
+
+    volume_intersection = RGB_colourspaces_intersection_volume_mesh(
+        colourspace, colourspace_reference, **settings)
+    volume_reference = RGB_colourspace_volume_mesh(colourspace_reference,
+                                                   **settings)
+
+    return 100 * volume_intersection / volume_reference
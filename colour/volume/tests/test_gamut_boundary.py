@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Defines unit tests for :mod:`colour.volume.gamut_boundary` module.
+"""
+
+from __future__ import division, unicode_literals
+
+import numpy as np
+import os
+import shutil
+import tempfile
+import unittest
+
+from colour.colorimetry import ILLUMINANTS
+from colour.models import RGB_to_XYZ, XYZ_to_Lab, XYZ_to_IPT, sRGB_COLOURSPACE
+from colour.volume import (GamutBoundaryDescriptor,
+                           gamut_boundary_descriptor_RGB_colourspace)
+
+__author__ = 'Colour Developers'
+__copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
+__license__ = 'New BSD License - http://opensource.org/licenses/BSD-3-Clause'
+__maintainer__ = 'Colour Developers'
+__email__ = 'colour-science@googlegroups.com'
+__status__ = 'Production'
+
+__all__ = [
+    'LAB', 'TestGamutBoundaryDescriptor',
+    'TestGamutBoundaryDescriptorRGBColourspace'
+]
+
+LAB = np.array([
+    [0.0, 0.0, 0.0],
+    [50.0, 40.0, 0.0],
+    [50.0, 0.0, 20.0],
+    [50.0, -40.0, 0.0],
+    [50.0, 0.0, -20.0],
+    [100.0, 0.0, 0.0],
+])
+
+
+class TestGamutBoundaryDescriptor(unittest.TestCase):
+    """
+    Defines :class:`colour.volume.gamut_boundary.GamutBoundaryDescriptor`
+    class unit tests methods.
+    """
+
+    def setUp(self):
+        """
+        Initialises common tests attributes.
+        """
+
+        self._GBD = GamutBoundaryDescriptor()
+        self._GBD.generate(LAB, (3, 4))
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        After tests actions.
+        """
+
+        shutil.rmtree(self._temporary_directory)
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('segments', 'L', 'h', 'maxima')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(GamutBoundaryDescriptor))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('generate', 'chroma', 'boundary', 'contains',
+                            'read', 'write')
+
+        for method in required_methods:
+            self.assertIn(method, dir(GamutBoundaryDescriptor))
+
+    def test_generate(self):
+        """
+        Tests :func:`colour.volume.gamut_boundary.GamutBoundaryDescriptor.\
+generate` method.
+        """
+
+        self.assertTupleEqual(self._GBD.segments, (3, 4))
+        np.testing.assert_almost_equal(self._GBD.L, np.array([0, 50, 100]))
+        np.testing.assert_almost_equal(self._GBD.h,
+                                       np.array([0, 90, 180, 270]))
+        np.testing.assert_almost_equal(
+            self._GBD.maxima,
+            np.array([[0, 0, 0, 0], [40, 20, 40, 20], [0, 0, 0, 0]]))
+
+        # The empty segments are interpolated from their neighbours.
+        GBD = GamutBoundaryDescriptor()
+        GBD.generate(LAB[[0, 1, 2, 3, 5]], (5, 4))
+        np.testing.assert_almost_equal(
+            GBD.maxima,
+            np.array([[0, 0, 0, 0], [20, 10, 20, 20], [40, 20, 40, 40],
+                      [20, 10, 20, 20], [0, 0, 0, 0]]))
+
+    def test_chroma(self):
+        """
+        Tests :func:`colour.volume.gamut_boundary.GamutBoundaryDescriptor.\
+chroma` method.
+        """
+
+        np.testing.assert_almost_equal(
+            self._GBD.chroma(
+                np.array([50, 50, 50, 25, 50, 50, -1, 101]),
+                np.array([0, 45, 315, 0, 360, -90, 0, 0])),
+            np.array([40, 30, 30, 20, 40, 20, 0, 0]))
+
+        self.assertAlmostEqual(self._GBD.chroma(50, 45), 30)
+
+        L = np.reshape(np.linspace(0, 100, 6), (2, 3))
+        h = np.reshape(np.linspace(0, 360, 6), (2, 3))
+        self.assertTupleEqual(self._GBD.chroma(L, h).shape, (2, 3))
+
+    def test_boundary(self):
+        """
+        Tests :func:`colour.volume.gamut_boundary.GamutBoundaryDescriptor.\
+boundary` method.
+        """
+
+        np.testing.assert_almost_equal(
+            self._GBD.boundary(np.array([50, 50]), np.array([0, 90])),
+            np.array([[50, 40, 0], [50, 0, 20]]))
+
+    def test_contains(self):
+        """
+        Tests :func:`colour.volume.gamut_boundary.GamutBoundaryDescriptor.\
+contains` method.
+        """
+
+        np.testing.assert_array_equal(
+            self._GBD.contains(
+                np.array([[50, 39, 0], [50, 41, 0], [50, 0, -21], [-1, 0, 0],
+                          [101, 0, 0]])),
+            np.array([True, False, False, False, False]))
+
+        np.testing.assert_array_equal(
+            self._GBD.contains(np.array([50, 41, 0]), tolerance=2), True)
+
+    def test_read_write(self):
+        """
+        Tests :func:`colour.volume.gamut_boundary.GamutBoundaryDescriptor.\
+read` and :func:`colour.volume.gamut_boundary.GamutBoundaryDescriptor.write`
+        methods.
+        """
+
+        path = os.path.join(self._temporary_directory, 'GBD.npz')
+        self.assertTrue(self._GBD.write(path))
+
+        GBD = GamutBoundaryDescriptor()
+        self.assertTrue(GBD.read(path))
+
+        np.testing.assert_array_equal(GBD.L, self._GBD.L)
+        np.testing.assert_array_equal(GBD.maxima, self._GBD.maxima)
+
+
+class TestGamutBoundaryDescriptorRGBColourspace(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.gamut_boundary.\
+gamut_boundary_descriptor_RGB_colourspace` definition unit tests methods.
+    """
+
+    def test_gamut_boundary_descriptor_RGB_colourspace(self):
+        """
+        Tests :func:`colour.volume.gamut_boundary.\
+gamut_boundary_descriptor_RGB_colourspace` definition.
+        """
+
+        illuminant = ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D50']
+
+        RGB = np.random.RandomState(4).uniform(-0.2, 1.2, (100000, 3))
+        inside = np.all(np.logical_and(RGB >= 0, RGB <= 1), axis=-1)
+        XYZ = RGB_to_XYZ(RGB, sRGB_COLOURSPACE.whitepoint, illuminant,
+                         sRGB_COLOURSPACE.RGB_to_XYZ_matrix, 'CAT02')
+
+        GBD = gamut_boundary_descriptor_RGB_colourspace(sRGB_COLOURSPACE)
+        np.testing.assert_almost_equal(GBD.L[[0, -1]], np.array([0, 100]),
+                                       decimal=3)
+
+        contains = GBD.contains(XYZ_to_Lab(XYZ, illuminant))
+        self.assertLess(np.mean(~contains[inside]), 1e-3)
+        self.assertLess(np.mean(contains[~inside]), 0.05)
+
+        GBD = gamut_boundary_descriptor_RGB_colourspace(
+            sRGB_COLOURSPACE, (64, 128), 128, XYZ_to_model=XYZ_to_IPT)
+        self.assertTupleEqual(GBD.segments, (64, 128))
+        self.assertAlmostEqual(GBD.L[0], 0, places=3)
+
+        contains = GBD.contains(XYZ_to_IPT(XYZ))
+        self.assertLess(np.mean(~contains[inside]), 1e-3)
+        self.assertLess(np.mean(contains[~inside]), 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
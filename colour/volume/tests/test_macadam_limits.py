@@ -9,7 +9,11 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.volume import is_within_macadam_limits
+from colour.colorimetry import (ILLUMINANTS_RELATIVE_SPDS,
+                                STANDARD_OBSERVERS_CMFS, SpectralShape)
+from colour.models import xyY_to_XYZ
+from colour.volume import (XYZ_optimal_colour_stimuli,
+                           is_within_macadam_limits, macadam_limits)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -19,7 +23,54 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMacadamLimits']
+__all__ = ['TestXYZ_optimal_colour_stimuli', 'TestIsWithinMacadamLimits']
+
+
+class TestXYZ_optimal_colour_stimuli(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+    definition unit tests methods.
+    """
+
+    def test_XYZ_optimal_colour_stimuli(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+        definition.
+        """
+
+        illuminant = ILLUMINANTS_RELATIVE_SPDS['D65']
+        XYZ = XYZ_optimal_colour_stimuli(illuminant)
+
+        self.assertTupleEqual(XYZ.shape, (95 * 94 + 2, 3))
+        np.testing.assert_almost_equal(XYZ[0], np.zeros(3), decimal=7)
+        np.testing.assert_almost_equal(
+            XYZ[-1], np.array([0.95046695, 1.00000000, 1.08896911]), decimal=7)
+
+        # A band-pass and its complementary band-stop reflectances sum to the
+        # perfect reflecting diffuser.
+        XYZ_b = np.reshape(XYZ[1:-1], (95, 94, 3))
+        np.testing.assert_almost_equal(
+            XYZ_b[0, 9] + XYZ_b[10, 84], XYZ[-1], decimal=7)
+
+        # A single band reflectance is the weighted colour matching functions.
+        cmfs = STANDARD_OBSERVERS_CMFS['CIE 1931 2 Degree Standard Observer']
+        shape = SpectralShape(cmfs.shape.start, cmfs.shape.end, 5)
+        cmfs = cmfs.copy().align(shape)
+        weights = cmfs.values * illuminant.copy().align(
+            shape).values[..., np.newaxis]
+        np.testing.assert_almost_equal(
+            XYZ_b[..., 0, :], weights / np.sum(weights[..., 1]), decimal=7)
+
+    def test_interval_XYZ_optimal_colour_stimuli(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.XYZ_optimal_colour_stimuli`
+        definition interval support.
+        """
+
+        self.assertTupleEqual(
+            XYZ_optimal_colour_stimuli(
+                ILLUMINANTS_RELATIVE_SPDS['A'], interval=10).shape,
+            (48 * 47 + 2, 3))
 
 
 class TestIsWithinMacadamLimits(unittest.TestCase):
@@ -46,6 +97,64 @@ class TestIsWithinMacadamLimits(unittest.TestCase):
         self.assertFalse(
             is_within_macadam_limits(np.array([0.0025, 0.0088, 0.0340]), 'C'))
 
+    def test_cache_is_within_macadam_limits(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
+        definition illuminants *Optimal Colour Stimuli* cache.
+        """
+
+        cache = macadam_limits._XYZ_OPTIMAL_COLOUR_STIMULI_CACHE
+        cache_size = macadam_limits._XYZ_OPTIMAL_COLOUR_STIMULI_CACHE_SIZE
+        macadam_limits._XYZ_OPTIMAL_COLOUR_STIMULI_CACHE_SIZE = 2
+        try:
+            xyY = np.array([0.3205, 0.4131, 0.5100])
+            for illuminant in ('A', 'C', 'D65', 'C'):
+                is_within_macadam_limits(xyY, illuminant)
+
+            self.assertListEqual(list(cache.keys()), ['D65', 'C'])
+        finally:
+            macadam_limits._XYZ_OPTIMAL_COLOUR_STIMULI_CACHE_SIZE = cache_size
+
+    def test_spd_is_within_macadam_limits(self):
+        """
+        Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
+        definition with an illuminant relative spectral power distribution.
+        """
+
+        illuminant = ILLUMINANTS_RELATIVE_SPDS['A']
+
+        self.assertTrue(
+            is_within_macadam_limits(
+                np.array([0.3205, 0.4131, 0.5100]), illuminant))
+
+        self.assertFalse(
+            is_within_macadam_limits(
+                np.array([0.0005, 0.0031, 0.0010]), illuminant))
+
+        # The computed *Optimal Colour Stimuli* agree with the tabulated
+        # *Optimal Colour Stimuli* within their luminance range.
+        prng = np.random.RandomState(4)
+        xyY = np.column_stack([
+            prng.uniform(0, 0.8, (10000, 2)),
+            prng.uniform(0.15, 0.9, 10000)
+        ])
+
+        self.assertGreater(
+            np.mean(
+                is_within_macadam_limits(xyY, 'A') ==
+                is_within_macadam_limits(xyY, illuminant)), 0.99)
+
+        XYZ = XYZ_optimal_colour_stimuli(illuminant)
+        XYZ = XYZ[np.logical_and(XYZ[..., 1] > 0.1, XYZ[..., 1] < 0.9)]
+        np.testing.assert_array_less(
+            np.linalg.norm(
+                XYZ - xyY_to_XYZ(
+                    np.column_stack([
+                        XYZ[..., 0:2] / np.sum(XYZ, axis=-1)[..., np.newaxis],
+                        XYZ[..., 1]
+                    ])),
+                axis=-1), 1e-7)
+
     def test_n_dimensional_is_within_macadam_limits(self):
         """
         Tests :func:`colour.volume.macadam_limits.is_within_macadam_limits`
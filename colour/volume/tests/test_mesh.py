@@ -9,7 +9,11 @@ import numpy as np
 import unittest
 from itertools import permutations
 
-from colour.volume import is_within_mesh_volume
+from colour.volume import (PreparedMeshVolume, prepare_mesh_volume,
+                           is_within_mesh_volume, subdivide_triangles,
+                           mesh_volume)
+from colour.volume.mesh import (_PREPARED_MESH_VOLUMES_CACHE,
+                                _PREPARED_MESH_VOLUMES_CACHE_SIZE)
 from colour.utilities import ignore_numpy_errors
 
 __author__ = 'Colour Developers'
@@ -19,7 +23,135 @@ __maintainer__ = 'Colour Developers'
 __email__ = 'colour-science@googlegroups.com'
 __status__ = 'Production'
 
-__all__ = ['TestIsWithinMeshVolume']
+__all__ = [
+    'MESH', 'TestPreparedMeshVolume', 'TestPrepareMeshVolume',
+    'TestIsWithinMeshVolume', 'TestSubdivideTriangles', 'TestMeshVolume'
+]
+
+MESH = np.array([
+    [-1.0, -1.0, 1.0],
+    [1.0, -1.0, 1.0],
+    [1.0, -1.0, -1.0],
+    [-1.0, -1.0, -1.0],
+    [0.0, 1.0, 0.0],
+])
+
+TETRAHEDRON_TRIANGLES = np.array([
+    [[0.0, 0.0, 0.0], [0.0, 1.0, 0.0], [1.0, 0.0, 0.0]],
+    [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, 1.0]],
+    [[0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 1.0, 0.0]],
+    [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+])
+
+
+class TestPreparedMeshVolume(unittest.TestCase):
+    """
+    Defines :class:`colour.volume.mesh.PreparedMeshVolume` class unit tests
+    methods.
+    """
+
+    def test_required_attributes(self):
+        """
+        Tests presence of required attributes.
+        """
+
+        required_attributes = ('mesh', 'hull', 'triangulation', 'equations')
+
+        for attribute in required_attributes:
+            self.assertIn(attribute, dir(PreparedMeshVolume))
+
+    def test_required_methods(self):
+        """
+        Tests presence of required methods.
+        """
+
+        required_methods = ('contains', )
+
+        for method in required_methods:
+            self.assertIn(method, dir(PreparedMeshVolume))
+
+    def test_contains(self):
+        """
+        Tests :func:`colour.volume.mesh.PreparedMeshVolume.contains` method.
+        """
+
+        volume = PreparedMeshVolume(MESH)
+
+        points = np.random.RandomState(4).uniform(-1.5, 1.5, (1000, 3))
+        within = volume.contains(points)
+        self.assertTrue(np.any(within))
+        self.assertFalse(np.all(within))
+
+        np.testing.assert_equal(
+            volume.contains(points, method='Half-spaces'), within)
+        np.testing.assert_equal(
+            volume.contains(points, method='half-spaces', chunk_size=7),
+            within)
+        np.testing.assert_equal(
+            volume.contains(np.reshape(points, (10, 100, 3)), chunk_size=64),
+            np.reshape(within, (10, 100)))
+
+        self.assertRaises(
+            ValueError, lambda: volume.contains(points, method='Undefined'))
+
+    def test_inner_hull_contains(self):
+        """
+        Tests :func:`colour.volume.mesh.PreparedMeshVolume.contains` method
+        with a convex hull having enough vertices to use an inner convex
+        hull.
+        """
+
+        prng = np.random.RandomState(4)
+        sphere = prng.normal(size=(1000, 3))
+        sphere /= np.linalg.norm(sphere, axis=-1)[..., np.newaxis]
+        volume = PreparedMeshVolume(sphere)
+
+        points = prng.uniform(-1.2, 1.2, (10000, 3))
+        within = volume.contains(points)
+        self.assertTrue(np.any(within))
+        self.assertFalse(np.all(within))
+
+        np.testing.assert_equal(
+            volume.contains(points, method='Half-spaces'), within)
+
+    @ignore_numpy_errors
+    def test_nan_contains(self):
+        """
+        Tests :func:`colour.volume.mesh.PreparedMeshVolume.contains` method
+        nan support.
+        """
+
+        volume = PreparedMeshVolume(MESH)
+
+        cases = [-1.0, 0.0, 1.0, -np.inf, np.inf, np.nan]
+        cases = np.array(list(set(permutations(cases * 3, r=3))))
+        np.testing.assert_equal(
+            volume.contains(cases),
+            volume.contains(cases, method='Half-spaces'))
+
+
+class TestPrepareMeshVolume(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.prepare_mesh_volume` definition unit
+    tests methods.
+    """
+
+    def test_prepare_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.prepare_mesh_volume` definition.
+        """
+
+        volume = prepare_mesh_volume(MESH)
+        self.assertIsInstance(volume, PreparedMeshVolume)
+        self.assertIs(prepare_mesh_volume(MESH.copy()), volume)
+        self.assertIsNot(prepare_mesh_volume(MESH * 2), volume)
+
+        for i in range(_PREPARED_MESH_VOLUMES_CACHE_SIZE * 2):
+            prepare_mesh_volume(MESH + i)
+
+        self.assertEqual(
+            len(_PREPARED_MESH_VOLUMES_CACHE),
+            _PREPARED_MESH_VOLUMES_CACHE_SIZE)
 
 
 class TestIsWithinMeshVolume(unittest.TestCase):
@@ -62,6 +194,18 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(
                 np.array([0.4325, 0.3788, 0.1034]), self._mesh))
 
+        self.assertTrue(
+            is_within_mesh_volume(
+                np.array([0.0025, 0.0088, 0.0340]),
+                self._mesh,
+                method='Half-spaces'))
+
+        self.assertFalse(
+            is_within_mesh_volume(
+                np.array([0.4325, 0.3788, 0.1034]),
+                self._mesh,
+                method='Half-spaces'))
+
     def test_n_dimensional_is_within_mesh_volume(self):
         """
         Tests :func:`colour.volume.mesh.is_within_mesh_volume` definition
@@ -93,5 +237,80 @@ class TestIsWithinMeshVolume(unittest.TestCase):
             is_within_mesh_volume(case, self._mesh)
 
 
+class TestSubdivideTriangles(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.subdivide_triangles` definition unit
+    tests methods.
+    """
+
+    def test_subdivide_triangles(self):
+        """
+        Tests :func:`colour.volume.mesh.subdivide_triangles` definition.
+        """
+
+        np.testing.assert_almost_equal(
+            subdivide_triangles(TETRAHEDRON_TRIANGLES, 1),
+            TETRAHEDRON_TRIANGLES,
+            decimal=7)
+
+        triangles = subdivide_triangles(TETRAHEDRON_TRIANGLES, 4)
+        self.assertTupleEqual(triangles.shape, (64, 3, 3))
+
+        np.testing.assert_almost_equal(
+            subdivide_triangles(TETRAHEDRON_TRIANGLES[0:1], 2)[:, 1],
+            np.array([
+                [0.0, 0.5, 0.0],
+                [0.5, 0.5, 0.0],
+                [0.0, 1.0, 0.0],
+                [0.5, 0.5, 0.0],
+            ]),
+            decimal=7)
+
+    def test_grading_subdivide_triangles(self):
+        """
+        Tests :func:`colour.volume.mesh.subdivide_triangles` definition
+        grading support.
+        """
+
+        triangles = subdivide_triangles(TETRAHEDRON_TRIANGLES[0:1], 4, 2)
+
+        # The edge opposite to the first vertex is uniformly subdivided.
+        vertices = triangles.reshape(-1, 3)
+        vertices = vertices[np.abs(np.sum(vertices, axis=-1) - 1) < 1e-7]
+        np.testing.assert_almost_equal(
+            np.unique(vertices[..., 0]), np.linspace(0, 1, 5), decimal=7)
+
+        # The edges through the first vertex are graded.
+        vertices = triangles.reshape(-1, 3)
+        np.testing.assert_almost_equal(
+            np.unique(vertices[vertices[..., 1] == 0][..., 0]),
+            np.linspace(0, 1, 5) ** 2,
+            decimal=7)
+
+
+class TestMeshVolume(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.mesh.mesh_volume` definition unit tests
+    methods.
+    """
+
+    def test_mesh_volume(self):
+        """
+        Tests :func:`colour.volume.mesh.mesh_volume` definition.
+        """
+
+        self.assertAlmostEqual(
+            mesh_volume(TETRAHEDRON_TRIANGLES), 1 / 6, places=7)
+
+        self.assertAlmostEqual(
+            mesh_volume(TETRAHEDRON_TRIANGLES[:, ::-1]), -1 / 6, places=7)
+
+        self.assertAlmostEqual(
+            mesh_volume(subdivide_triangles(TETRAHEDRON_TRIANGLES, 8) * 2 +
+                        10),
+            8 / 6,
+            places=7)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -23,14 +23,16 @@ from __future__ import division, unicode_literals
 import numpy as np
 import unittest
 
-from colour.models import (ACES_2065_1_COLOURSPACE, BT2020_COLOURSPACE,
-                           BT709_COLOURSPACE)
+from colour.algebra import halton_triplet_generator, random_triplet_generator
+from colour.models import (ACES_2065_1_COLOURSPACE, ADOBE_RGB_1998_COLOURSPACE,
+                           BT2020_COLOURSPACE, BT709_COLOURSPACE, XYZ_to_Luv)
 from colour.volume import (
     RGB_colourspace_limits, RGB_colourspace_volume_MonteCarlo,
     RGB_colourspace_volume_coverage_MonteCarlo,
     RGB_colourspace_pointer_gamut_coverage_MonteCarlo,
     RGB_colourspace_visible_spectrum_coverage_MonteCarlo,
-    is_within_pointer_gamut)
+    RGB_colourspace_volume_mesh, RGB_colourspaces_intersection_volume_mesh,
+    RGB_colourspace_coverage_mesh, is_within_pointer_gamut)
 
 __author__ = 'Colour Developers'
 __copyright__ = 'Copyright (C) 2013-2018 - Colour Developers'
@@ -43,7 +45,10 @@ __all__ = [
     'TestRGB_colourspaceLimits', 'TestRGB_colourspaceVolumeMonteCarlo',
     'TestRGB_colourspace_volume_coverage_MonteCarlo',
     'TestRGB_colourspacePointerGamutCoverageMonteCarlo',
-    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo'
+    'TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo',
+    'TestRGB_colourspaceVolumeMesh',
+    'TestRGB_colourspacesIntersectionVolumeMesh',
+    'TestRGB_colourspaceCoverageMesh'
 ]
 
 
@@ -100,7 +105,92 @@ class TestRGB_colourspaceVolumeMonteCarlo(unittest.TestCase):
                 BT709_COLOURSPACE,
                 10e3,
                 random_state=np.random.RandomState(2),
-                processes=1), 858600.0)
+                processes=1), 884700.0)
+
+    def test_processes_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition independence from the processes count.
+        """
+
+        volumes = [
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_state=np.random.RandomState(2),
+                processes=processes,
+                chunk_size=10e2) for processes in (1, 2)
+        ]
+
+        self.assertEqual(volumes[0], volumes[1])
+
+    def test_additional_data_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition confidence interval.
+        """
+
+        volume, interval = RGB_colourspace_volume_MonteCarlo(
+            BT709_COLOURSPACE,
+            10e3,
+            random_state=np.random.RandomState(2),
+            processes=1,
+            additional_data=True)
+
+        self.assertEqual(volume, 884700.0)
+        np.testing.assert_almost_equal(
+            interval, np.array([832183.18321520, 937216.81678480]), decimal=7)
+
+    def test_halton_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition with quasi-random triplets.
+        """
+
+        self.assertEquals(
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e3,
+                random_generator=halton_triplet_generator,
+                random_state=np.random.RandomState(2),
+                processes=1), 853200.0)
+
+    def test_standard_error_RGB_colourspace_volume_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition early stop on a target standard error.
+        """
+
+        _volume, interval = RGB_colourspace_volume_MonteCarlo(
+            BT709_COLOURSPACE,
+            10e6,
+            random_generator=halton_triplet_generator,
+            random_state=np.random.RandomState(2),
+            processes=1,
+            chunk_size=10e3,
+            confidence=0.5,
+            standard_error=5000,
+            additional_data=True)
+
+        self.assertLessEqual((interval[1] - interval[0]) / 2 / 0.67448975,
+                             5000)
+
+        # The standard error is estimated from the tasks spread, reflecting
+        # the faster convergence of the quasi-random triplets.
+        intervals = [
+            RGB_colourspace_volume_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e4,
+                random_generator=random_generator,
+                random_state=np.random.RandomState(2),
+                processes=1,
+                chunk_size=10e2,
+                additional_data=True)[1]
+            for random_generator in (random_triplet_generator,
+                                     halton_triplet_generator)
+        ]
+        self.assertLess(intervals[1][1] - intervals[1][0],
+                        (intervals[0][1] - intervals[0][0]) / 2)
 
 
 class TestRGB_colourspace_volume_coverage_MonteCarlo(unittest.TestCase):
@@ -128,6 +218,61 @@ RGB_colourspace_volume_coverage_MonteCarlo` definition.
             83.02013423,
             decimal=7)
 
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_coverage_MonteCarlo(
+                BT709_COLOURSPACE,
+                is_within_pointer_gamut,
+                10e3,
+                halton_triplet_generator,
+                random_state=np.random.RandomState(2)),
+            81.71390013,
+            decimal=7)
+
+    def test_standard_error_RGB_colourspace_volume_coverage_MonteCarlo(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_volume_coverage_MonteCarlo` definition early stop on a
+        target standard error.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_volume_coverage_MonteCarlo(
+                BT709_COLOURSPACE,
+                is_within_pointer_gamut,
+                10e6,
+                halton_triplet_generator,
+                random_state=np.random.RandomState(2),
+                standard_error=0.5),
+            81.23778062,
+            decimal=7)
+
+        samples = []
+        for random_generator in (random_triplet_generator,
+                                 halton_triplet_generator):
+            XYZ_samples = []
+
+            def coverage_sampler(XYZ):
+                """
+                Counts the samples drawn while checking the *Pointer's Gamut*
+                coverage.
+                """
+
+                XYZ_samples.append(len(XYZ))
+
+                return is_within_pointer_gamut(XYZ)
+
+            RGB_colourspace_volume_coverage_MonteCarlo(
+                BT709_COLOURSPACE,
+                coverage_sampler,
+                10e6,
+                random_generator,
+                random_state=np.random.RandomState(2),
+                chunk_size=10e3,
+                standard_error=0.2)
+            samples.append(sum(XYZ_samples))
+
+        self.assertLess(samples[1], samples[0] / 2)
+
 
 class TestRGB_colourspacePointerGamutCoverageMonteCarlo(unittest.TestCase):
     """
@@ -153,6 +298,23 @@ RGB_colourspace_pointer_gamut_coverage_MonteCarlo` definition.
             83.02013423,
             decimal=7)
 
+    def test_chunk_size_RGB_colourspace_pointer_gamut_coverage(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_pointer_gamut_coverage_MonteCarlo` definition chunk size
+        support.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_pointer_gamut_coverage_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e5,
+                random_state=np.random.RandomState(2),
+                chunk_size=10e2,
+                standard_error=0.5),
+            81.46804354,
+            decimal=7)
+
 
 class TestRGB_colourspaceVisibleSpectrumCoverageMonteCarlo(unittest.TestCase):
     """
@@ -178,6 +340,129 @@ RGB_colourspace_visible_spectrum_coverage_MonteCarlo` definition.
             36.48383937,
             decimal=7)
 
+    def test_chunk_size_RGB_colourspace_visible_spectrum_coverage(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspace_visible_spectrum_coverage_MonteCarlo` definition chunk size
+        support.
+        """
+
+        np.testing.assert_almost_equal(
+            RGB_colourspace_visible_spectrum_coverage_MonteCarlo(
+                BT709_COLOURSPACE,
+                10e5,
+                random_state=np.random.RandomState(2),
+                chunk_size=10e2,
+                standard_error=0.5),
+            37.79251170,
+            decimal=7)
+
+
+class TestRGB_colourspaceVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_volume_mesh` definition
+    unit tests methods.
+    """
+
+    def test_RGB_colourspace_volume_mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE),
+            857059.34021818,
+            places=4)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(BT2020_COLOURSPACE),
+            1941149.32019011,
+            places=4)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_volume_mesh(
+                BT709_COLOURSPACE, XYZ_to_model=XYZ_to_Luv),
+            1217495.83061599,
+            places=4)
+
+    def test_convergence_RGB_colourspace_volume_mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_volume_mesh`
+        definition convergence and agreement with
+        :func:`colour.volume.rgb.RGB_colourspace_volume_MonteCarlo`
+        definition.
+        """
+
+        volume = RGB_colourspace_volume_mesh(BT709_COLOURSPACE, 256)
+
+        self.assertLess(
+            abs(RGB_colourspace_volume_mesh(BT709_COLOURSPACE, 32) - volume) /
+            volume, 1e-4)
+        self.assertLess(
+            abs(RGB_colourspace_volume_mesh(BT709_COLOURSPACE) - volume) /
+            volume, 1e-6)
+
+        _volume, interval = RGB_colourspace_volume_MonteCarlo(
+            BT709_COLOURSPACE,
+            10e4,
+            random_state=np.random.RandomState(2),
+            processes=1,
+            confidence=0.999,
+            additional_data=True)
+
+        self.assertTrue(interval[0] < volume < interval[1])
+
+
+class TestRGB_colourspacesIntersectionVolumeMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.\
+RGB_colourspaces_intersection_volume_mesh` definition unit tests methods.
+    """
+
+    def test_RGB_colourspaces_intersection_volume_mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.\
+RGB_colourspaces_intersection_volume_mesh` definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspaces_intersection_volume_mesh(
+                BT709_COLOURSPACE, ADOBE_RGB_1998_COLOURSPACE),
+            857057.83583945,
+            places=4)
+
+        self.assertAlmostEqual(
+            RGB_colourspaces_intersection_volume_mesh(BT709_COLOURSPACE,
+                                                      BT709_COLOURSPACE),
+            RGB_colourspace_volume_mesh(BT709_COLOURSPACE),
+            places=4)
+
+
+class TestRGB_colourspaceCoverageMesh(unittest.TestCase):
+    """
+    Defines :func:`colour.volume.rgb.RGB_colourspace_coverage_mesh`
+    definition unit tests methods.
+    """
+
+    def test_RGB_colourspace_coverage_mesh(self):
+        """
+        Tests :func:`colour.volume.rgb.RGB_colourspace_coverage_mesh`
+        definition.
+        """
+
+        self.assertAlmostEqual(
+            RGB_colourspace_coverage_mesh(BT709_COLOURSPACE,
+                                          BT2020_COLOURSPACE),
+            44.15215931,
+            places=7)
+
+        self.assertAlmostEqual(
+            RGB_colourspace_coverage_mesh(BT2020_COLOURSPACE,
+                                          BT709_COLOURSPACE),
+            100,
+            places=2)
+
 
 if __name__ == '__main__':
     unittest.main()